@@ -31,12 +31,22 @@ list along with the generator's understanding of face structure.
 Usage:
     python scripts/audit_assurance_chart.py charts/chart-types-audit/chart-types-audit.md
     python scripts/audit_assurance_chart.py chart.md --search-dir /path/to/assurance/dir
+    python scripts/audit_assurance_chart.py --changed-since origin/main
+    python scripts/audit_assurance_chart.py --all --report coverage.md
 
 Options:
     --search-dir DIR    Additional directory to search for faces/edges/vertices.
                         Can be specified multiple times. These directories are
                         searched in addition to the standard 00_vertices/,
                         01_edges/, 02_faces/ locations.
+    --all               Audit every assurance_audit chart under charts/ in one
+                        run, sharing the element index and face metadata.
+    --changed-since REV Audit every assurance_audit chart affected by changes
+                        since a git revision (see invalidation.py).
+    --jobs N            Audit charts across N worker processes (with
+                        --all/--changed-since).
+    --report FILE       Write an aggregated coverage report (markdown).
+    --json FILE         Write every chart's audit result as JSON.
 
 Output:
     - PASS/FAIL status
@@ -46,11 +56,16 @@ Output:
 
 import sys
 import json
-import yaml
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 
+from build_cache import load_previous_build
+from element_index import ElementIndex, get_element_index
+from invalidation import InvalidationError, tasks_changed_since
+from parse_chart import ParseError, list_element_files, load_yaml, read_frontmatter
+
 # Import the generator to understand face structure
 try:
     from generate_assurance_audit_elements import (
@@ -76,7 +91,7 @@ def load_chart(chart_path: Path) -> dict:
         if len(parts) >= 3:
             frontmatter_text = parts[1]
             body = parts[2]
-            metadata = yaml.safe_load(frontmatter_text)
+            metadata = load_yaml(frontmatter_text)
         else:
             metadata = {}
             body = content
@@ -91,98 +106,24 @@ def load_chart(chart_path: Path) -> dict:
     }
 
 
-def load_element(element_id: str, base_dir: Path, search_dirs: list = None) -> dict:
+def load_element(element_id: str, base_dir: Path, search_dirs: list = None, index: ElementIndex = None) -> dict:
     """Load an element (vertex, edge, or face) by ID.
 
     Args:
         element_id: The element ID (e.g., 'v:spec:chart', 'f:assurance:field-survey-wqm')
         base_dir: Base directory containing 00_vertices/, 01_edges/, 02_faces/
         search_dirs: Additional directories to search for elements (flat search)
+        index: Element index to resolve IDs with (default: the shared index
+            for base_dir and search_dirs)
     """
-    if search_dirs is None:
-        search_dirs = []
-
-    # Try to find the file by globbing since naming conventions vary
-    element_path = None
-
-    # Determine which subdirectory and patterns to use based on element type
-    if element_id.startswith('v:') or element_id.startswith('b0:'):
-        subdir_name = '00_vertices'
-        # Try different patterns
-        patterns = [
-            f"*{element_id.split(':')[-1]}*.md",
-            f"{element_id.replace(':', '-')}.md",
-            "b0-root.md" if element_id == 'b0:root' else None
-        ]
-    elif element_id.startswith('e:') or element_id.startswith('b1:'):
-        subdir_name = '01_edges'
-        # For edges, the filename usually drops the prefix
-        patterns = [
-            f"{element_id.replace('e:', '').replace(':', '-')}.md",
-            f"{element_id.replace('b1:', 'b1-').replace(':', '-')}.md"
-        ]
-    elif element_id.startswith('f:') or element_id.startswith('b2:'):
-        subdir_name = '02_faces'
-        # For faces, pattern is usually assurance-{type}.md or b2-{type}.md
-        patterns = [
-            f"{element_id.replace('f:assurance:', 'assurance-').replace('b2:', 'b2-').replace(':', '-')}.md",
-            f"{element_id.replace('f:', '').replace('b2:', 'b2-').replace(':', '-')}.md"
-        ]
-    else:
-        return None
-
-    # First, search in the standard subdirectory
-    subdir = base_dir / subdir_name
-    for pattern in patterns:
-        if pattern:
-            if '*' in pattern:
-                matches = list(subdir.glob(pattern))
-                if matches:
-                    element_path = matches[0]
-                    break
-            else:
-                test_path = subdir / pattern
-                if test_path.exists():
-                    element_path = test_path
-                    break
-
-    # If not found in standard location, search in additional directories (flat search)
-    if not element_path:
-        for search_dir in search_dirs:
-            search_path = Path(search_dir)
-            if not search_path.exists():
-                continue
-            for pattern in patterns:
-                if pattern:
-                    if '*' in pattern:
-                        matches = list(search_path.glob(pattern))
-                        if matches:
-                            element_path = matches[0]
-                            break
-                    else:
-                        test_path = search_path / pattern
-                        if test_path.exists():
-                            element_path = test_path
-                            break
-            if element_path:
-                break
+    if index is None:
+        index = get_element_index(base_dir, search_dirs)
 
+    element_path = index.resolve(element_id)
     if not element_path or not element_path.exists():
         return None
 
-    with open(element_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Split frontmatter from content
-    if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            frontmatter_text = parts[1]
-            metadata = yaml.safe_load(frontmatter_text)
-        else:
-            metadata = {}
-    else:
-        metadata = {}
+    metadata = read_frontmatter(element_path) or {}
 
     return {
         'id': element_id,
@@ -234,24 +175,124 @@ def infer_face_target(face_id: str) -> str:
     return None
 
 
-def get_face_target(face_id: str, base_dir: Path, search_dirs: list = None) -> str:
+# Face frontmatter fields the audit reads
+FACE_METADATA_FIELDS = ('type', 'target', 'validation_edge')
+
+
+class FaceMetadata:
+    """
+    Face ID -> {'type', 'target', 'validation_edge'} lookups for audits.
+
+    Faces are resolved through the element index and each entry is kept
+    with its file's (mtime_ns, size), so a lookup costs one stat once the
+    face has been seen. New or changed faces are taken from complex.json
+    when its build manifest records the file unchanged, and read from the
+    file otherwise, so the table is never staler than the files.
+    """
+
+    def __init__(self, base_dir: Path, search_dirs: list = None):
+        """
+        Args:
+            base_dir: Repository root containing 02_faces/ and complex.json
+            search_dirs: Additional directories to search for face files
+        """
+        self.index = get_element_index(base_dir, search_dirs)
+        previous = load_previous_build(self.index.root_path / 'complex.json')
+        self._build_faces, self._records = (
+            (previous[0]['elements'].get('faces', {}), previous[1]['files'])
+            if previous is not None else ({}, {})
+        )
+        # Face ID -> (path, signature, metadata)
+        self._faces = {}
+
+    def _from_build(self, face_id: str, path: Path, signature: tuple) -> dict:
+        """Metadata from complex.json if the manifest shows the file unchanged."""
+        try:
+            rel_path = str(path.relative_to(self.index.root_path))
+        except ValueError:
+            return None
+        record = self._records.get(rel_path)
+        if (record is None or record['id'] != face_id
+                or (record['mtime_ns'], record['size']) != signature):
+            return None
+        entry = self._build_faces.get(face_id)
+        if entry is None or entry['file'] != rel_path:
+            return None
+        return {field: entry.get(field) for field in FACE_METADATA_FIELDS}
+
+    def get(self, face_id: str) -> dict:
+        """
+        Look up a face's metadata.
+
+        Returns:
+            Dictionary of FACE_METADATA_FIELDS (missing fields are None), or
+            None if the face has no file
+
+        Raises:
+            ParseError: If the face file's frontmatter is malformed
+        """
+        path = self.index.resolve(face_id)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._faces.get(face_id)
+        if cached is not None and cached[0] == path and cached[1] == signature:
+            return cached[2]
+
+        metadata = self._from_build(face_id, path, signature)
+        if metadata is None:
+            frontmatter = read_frontmatter(path) or {}
+            metadata = {field: frontmatter.get(field) for field in FACE_METADATA_FIELDS}
+        self._faces[face_id] = (path, signature, metadata)
+        return metadata
+
+
+_face_metadata = {}
+
+
+def get_face_metadata(base_dir: Path, search_dirs: list = None) -> FaceMetadata:
+    """
+    Get the face metadata table for a repository, reusing it within a process.
+
+    Args:
+        base_dir: Repository root
+        search_dirs: Additional directories to search for face files
+    """
+    key = (Path(base_dir).resolve(), tuple(str(Path(d).resolve()) for d in search_dirs or []))
+    faces = _face_metadata.get(key)
+    if faces is None:
+        faces = _face_metadata[key] = FaceMetadata(base_dir, search_dirs)
+    else:
+        # Picks up added, removed or renamed face files
+        faces.index = get_element_index(base_dir, search_dirs)
+    return faces
+
+
+def get_face_target(face_id: str, base_dir: Path, search_dirs: list = None, faces: FaceMetadata = None) -> str:
     """
     Get the target vertex for a face, preferring explicit metadata over inference.
 
-    First tries to load the face file and read its 'target' field.
+    First looks up the face's 'target' field (see FaceMetadata).
     Falls back to infer_face_target() if file not found or no target field.
 
     Args:
         face_id: The face ID (e.g., 'f:assurance:field-survey-wqm')
         base_dir: Base directory containing 00_vertices/, 01_edges/, 02_faces/
         search_dirs: Additional directories to search for face files
+        faces: Face metadata table (default: the shared table for base_dir
+            and search_dirs)
     """
-    # Try to load face file and read explicit target
-    face_data = load_element(face_id, base_dir, search_dirs)
-    if face_data and face_data.get('metadata'):
-        explicit_target = face_data['metadata'].get('target')
-        if explicit_target:
-            return explicit_target
+    if faces is None:
+        faces = get_face_metadata(base_dir, search_dirs)
+
+    metadata = faces.get(face_id)
+    if metadata and metadata.get('target'):
+        return metadata['target']
 
     # Fall back to inference from naming convention
     return infer_face_target(face_id)
@@ -295,11 +336,12 @@ def build_assurance_network_from_frontmatter(chart_data: dict, base_dir: Path =
         else:
             base_dir = Path('.')
 
-    # Build vertex -> face mapping
+    # Build vertex -> face mapping from one face metadata table
+    face_metadata = get_face_metadata(base_dir, search_dirs)
     assured_vertices = {}
 
     for face_id in faces:
-        target = get_face_target(face_id, base_dir, search_dirs)
+        target = get_face_target(face_id, base_dir, search_dirs, face_metadata)
         if target:
             assured_vertices[target] = face_id
 
@@ -613,34 +655,18 @@ def format_audit_trail(audit_result: dict) -> str:
     return '\n'.join(lines)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Audit an assurance_audit chart for complete assurance coverage.',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog='''
-Examples:
-    python scripts/audit_assurance_chart.py charts/chart-types-audit/chart-types-audit.md
-    python scripts/audit_assurance_chart.py chart.md --search-dir /path/to/assurance/dir
-    python scripts/audit_assurance_chart.py chart.md --search-dir dir1 --search-dir dir2
-        '''
-    )
-    parser.add_argument('chart', type=Path, help='Path to the assurance audit chart markdown file')
-    parser.add_argument(
-        '--search-dir', '-s',
-        action='append',
-        dest='search_dirs',
-        metavar='DIR',
-        help='Additional directory to search for faces/edges/vertices. Can be specified multiple times.'
-    )
-
-    args = parser.parse_args()
+def report_audit(chart_path: Path, search_dirs: list = None) -> bool:
+    """
+    Audit a chart, print the report and write its audit trail.
 
-    chart_path = args.chart
-    search_dirs = args.search_dirs or []
+    Args:
+        chart_path: Path to the assurance audit chart markdown file
+        search_dirs: Additional directories to search for faces/edges/vertices
 
-    if not chart_path.exists():
-        print(f"Error: Chart file not found: {chart_path}")
-        sys.exit(1)
+    Returns:
+        True if the audit passed
+    """
+    search_dirs = search_dirs or []
 
     print(f"Auditing: {chart_path.name}")
     if search_dirs:
@@ -680,15 +706,318 @@ Examples:
             print(f"  - {issue}")
         print("")
 
-    # Generate audit trail markdown
-    trail = format_audit_trail(result)
+    trail_path = write_audit_trail(chart_path, result)
+    print(f"✓ Audit trail written to: {trail_path.name}")
+
+    return result['status'] == 'PASS'
+
+
+def write_audit_trail(chart_path: Path, result: dict) -> Path:
+    """
+    Write a chart's audit trail markdown next to the chart.
+
+    Returns:
+        Path to the audit trail (<chart>-audit-trail.md)
+    """
     trail_path = chart_path.parent / f"{chart_path.stem}-audit-trail.md"
     with open(trail_path, 'w', encoding='utf-8') as f:
-        f.write(trail)
+        f.write(format_audit_trail(result))
+    return trail_path
 
-    print(f"✓ Audit trail written to: {trail_path.name}")
 
-    sys.exit(0 if result['status'] == 'PASS' else 1)
+def find_audit_charts(root_path: Path) -> list:
+    """
+    Find every chart/assurance_audit chart under root_path/charts/.
+
+    Args:
+        root_path: Repository root
+
+    Returns:
+        Sorted list of chart paths (files with unreadable frontmatter are skipped)
+    """
+    charts = []
+    for md_file in list_element_files(root_path / 'charts', 'chart'):
+        try:
+            frontmatter = read_frontmatter(md_file)
+        except ParseError:
+            continue
+        if isinstance(frontmatter, dict) and frontmatter.get('type') == 'chart/assurance_audit':
+            charts.append(md_file)
+    return charts
+
+
+def _audit_one(chart_path: Path, search_dirs: list) -> dict:
+    """Audit one chart, turning an exception into an 'ERROR' result."""
+    try:
+        return audit_assurance_chart(chart_path, search_dirs=search_dirs)
+    except Exception as e:
+        return {
+            'status': 'ERROR',
+            'chart_id': 'unknown',
+            'summary': f"Audit failed: {e}",
+            'issues': [str(e)],
+        }
+
+
+def _prime_face_metadata(chart_paths: list, search_dirs: list):
+    """Build the face metadata table of every repository the charts belong to."""
+    # Charts live at <root>/charts/<name>/<name>.md (see build_assurance_network_from_frontmatter)
+    for base_dir in {chart_path.parent.parent.parent for chart_path in chart_paths}:
+        get_face_metadata(base_dir, search_dirs)
+
+
+# search_dirs of each audit_charts worker process (see _init_worker)
+_worker_search_dirs: list = []
+
+
+def _init_worker(chart_paths: list, search_dirs: list):
+    """Build the element index and face metadata once per worker process."""
+    global _worker_search_dirs
+    _worker_search_dirs = search_dirs
+    _prime_face_metadata(chart_paths, search_dirs)
+
+
+def _audit_batch(chart_paths: list) -> list:
+    """Audit a batch of charts in a worker process."""
+    return [_audit_one(chart_path, _worker_search_dirs) for chart_path in chart_paths]
+
+
+def audit_charts(chart_paths: list, search_dirs: list = None, jobs: int = None) -> dict:
+    """
+    Audit several charts, optionally across worker processes.
+
+    The element index and face metadata table are built once up front (once
+    per worker process) and shared by every audit, so a face referenced by
+    many charts is resolved once. Audits are CPU-bound Python, so charts
+    are fanned out over processes in contiguous batches, like
+    parse_chart.iter_parse_files.
+
+    Args:
+        chart_paths: Assurance audit chart markdown files
+        search_dirs: Additional directories to search for faces/edges/vertices
+        jobs: Number of worker processes (None or 1 audits in this process)
+
+    Returns:
+        Mapping of chart path to its audit_assurance_chart() result, in
+        input order. A chart whose audit raises gets status 'ERROR' with
+        the exception as its issue.
+    """
+    search_dirs = search_dirs or []
+
+    if not jobs or jobs <= 1 or len(chart_paths) < 2:
+        _prime_face_metadata(chart_paths, search_dirs)
+        return {chart_path: _audit_one(chart_path, search_dirs) for chart_path in chart_paths}
+
+    batch_count = min(len(chart_paths), jobs * 4)
+    batch_size = -(-len(chart_paths) // batch_count)
+    batches = [chart_paths[i:i + batch_size] for i in range(0, len(chart_paths), batch_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(chart_paths, search_dirs)
+    ) as executor:
+        results = [result for batch in executor.map(_audit_batch, batches) for result in batch]
+    return dict(zip(chart_paths, results))
+
+
+def coverage_summary(results: dict) -> dict:
+    """
+    Aggregate audit results.
+
+    Args:
+        results: Mapping of chart path to audit result (see audit_charts)
+
+    Returns:
+        {'charts', 'passed', 'failed', 'targets_audited', 'targets_assured', 'coverage'}
+    """
+    audited = sum(result.get('vertices_audited', 0) for result in results.values())
+    assured = sum(result.get('vertices_assured', 0) for result in results.values())
+    passed = sum(1 for result in results.values() if result['status'] == 'PASS')
+    return {
+        'charts': len(results),
+        'passed': passed,
+        'failed': len(results) - passed,
+        'targets_audited': audited,
+        'targets_assured': assured,
+        'coverage': (assured / audited * 100) if audited > 0 else 0,
+    }
+
+
+def format_coverage_report(results: dict, root_path: Path = None) -> str:
+    """
+    Format the results of a batch audit as one markdown coverage report.
+
+    Args:
+        results: Mapping of chart path to audit result (see audit_charts)
+        root_path: Show chart paths relative to this directory
+    """
+    summary = coverage_summary(results)
+    lines = []
+    lines.append("# Assurance Coverage Report")
+    lines.append("")
+    lines.append(f"**Charts:** {summary['charts']} audited, {summary['passed']} passed, {summary['failed']} failed")
+    lines.append(f"**Coverage:** {summary['coverage']:.1f}% ({summary['targets_assured']}/{summary['targets_audited']} audit targets)")
+    lines.append("")
+    lines.append("| Chart | File | Status | Coverage | Assured | Issues |")
+    lines.append("|-------|------|--------|----------|---------|--------|")
+
+    for chart_path, result in results.items():
+        if root_path is not None:
+            try:
+                chart_path = chart_path.resolve().relative_to(Path(root_path).resolve())
+            except ValueError:
+                pass
+        status_icon = '✅' if result['status'] == 'PASS' else '❌'
+        coverage = f"{result['coverage']:.1f}%" if 'coverage' in result else '-'
+        assured = (f"{result['vertices_assured']}/{result['vertices_audited']}"
+                   if 'vertices_audited' in result else '-')
+        lines.append(f"| `{result['chart_id']}` | {chart_path} | {status_icon} {result['status']} | "
+                     f"{coverage} | {assured} | {len(result['issues'])} |")
+    lines.append("")
+
+    failing = [result for result in results.values() if result['issues']]
+    if failing:
+        lines.append("## Issues")
+        lines.append("")
+        for result in failing:
+            lines.append(f"### {result['chart_id']}")
+            lines.append("")
+            for issue in result['issues']:
+                lines.append(f"- ❌ {issue}")
+            lines.append("")
+
+    return '\n'.join(lines)
+
+
+def report_batch(chart_paths: list, search_dirs: list = None, jobs: int = None,
+                 report_path: Path = None, json_path: Path = None, root_path: Path = None) -> bool:
+    """
+    Audit several charts, print one line per chart and write their audit trails.
+
+    Args:
+        chart_paths: Assurance audit chart markdown files
+        search_dirs: Additional directories to search for faces/edges/vertices
+        jobs: Number of worker processes (None or 1 audits in this process)
+        report_path: Write the aggregated coverage report (markdown) here
+        json_path: Write every chart's audit result and the summary (JSON) here
+        root_path: Show chart paths relative to this directory
+
+    Returns:
+        True if every audit passed
+    """
+    results = audit_charts(chart_paths, search_dirs, jobs)
+
+    for chart_path, result in results.items():
+        status_icon = '✓' if result['status'] == 'PASS' else '✗'
+        print(f"{status_icon} {result['chart_id']} ({chart_path}): {result.get('summary', result['status'])}")
+        if result['status'] != 'ERROR':
+            write_audit_trail(chart_path, result)
+
+    summary = coverage_summary(results)
+    print("")
+    print(f"{summary['passed']}/{summary['charts']} charts passed, "
+          f"{summary['coverage']:.1f}% of {summary['targets_audited']} audit targets assured")
+
+    if report_path:
+        report_path.write_text(format_coverage_report(results, root_path), encoding='utf-8')
+        print(f"✓ Coverage report written to: {report_path}")
+    if json_path:
+        data = {
+            'summary': summary,
+            'charts': {str(chart_path): result for chart_path, result in results.items()},
+        }
+        json_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        print(f"✓ Audit results written to: {json_path}")
+
+    return summary['failed'] == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Audit an assurance_audit chart for complete assurance coverage.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+    python scripts/audit_assurance_chart.py charts/chart-types-audit/chart-types-audit.md
+    python scripts/audit_assurance_chart.py chart.md --search-dir /path/to/assurance/dir
+    python scripts/audit_assurance_chart.py chart.md --search-dir dir1 --search-dir dir2
+    python scripts/audit_assurance_chart.py --changed-since origin/main
+    python scripts/audit_assurance_chart.py --all --report coverage.md --json coverage.json
+        '''
+    )
+    parser.add_argument('chart', type=Path, nargs='?', help='Path to the assurance audit chart markdown file')
+    parser.add_argument(
+        '--search-dir', '-s',
+        action='append',
+        dest='search_dirs',
+        metavar='DIR',
+        help='Additional directory to search for faces/edges/vertices. Can be specified multiple times.'
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Audit every assurance_audit chart under <root>/charts/ in one run'
+    )
+    parser.add_argument(
+        '--changed-since',
+        metavar='REV',
+        help='Audit every assurance_audit chart affected by changes since a git revision '
+             '(see invalidation.py)'
+    )
+    parser.add_argument(
+        '--root',
+        type=Path,
+        default=Path.cwd(),
+        help='Repository root for --all and --changed-since (default: current directory)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Audit charts across N worker processes with --all or --changed-since'
+    )
+    parser.add_argument(
+        '--report',
+        type=Path,
+        metavar='FILE',
+        help='With --all or --changed-since, write an aggregated coverage report (markdown)'
+    )
+    parser.add_argument(
+        '--json',
+        type=Path,
+        metavar='FILE',
+        help='With --all or --changed-since, write every audit result as JSON'
+    )
+
+    args = parser.parse_args()
+
+    search_dirs = args.search_dirs or []
+
+    if args.all or args.changed_since:
+        if args.changed_since:
+            try:
+                tasks = tasks_changed_since(args.root, args.changed_since, 'audit')
+            except InvalidationError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            chart_paths = [args.root / task.file for task in tasks]
+            print(f"{len(chart_paths)} audit chart(s) affected since {args.changed_since}")
+        else:
+            chart_paths = find_audit_charts(args.root)
+            print(f"{len(chart_paths)} audit chart(s) found")
+        print("")
+        passed = report_batch(chart_paths, search_dirs, args.jobs, args.report, args.json, args.root)
+        sys.exit(0 if passed else 1)
+
+    if args.chart is None:
+        parser.error('a chart path is required unless --all or --changed-since is given')
+
+    chart_path = args.chart
+
+    if not chart_path.exists():
+        print(f"Error: Chart file not found: {chart_path}")
+        sys.exit(1)
+
+    sys.exit(0 if report_audit(chart_path, search_dirs) else 1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,134 @@
+"""
+Benchmark face-target resolution in audit_assurance_chart.
+
+Generates a synthetic assurance_audit chart whose documents are each
+assured by one face file with an explicit target, then times:
+
+  - per-face reads: loading every face's frontmatter through load_element
+    (what the audit did before FaceMetadata)
+  - a cold audit: no complex.json, each face file read once
+  - an audit with a fresh complex.json: face metadata from the build cache
+  - a repeated audit in the same process: the table is reused (one stat
+    per face)
+
+The element index is warmed first so only face resolution is compared.
+"""
+
+import argparse
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import audit_assurance_chart
+from audit_assurance_chart import audit_assurance_chart as run_audit, load_element
+from build_cache import build_cache
+from element_index import get_element_index
+
+
+def write_synthetic_audit(root_path: Path, n_faces: int) -> Path:
+    """
+    Write n_faces document vertices, one assurance face per document and an
+    assurance_audit chart over them.
+
+    Args:
+        root_path: Directory to write 00_vertices, 02_faces and charts into
+        n_faces: Number of documents and assurance faces
+
+    Returns:
+        Path to the chart file
+    """
+    vertices_dir = root_path / '00_vertices'
+    faces_dir = root_path / '02_faces'
+    chart_dir = root_path / 'charts' / 'synthetic-audit'
+    for directory in (vertices_dir, faces_dir, chart_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    for i in range(n_faces):
+        (vertices_dir / f"doc-{i}.md").write_text(
+            f"---\ntype: vertex/doc\nextends: doc\nid: v:doc:syn-{i}\n"
+            f"name: Synthetic Document {i}\ntags:\n  - vertex\n  - doc\n"
+            f"version: 1.0.0\n---\n\n# Synthetic Document {i}\n",
+            encoding='utf-8'
+        )
+        (faces_dir / f"assurance-syn-{i}.md").write_text(
+            f"---\ntype: face/assurance\nextends: face\nid: f:assurance:syn-{i}\n"
+            f"name: Synthetic Assurance {i}\ntarget: v:doc:syn-{i}\n"
+            f"validation_edge: e:validation:syn-{i}\n"
+            f"vertices:\n  - v:doc:syn-{i}\n  - v:spec:syn\n  - v:guidance:syn\n"
+            f"edges:\n  - e:verification:syn-{i}\n  - e:validation:syn-{i}\n  - e:coupling:syn\n"
+            f"orientation: oriented\ntags:\n  - face\n  - assurance\n"
+            f"version: 1.0.0\n---\n",
+            encoding='utf-8'
+        )
+
+    vertices = '\n'.join(f"    - v:doc:syn-{i}" for i in range(n_faces))
+    faces = '\n'.join(f"    - f:assurance:syn-{i}" for i in range(n_faces))
+    chart_path = chart_dir / 'synthetic-audit.md'
+    chart_path.write_text(
+        f"---\ntype: chart/assurance_audit\nextends: chart\nid: c:synthetic-audit\n"
+        f"name: Synthetic Audit\ntags:\n  - chart\nversion: 1.0.0\n"
+        f"assurance_requirements:\n  requires_boundary_anchoring: false\n"
+        f"elements:\n  vertices:\n{vertices}\n  edges: []\n  faces:\n{faces}\n---\n",
+        encoding='utf-8'
+    )
+    return chart_path
+
+
+def timed(function, *args) -> tuple:
+    """Call function and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Command-line interface for the audit benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark face-target resolution in audit_assurance_chart'
+    )
+    parser.add_argument(
+        '--faces',
+        type=int,
+        default=10000,
+        help='Number of synthetic assurance faces (default: 10000)'
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root_path = Path(tmp)
+        print(f"Writing synthetic audit chart ({args.faces} faces)...")
+        chart_path = write_synthetic_audit(root_path, args.faces)
+        face_ids = [f"f:assurance:syn-{i}" for i in range(args.faces)]
+        index = get_element_index(root_path)
+
+        _, per_face = timed(lambda: [load_element(face_id, root_path, index=index) for face_id in face_ids])
+
+        audit_assurance_chart._face_metadata.clear()
+        cold_result, cold = timed(run_audit, chart_path)
+
+        with redirect_stdout(StringIO()):
+            build_cache(root_path)
+        audit_assurance_chart._face_metadata.clear()
+        cached_result, cached = timed(run_audit, chart_path)
+
+        warm_result, warm = timed(run_audit, chart_path)
+
+    results = [cold_result, cached_result, warm_result]
+    consistent = all(
+        result['status'] == 'PASS' and result['vertices_assured'] == args.faces
+        for result in results
+    )
+
+    print(f"Per-face reads (load_element):  {per_face:8.3f}s")
+    print(f"Audit, no complex.json:         {cold:8.3f}s")
+    print(f"Audit, fresh complex.json:      {cached:8.3f}s")
+    print(f"Audit, repeated in process:     {warm:8.3f}s")
+    print(f"All audits PASS with coverage:  {'yes' if consistent else 'NO'}")
+
+    return 0 if consistent else 1
+
+
+if __name__ == '__main__':
+    exit(main())
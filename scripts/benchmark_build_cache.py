@@ -0,0 +1,132 @@
+"""
+Benchmark cold vs. incremental complex.json builds.
+
+Generates a synthetic complex (a triangulated strip of vertices, edges and
+faces) in a temporary directory, runs a full build, changes one vertex
+file, and times an incremental rebuild against a second full rebuild.
+"""
+
+import argparse
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from build_cache import build_cache
+
+
+def write_synthetic_complex(root_path: Path, n_elements: int) -> None:
+    """
+    Write a synthetic complex of roughly n_elements element files.
+
+    Vertex i is joined to vertices i+1 and i+2, and every consecutive
+    triple (i, i+1, i+2) is filled by a face, giving ~4 elements per vertex.
+
+    Args:
+        root_path: Directory to write 00_vertices, 01_edges, 02_faces into
+        n_elements: Approximate total number of elements
+    """
+    vertices_dir = root_path / '00_vertices'
+    edges_dir = root_path / '01_edges'
+    faces_dir = root_path / '02_faces'
+    for directory in (vertices_dir, edges_dir, faces_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    n_vertices = max(3, n_elements // 4)
+
+    def edge_id(i: int, j: int) -> str:
+        return f"e:syn:{i}:{j}"
+
+    for i in range(n_vertices):
+        (vertices_dir / f"syn-{i}.md").write_text(
+            f"---\ntype: vertex/doc\nextends: doc\nid: v:syn:{i}\n"
+            f"name: Synthetic Vertex {i}\ntags:\n  - vertex\n  - doc\n"
+            f"version: 1.0.0\n---\n\n# Synthetic Vertex {i}\n\nBody text.\n",
+            encoding='utf-8'
+        )
+
+    for i in range(n_vertices):
+        for j in (i + 1, i + 2):
+            if j >= n_vertices:
+                continue
+            (edges_dir / f"syn-{i}-{j}.md").write_text(
+                f"---\ntype: edge/dependency\nextends: edge\nid: {edge_id(i, j)}\n"
+                f"name: Synthetic Edge {i}-{j}\nsource: v:syn:{i}\ntarget: v:syn:{j}\n"
+                f"source_type: vertex/doc\ntarget_type: vertex/doc\n"
+                f"orientation: directed\ntags:\n  - edge\n  - dependency\n"
+                f"version: 1.0.0\n---\n",
+                encoding='utf-8'
+            )
+
+    for i in range(n_vertices - 2):
+        (faces_dir / f"syn-{i}.md").write_text(
+            f"---\ntype: face/assurance\nextends: face\nid: f:syn:{i}\n"
+            f"name: Synthetic Face {i}\n"
+            f"vertices:\n  - v:syn:{i}\n  - v:syn:{i + 1}\n  - v:syn:{i + 2}\n"
+            f"edges:\n  - {edge_id(i, i + 1)}\n  - {edge_id(i + 1, i + 2)}\n"
+            f"  - {edge_id(i, i + 2)}\n"
+            f"orientation: oriented\ntags:\n  - face\n  - assurance\n"
+            f"version: 1.0.0\n---\n",
+            encoding='utf-8'
+        )
+
+
+def timed_build(root_path: Path, output_path: Path, incremental: bool = False) -> float:
+    """Run build_cache quietly and return elapsed seconds."""
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        build_cache(root_path, output_path, incremental=incremental)
+    return time.perf_counter() - start
+
+
+def strip_generated(text: str) -> str:
+    """Drop the 'generated' timestamp line so builds can be compared."""
+    return '\n'.join(line for line in text.splitlines() if '"generated"' not in line)
+
+
+def main():
+    """Command-line interface for the build benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark cold vs. incremental complex.json builds'
+    )
+    parser.add_argument(
+        '--elements',
+        type=int,
+        default=50000,
+        help='Approximate number of synthetic elements (default: 50000)'
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root_path = Path(tmp)
+        print(f"Writing synthetic complex (~{args.elements} elements)...")
+        write_synthetic_complex(root_path, args.elements)
+
+        cache_path = root_path / 'complex.json'
+        cold = timed_build(root_path, cache_path)
+
+        changed = root_path / '00_vertices' / 'syn-0.md'
+        changed.write_text(
+            changed.read_text(encoding='utf-8').replace('Synthetic Vertex 0', 'Changed Vertex 0'),
+            encoding='utf-8'
+        )
+
+        incremental = timed_build(root_path, cache_path, incremental=True)
+        full_path = root_path / 'full.json'
+        full = timed_build(root_path, full_path)
+
+        identical = strip_generated(cache_path.read_text(encoding='utf-8')) == \
+            strip_generated(full_path.read_text(encoding='utf-8'))
+
+    print(f"Cold build:                    {cold:8.3f}s")
+    print(f"Incremental (1 file changed):  {incremental:8.3f}s")
+    print(f"Full rebuild (1 file changed): {full:8.3f}s")
+    print(f"Speedup vs. full rebuild:      {full / incremental:8.1f}x")
+    print(f"Output identical to full:      {'yes' if identical else 'NO'}")
+
+    return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    exit(main())
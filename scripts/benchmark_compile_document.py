@@ -0,0 +1,116 @@
+"""
+Benchmark embed expansion in compile_document on a synthetic paper.
+
+Builds a paper in the shape of the INCOSE paper builds: a root document
+embedding every section, each section embedding a few subsections and a
+set of shared snippets (definitions, notices) that recur throughout. Times:
+
+  - multi-pass: the original expansion, re-running the embed regex over the
+    whole growing document until no embeds remain, resolving and reading
+    the embedded file at every occurrence
+  - single pass: compile_document (EmbedExpander streaming to disk)
+
+The two outputs are checked to be identical.
+"""
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from compile_document import (
+    compile_document,
+    extract_content_without_frontmatter,
+    resolve_embed_path,
+)
+
+EMBED_PATTERN = re.compile(r'!\[\[([^\]]+)\]\]')
+
+
+def multipass(source_path: Path, output_path: Path, base_dir: Path) -> None:
+    """Original strategy: repeated whole-document substitution passes."""
+    def expand_embed(match: re.Match) -> str:
+        embed_path = resolve_embed_path(match.group(1), base_dir)
+        return extract_content_without_frontmatter(embed_path).rstrip('\n')
+
+    compiled_content = source_path.read_text(encoding='utf-8')
+    iteration = 0
+    while EMBED_PATTERN.search(compiled_content) and iteration < 100:
+        compiled_content = EMBED_PATTERN.sub(expand_embed, compiled_content)
+        iteration += 1
+    output_path.write_text(compiled_content, encoding='utf-8')
+
+
+def write_paper(base_dir: Path, sections: int, subsections: int, snippets: int) -> Path:
+    """Write a synthetic paper and return its root document."""
+    base_dir.mkdir(parents=True)
+    frontmatter = "---\ntype: vertex/doc\nid: v:doc:{name}\n---\n\n"
+    paragraph = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8 + "\n\n"
+
+    for snippet in range(snippets):
+        name = f"snippet-{snippet}"
+        (base_dir / f"{name}.md").write_text(
+            frontmatter.format(name=name) + f"**Snippet {snippet}.** " + paragraph,
+            encoding='utf-8'
+        )
+
+    root = [frontmatter.format(name='paper'), "# Paper\n\n"]
+    for section in range(sections):
+        section_body = [frontmatter.format(name=f"section-{section}"), f"## Section {section}\n\n"]
+        for subsection in range(subsections):
+            name = f"subsection-{section}-{subsection}"
+            body = [frontmatter.format(name=name), f"### Subsection {section}.{subsection}\n\n", paragraph]
+            body.extend(f"![[snippet-{(section + subsection + k) % snippets}]]\n\n" for k in range(3))
+            (base_dir / f"{name}.md").write_text(''.join(body), encoding='utf-8')
+            section_body.append(f"![[{name}]]\n\n{paragraph}")
+        (base_dir / f"section-{section}.md").write_text(''.join(section_body), encoding='utf-8')
+        root.append(f"![[section-{section}]]\n\n")
+
+    root_path = base_dir / "paper.md"
+    root_path.write_text(''.join(root), encoding='utf-8')
+    return root_path
+
+
+def timed(function, *args) -> float:
+    """Call function and return elapsed seconds."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Command-line interface for the embed expansion benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark compile_document embed expansion on a synthetic paper'
+    )
+    parser.add_argument('--sections', type=int, default=40,
+                        help='Sections embedded by the root document (default: 40)')
+    parser.add_argument('--subsections', type=int, default=10,
+                        help='Subsections embedded by each section (default: 10)')
+    parser.add_argument('--snippets', type=int, default=20,
+                        help='Shared snippets embedded throughout (default: 20)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = Path(tmp) / '00_vertices'
+        root_path = write_paper(base_dir, args.sections, args.subsections, args.snippets)
+        multipass_output = Path(tmp) / 'multipass.md'
+        single_output = Path(tmp) / 'single.md'
+
+        old = timed(multipass, root_path, multipass_output, base_dir)
+        new = timed(compile_document, root_path, single_output, base_dir)
+
+        size = single_output.stat().st_size
+        consistent = multipass_output.read_bytes() == single_output.read_bytes()
+
+    print(f"Compiled size:                  {size / 1e6:8.2f} MB")
+    print(f"Multi-pass expansion:           {old:8.3f}s")
+    print(f"Single-pass expansion:          {new:8.3f}s")
+    print(f"Outputs identical:              {'yes' if consistent else 'NO'}")
+
+    return 0 if consistent else 1
+
+
+if __name__ == '__main__':
+    exit(main())
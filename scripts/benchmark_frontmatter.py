@@ -0,0 +1,86 @@
+"""
+Microbenchmark frontmatter parsing strategies over real element files.
+
+Compares, per file in 00_vertices/ and 01_edges/:
+  - baseline:  read whole file, DOTALL regex, pure-Python yaml.safe_load
+  - csafe:     read whole file, extract_frontmatter (CSafeLoader if available)
+  - fast path: read_frontmatter (stops at the closing --- delimiter)
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import yaml
+
+from parse_chart import SafeLoader, extract_frontmatter, read_frontmatter
+
+BASELINE_PATTERN = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
+
+
+def baseline(file_path: Path):
+    """Original strategy: full read, regex, pure-Python safe_load."""
+    content = file_path.read_text(encoding='utf-8')
+    match = re.match(BASELINE_PATTERN, content, re.DOTALL)
+    return yaml.safe_load(match.group(1)) if match else None
+
+
+def csafe(file_path: Path):
+    """Full read and regex through extract_frontmatter."""
+    return extract_frontmatter(file_path.read_text(encoding='utf-8'))[0]
+
+
+def time_strategy(strategy: Callable, files: List[Path], repeat: int) -> float:
+    """Return the best per-file time in microseconds over `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for file_path in files:
+            try:
+                strategy(file_path)
+            except Exception:
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best / max(len(files), 1) * 1e6
+
+
+def main():
+    """Command-line interface for the frontmatter benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Microbenchmark frontmatter parsing over element files'
+    )
+    parser.add_argument(
+        '--root',
+        type=Path,
+        default=Path(__file__).parent.parent,
+        help='Repository root (default: parent of scripts/)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Runs per strategy; the best is reported (default: 5)'
+    )
+    args = parser.parse_args()
+
+    files = sorted((args.root / '00_vertices').glob('*.md')) + \
+        sorted((args.root / '01_edges').glob('*.md'))
+    if not files:
+        print(f"No element files found under {args.root}")
+        return 1
+
+    print(f"Files: {len(files)} ({sum(f.stat().st_size for f in files) / 1024:.0f} KB)")
+    print(f"Loader: {SafeLoader.__name__}")
+
+    base = time_strategy(baseline, files, args.repeat)
+    for name, strategy in [('baseline', baseline), ('csafe', csafe), ('fast path', read_frontmatter)]:
+        per_file = base if strategy is baseline else time_strategy(strategy, files, args.repeat)
+        print(f"  {name:10s} {per_file:9.1f} µs/file  ({base / per_file:5.1f}x)")
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
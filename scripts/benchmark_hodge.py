@@ -0,0 +1,99 @@
+"""
+Benchmark edge Laplacian assembly as charts grow from 1k to 100k edges.
+
+Builds synthetic triangulated strips (vertex i joined to i+1 and i+2, faces
+on consecutive triples) and times the boundary operators, the vectorized
+Laplacian, and the original per-row degree loop it replaced.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from hodge_analysis import ChartData, HodgeAnalyzer
+
+
+def make_strip_chart(n_edges: int) -> ChartData:
+    """
+    Build a triangulated strip chart with roughly n_edges edges.
+
+    Args:
+        n_edges: Approximate number of edges (two per vertex)
+
+    Returns:
+        ChartData for the strip
+    """
+    n_vertices = max(3, n_edges // 2 + 1)
+    vertices = [f"v:{i}" for i in range(n_vertices)]
+    edges = [
+        {'id': f"e:{i}:{j}", 'source': f"v:{i}", 'target': f"v:{j}"}
+        for i in range(n_vertices)
+        for j in (i + 1, i + 2)
+        if j < n_vertices
+    ]
+    faces = [
+        {'id': f"f:{i}", 'edges': [f"e:{i}:{i + 1}", f"e:{i + 1}:{i + 2}", f"e:{i}:{i + 2}"]}
+        for i in range(n_vertices - 2)
+    ]
+    return ChartData({
+        'chart_id': 'c:benchmark',
+        'elements': {'vertices': vertices, 'edges': edges, 'faces': faces},
+    })
+
+
+def loop_degrees(d0, d1):
+    """Original degree computation: one sparse row slice per vertex and edge."""
+    vertex_degrees = np.array([np.abs(d0[i, :]).sum() for i in range(d0.shape[0])])
+    edge_degrees = np.array([np.abs(d1[i, :]).sum() for i in range(d1.shape[0])])
+    return vertex_degrees, edge_degrees
+
+
+def timed(func, *args):
+    """Call func and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Command-line interface for the Laplacian benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark edge Laplacian assembly from 1k to 100k edges'
+    )
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[1000, 10000, 100000],
+        help='Edge counts to benchmark (default: 1000 10000 100000)'
+    )
+    parser.add_argument(
+        '--skip-loop',
+        action='store_true',
+        help='Do not time the original per-row degree loop'
+    )
+    args = parser.parse_args()
+
+    print(f"{'edges':>8s} {'d0':>8s} {'d1':>8s} {'laplacian':>10s} {'loop degrees':>13s}")
+    for size in args.sizes:
+        chart = make_strip_chart(size)
+        analyzer = HodgeAnalyzer(chart, verbose=False)
+        edge_to_index, _ = analyzer._build_edge_index()
+
+        d0, t_d0 = timed(analyzer._build_d0, edge_to_index)
+        d1, t_d1 = timed(analyzer._build_d1, edge_to_index)
+        _, t_laplacian = timed(analyzer._build_edge_laplacian, d0, d1, edge_to_index)
+
+        loop = '-'
+        if not args.skip_loop:
+            _, t_loop = timed(loop_degrees, d0, d1)
+            loop = f"{t_loop:12.3f}s"
+
+        print(f"{len(edge_to_index):8d} {t_d0:7.3f}s {t_d1:7.3f}s {t_laplacian:9.3f}s {loop:>13s}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
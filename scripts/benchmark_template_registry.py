@@ -0,0 +1,113 @@
+"""
+Benchmark template registry loading at verifier startup.
+
+Copies the repository's templates into a temporary directory (optionally
+several times over, each copy with its own type names) and times:
+
+  - parsing every template (what every TemplateBasedVerifier did before the
+    registry cache)
+  - a cold start: no registry cache, templates parsed and the cache written
+  - a warm start: templates hashed and loaded from the registry cache
+  - a warm start after editing one template: only that template is reparsed
+
+Each warm load is checked against a fresh parse.
+"""
+
+import argparse
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from template_parser import TemplateParser
+from verify_template_based import TemplateBasedVerifier
+
+
+def copy_templates(source_dir: Path, target_dir: Path, copies: int) -> None:
+    """
+    Copy source_dir's templates into target_dir copies times over.
+
+    Copy n > 0 renames each template's type (vertex/doc -> vertex/doc-n) so
+    every copy registers separately.
+    """
+    for copy in range(copies):
+        for template_file in source_dir.rglob('*.md'):
+            rel_path = template_file.relative_to(source_dir)
+            content = template_file.read_text(encoding='utf-8')
+            if copy:
+                rel_path = rel_path.with_name(f"{rel_path.stem}-{copy}.md")
+                content = re.sub(r'^(type: \S+)$', rf'\1-{copy}', content, count=1, flags=re.MULTILINE)
+            target = target_dir / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding='utf-8')
+
+
+def timed(function, *args) -> tuple:
+    """Call function and return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def parse_all(templates_dir: Path) -> TemplateParser:
+    parser = TemplateParser(templates_dir)
+    parser.load_all_templates(use_cache=False)
+    return parser
+
+
+def same_registry(loaded: TemplateParser, parsed: TemplateParser) -> bool:
+    """Check a cached load matches a fresh parse."""
+    if loaded.templates.keys() != parsed.templates.keys():
+        return False
+    return all(
+        loaded.templates[name].to_dict() == spec.to_dict()
+        and loaded.templates[name].extends_chain == spec.extends_chain
+        for name, spec in parsed.templates.items()
+    )
+
+
+def main():
+    """Command-line interface for the template registry benchmark."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark template registry loading at verifier startup'
+    )
+    parser.add_argument(
+        '--copies',
+        type=int,
+        default=20,
+        help='Number of copies of the repository templates (default: 20)'
+    )
+    args = parser.parse_args()
+
+    source_dir = Path(__file__).parent.parent / 'templates'
+    with tempfile.TemporaryDirectory() as tmp:
+        templates_dir = Path(tmp) / 'templates'
+        copy_templates(source_dir, templates_dir, args.copies)
+        n_files = sum(1 for _ in templates_dir.rglob('*.md'))
+        print(f"Loading {n_files} template files...")
+
+        parsed, parse = timed(parse_all, templates_dir)
+        _, cold = timed(TemplateBasedVerifier, templates_dir)
+        warm_verifier, warm = timed(TemplateBasedVerifier, templates_dir)
+
+        edited = next(templates_dir.rglob('validation.md'))
+        edited.write_text(edited.read_text(encoding='utf-8') + '\n', encoding='utf-8')
+        edited_verifier, one_changed = timed(TemplateBasedVerifier, templates_dir)
+
+        consistent = (
+            same_registry(warm_verifier.parser, parsed)
+            and same_registry(edited_verifier.parser, parse_all(templates_dir))
+        )
+
+    print(f"Parse every template:           {parse:8.3f}s")
+    print(f"Verifier start, no cache:       {cold:8.3f}s")
+    print(f"Verifier start, cached:         {warm:8.3f}s")
+    print(f"Verifier start, one edited:     {one_changed:8.3f}s")
+    print(f"Cached registry matches parse:  {'yes' if consistent else 'NO'}")
+
+    return 0 if consistent else 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,525 @@
+"""
+Homology of the cached complex: Betti numbers and cycle generators.
+
+Computes β₀ (connected components), β₁ (independent 1-cycles that no face
+fills) and β₂ (closed 2-cycles) for one chart or for all of complex.json,
+by reducing the boundary matrices ∂₁ (edges → vertices) and ∂₂ (faces →
+edges):
+
+    β₀ = V − rank ∂₁,   β₁ = E − rank ∂₁ − rank ∂₂,   β₂ = F − rank ∂₂
+
+Ranks are computed over two fields:
+  - GF(2): columns are bit-packed into Python integers, so adding two
+    columns is a single XOR; representative cycles come from this reduction
+  - ℝ: exact rank over ℚ, computed modulo the prime 2³¹ − 1 (boundary
+    matrices have integer entries, so this equals the real rank unless the
+    prime divides a torsion coefficient)
+
+Betti numbers that differ between the two fields indicate torsion (e.g. a
+non-orientable surface).
+
+Unlike topology.py's "holes" (unfilled triangles), β₁ counts every cycle
+that is not a boundary, including ones longer than three edges.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from cached_complex import get_complex
+from parse_chart import parse_chart, ParseError
+
+# Prime modulus for exact rank computation over ℚ
+PRIME = 2 ** 31 - 1
+
+# A GF(2) column: (base, bits) where bit i of `bits` is row base + i
+Column = Tuple[int, int]
+
+
+def _pack(rows: List[int]) -> Column:
+    """Pack row indices into a bit column (rows appearing twice cancel)."""
+    bits = 0
+    for row in rows:
+        bits ^= 1 << row
+    return _normalize(0, bits)
+
+
+def _normalize(base: int, bits: int) -> Column:
+    """Shift trailing zero bits into the base so storage spans only the support."""
+    if not bits:
+        return (0, 0)
+    shift = (bits & -bits).bit_length() - 1
+    return (base + shift, bits >> shift)
+
+
+def _xor(a: Column, b: Column) -> Column:
+    """Add two GF(2) columns."""
+    base = min(a[0], b[0])
+    return _normalize(base, (a[1] << (a[0] - base)) ^ (b[1] << (b[0] - base)))
+
+
+def _low(column: Column) -> int:
+    """Index of the lowest (largest) nonzero row of a nonempty column."""
+    return column[0] + column[1].bit_length() - 1
+
+
+def _unpack(column: Column) -> List[int]:
+    """Row indices of a bit column in increasing order."""
+    base, bits = column
+    rows = []
+    while bits:
+        low_bit = bits & -bits
+        rows.append(base + low_bit.bit_length() - 1)
+        bits ^= low_bit
+    return rows
+
+
+def reduce_gf2(
+    columns: List[List[int]],
+    skip: Set[int] = frozenset(),
+    track: bool = False
+) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
+    """
+    Column-reduce a boundary matrix over GF(2).
+
+    Each column is repeatedly added to the earlier column sharing its lowest
+    row until its lowest row is unique or it vanishes.
+
+    Args:
+        columns: Row indices of each column's nonzero entries
+        skip: Columns known to reduce to zero (cleared), left unreduced
+        track: Record which original columns sum to each zero column
+
+    Returns:
+        Tuple of (pivots, cycles):
+            - pivots: lowest row -> column index, one per independent column
+            - cycles: zero column -> sorted column indices summing to zero
+              (only when track is True)
+    """
+    pivots: Dict[int, int] = {}
+    reduced: Dict[int, Column] = {}
+    chains: Dict[int, Column] = {}
+    cycles: Dict[int, List[int]] = {}
+
+    for j, rows in enumerate(columns):
+        if j in skip:
+            continue
+        column = _pack(rows)
+        chain = (j, 1) if track else None
+        while column[1]:
+            k = pivots.get(_low(column))
+            if k is None:
+                break
+            column = _xor(column, reduced[k])
+            if track:
+                chain = _xor(chain, chains[k])
+        if column[1]:
+            pivots[_low(column)] = j
+            reduced[j] = column
+            if track:
+                chains[j] = chain
+        elif track:
+            cycles[j] = _unpack(chain)
+
+    return pivots, cycles
+
+
+def rank_mod_p(
+    columns: List[List[Tuple[int, int]]],
+    skip: Set[int] = frozenset(),
+    prime: int = PRIME
+) -> Dict[int, int]:
+    """
+    Column-reduce an integer matrix modulo a prime.
+
+    Args:
+        columns: (row, coefficient) entries of each column
+        skip: Columns known to reduce to zero (cleared), left unreduced
+        prime: Field modulus
+
+    Returns:
+        pivots: lowest row -> column index, one per independent column
+    """
+    pivots: Dict[int, int] = {}
+    reduced: Dict[int, Dict[int, int]] = {}
+
+    for j, entries in enumerate(columns):
+        if j in skip:
+            continue
+        column: Dict[int, int] = {}
+        for row, coeff in entries:
+            column[row] = (column.get(row, 0) + coeff) % prime
+        column = {row: coeff for row, coeff in column.items() if coeff}
+
+        while column:
+            low = max(column)
+            k = pivots.get(low)
+            if k is None:
+                break
+            # Reduced columns are scaled so their lowest entry is 1
+            factor = column[low]
+            for row, coeff in reduced[k].items():
+                value = (column.get(row, 0) - factor * coeff) % prime
+                if value:
+                    column[row] = value
+                else:
+                    column.pop(row, None)
+
+        if column:
+            low = max(column)
+            inverse = pow(column[low], prime - 2, prime)
+            pivots[low] = j
+            reduced[j] = {row: coeff * inverse % prime for row, coeff in column.items()}
+
+    return pivots
+
+
+def orient_face(
+    face_edges: List[str],
+    edges: Dict[str, Tuple[str, str]]
+) -> Optional[List[Tuple[str, int]]]:
+    """
+    Orient a face's boundary edges as a closed walk.
+
+    The first edge keeps its direction; each following edge gets +1 if it
+    leaves the vertex the walk has reached and -1 if it enters it, so the
+    signed sum of the boundary has zero boundary (∂₁∂₂ = 0).
+
+    Args:
+        face_edges: Boundary edge IDs of the face
+        edges: Edge ID -> (source, target)
+
+    Returns:
+        List of (edge_id, sign), or None if the edges do not form a closed walk
+    """
+    if not face_edges or any(edge_id not in edges for edge_id in face_edges):
+        return None
+
+    first = face_edges[0]
+    start, head = edges[first]
+    oriented = [(first, 1)]
+    remaining = list(face_edges[1:])
+
+    while remaining:
+        for i, edge_id in enumerate(remaining):
+            source, target = edges[edge_id]
+            if source == head:
+                oriented.append((edge_id, 1))
+                head = target
+                break
+            if target == head:
+                oriented.append((edge_id, -1))
+                head = source
+                break
+        else:
+            return None
+        del remaining[i]
+
+    return oriented if head == start else None
+
+
+def build_complex(
+    elements: Dict[str, Any],
+    vertex_ids: List[str],
+    edge_ids: List[str],
+    face_ids: List[str]
+) -> Dict[str, Any]:
+    """
+    Assemble the simplicial closure of a set of elements.
+
+    Edges pull in their endpoint vertices and faces their boundary edges,
+    so the result is closed under taking boundaries even when a chart lists
+    only some of them.
+
+    Args:
+        elements: complex.json 'elements' mapping
+        vertex_ids: Vertex IDs to include
+        edge_ids: Edge IDs to include
+        face_ids: Face IDs to include
+
+    Returns:
+        Dictionary with:
+            - vertices, edges, faces: ordered simplex IDs
+            - edge_boundary: edge ID -> (source, target)
+            - face_boundary: face ID -> [(edge_id, sign)]
+            - added: IDs pulled in by closure
+            - missing: referenced IDs that are not in complex.json
+            - invalid_faces: faces whose edges do not form a closed walk
+    """
+    cached_edges = elements.get('edges', {})
+    cached_faces = elements.get('faces', {})
+
+    vertices = dict.fromkeys(vertex_ids)
+    edges = dict.fromkeys(e for e in edge_ids if e in cached_edges)
+    faces = dict.fromkeys(f for f in face_ids if f in cached_faces)
+    missing = [v for v in vertex_ids if v not in elements.get('vertices', {})] + \
+        [e for e in edge_ids if e not in cached_edges] + \
+        [f for f in face_ids if f not in cached_faces]
+    added = []
+
+    # Close faces under their boundary edges
+    for face_id in faces:
+        for edge_id in cached_faces[face_id].get('edges', []):
+            if edge_id in edges:
+                continue
+            if edge_id in cached_edges:
+                edges[edge_id] = None
+                added.append(edge_id)
+            elif edge_id not in missing:
+                missing.append(edge_id)
+
+    # Close edges under their endpoints
+    edge_boundary = {}
+    for edge_id in edges:
+        source = cached_edges[edge_id].get('source', '')
+        target = cached_edges[edge_id].get('target', '')
+        edge_boundary[edge_id] = (source, target)
+        for vertex_id in (source, target):
+            if vertex_id not in vertices:
+                vertices[vertex_id] = None
+                added.append(vertex_id)
+                if vertex_id not in elements.get('vertices', {}):
+                    missing.append(vertex_id)
+
+    face_boundary = {}
+    invalid_faces = []
+    for face_id in faces:
+        oriented = orient_face(cached_faces[face_id].get('edges', []), edge_boundary)
+        if oriented is None:
+            invalid_faces.append(face_id)
+            oriented = [
+                (edge_id, 1) for edge_id in cached_faces[face_id].get('edges', [])
+                if edge_id in edge_boundary
+            ]
+        face_boundary[face_id] = oriented
+
+    return {
+        'vertices': list(vertices),
+        'edges': list(edges),
+        'faces': list(faces),
+        'edge_boundary': edge_boundary,
+        'face_boundary': face_boundary,
+        'added': added,
+        'missing': missing,
+        'invalid_faces': invalid_faces,
+    }
+
+
+def compute_homology(complex_data: Dict[str, Any], generators: bool = True) -> Dict[str, Any]:
+    """
+    Compute Betti numbers over GF(2) and ℝ, and GF(2) cycle generators.
+
+    Higher dimensions are reduced first so their pivots clear columns of the
+    lower boundary matrix (a cleared edge bounds a face, so its ∂₁ column
+    would reduce to zero anyway).
+
+    Args:
+        complex_data: Result of build_complex()
+        generators: Also return representative cycles
+
+    Returns:
+        Dictionary with:
+            - statistics: simplex counts and Euler characteristic
+            - gf2, real: {'ranks': {'d1', 'd2'}, 'betti': [β₀, β₁, β₂]}
+            - generators: {'0': [[vertex]], '1': [[edges]], '2': [[faces]]}
+    """
+    vertices = complex_data['vertices']
+    edges = complex_data['edges']
+    faces = complex_data['faces']
+
+    vertex_index = {v: i for i, v in enumerate(vertices)}
+    edge_index = {e: i for i, e in enumerate(edges)}
+
+    d1 = [
+        [(vertex_index[source], -1), (vertex_index[target], 1)]
+        for source, target in (complex_data['edge_boundary'][e] for e in edges)
+    ]
+    d2 = [
+        [(edge_index[edge_id], sign) for edge_id, sign in complex_data['face_boundary'][f]]
+        for f in faces
+    ]
+
+    V, E, F = len(vertices), len(edges), len(faces)
+    results: Dict[str, Any] = {
+        'statistics': {
+            'vertices': V,
+            'edges': E,
+            'faces': F,
+            'euler_characteristic': V - E + F,
+        }
+    }
+
+    # GF(2)
+    d2_pivots, face_cycles = reduce_gf2(
+        [[row for row, _ in column] for column in d2], track=generators
+    )
+    d1_pivots, edge_cycles = reduce_gf2(
+        [[row for row, _ in column] for column in d1],
+        skip=set(d2_pivots), track=generators
+    )
+    rank_d1, rank_d2 = len(d1_pivots), len(d2_pivots)
+    results['gf2'] = {
+        'ranks': {'d1': rank_d1, 'd2': rank_d2},
+        'betti': [V - rank_d1, E - rank_d1 - rank_d2, F - rank_d2],
+    }
+
+    # ℝ (exact over ℚ, modulo a large prime)
+    d2_pivots_real = rank_mod_p(d2)
+    d1_pivots_real = rank_mod_p(d1, skip=set(d2_pivots_real))
+    rank_d1, rank_d2 = len(d1_pivots_real), len(d2_pivots_real)
+    results['real'] = {
+        'ranks': {'d1': rank_d1, 'd2': rank_d2},
+        'betti': [V - rank_d1, E - rank_d1 - rank_d2, F - rank_d2],
+    }
+
+    if generators:
+        # A vertex that is never the lowest row of a reduced edge starts a component
+        results['generators'] = {
+            '0': [[vertices[i]] for i in range(V) if i not in d1_pivots],
+            '1': [[edges[i] for i in cycle] for cycle in edge_cycles.values()],
+            '2': [[faces[i] for i in cycle] for cycle in face_cycles.values()],
+        }
+
+    return results
+
+
+def betti_numbers(
+    cache: Dict[str, Any],
+    chart: Optional[Dict[str, Any]] = None,
+    generators: bool = True
+) -> Dict[str, Any]:
+    """
+    Compute homology for a chart or for the whole cached complex.
+
+    Args:
+        cache: Loaded complex.json
+        chart: Chart dict with 'elements' (default: every cached element)
+        generators: Also return representative cycles
+
+    Returns:
+        compute_homology() results plus 'scope' and closure diagnostics
+    """
+    elements = cache['elements']
+    if chart is None:
+        scope = 'complex'
+        chart_elements = {
+            'vertices': list(elements.get('vertices', {})),
+            'edges': list(elements.get('edges', {})),
+            'faces': list(elements.get('faces', {})),
+        }
+    else:
+        scope = chart.get('id', 'unknown')
+        chart_elements = chart.get('elements', {})
+
+    complex_data = build_complex(
+        elements,
+        chart_elements.get('vertices', []),
+        chart_elements.get('edges', []),
+        chart_elements.get('faces', [])
+    )
+
+    results = {'scope': scope}
+    results.update(compute_homology(complex_data, generators=generators))
+    results['added'] = complex_data['added']
+    results['missing'] = complex_data['missing']
+    results['invalid_faces'] = complex_data['invalid_faces']
+    return results
+
+
+def main():
+    """Command-line interface for Betti numbers."""
+    parser = argparse.ArgumentParser(
+        description='Compute Betti numbers and cycle generators of a chart or the whole complex'
+    )
+    parser.add_argument(
+        'chart',
+        nargs='?',
+        help='Chart ID or chart markdown file (default: whole complex.json)'
+    )
+    parser.add_argument(
+        '--root',
+        type=Path,
+        default=Path.cwd(),
+        help='Directory containing complex.json (default: current directory)'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Output as JSON instead of human-readable format'
+    )
+    parser.add_argument(
+        '--no-generators',
+        action='store_true',
+        help='Skip computing representative cycles'
+    )
+    parser.add_argument(
+        '--expect',
+        type=int,
+        nargs=3,
+        metavar=('B0', 'B1', 'B2'),
+        help='Exit with status 1 unless the real Betti numbers match (for CI)'
+    )
+    args = parser.parse_args()
+
+    try:
+        cache = get_complex(args.root)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return 1
+
+    chart = None
+    if args.chart:
+        chart_path = Path(args.chart)
+        if chart_path.suffix == '.md' and chart_path.exists():
+            try:
+                chart = parse_chart(chart_path)
+            except ParseError as e:
+                print(f"Error: Parse error: {e}")
+                return 1
+        else:
+            chart = cache['elements'].get('charts', {}).get(args.chart)
+            if chart is None:
+                print(f"Error: Chart not found in complex.json: {args.chart}")
+                return 1
+
+    results = betti_numbers(cache, chart, generators=not args.no_generators)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        stats = results['statistics']
+        print(f"\n=== Homology: {results['scope']} ===\n")
+        print(f"Vertices (V): {stats['vertices']}")
+        print(f"Edges (E):    {stats['edges']}")
+        print(f"Faces (F):    {stats['faces']}")
+        print(f"Euler characteristic: χ = {stats['euler_characteristic']}")
+        print(f"\nBetti numbers over ℝ:     β = {results['real']['betti']}")
+        print(f"Betti numbers over GF(2): β = {results['gf2']['betti']}")
+        if results['real']['betti'] != results['gf2']['betti']:
+            print("⚠️  Betti numbers differ between fields: the complex has torsion")
+
+        if results['added']:
+            print(f"\nAdded {len(results['added'])} boundary element(s) to close the complex")
+        if results['missing']:
+            print(f"⚠️  {len(results['missing'])} referenced element(s) not in complex.json")
+        if results['invalid_faces']:
+            print(f"⚠️  {len(results['invalid_faces'])} face(s) whose edges do not form a closed cycle:")
+            for face_id in results['invalid_faces']:
+                print(f"  - {face_id}")
+
+        for dim, label in [('1', '1-cycles (holes)'), ('2', '2-cycles (voids)')]:
+            cycles = results.get('generators', {}).get(dim, [])
+            if cycles:
+                print(f"\nGenerators of {label}:")
+                for i, cycle in enumerate(cycles, 1):
+                    print(f"  {i}. {' + '.join(cycle)}")
+
+    if args.expect and results['real']['betti'] != args.expect:
+        print(f"✗ Expected β = {args.expect}, got {results['real']['betti']}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
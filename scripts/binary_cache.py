@@ -0,0 +1,362 @@
+"""
+Compact, memory-mappable binary layout of the complex.json cache.
+
+complex.bin holds the same data as complex.json in a columnar layout:
+
+  - an interned string table shared by every ID, type and reference
+  - per element section (vertices, edges, faces, charts): int32 columns of
+    string indices for ``id`` and ``type``
+  - edges: int32 ``source``/``target`` columns
+  - faces: ragged int32 ``vertices``/``edges`` lists (triples for 2-simplices)
+  - charts: ragged int32 ``vertices``/``edges``/``faces`` lists
+  - per element: its full complex.json entry as a compact JSON record,
+    decoded only when that element is looked up
+
+The file is opened with mmap and columns are exposed as memoryviews, so
+tools read only the columns and records they touch. BinaryCache is a
+read-only mapping with the same shape as the loaded complex.json
+dictionary (``cache['elements']['edges'][edge_id]['source']``).
+
+Layout (little-endian):
+
+    magic    8 bytes   b'KCBIN\\x00\\x00\\x01'
+    count    uint32    number of sections
+    table    count x (name: 32 bytes, offset: uint64, length: uint64)
+    data     sections, each aligned to 8 bytes
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+MAGIC = b'KCBIN\x00\x00\x01'
+
+_HEADER = struct.Struct('<8sI')
+_ENTRY = struct.Struct('<32sQQ')
+
+# Columns of string references stored per section (ragged lists for faces/charts)
+SCALAR_COLUMNS = {
+    'vertices': ['id', 'type'],
+    'edges': ['id', 'type', 'source', 'target'],
+    'faces': ['id', 'type'],
+    'charts': ['id', 'type'],
+}
+LIST_COLUMNS = {
+    'vertices': [],
+    'edges': [],
+    'faces': ['vertices', 'edges'],
+    'charts': ['vertices', 'edges', 'faces'],
+}
+
+NO_STRING = -1
+
+
+def binary_path_for(cache_path: Path) -> Path:
+    """
+    Get the path of the binary cache stored next to complex.json.
+
+    Args:
+        cache_path: Path to complex.json
+
+    Returns:
+        Path to the binary cache (e.g. complex.bin)
+    """
+    return cache_path.with_name(f"{cache_path.stem}.bin")
+
+
+def _int_array(typecode: str, values) -> array:
+    """Build a little-endian integer array."""
+    column = array(typecode, values)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+class BinaryCacheWriter:
+    """
+    Incremental writer for the binary layout.
+
+    Elements are added one at a time; only their interned column values and
+    the position of their record in a temporary spool file are kept in
+    memory. As in a dictionary, re-adding an ID keeps its first position and
+    the latest entry.
+    """
+
+    def __init__(self, output_path: Path):
+        """
+        Args:
+            output_path: Path to complex.bin
+        """
+        self.output_path = output_path
+        self._strings: Dict[str, int] = {}
+        self._spool = tempfile.TemporaryFile()
+        # section -> element ID -> (record offset, record length, scalars, lists)
+        self._index: Dict[str, Dict[str, tuple]] = {section: {} for section in SCALAR_COLUMNS}
+
+    def _intern(self, value: Any) -> int:
+        if value is None:
+            return NO_STRING
+        value = str(value)
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def add(self, section: str, element_id: str, entry: Dict[str, Any]) -> None:
+        """
+        Add one element entry (as stored in complex.json).
+
+        Args:
+            section: 'vertices', 'edges', 'faces' or 'charts'
+            element_id: Element ID
+            entry: JSON-safe element entry
+        """
+        scalars = tuple(
+            self._intern(element_id if column == 'id' else entry.get(column))
+            for column in SCALAR_COLUMNS[section]
+        )
+
+        # Charts list their elements under 'elements'
+        source = entry.get('elements', {}) if section == 'charts' else entry
+        lists = []
+        for column in LIST_COLUMNS[section]:
+            refs = source.get(column, []) if isinstance(source, dict) else []
+            lists.append(tuple(self._intern(ref) for ref in refs) if isinstance(refs, list) else ())
+
+        record = json.dumps(entry, separators=(',', ':')).encode('utf-8')
+        offset = self._spool.seek(0, os.SEEK_END)
+        self._spool.write(record)
+        self._index[section][element_id] = (offset, len(record), scalars, tuple(lists))
+
+    def close(self, meta: Dict[str, Any]) -> None:
+        """
+        Write the file and release the spool.
+
+        The file is written to a temporary path and renamed into place, so
+        processes that have the previous file mapped keep a consistent view.
+
+        Args:
+            meta: Top-level cache fields other than 'elements'
+        """
+        # Column sections are built in memory; records are copied from the spool
+        sections: Dict[str, Any] = {'meta': json.dumps(meta).encode('utf-8')}
+        for section, index in self._index.items():
+            rows = list(index.values())
+            for i, column in enumerate(SCALAR_COLUMNS[section]):
+                sections[f"{section}.{column}"] = _int_array('i', (row[2][i] for row in rows)).tobytes()
+            for i, column in enumerate(LIST_COLUMNS[section]):
+                offsets, data = [0], array('i')
+                for row in rows:
+                    data.extend(row[3][i])
+                    offsets.append(len(data))
+                if sys.byteorder == 'big':
+                    data.byteswap()
+                sections[f"{section}.{column}.offsets"] = _int_array('I', offsets).tobytes()
+                sections[f"{section}.{column}"] = data.tobytes()
+            offsets = [0]
+            for row in rows:
+                offsets.append(offsets[-1] + row[1])
+            sections[f"{section}.records.offsets"] = _int_array('Q', offsets).tobytes()
+            sections[f"{section}.records"] = rows
+
+        encoded = [value.encode('utf-8') for value in self._strings]
+        offsets = [0]
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        sections['strings.offsets'] = _int_array('Q', offsets).tobytes()
+        sections['strings'] = b''.join(encoded)
+
+        def length(data) -> int:
+            return sum(row[1] for row in data) if isinstance(data, list) else len(data)
+
+        # Lay out sections after the header and table, 8-byte aligned
+        position = _HEADER.size + _ENTRY.size * len(sections)
+        table = []
+        for name, data in sections.items():
+            position += -position % 8
+            table.append((name, position, length(data)))
+            position += length(data)
+
+        tmp_path = self.output_path.with_name(self.output_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, len(sections)))
+            for name, offset, size in table:
+                f.write(_ENTRY.pack(name.encode('ascii'), offset, size))
+            for (name, offset, _), data in zip(table, sections.values()):
+                f.write(b'\x00' * (offset - f.tell()))
+                if isinstance(data, list):
+                    for record_offset, record_length, _, _ in data:
+                        self._spool.seek(record_offset)
+                        f.write(self._spool.read(record_length))
+                else:
+                    f.write(data)
+        os.replace(tmp_path, self.output_path)
+        self._spool.close()
+
+
+def write_binary_cache(cache: Mapping, output_path: Path) -> None:
+    """
+    Write a cache dictionary in the binary columnar layout.
+
+    Args:
+        cache: Cache dictionary (as written to complex.json)
+        output_path: Path to complex.bin
+    """
+    writer = BinaryCacheWriter(output_path)
+    for section in SCALAR_COLUMNS:
+        for element_id, entry in cache.get('elements', {}).get(section, {}).items():
+            writer.add(section, element_id, entry)
+    writer.close({key: value for key, value in cache.items() if key != 'elements'})
+
+
+class ElementTable(Mapping):
+    """One element section of a binary cache: element ID -> entry."""
+
+    def __init__(self, cache: 'BinaryCache', section: str):
+        self._cache = cache
+        self.section = section
+        self._rows: Optional[Dict[str, int]] = None
+        self._ids: Optional[List[str]] = None
+
+    @property
+    def ids(self) -> List[str]:
+        """Element IDs in file order."""
+        if self._ids is None:
+            self._ids = self.strings('id')
+        return self._ids
+
+    def _row(self, element_id: str) -> Optional[int]:
+        if self._rows is None:
+            self._rows = {element_id: row for row, element_id in enumerate(self.ids)}
+        return self._rows.get(element_id)
+
+    def column(self, name: str) -> memoryview:
+        """Raw int32 column of string indices (no decoding)."""
+        return self._cache.section(f"{self.section}.{name}", 'i')
+
+    def strings(self, name: str) -> List[Optional[str]]:
+        """Decode a scalar string column, one value per element."""
+        string = self._cache.string
+        return [string(index) for index in self.column(name)]
+
+    def lists(self, name: str) -> List[List[str]]:
+        """Decode a ragged list column, one list per element."""
+        offsets = self._cache.section(f"{self.section}.{name}.offsets", 'I')
+        data = self.column(name)
+        string = self._cache.string
+        return [
+            [string(index) for index in data[offsets[row]:offsets[row + 1]]]
+            for row in range(len(offsets) - 1)
+        ]
+
+    def __getitem__(self, element_id: str) -> Dict[str, Any]:
+        row = self._row(element_id)
+        if row is None:
+            raise KeyError(element_id)
+        offsets = self._cache.section(f"{self.section}.records.offsets", 'Q')
+        records = self._cache.section(f"{self.section}.records", 'B')
+        return json.loads(bytes(records[offsets[row]:offsets[row + 1]]))
+
+    def __contains__(self, element_id: object) -> bool:
+        return self._row(element_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.column('id'))
+
+
+class BinaryCache(Mapping):
+    """Memory-mapped binary cache with the same shape as complex.json."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Path to complex.bin
+
+        Raises:
+            ValueError: If the file is not a binary cache
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        magic, count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a binary complex cache: {path}")
+        self._sections = {}
+        for i in range(count):
+            name, offset, length = _ENTRY.unpack_from(self._buffer, _HEADER.size + i * _ENTRY.size)
+            self._sections[name.rstrip(b'\x00').decode('ascii')] = (offset, length)
+
+        self._views: Dict[str, memoryview] = {}
+        self._string_cache: Dict[int, str] = {}
+        self._meta = json.loads(bytes(self.section('meta', 'B')))
+        self._elements = {section: ElementTable(self, section) for section in SCALAR_COLUMNS}
+
+    def section(self, name: str, typecode: str) -> memoryview:
+        """
+        Get a section as a typed memoryview over the mapped file.
+
+        Args:
+            name: Section name (e.g. 'edges.source')
+            typecode: struct format of the items ('i', 'I', 'Q' or 'B')
+        """
+        view = self._views.get(name)
+        if view is None:
+            offset, length = self._sections[name]
+            view = self._buffer[offset:offset + length]
+            if typecode != 'B':
+                if sys.byteorder == 'big':
+                    swapped = array(typecode, bytes(view))
+                    swapped.byteswap()
+                    view = memoryview(swapped)
+                else:
+                    view = view.cast(typecode)
+            self._views[name] = view
+        return view
+
+    def string(self, index: int) -> Optional[str]:
+        """Look up an interned string by index."""
+        if index == NO_STRING:
+            return None
+        value = self._string_cache.get(index)
+        if value is None:
+            offsets = self.section('strings.offsets', 'Q')
+            data = self.section('strings', 'B')
+            value = str(data[offsets[index]:offsets[index + 1]], 'utf-8')
+            self._string_cache[index] = value
+        return value
+
+    def close(self) -> None:
+        """Release the memory map."""
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'elements':
+            return self._elements
+        return self._meta[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([*self._meta, 'elements'])
+
+    def __len__(self) -> int:
+        return len(self._meta) + 1
+
+
+def open_binary_cache(path: Path) -> BinaryCache:
+    """Open a binary cache file (see BinaryCache)."""
+    return BinaryCache(path)
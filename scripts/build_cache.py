@@ -2,16 +2,30 @@
 Build complex.json cache from markdown files.
 
 Scans directories for vertices, edges, faces, and charts, parses them,
-and generates a JSON cache file with all element metadata.
+and generates a JSON cache file with all element metadata, plus the same
+data in the memory-mappable binary layout (complex.bin, see binary_cache.py).
+Elements are streamed from the parser to the writers one at a time.
 """
 
+import os
 import json
+import hashlib
 import argparse
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, date, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
 
-from parse_chart import parse_directory, ParseError
+from binary_cache import BinaryCacheWriter, binary_path_for, open_binary_cache
+from cached_complex import Complex, cache_file_for, get_complex
+from parse_chart import (
+    ParseError,
+    iter_parse_files,
+    list_element_files,
+    warn_skipped_files,
+)
 
 
 def sanitize_for_json(obj: Any) -> Any:
@@ -51,16 +65,412 @@ def calculate_euler_characteristic(vertices: List, edges: List, faces: List) ->
     return len(vertices) - len(edges) + len(faces)
 
 
-def build_cache(root_path: Path, output_path: Path = None) -> Dict[str, Any]:
+CACHE_VERSION = '1.0.0'
+
+# (cache section, directory name, element type) in build order
+ELEMENT_DIRECTORIES = [
+    ('vertices', '00_vertices', 'vertex'),
+    ('edges', '01_edges', 'edge'),
+    ('faces', '02_faces', 'face'),
+    ('charts', 'charts', 'chart'),
+]
+
+
+def manifest_path_for(output_path: Path) -> Path:
+    """
+    Get the path of the build manifest stored next to a cache file.
+
+    The manifest records per-file mtime/size/SHA-256 fingerprints so that
+    incremental builds can tell which element files changed.
+
+    Args:
+        output_path: Path to complex.json
+
+    Returns:
+        Path to the manifest (e.g. complex.manifest.json)
+    """
+    return output_path.with_name(f"{output_path.stem}.manifest.json")
+
+
+def fingerprint_file(file_path: Path) -> Dict[str, Any]:
+    """
+    Fingerprint a file by modification time, size and content hash.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Dictionary with mtime_ns, size and sha256 keys
+    """
+    stat = file_path.stat()
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': hashlib.sha256(file_path.read_bytes()).hexdigest(),
+    }
+
+
+def is_unchanged(file_path: Path, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Check a file against its manifest record.
+
+    Matching mtime and size are trusted without reading the file; otherwise
+    the content hash decides (e.g. after a fresh checkout touches mtimes).
+
+    Args:
+        file_path: Path to file
+        record: Manifest record with mtime_ns, size and sha256
+
+    Returns:
+        Updated record if the file is unchanged, None if it changed
+    """
+    stat = file_path.stat()
+    if stat.st_mtime_ns == record['mtime_ns'] and stat.st_size == record['size']:
+        return record
+
+    fingerprint = fingerprint_file(file_path)
+    if fingerprint['sha256'] != record['sha256']:
+        return None
+    return {**record, **fingerprint}
+
+
+def cache_entry(element: Dict[str, Any], root_path: Path) -> Dict[str, Any]:
+    """
+    Convert a parsed element into its complex.json entry.
+
+    Args:
+        element: Parsed element dictionary (from parse_chart)
+        root_path: Root directory the file path is made relative to
+
+    Returns:
+        JSON-safe element metadata without the markdown body
+    """
+    entry = element.copy()
+    # Make file path relative to root
+    entry['file'] = str(Path(element['file']).relative_to(root_path))
+    # Remove body from cache (keep only metadata)
+    entry.pop('body', None)
+    # Sanitize for JSON serialization
+    return sanitize_for_json(entry)
+
+
+class CacheWriter:
+    """
+    Incremental writer for complex.json (and optionally complex.bin).
+
+    Entries are added one at a time, section by section in ELEMENT_DIRECTORIES
+    order, and written out as each section completes, so only one section's
+    (body-free) entries are buffered, in a temporary spool file rather than
+    in memory. The text is identical to ``json.dumps(cache, indent=2)`` of
+    the assembled cache dictionary, including dictionary semantics for
+    duplicate IDs: the first position is kept with the last entry.
+    """
+
+    def __init__(self, output_path: Path, binary_path: Optional[Path] = None):
+        """
+        Args:
+            output_path: Path to complex.json
+            binary_path: Also write the binary cache to this path (optional)
+        """
+        self.output_path = output_path
+        self._tmp_path = output_path.with_name(output_path.name + '.tmp')
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._binary = BinaryCacheWriter(binary_path) if binary_path is not None else None
+        self.meta = {
+            'version': CACHE_VERSION,
+            'generated': datetime.now(timezone.utc).isoformat(),
+            'root_path': '.',
+        }
+        self.counts = {section: 0 for section, _, _ in ELEMENT_DIRECTORIES}
+        self._sections = iter(self.counts)
+        self._section = None
+        self._spool = None
+        # Element ID -> (offset, length) of its latest entry in the spool
+        self._index: Dict[str, tuple[int, int]] = {}
+
+        for key, value in self.meta.items():
+            self._file.write(f'{"{" if key == "version" else ","}\n  {json.dumps(key)}: {json.dumps(value)}')
+        self._file.write(',\n  "elements": {')
+
+    def _start_section(self, section: str) -> None:
+        """Flush the current section and every empty one up to ``section``."""
+        while self._section != section:
+            self._flush_section()
+            self._section = next(self._sections)
+            self._spool = tempfile.TemporaryFile()
+            self._index = {}
+
+    def _flush_section(self) -> None:
+        if self._section is None:
+            return
+        prefix = '' if self._section == 'vertices' else ','
+        self._file.write(f'{prefix}\n    {json.dumps(self._section)}: ')
+        if not self._index:
+            self._file.write('{}')
+        else:
+            separator = '{'
+            for element_id, (offset, length) in self._index.items():
+                self._spool.seek(offset)
+                entry = self._spool.read(length).decode('utf-8')
+                self._file.write(f'{separator}\n      {json.dumps(element_id)}: {entry}')
+                separator = ','
+            self._file.write('\n    }')
+        self._spool.close()
+
+    def add(self, section: str, entry: Dict[str, Any]) -> None:
+        """
+        Add one element entry.
+
+        Args:
+            section: Cache section ('vertices', 'edges', 'faces' or 'charts')
+            entry: JSON-safe element entry (see cache_entry)
+        """
+        if section != self._section:
+            self._start_section(section)
+        self.counts[section] += 1
+
+        text = json.dumps(entry, indent=2).replace('\n', '\n      ').encode('utf-8')
+        offset = self._spool.seek(0, os.SEEK_END)
+        self._spool.write(text)
+        self._index[entry['id']] = (offset, len(text))
+        if self._binary is not None:
+            self._binary.add(section, entry['id'], entry)
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Element counts (duplicate IDs included) and the Euler characteristic."""
+        return {
+            'vertex_count': self.counts['vertices'],
+            'edge_count': self.counts['edges'],
+            'face_count': self.counts['faces'],
+            'chart_count': self.counts['charts'],
+            'euler_characteristic':
+                self.counts['vertices'] - self.counts['edges'] + self.counts['faces'],
+        }
+
+    def close(self) -> None:
+        """Finish writing and move the files into place."""
+        self._start_section(ELEMENT_DIRECTORIES[-1][0])
+        self._flush_section()
+        statistics = json.dumps(self.statistics, indent=2).replace('\n', '\n  ')
+        self._file.write(f'\n  }},\n  "statistics": {statistics}\n}}')
+        self._file.close()
+        os.replace(self._tmp_path, self.output_path)
+
+        if self._binary is not None:
+            # Written after the JSON so it is never older than the cache it mirrors
+            self._binary.close({**self.meta, 'statistics': self.statistics})
+
+    def discard(self) -> None:
+        """Abandon a partial write, leaving any previous cache in place."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def load_previous_build(output_path: Path) -> Optional[tuple[Mapping, Dict[str, Any]]]:
+    """
+    Load the previous cache and manifest for an incremental build.
+
+    A fresh complex.bin is opened instead of parsing complex.json, so entries
+    of unchanged files are decoded only as they are copied over; close it
+    once the build is written.
+
+    Args:
+        output_path: Path to complex.json
+
+    Returns:
+        Tuple of (cache, manifest), or None if either is missing,
+        unreadable, or was written by a different cache version
+    """
+    manifest_path = manifest_path_for(output_path)
+    if not output_path.exists() or not manifest_path.exists():
+        return None
+
+    cache = None
+    try:
+        cache_file = cache_file_for(output_path)
+        if cache_file.suffix == '.bin':
+            cache = open_binary_cache(cache_file)
+        else:
+            cache = json.loads(cache_file.read_text(encoding='utf-8'))
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if cache.get('version') == CACHE_VERSION and manifest.get('version') == CACHE_VERSION:
+            return cache, manifest
+    except (OSError, ValueError):
+        pass
+
+    # Unusable: release the memory map of an opened binary cache
+    if hasattr(cache, 'close'):
+        cache.close()
+    return None
+
+
+def iter_full_entries(
+    root_path: Path,
+    records: Dict[str, Any],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> Iterator[tuple[str, Dict[str, Any]]]:
+    """
+    Parse every element file and fingerprint it.
+
+    Bodies are dropped at parse time and entries are yielded as they are
+    parsed, so nothing but the manifest records accumulates.
+
+    Args:
+        root_path: Root directory containing element directories
+        records: Manifest file records, filled in as files are parsed
+        workers: Number of parser processes (None parses sequentially)
+        executor: Parser process pool shared by every directory
+
+    Yields:
+        (section, cache entry) tuples in file order
+    """
+    for section, dir_name, element_type in ELEMENT_DIRECTORIES:
+        directory = root_path / dir_name
+        parse_errors = []
+        for file_path, element, error in iter_parse_files(
+            list_element_files(directory, element_type), element_type, workers,
+            include_body=False, executor=executor
+        ):
+            rel_path = str(file_path.relative_to(root_path))
+            entry = None
+            if error is None:
+                entry = cache_entry(element, root_path)
+            else:
+                parse_errors.append((file_path, error))
+            records[rel_path] = {
+                'section': section,
+                # None marks files skipped by the parser (README.md etc.)
+                'id': entry['id'] if entry is not None else None,
+                **fingerprint_file(file_path),
+            }
+            if entry is not None:
+                yield section, entry
+
+        warn_skipped_files(directory, parse_errors)
+
+
+def iter_incremental_entries(
+    root_path: Path,
+    previous_cache: Mapping,
+    previous_records: Dict[str, Any],
+    records: Dict[str, Any],
+    counts: Dict[str, int],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> Iterator[tuple[str, Dict[str, Any]]]:
+    """
+    Reuse cache entries of unchanged files and re-parse only the rest.
+
+    Args:
+        root_path: Root directory containing element directories
+        previous_cache: Previously written cache (dictionary or BinaryCache)
+        previous_records: File records from the previous manifest
+        records: Manifest file records, filled in as files are processed
+        counts: Filled in with 'reused', 'reparsed' and 'removed' counts
+            ('removed' once the generator is exhausted)
+        workers: Number of parser processes (None parses sequentially)
+        executor: Parser process pool shared by every directory
+
+    Yields:
+        (section, cache entry) tuples in file order
+    """
+    counts.update({'reused': 0, 'reparsed': 0, 'removed': 0})
+
+    for section, dir_name, element_type in ELEMENT_DIRECTORIES:
+        directory = root_path / dir_name
+        previous_elements = previous_cache['elements'].get(section, {})
+        # One slot per file in parse order: a reused element ID, or None if
+        # the file is skipped, or the file path itself if it needs re-parsing
+        slots = []
+
+        for file_path in list_element_files(directory, element_type):
+            rel_path = str(file_path.relative_to(root_path))
+            record = previous_records.get(rel_path)
+
+            if record is not None and record['section'] == section:
+                record = is_unchanged(file_path, record)
+                if record is not None and record['id'] is None:
+                    # Unchanged file that the parser skipped last time
+                    records[rel_path] = record
+                    slots.append(None)
+                    counts['reused'] += 1
+                    continue
+                if record is not None:
+                    entry = previous_elements.get(record['id'])
+                    # A duplicate ID elsewhere means this file's entry was
+                    # overwritten in the cache, so it has to be re-parsed
+                    if entry is not None and entry['file'] == rel_path:
+                        records[rel_path] = record
+                        slots.append(record['id'])
+                        counts['reused'] += 1
+                        continue
+
+            slots.append(file_path)
+
+        changed = [slot for slot in slots if isinstance(slot, Path)]
+        counts['reparsed'] += len(changed)
+        parsed = {}
+        parse_errors = []
+        for file_path, element, error in iter_parse_files(
+            changed, element_type, workers, include_body=False, executor=executor
+        ):
+            rel_path = str(file_path.relative_to(root_path))
+            if error is None:
+                parsed[file_path] = cache_entry(element, root_path)
+            else:
+                parse_errors.append((file_path, error))
+            records[rel_path] = {
+                'section': section,
+                'id': parsed[file_path]['id'] if file_path in parsed else None,
+                **fingerprint_file(file_path),
+            }
+
+        for slot in slots:
+            if isinstance(slot, Path):
+                entry = parsed.get(slot)
+            elif slot is not None:
+                entry = previous_elements[slot]
+            else:
+                entry = None
+            if entry is not None:
+                yield section, entry
+
+        warn_skipped_files(directory, parse_errors)
+
+    counts['removed'] = len(set(previous_records) - set(records))
+
+
+def build_cache(
+    root_path: Path,
+    output_path: Path = None,
+    incremental: bool = False,
+    workers: Optional[int] = None,
+    binary: bool = True
+) -> Complex:
     """
     Build complex.json cache from directory structure.
 
+    Parsed elements are streamed straight into the cache file (see
+    CacheWriter), so memory use does not grow with the size of the
+    documents.
+
+    In incremental mode the previous cache and its manifest are reused:
+    only added or changed files are re-parsed, deleted files are dropped,
+    and the output is identical to a full rebuild (apart from the
+    'generated' timestamp). Falls back to a full build when no usable
+    previous build exists.
+
     Args:
         root_path: Root directory containing element directories
         output_path: Optional path for complex.json (defaults to root_path/complex.json)
+        incremental: Re-parse only files changed since the previous build
+        workers: Number of parser processes (None parses sequentially)
+        binary: Also write the binary cache (complex.bin) next to the output
 
     Returns:
-        Cache dictionary
+        Complex view of the written cache (see cached_complex.py)
 
     Raises:
         ParseError: If any element fails to parse
@@ -71,75 +481,57 @@ def build_cache(root_path: Path, output_path: Path = None) -> Dict[str, Any]:
     # Parse all directories
     print(f"Building cache for: {root_path}")
 
-    vertices_dir = root_path / '00_vertices'
-    edges_dir = root_path / '01_edges'
-    faces_dir = root_path / '02_faces'
-    charts_dir = root_path / 'charts'
-
-    vertices = parse_directory(vertices_dir, 'vertex')
-    edges = parse_directory(edges_dir, 'edge')
-    faces = parse_directory(faces_dir, 'face')
-    charts = parse_directory(charts_dir, 'chart')
-
-    print(f"  Parsed {len(vertices)} vertices")
-    print(f"  Parsed {len(edges)} edges")
-    print(f"  Parsed {len(faces)} faces")
-    print(f"  Parsed {len(charts)} charts")
-
-    # Build cache structure
-    cache = {
-        'version': '1.0.0',
-        'generated': datetime.now(timezone.utc).isoformat(),
-        'root_path': '.',
-        'elements': {
-            'vertices': {},
-            'edges': {},
-            'faces': {},
-            'charts': {}
-        },
-        'statistics': {
-            'vertex_count': len(vertices),
-            'edge_count': len(edges),
-            'face_count': len(faces),
-            'chart_count': len(charts),
-            'euler_characteristic': calculate_euler_characteristic(vertices, edges, faces)
-        }
-    }
+    previous = load_previous_build(output_path) if incremental else None
 
-    # Index elements by ID
-    for vertex in vertices:
-        # Make file path relative to root
-        vertex_copy = vertex.copy()
-        vertex_copy['file'] = str(Path(vertex['file']).relative_to(root_path))
-        # Remove body from cache (keep only metadata)
-        vertex_copy.pop('body', None)
-        # Sanitize for JSON serialization
-        cache['elements']['vertices'][vertex['id']] = sanitize_for_json(vertex_copy)
-
-    for edge in edges:
-        edge_copy = edge.copy()
-        edge_copy['file'] = str(Path(edge['file']).relative_to(root_path))
-        edge_copy.pop('body', None)
-        cache['elements']['edges'][edge['id']] = sanitize_for_json(edge_copy)
-
-    for face in faces:
-        face_copy = face.copy()
-        face_copy['file'] = str(Path(face['file']).relative_to(root_path))
-        face_copy.pop('body', None)
-        cache['elements']['faces'][face['id']] = sanitize_for_json(face_copy)
-
-    for chart in charts:
-        chart_copy = chart.copy()
-        chart_copy['file'] = str(Path(chart['file']).relative_to(root_path))
-        chart_copy.pop('body', None)
-        cache['elements']['charts'][chart['id']] = sanitize_for_json(chart_copy)
-
-    # Write cache file
-    output_path.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+    # One parser pool for every element directory, so workers start once
+    executor = ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+
+    records = {}
+    counts = {}
+    if previous is None:
+        if incremental:
+            print("  No previous build found, running full build")
+        entries = iter_full_entries(root_path, records, workers=workers, executor=executor)
+    else:
+        previous_cache, previous_manifest = previous
+        entries = iter_incremental_entries(
+            root_path, previous_cache, previous_manifest['files'], records, counts,
+            workers=workers, executor=executor
+        )
+
+    # Stream entries into the cache file(s)
+    binary_path = binary_path_for(output_path) if binary else None
+    writer = CacheWriter(output_path, binary_path)
+    try:
+        for section, entry in entries:
+            writer.add(section, entry)
+    except BaseException:
+        writer.discard()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if previous is not None and hasattr(previous_cache, 'close'):
+            previous_cache.close()
+    writer.close()
+
+    if counts:
+        print(f"  Incremental: {counts['reused']} unchanged, "
+              f"{counts['reparsed']} re-parsed, {counts['removed']} removed")
+    print(f"  Parsed {writer.counts['vertices']} vertices")
+    print(f"  Parsed {writer.counts['edges']} edges")
+    print(f"  Parsed {writer.counts['faces']} faces")
+    print(f"  Parsed {writer.counts['charts']} charts")
+
+    # Write the manifest used by the next incremental build
+    manifest = {'version': CACHE_VERSION, 'files': records}
+    manifest_path_for(output_path).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
     print(f"\nCache written to: {output_path}")
-    print(f"Euler characteristic: χ = {cache['statistics']['euler_characteristic']}")
+    if binary:
+        print(f"Binary cache written to: {binary_path}")
+    print(f"Euler characteristic: χ = {writer.statistics['euler_characteristic']}")
 
-    return cache
+    return get_complex(output_path.parent, output_path)
 
 
 def main():
@@ -158,6 +550,22 @@ def main():
         type=Path,
         help='Output path for complex.json (default: <path>/complex.json)'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Re-parse only files changed since the last build (uses <output>.manifest.json)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Parse files with N worker processes (default: sequential)'
+    )
+    parser.add_argument(
+        '--no-binary',
+        action='store_true',
+        help='Do not write the binary cache (<output>.bin)'
+    )
     parser.add_argument(
         '--verify',
         action='store_true',
@@ -167,13 +575,16 @@ def main():
     args = parser.parse_args()
 
     try:
-        cache = build_cache(args.path, args.output)
+        cache = build_cache(
+            args.path, args.output, incremental=args.incremental, workers=args.jobs,
+            binary=not args.no_binary
+        )
 
         if args.verify:
             print("\n=== Running verification ===")
             # Import here to avoid circular dependency
             from verify_structure import verify_all
-            errors = verify_all(args.path)
+            errors = verify_all(args.path, workers=args.jobs)
             if errors:
                 print(f"\nVerification failed with {len(errors)} errors:")
                 for error in errors:
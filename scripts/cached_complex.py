@@ -0,0 +1,209 @@
+"""
+In-memory view of the complex.json cache shared by the verification tools.
+
+A Complex loads complex.json once and exposes typed ID sets and adjacency
+maps (edge boundaries, incident edges per vertex, cofaces per edge), so
+checking many charts in one process parses the cache a single time.
+
+Complex is a read-only mapping over the raw cache dictionary, so functions
+written against ``cache['elements'][...]`` accept it unchanged. When
+build_cache.py has written complex.bin next to complex.json (and it is at
+least as new), the binary cache is memory-mapped instead of parsing JSON,
+and the adjacency maps are built from its columns.
+"""
+
+import json
+from collections.abc import Mapping
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List, Set, Tuple
+
+from binary_cache import BinaryCache, ElementTable, binary_path_for
+
+
+def load_cache(cache_path: Path) -> Dict[str, Any]:
+    """
+    Load a complex.json cache file.
+
+    Args:
+        cache_path: Path to complex.json
+
+    Returns:
+        Cache dictionary
+
+    Raises:
+        FileNotFoundError: If the cache doesn't exist
+        json.JSONDecodeError: If the cache is not valid JSON
+    """
+    if not cache_path.exists():
+        raise FileNotFoundError(f"Cache not found: {cache_path}")
+    return json.loads(cache_path.read_text(encoding='utf-8'))
+
+
+def cache_file_for(cache_path: Path) -> Path:
+    """
+    Pick the file to load for a cache: complex.bin if it is fresh, else complex.json.
+
+    Args:
+        cache_path: Path to complex.json (or directly to a .bin file)
+
+    Returns:
+        Path of the file to load
+    """
+    if cache_path.suffix == '.bin':
+        return cache_path
+    binary_path = binary_path_for(cache_path)
+    try:
+        if binary_path.stat().st_mtime_ns >= cache_path.stat().st_mtime_ns:
+            return binary_path
+    except FileNotFoundError:
+        pass
+    return cache_path
+
+
+class Complex(Mapping):
+    """Indexed, read-only view of a loaded complex.json cache."""
+
+    def __init__(self, cache: Mapping, cache_path: Path = None):
+        """
+        Args:
+            cache: Loaded complex.json dictionary (or an open BinaryCache)
+            cache_path: File the cache was loaded from (if any)
+        """
+        self.cache = cache
+        self.cache_path = cache_path
+
+        elements = cache.get('elements', {})
+        self.vertices: Dict[str, Dict[str, Any]] = elements.get('vertices', {})
+        self.edges: Dict[str, Dict[str, Any]] = elements.get('edges', {})
+        self.faces: Dict[str, Dict[str, Any]] = elements.get('faces', {})
+        self.charts: Dict[str, Dict[str, Any]] = elements.get('charts', {})
+
+        self.vertex_ids: FrozenSet[str] = frozenset(self.vertices)
+        self.edge_ids: FrozenSet[str] = frozenset(self.edges)
+        self.face_ids: FrozenSet[str] = frozenset(self.faces)
+        self.chart_ids: FrozenSet[str] = frozenset(self.charts)
+
+    @classmethod
+    def load(cls, cache_path: Path) -> 'Complex':
+        """Load and index a complex.json or complex.bin file."""
+        if cache_path.suffix == '.bin':
+            return cls(BinaryCache(cache_path), cache_path)
+        return cls(load_cache(cache_path), cache_path)
+
+    def close(self) -> None:
+        """Release the memory map of a binary cache (nothing to do for JSON)."""
+        if isinstance(self.cache, BinaryCache):
+            self.cache.close()
+
+    # Mapping interface over the raw cache
+
+    def __getitem__(self, key: str) -> Any:
+        return self.cache[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.cache)
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    # Adjacency maps (built on first use)
+
+    @cached_property
+    def edge_boundary(self) -> Dict[str, Tuple[str, str]]:
+        """Edge ID -> (source, target) vertex IDs."""
+        if isinstance(self.edges, ElementTable):
+            sources = self.edges.strings('source')
+            targets = self.edges.strings('target')
+            return {
+                edge_id: (source or '', target or '')
+                for edge_id, source, target in zip(self.edges.ids, sources, targets)
+            }
+        return {
+            edge_id: (edge.get('source', ''), edge.get('target', ''))
+            for edge_id, edge in self.edges.items()
+        }
+
+    @cached_property
+    def vertex_edges(self) -> Dict[str, Set[str]]:
+        """Vertex ID -> IDs of edges incident to it."""
+        incident: Dict[str, Set[str]] = {}
+        for edge_id, (source, target) in self.edge_boundary.items():
+            incident.setdefault(source, set()).add(edge_id)
+            incident.setdefault(target, set()).add(edge_id)
+        return incident
+
+    @cached_property
+    def face_edges(self) -> Dict[str, List[str]]:
+        """Face ID -> boundary edge IDs."""
+        if isinstance(self.faces, ElementTable):
+            return dict(zip(self.faces.ids, self.faces.lists('edges')))
+        return {face_id: face.get('edges', []) for face_id, face in self.faces.items()}
+
+    @cached_property
+    def face_vertices(self) -> Dict[str, List[str]]:
+        """Face ID -> vertex IDs."""
+        if isinstance(self.faces, ElementTable):
+            return dict(zip(self.faces.ids, self.faces.lists('vertices')))
+        return {face_id: face.get('vertices', []) for face_id, face in self.faces.items()}
+
+    @cached_property
+    def edge_faces(self) -> Dict[str, Set[str]]:
+        """Edge ID -> IDs of faces it bounds."""
+        cofaces: Dict[str, Set[str]] = {}
+        for face_id, face_edges in self.face_edges.items():
+            for edge_id in face_edges:
+                cofaces.setdefault(edge_id, set()).add(face_id)
+        return cofaces
+
+    @cached_property
+    def neighbours(self) -> Dict[str, Set[str]]:
+        """Vertex ID -> IDs of vertices sharing an edge with it."""
+        adjacency: Dict[str, Set[str]] = {}
+        for source, target in self.edge_boundary.values():
+            adjacency.setdefault(source, set()).add(target)
+            adjacency.setdefault(target, set()).add(source)
+        return adjacency
+
+
+_loaded_complexes: Dict[Path, Tuple[Tuple[int, int], Complex]] = {}
+
+
+def get_complex(root_path: Path, cache_path: Path = None) -> Complex:
+    """
+    Get the indexed complex for a repository, reusing it within a process.
+
+    The cache file is re-read only when its mtime or size changes; the
+    complex it replaces is closed, so a long-running process does not keep
+    one memory map per rebuild. A fresh complex.bin next to complex.json is
+    opened in its place.
+
+    Args:
+        root_path: Directory containing complex.json
+        cache_path: Cache file (default: root_path/complex.json)
+
+    Returns:
+        Complex for the cache file
+
+    Raises:
+        FileNotFoundError: If the cache doesn't exist
+        json.JSONDecodeError: If the cache is not valid JSON
+    """
+    if cache_path is None:
+        cache_path = Path(root_path) / 'complex.json'
+    cache_path = cache_file_for(Path(cache_path).resolve())
+
+    try:
+        stat = cache_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Cache not found: {cache_path}")
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    loaded = _loaded_complexes.get(cache_path)
+    if loaded is None or loaded[0] != signature:
+        if loaded is not None:
+            del _loaded_complexes[cache_path]
+            loaded[1].close()
+        loaded = (signature, Complex.load(cache_path))
+        _loaded_complexes[cache_path] = loaded
+    return loaded[1]
@@ -22,6 +22,7 @@ When these share a validation edge, they MUST reference the same person.
 Usage:
     python scripts/check_accountability.py                    # Commit-time check
     python scripts/check_accountability.py --check-consistency # Consistency check
+    python scripts/check_accountability.py --check-consistency --changed-since origin/main
 
 Exit codes:
     0 - All accountability checks passed
@@ -40,7 +41,10 @@ from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
 
 sys.path.insert(0, str(Path(__file__).parent))
-from parse_chart import extract_frontmatter, ParseError
+from element_index import get_element_index
+from git_metadata import get_git_metadata
+from invalidation import InvalidationError, tasks_changed_since
+from parse_chart import read_frontmatter, ParseError
 
 
 class AccountabilityError(Exception):
@@ -85,50 +89,37 @@ def get_github_actor() -> str:
 
 def get_file_author_from_blame(file_path: str) -> str:
     """
-    Get the author who actually created/modified a file using git blame.
+    Get the author who actually created/modified a file.
 
     For validation edges, we care about who authored the frontmatter
-    (specifically the accountability fields). This uses git blame to
-    find the actual author of the file content.
+    (specifically the accountability fields), i.e. the author of the last
+    commit that changed the file. Lookups go through the batched git
+    backend (see git_metadata.py), so files already looked up at the same
+    commit do not run git again.
 
     Returns the author name, or empty string if unable to determine.
     """
-    try:
-        # Use git log to find who last modified this file
-        # This is more reliable than blame for newly added files
-        result = subprocess.run(
-            ['git', 'log', '-1', '--format=%an', '--follow', '--', file_path],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
+    metadata = get_git_metadata()
+    if metadata is None:
         return ""
+    return metadata.last_author(file_path)
 
 
 def get_file_author_in_commit(file_path: str, commit: str = 'HEAD') -> str:
     """
     Get the author who actually modified a specific file in a commit.
 
-    Uses git log to find who authored the changes to this file.
-    For merge commits or PRs, this checks if the file was actually
-    modified by the commit author.
+    Finds who authored the last change that added or modified this file
+    in the history of the commit. For merge commits or PRs, this checks if
+    the file was actually modified by the commit author.
 
     Returns empty string if file wasn't modified by the commit author.
     """
-    try:
-        # Check if this file was actually added or modified in this commit
-        result = subprocess.run(
-            ['git', 'log', '-1', '--format=%an', '--diff-filter=AM', '--', file_path],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=str(Path(file_path).parent) if Path(file_path).exists() else None
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
+    directory = Path(file_path).parent if Path(file_path).exists() else None
+    metadata = get_git_metadata(directory)
+    if metadata is None:
         return ""
+    return metadata.last_author(file_path, commit, diff_filter='AM')
 
 
 def get_modified_validation_edges() -> List[Tuple[Path, str]]:
@@ -136,10 +127,11 @@ def get_modified_validation_edges() -> List[Tuple[Path, str]]:
     Get list of validation edges modified in this commit/PR with their authors.
 
     Returns list of (path, author) tuples for validation edge markdown files
-    that were added or modified. Uses git blame/log to find the actual author
+    that were added or modified. Uses git log to find the actual author
     of each file, not just the commit author. This ensures that when user A
     pushes a branch containing user B's validation edges, the check correctly
-    attributes those edges to user B.
+    attributes those edges to user B. Authors of all edges come from a single
+    batched git log (see git_metadata.py) rather than one git call per file.
     """
     try:
         # Get files changed in HEAD commit (Added or Modified only)
@@ -152,7 +144,7 @@ def get_modified_validation_edges() -> List[Tuple[Path, str]]:
         changed_files = result.stdout.strip().split('\n')
 
         # Filter for validation edges
-        validation_edges = []
+        edge_paths = []
         for file_path in changed_files:
             if not file_path:
                 continue
@@ -163,16 +155,16 @@ def get_modified_validation_edges() -> List[Tuple[Path, str]]:
                 # Check if it's a validation edge by reading frontmatter
                 if path.exists():
                     try:
-                        content = path.read_text(encoding='utf-8')
-                        frontmatter, _ = extract_frontmatter(content)
+                        frontmatter = read_frontmatter(path)
                         if frontmatter and frontmatter.get('type') == 'edge/validation':
-                            # Get who actually authored this file (using git log --follow)
-                            file_author = get_file_author_from_blame(file_path)
-                            validation_edges.append((path, file_author))
+                            edge_paths.append(path)
                     except Exception as e:
                         print(f"Warning: Could not parse {path}: {e}")
 
-        return validation_edges
+        # Get who actually authored each file, in one pass over the history
+        metadata = get_git_metadata()
+        authors = metadata.last_authors(edge_paths) if metadata and edge_paths else {}
+        return [(path, authors.get(str(path), '')) for path in edge_paths]
 
     except subprocess.CalledProcessError as e:
         print(f"Error getting modified files: {e}")
@@ -198,8 +190,7 @@ def check_validation_edge_accountability(
         (passed, message) tuple
     """
     try:
-        content = file_path.read_text(encoding='utf-8')
-        frontmatter, _ = extract_frontmatter(content)
+        frontmatter = read_frontmatter(file_path)
 
         if not frontmatter:
             return False, f"{file_path}: No frontmatter found"
@@ -385,38 +376,68 @@ def find_validation_edge_file(edge_id: str, root_path: Path) -> Optional[Path]:
     """
     Find the file path for a validation edge by its ID.
 
-    Edge ID format: e:validation:doc-name:guidance-name
-    File format: validation-doc-name:guidance-name.md
+    Resolves the ID through the shared element index (see element_index.py)
+    rather than guessing filenames or scanning validation-*.md files.
     """
     edges_dir = root_path / '01_edges'
     if not edges_dir.exists():
         return None
 
-    # Convert edge ID to filename
-    # e:validation:architecture-spec:guidance-spec -> validation-architecture-spec:guidance-spec.md
-    if edge_id.startswith('e:validation:'):
-        suffix = edge_id[len('e:validation:'):]
-        filename = f"validation-{suffix}.md"
-        file_path = edges_dir / filename
-        if file_path.exists():
-            return file_path
-
-    # Try direct search
-    for f in edges_dir.glob('validation-*.md'):
-        try:
-            content = f.read_text(encoding='utf-8')
-            fm, _ = extract_frontmatter(content)
-            if fm and fm.get('id') == edge_id:
-                return f
-        except Exception:
-            continue
+    edge_path = get_element_index(root_path).resolve(edge_id)
+    if edge_path is None or edge_path.parent.name != '01_edges':
+        return None
+    return edge_path
 
-    return None
+
+class AccountabilityIndex:
+    """
+    Join of assurance faces and validation edges keyed by validation_edge ID.
+
+    Every assurance face is read once when the index is built, and each
+    validation edge at most once however many signature faces share it, so
+    checking all signatures is a single pass over 01_edges and 02_faces
+    instead of a scan of every assurance face per signature.
+    """
+
+    def __init__(self, root_path: Path):
+        self.root_path = root_path
+        self._assurance_faces: Dict[str, Tuple[Path, Dict[str, Any]]] = {}
+        self._validation_edges: Dict[str, Tuple[Optional[Path], Optional[Dict[str, Any]]]] = {}
+
+        for af_path in find_assurance_faces(root_path):
+            try:
+                af_fm = read_frontmatter(af_path)
+            except Exception:
+                continue
+            edge_id = af_fm.get('validation_edge') if af_fm else None
+            if isinstance(edge_id, str) and edge_id:
+                # First face found wins, as with the per-signature scan
+                self._assurance_faces.setdefault(edge_id, (af_path, af_fm))
+
+    def assurance_face(self, edge_id: str) -> Optional[Tuple[Path, Dict[str, Any]]]:
+        """Return (path, frontmatter) of the assurance face sharing edge_id, if any."""
+        if not isinstance(edge_id, str):
+            return None
+        return self._assurance_faces.get(edge_id)
+
+    def validation_edge(self, edge_id: str) -> Tuple[Optional[Path], Optional[Dict[str, Any]]]:
+        """
+        Return (path, frontmatter) of a validation edge, reading it on first use.
+
+        The path is None if the edge cannot be found. Parse errors propagate
+        and are not cached.
+        """
+        if edge_id not in self._validation_edges:
+            edge_path = find_validation_edge_file(edge_id, self.root_path)
+            edge_fm = read_frontmatter(edge_path) if edge_path else None
+            self._validation_edges[edge_id] = (edge_path, edge_fm)
+        return self._validation_edges[edge_id]
 
 
 def check_shared_validation_edge_consistency(
     signature_face_path: Path,
-    root_path: Path
+    root_path: Path,
+    index: Optional[AccountabilityIndex] = None
 ) -> Tuple[bool, str, Dict[str, Any]]:
     """
     Check that a signature face, its corresponding assurance face, and their
@@ -425,6 +446,8 @@ def check_shared_validation_edge_consistency(
     Args:
         signature_face_path: Path to signature face file
         root_path: Repository root path
+        index: Prebuilt AccountabilityIndex for root_path; pass one when
+            checking many signatures (built here if omitted)
 
     Returns:
         (passed, message, details) tuple where details contains the extracted info
@@ -440,8 +463,7 @@ def check_shared_validation_edge_consistency(
 
     try:
         # Read signature face
-        sig_content = signature_face_path.read_text(encoding='utf-8')
-        sig_fm, _ = extract_frontmatter(sig_content)
+        sig_fm = read_frontmatter(signature_face_path)
 
         if not sig_fm:
             return False, f"{signature_face_path.name}: No frontmatter found", details
@@ -474,14 +496,14 @@ def check_shared_validation_edge_consistency(
         assurance_face_id = sig_fm.get('assurance_face', '')
         details['assurance_face'] = assurance_face_id
 
+        if index is None:
+            index = AccountabilityIndex(root_path)
+
         # Find and read validation edge
-        edge_path = find_validation_edge_file(validation_edge_id, root_path)
+        edge_path, edge_fm = index.validation_edge(validation_edge_id)
         if not edge_path:
             return False, f"{signature_face_path.name}: Validation edge file not found for {validation_edge_id}", details
 
-        edge_content = edge_path.read_text(encoding='utf-8')
-        edge_fm, _ = extract_frontmatter(edge_content)
-
         if not edge_fm:
             return False, f"{edge_path.name}: No frontmatter found in validation edge", details
 
@@ -495,18 +517,13 @@ def check_shared_validation_edge_consistency(
         assurance_approver = None
         assurance_face_file = None
 
-        for af_path in find_assurance_faces(root_path):
-            try:
-                af_content = af_path.read_text(encoding='utf-8')
-                af_fm, _ = extract_frontmatter(af_content)
-                if af_fm and af_fm.get('validation_edge') == validation_edge_id:
-                    assurance_approver = af_fm.get('human_approver', '')
-                    assurance_face_file = af_path.name
-                    details['assurance_face'] = af_fm.get('id', af_path.name)
-                    details['assurance_approver'] = assurance_approver
-                    break
-            except Exception:
-                continue
+        assurance_face = index.assurance_face(validation_edge_id)
+        if assurance_face:
+            af_path, af_fm = assurance_face
+            assurance_approver = af_fm.get('human_approver', '')
+            assurance_face_file = af_path.name
+            details['assurance_face'] = af_fm.get('id', af_path.name)
+            details['assurance_approver'] = assurance_approver
 
         if not assurance_face_file:
             # No matching assurance face found - this is OK if the chart doesn't require it
@@ -555,7 +572,10 @@ def check_shared_validation_edge_consistency(
         return False, f"{signature_face_path.name}: Error checking consistency: {e}", details
 
 
-def check_all_signature_accountability(root_path: Path = None) -> Tuple[bool, List[str]]:
+def check_all_signature_accountability(
+    root_path: Path = None,
+    signature_faces: List[Path] = None
+) -> Tuple[bool, List[str]]:
     """
     Check accountability consistency for all signature faces in the repository.
 
@@ -564,6 +584,7 @@ def check_all_signature_accountability(root_path: Path = None) -> Tuple[bool, Li
 
     Args:
         root_path: Repository root (defaults to current directory)
+        signature_faces: Check only these signature faces (default: all)
 
     Returns:
         (all_passed, messages) tuple
@@ -571,16 +592,18 @@ def check_all_signature_accountability(root_path: Path = None) -> Tuple[bool, Li
     if root_path is None:
         root_path = Path.cwd()
 
-    signature_faces = find_signature_faces(root_path)
+    if signature_faces is None:
+        signature_faces = find_signature_faces(root_path)
 
     if not signature_faces:
         return True, ["No signature faces found - accountability consistency check skipped"]
 
     messages = []
     all_passed = True
+    index = AccountabilityIndex(root_path)
 
     for sig_path in signature_faces:
-        passed, message, details = check_shared_validation_edge_consistency(sig_path, root_path)
+        passed, message, details = check_shared_validation_edge_consistency(sig_path, root_path, index)
         messages.append(message)
         if not passed:
             all_passed = False
@@ -609,19 +632,29 @@ def main() -> int:
         default=None,
         help='Repository root path (defaults to current directory)'
     )
+    parser.add_argument(
+        '--changed-since',
+        metavar='REV',
+        help='With --check-consistency, check only signature faces affected by '
+             'changes since a git revision (see invalidation.py)'
+    )
 
     args = parser.parse_args()
 
     if args.check_consistency:
-        return check_consistency_main(args.root)
+        return check_consistency_main(args.root, args.changed_since)
     else:
         return check_commit_main()
 
 
-def check_consistency_main(root_path: Path = None) -> int:
+def check_consistency_main(root_path: Path = None, changed_since: str = None) -> int:
     """
     Check accountability consistency for signature faces.
 
+    Args:
+        root_path: Repository root (defaults to current directory)
+        changed_since: Only check signature faces affected since this git revision
+
     Returns:
         0 if all checks pass, 1 if any check fails
     """
@@ -636,7 +669,18 @@ def check_consistency_main(root_path: Path = None) -> int:
     if root_path is None:
         root_path = Path.cwd()
 
-    all_passed, messages = check_all_signature_accountability(root_path)
+    signature_faces = None
+    if changed_since:
+        try:
+            tasks = tasks_changed_since(root_path, changed_since, 'accountability')
+        except InvalidationError as e:
+            print(f"Error: {e}")
+            return 1
+        signature_faces = [root_path / task.file for task in tasks]
+        print(f"Checking {len(signature_faces)} signature face(s) affected since {changed_since}")
+        print()
+
+    all_passed, messages = check_all_signature_accountability(root_path, signature_faces)
 
     for message in messages:
         print(message)
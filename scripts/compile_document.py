@@ -7,6 +7,12 @@ and expands all embeds inline by reading the referenced files and inserting thei
 content (excluding frontmatter). The result is a standalone markdown file suitable
 for deployment or assurance verification.
 
+Embeds are expanded in a single pass: each embedded file is resolved, read and
+split at its embeds once, however many times it is embedded, and the output
+is streamed to disk as it is produced. Embed cycles are detected with the
+stack of files being expanded; the embed that would close a cycle is left
+as-is with a warning.
+
 Usage:
     python scripts/compile_document.py <source.md> <output.md> [--base-dir <dir>]
 
@@ -16,10 +22,14 @@ Example:
         00_vertices/system_prompt-claude-assistant-compiled.md
 """
 
+import os
 import re
 import sys
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Iterator, List, Optional
+
+# Obsidian embeds: ![[reference]]
+EMBED_PATTERN = re.compile(r'!\[\[([^\]]+)\]\]')
 
 
 def extract_content_without_frontmatter(file_path: Path) -> str:
@@ -83,6 +93,90 @@ def resolve_embed_path(embed_ref: str, base_dir: Path) -> Path:
     raise FileNotFoundError(f"Cannot resolve embed reference: {embed_ref}")
 
 
+class EmbedExpander:
+    """
+    Expands embeds recursively, memoizing resolved paths and file contents.
+
+    Each file's content is split once with EMBED_PATTERN into alternating
+    text and embed references; expansion walks these splits with an explicit
+    stack, so a file embedded many times is read once and expansion time is
+    proportional to the output size.
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.embeds_expanded = 0
+        # embed reference -> absolute path (None if it cannot be resolved)
+        self._paths: Dict[str, Optional[Path]] = {}
+        # absolute path -> [text, ref, text, ..., text]
+        self._splits: Dict[Path, List[str]] = {}
+
+    @property
+    def files_read(self) -> int:
+        """Number of distinct embedded files read."""
+        return len(self._splits)
+
+    def resolve(self, embed_ref: str) -> Optional[Path]:
+        """Resolve an embed reference once; unresolvable references warn once."""
+        if embed_ref not in self._paths:
+            try:
+                path = Path(os.path.abspath(resolve_embed_path(embed_ref, self.base_dir)))
+            except FileNotFoundError as e:
+                print(f"WARNING: {e}", file=sys.stderr)
+                path = None
+            self._paths[embed_ref] = path
+        return self._paths[embed_ref]
+
+    def _split(self, path: Path) -> List[str]:
+        """Embedded content of a file (no frontmatter, no trailing newlines), split at embeds."""
+        if path not in self._splits:
+            content = extract_content_without_frontmatter(path).rstrip('\n')
+            self._splits[path] = EMBED_PATTERN.split(content)
+        return self._splits[path]
+
+    def expand(self, source_path: Path) -> Iterator[str]:
+        """
+        Yield the source document's content with every embed expanded.
+
+        The source keeps its frontmatter. Embeds that cannot be resolved, or
+        that would embed a file already being expanded, are yielded as-is.
+        """
+        source_key = Path(os.path.abspath(source_path))
+        # Frames of [path, split, next index]; `expanding` holds their paths
+        stack = [[source_key, EMBED_PATTERN.split(source_path.read_text(encoding='utf-8')), 0]]
+        expanding = {source_key}
+
+        while stack:
+            frame = stack[-1]
+            path, split, index = frame
+            if index == len(split):
+                stack.pop()
+                expanding.discard(path)
+                continue
+            frame[2] = index + 1
+
+            piece = split[index]
+            if index % 2 == 0:
+                # Text between embeds
+                if piece:
+                    yield piece
+                continue
+
+            embed_path = self.resolve(piece)
+            if embed_path is None:
+                yield f"![[{piece}]]"
+                continue
+            if embed_path in expanding:
+                chain = ' → '.join(frame_path.name for frame_path, _, _ in stack)
+                print(f"WARNING: Circular embed: {chain} → {embed_path.name}", file=sys.stderr)
+                yield f"![[{piece}]]"
+                continue
+
+            self.embeds_expanded += 1
+            stack.append([embed_path, self._split(embed_path), 0])
+            expanding.add(embed_path)
+
+
 def compile_document(source_path: Path, output_path: Path, base_dir: Optional[Path] = None) -> None:
     """
     Compile a document by expanding all Obsidian embeds.
@@ -99,40 +193,23 @@ def compile_document(source_path: Path, output_path: Path, base_dir: Optional[Pa
     if not source_path.exists():
         raise FileNotFoundError(f"Source document not found: {source_path}")
 
-    source_content = source_path.read_text(encoding='utf-8')
+    expander = EmbedExpander(base_dir)
 
-    # Pattern to match Obsidian embeds: ![[reference]]
-    embed_pattern = re.compile(r'!\[\[([^\]]+)\]\]')
-
-    def expand_embed(match: re.Match) -> str:
-        """Replace embed with actual content."""
-        embed_ref = match.group(1)
-        try:
-            embed_path = resolve_embed_path(embed_ref, base_dir)
-            embedded_content = extract_content_without_frontmatter(embed_path)
-            return embedded_content.rstrip('\n')  # Remove trailing newlines
-        except FileNotFoundError as e:
-            # If embed can't be resolved, leave it as-is and warn
-            print(f"WARNING: {e}", file=sys.stderr)
-            return match.group(0)  # Return original embed syntax
-
-    # Expand all embeds recursively (keep expanding until no embeds remain)
-    compiled_content = source_content
-    max_iterations = 100  # Prevent infinite loops
-    iteration = 0
-
-    while embed_pattern.search(compiled_content) and iteration < max_iterations:
-        compiled_content = embed_pattern.sub(expand_embed, compiled_content)
-        iteration += 1
-
-    if iteration >= max_iterations:
-        print(f"WARNING: Reached maximum iterations ({max_iterations}), possible circular embeds", file=sys.stderr)
-
-    # Write compiled output
+    # Stream to a temporary file and swap it in, so a source embedding the
+    # output file reads the previous version, not a truncated one
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(compiled_content, encoding='utf-8')
-
-    print(f"✓ Compiled: {source_path} → {output_path} ({iteration} passes)")
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        with tmp_path.open('w', encoding='utf-8') as output:
+            for chunk in expander.expand(source_path):
+                output.write(chunk)
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    print(f"✓ Compiled: {source_path} → {output_path} "
+          f"({expander.embeds_expanded} embeds from {expander.files_read} files)")
 
 
 def main():
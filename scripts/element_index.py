@@ -0,0 +1,258 @@
+"""
+Persistent element-ID-to-path index shared by the CLI tools.
+
+Maps every element ID in 00_vertices/, 01_edges/, 02_faces/ and charts/ to
+its markdown file so tools can resolve IDs with a dictionary lookup instead
+of globbing or scanning directories per element.
+
+The index is stored next to complex.json (complex.index.json) and is
+invalidated by directory modification times: adding, removing or renaming
+an element file changes its directory's mtime and triggers a rescan.
+Editing the ``id`` of an existing file in place does not, so run
+``python scripts/element_index.py --rebuild`` after renaming element IDs.
+"""
+
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from parse_chart import ParseError, read_frontmatter
+
+INDEX_VERSION = '1.0.0'
+
+# Indexed directories in precedence order (later entries win on duplicate
+# IDs, matching complex.json); charts are nested one level per chart
+INDEX_DIRECTORIES = ['00_vertices', '01_edges', '02_faces', 'charts']
+
+
+def index_path_for(cache_path: Path) -> Path:
+    """
+    Get the path of the element index stored next to a cache file.
+
+    Args:
+        cache_path: Path to complex.json
+
+    Returns:
+        Path to the index (e.g. complex.index.json)
+    """
+    return cache_path.with_name(f"{cache_path.stem}.index.json")
+
+
+def directory_mtimes(root_path: Path) -> Dict[str, int]:
+    """
+    Record modification times of every indexed directory.
+
+    Args:
+        root_path: Repository root
+
+    Returns:
+        Mapping of directory path (relative to root) to st_mtime_ns
+    """
+    mtimes = {}
+    for dir_name in INDEX_DIRECTORIES:
+        directory = root_path / dir_name
+        if not directory.is_dir():
+            continue
+        mtimes[dir_name] = directory.stat().st_mtime_ns
+        if dir_name == 'charts':
+            for subdir in sorted(p for p in directory.rglob('*') if p.is_dir()):
+                mtimes[str(subdir.relative_to(root_path))] = subdir.stat().st_mtime_ns
+    return mtimes
+
+
+def _scan_files(directory: Path, recursive: bool) -> Iterable[tuple[str, Path]]:
+    """Yield (element_id, path) for every markdown file with an id."""
+    md_files = directory.glob('**/*.md' if recursive else '*.md')
+    for md_file in sorted(md_files):
+        try:
+            frontmatter = read_frontmatter(md_file)
+        except (ParseError, OSError, UnicodeDecodeError):
+            continue
+        if isinstance(frontmatter, dict) and frontmatter.get('id'):
+            yield str(frontmatter['id']), md_file
+
+
+class ElementIndex:
+    """Mapping of element ID to file path for one repository root."""
+
+    def __init__(self, root_path: Path, paths: Dict[str, str], directories: Dict[str, int]):
+        """
+        Args:
+            root_path: Repository root
+            paths: Mapping of element ID to file path relative to root
+            directories: Directory mtimes the index was built against
+        """
+        self.root_path = root_path
+        self.paths = paths
+        self.directories = directories
+        # Elements found in additional search directories (never persisted)
+        self.extra_paths: Dict[str, Path] = {}
+
+    @classmethod
+    def build(cls, root_path: Path) -> 'ElementIndex':
+        """Scan the element directories and build a fresh index."""
+        directories = directory_mtimes(root_path)
+        paths = {}
+        for dir_name in INDEX_DIRECTORIES:
+            directory = root_path / dir_name
+            if not directory.is_dir():
+                continue
+            for element_id, md_file in _scan_files(directory, recursive=dir_name == 'charts'):
+                paths[element_id] = str(md_file.relative_to(root_path))
+        return cls(root_path, paths, directories)
+
+    @classmethod
+    def load(cls, root_path: Path, index_path: Path = None) -> 'ElementIndex':
+        """
+        Load the on-disk index, rebuilding and saving it if stale or missing.
+
+        Args:
+            root_path: Repository root
+            index_path: Index file (default: root_path/complex.index.json)
+        """
+        if index_path is None:
+            index_path = index_path_for(root_path / 'complex.json')
+
+        try:
+            data = json.loads(index_path.read_text(encoding='utf-8'))
+            if data.get('version') == INDEX_VERSION:
+                index = cls(root_path, data['elements'], data['directories'])
+                if index.is_fresh():
+                    return index
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
+
+        index = cls.build(root_path)
+        try:
+            index.save(index_path)
+        except OSError:
+            # Read-only checkout: keep the index in memory only
+            pass
+        return index
+
+    def is_fresh(self) -> bool:
+        """Check that no indexed directory changed since the index was built."""
+        return directory_mtimes(self.root_path) == self.directories
+
+    def save(self, index_path: Path) -> None:
+        """Write the index to disk."""
+        data = {
+            'version': INDEX_VERSION,
+            'directories': self.directories,
+            'elements': self.paths,
+        }
+        index_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+
+    def add_search_dirs(self, search_dirs: List[Path]) -> None:
+        """
+        Index additional directories (flat search, not persisted).
+
+        Elements already in the index take precedence over these, and
+        earlier search directories take precedence over later ones.
+
+        Args:
+            search_dirs: Additional directories containing element files
+        """
+        for search_dir in search_dirs:
+            search_dir = Path(search_dir)
+            if not search_dir.is_dir():
+                continue
+            for element_id, md_file in _scan_files(search_dir, recursive=False):
+                if element_id not in self.paths and element_id not in self.extra_paths:
+                    self.extra_paths[element_id] = md_file
+
+    def resolve(self, element_id: str) -> Optional[Path]:
+        """
+        Resolve an element ID to its file path.
+
+        Args:
+            element_id: Element ID (e.g. 'v:spec:chart')
+
+        Returns:
+            Path to the element file, or None if unknown
+        """
+        rel_path = self.paths.get(element_id)
+        if rel_path is not None:
+            return self.root_path / rel_path
+        return self.extra_paths.get(element_id)
+
+    def __contains__(self, element_id: str) -> bool:
+        return element_id in self.paths or element_id in self.extra_paths
+
+    def __len__(self) -> int:
+        return len(self.paths) + len(self.extra_paths)
+
+
+_loaded_indexes: Dict[tuple, ElementIndex] = {}
+
+
+def get_element_index(root_path: Path, search_dirs: List[Path] = None) -> ElementIndex:
+    """
+    Get the element index for a repository, reusing it within a process.
+
+    The returned index is re-validated against directory mtimes on every
+    call (a handful of stat calls), so hold on to it in hot loops.
+
+    Args:
+        root_path: Repository root
+        search_dirs: Additional directories to search for elements
+
+    Returns:
+        ElementIndex for the root (plus search directories)
+    """
+    root_path = Path(root_path).resolve()
+    key = (root_path, tuple(str(Path(d).resolve()) for d in search_dirs or []))
+
+    index = _loaded_indexes.get(key)
+    if index is None or not index.is_fresh():
+        index = ElementIndex.load(root_path)
+        if search_dirs:
+            index.add_search_dirs(search_dirs)
+        _loaded_indexes[key] = index
+    return index
+
+
+def main():
+    """Command-line interface for the element index."""
+    parser = argparse.ArgumentParser(
+        description='Build or query the element ID to file path index'
+    )
+    parser.add_argument(
+        '--path',
+        type=Path,
+        default=Path.cwd(),
+        help='Repository root (default: current directory)'
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Rescan all element directories even if the index is fresh'
+    )
+    parser.add_argument(
+        'ids',
+        nargs='*',
+        help='Element IDs to resolve'
+    )
+    args = parser.parse_args()
+
+    if args.rebuild:
+        index = ElementIndex.build(args.path)
+        index.save(index_path_for(args.path / 'complex.json'))
+    else:
+        index = ElementIndex.load(args.path)
+    print(f"Indexed {len(index)} elements under {args.path}")
+
+    status = 0
+    for element_id in args.ids:
+        element_path = index.resolve(element_id)
+        if element_path is None:
+            print(f"✗ {element_id}: not found")
+            status = 1
+        else:
+            print(f"  {element_id} → {element_path}")
+    return status
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -10,89 +10,41 @@ Usage:
 
 import sys
 import json
-import yaml
 import re
 import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 
+from element_index import ElementIndex, get_element_index
+from parse_chart import load_yaml
+
 
 def parse_frontmatter(content: str) -> Dict[str, Any]:
     """Extract YAML frontmatter from markdown."""
     match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
     if not match:
         raise ValueError("No frontmatter found")
-    return yaml.safe_load(match.group(1))
+    return load_yaml(match.group(1))
+
 
+def build_element_index(base_path: Path, search_dirs: List[Path] = None) -> ElementIndex:
+    """Get the element ID to file path index for a repository.
 
-def build_element_index(base_path: Path, search_dirs: List[Path] = None) -> Dict[str, Path]:
-    """Build a mapping of element ID to file path by scanning directories.
+    Uses the persistent index shared by all tools (see element_index.py),
+    rescanning directories only when they changed.
 
     Args:
         base_path: Base path containing 00_vertices/, 01_edges/, 02_faces/
         search_dirs: Additional directories to search for elements (flat search)
     """
-    if search_dirs is None:
-        search_dirs = []
+    return get_element_index(base_path, search_dirs)
+
 
-    index = {}
-
-    # Scan vertices
-    vertices_dir = base_path / '00_vertices'
-    if vertices_dir.exists():
-        for md_file in vertices_dir.glob('*.md'):
-            try:
-                content = md_file.read_text(encoding='utf-8')
-                fm = parse_frontmatter(content)
-                if 'id' in fm:
-                    index[fm['id']] = md_file
-            except:
-                pass
-
-    # Scan edges
-    edges_dir = base_path / '01_edges'
-    if edges_dir.exists():
-        for md_file in edges_dir.glob('*.md'):
-            try:
-                content = md_file.read_text(encoding='utf-8')
-                fm = parse_frontmatter(content)
-                if 'id' in fm:
-                    index[fm['id']] = md_file
-            except:
-                pass
-
-    # Scan faces
-    faces_dir = base_path / '02_faces'
-    if faces_dir.exists():
-        for md_file in faces_dir.glob('*.md'):
-            try:
-                content = md_file.read_text(encoding='utf-8')
-                fm = parse_frontmatter(content)
-                if 'id' in fm:
-                    index[fm['id']] = md_file
-            except:
-                pass
-
-    # Scan additional search directories (flat search for all element types)
-    for search_dir in search_dirs:
-        if search_dir.exists():
-            for md_file in search_dir.glob('*.md'):
-                try:
-                    content = md_file.read_text(encoding='utf-8')
-                    fm = parse_frontmatter(content)
-                    if 'id' in fm and fm['id'] not in index:
-                        index[fm['id']] = md_file
-                except:
-                    pass
-
-    return index
-
-
-def read_element(element_id: str, element_index: Dict[str, Path]) -> Dict[str, Any]:
+def read_element(element_id: str, element_index: ElementIndex) -> Dict[str, Any]:
     """Read element file and extract key info using element index."""
     # Look up element path in index
-    element_path = element_index.get(element_id)
+    element_path = element_index.resolve(element_id)
     if not element_path:
         return None
 
@@ -11,12 +11,21 @@ Usage:
     python scripts/generate_all_templates.py --check       # Check if up-to-date
     python scripts/generate_all_templates.py --dry-run     # Show what would be generated
     python scripts/generate_all_templates.py --verbose     # Show generation details
+    python scripts/generate_all_templates.py --force       # Ignore the manifest
+
+Templates unchanged since they were generated (per
+templates/generated.manifest.json) are skipped; the rest are regenerated,
+across --jobs worker processes.
 """
 
 import sys
 import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import difflib
 
 # Add scripts directory to path
@@ -39,50 +48,241 @@ SPEC_TO_TEMPLATE_MAP = {
     '00_vertices/spec-for-assurance-audits.md': 'templates/charts/assurance_audit.md',
 }
 
+# Manifest of generated templates, committed alongside them. Each entry
+# records the spec and template content hashes and the generator version
+# that produced the template, so freshness is a hash comparison.
+MANIFEST_PATH = 'templates/generated.manifest.json'
+MANIFEST_VERSION = '1.0.0'
+
+# Source whose code determines the generated output. Only the generator
+# itself is hashed: shared helpers (parse_chart.py) change often without
+# changing templates, and hashing them would invalidate every entry.
+GENERATOR_SOURCE = 'generate_template_from_spec.py'
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of text content."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def generator_version() -> str:
+    """Hash of the generator source; changes whenever generation may change."""
+    source = (Path(__file__).parent / GENERATOR_SOURCE).read_bytes()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def render_template(spec_full: Path) -> str:
+    """Generate a template's content from its spec."""
+    return TemplateGenerator(SpecParser(spec_full)).generate_template()
+
+
+def _render_batch(spec_paths: List[Path]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Render a batch of specs in a worker process: (content, error) per spec."""
+    rendered = []
+    for spec_full in spec_paths:
+        try:
+            rendered.append((render_template(spec_full), None))
+        except Exception as e:
+            rendered.append((None, str(e)))
+    return rendered
+
+
+class TemplateManifest:
+    """Spec/template hashes recorded when each template was generated."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = dict(data['templates'])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def is_fresh(self, spec_path: str, template_path: str, spec_hash: str,
+                 template_hash: str, generator: str) -> bool:
+        """True if the template was generated from this spec by this generator and not edited since."""
+        return self.entries.get(template_path) == {
+            'spec': spec_path,
+            'spec_sha256': spec_hash,
+            'template_sha256': template_hash,
+            'generator': generator,
+        }
+
+    def record(self, spec_path: str, template_path: str, spec_hash: str,
+               template_hash: str, generator: str):
+        """Record that template_path is spec_path's output under generator."""
+        entry = {
+            'spec': spec_path,
+            'spec_sha256': spec_hash,
+            'template_sha256': template_hash,
+            'generator': generator,
+        }
+        if self.entries.get(template_path) != entry:
+            self.entries[template_path] = entry
+            self._dirty = True
+
+    def save(self):
+        """Write the manifest if it changed."""
+        if not self._dirty:
+            return
+        data = {'version': MANIFEST_VERSION, 'templates': dict(sorted(self.entries.items()))}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
 class BatchTemplateGenerator:
-    """Generate multiple templates from specs."""
+    """
+    Generate multiple templates from specs.
 
-    def __init__(self, repo_root: Path, verbose: bool = False, dry_run: bool = False):
+    Templates whose spec, content and generator version match the manifest
+    are skipped without running the generator; the rest are regenerated
+    (across jobs worker processes if jobs > 1). Pass force=True to ignore
+    the manifest.
+    """
+
+    def __init__(self, repo_root: Path, verbose: bool = False, dry_run: bool = False,
+                 jobs: Optional[int] = None, force: bool = False):
         self.repo_root = repo_root
         self.verbose = verbose
         self.dry_run = dry_run
+        self.jobs = jobs
+        self.force = force
         self.results: List[Dict] = []
+        self.manifest = TemplateManifest(repo_root / MANIFEST_PATH)
+        self.generator = generator_version()
 
     def log(self, message: str):
         """Log if verbose mode."""
         if self.verbose:
             print(f"  {message}")
 
+    def _select(self, filter_type: str = None) -> List[Tuple[str, str]]:
+        """(spec path, template path) pairs, optionally filtered by type."""
+        pairs = []
+        for spec_path, template_path in SPEC_TO_TEMPLATE_MAP.items():
+            if filter_type == 'vertex' and not template_path.startswith('templates/00_vertices/'):
+                continue
+            if filter_type == 'chart' and not template_path.startswith('templates/charts/'):
+                continue
+            pairs.append((spec_path, template_path))
+        return pairs
+
+    def _hashes(self, spec_path: str, template_path: str) -> Optional[Tuple[str, str]]:
+        """(spec hash, template hash), or None if either file is missing."""
+        try:
+            spec_content = (self.repo_root / spec_path).read_text(encoding='utf-8')
+            template_content = (self.repo_root / template_path).read_text(encoding='utf-8')
+        except OSError:
+            return None
+        return content_hash(spec_content), content_hash(template_content)
+
+    def _fresh_in_manifest(self, spec_path: str, template_path: str) -> bool:
+        """True if the manifest shows the template is current, without generating it."""
+        if self.force:
+            return False
+        hashes = self._hashes(spec_path, template_path)
+        return hashes is not None and self.manifest.is_fresh(
+            spec_path, template_path, *hashes, self.generator
+        )
+
+    def _render_many(self, spec_paths: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Generate templates for specs, in parallel if jobs > 1.
+
+        Returns:
+            Each spec path -> (content, error), exactly one of which is None
+        """
+        spec_fulls = [self.repo_root / spec_path for spec_path in spec_paths]
+        if not self.jobs or self.jobs <= 1 or len(spec_fulls) < 2:
+            rendered = _render_batch(spec_fulls)
+        else:
+            batch_count = min(len(spec_fulls), self.jobs * 4)
+            batch_size = -(-len(spec_fulls) // batch_count)
+            batches = [spec_fulls[i:i + batch_size] for i in range(0, len(spec_fulls), batch_size)]
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                rendered = [item for batch in executor.map(_render_batch, batches) for item in batch]
+        return dict(zip(spec_paths, rendered))
+
     def generate_all(self, filter_type: str = None) -> bool:
         """
         Generate all templates from specs.
 
+        Specs unchanged since their template was generated (per the
+        manifest) are skipped; changed specs are regenerated in parallel.
+
         Args:
             filter_type: Optional filter ('vertex', 'chart')
 
         Returns:
             True if all generations successful
         """
-        success = True
+        pairs = self._select(filter_type)
+        fresh = {
+            template_path for spec_path, template_path in pairs
+            if self._fresh_in_manifest(spec_path, template_path)
+        }
+        rendered = self._render_many([
+            spec_path for spec_path, template_path in pairs
+            if template_path not in fresh and (self.repo_root / spec_path).exists()
+        ])
 
-        for spec_path, template_path in SPEC_TO_TEMPLATE_MAP.items():
-            # Apply type filter if specified
-            if filter_type:
-                if filter_type == 'vertex' and not template_path.startswith('templates/00_vertices/'):
-                    continue
-                elif filter_type == 'chart' and not template_path.startswith('templates/charts/'):
-                    continue
-
-            result = self.generate_one(spec_path, template_path)
+        success = True
+        for spec_path, template_path in pairs:
+            if template_path in fresh:
+                result = self._up_to_date(spec_path, template_path, "Unchanged (manifest)")
+            else:
+                result = self.generate_one(spec_path, template_path, rendered.get(spec_path))
             self.results.append(result)
 
             if not result['success']:
                 success = False
 
+        if not self.dry_run:
+            self.manifest.save()
         return success
 
-    def generate_one(self, spec_path: str, template_path: str) -> Dict:
-        """Generate a single template from spec."""
+    def _up_to_date(self, spec_path: str, template_path: str, reason: str) -> Dict:
+        if self.verbose:
+            print(f"✓ {spec_path} → {template_path}")
+            self.log(reason)
+        else:
+            print(f"✓ {spec_path} → {template_path} (up-to-date)")
+        return {
+            'spec': spec_path,
+            'template': template_path,
+            'success': True,
+            'message': "Up-to-date",
+            'changed': False
+        }
+
+    def _record(self, spec_path: str, template_path: str, new_content: str):
+        """Record a template written (or confirmed) from its spec in the manifest."""
+        spec_content = (self.repo_root / spec_path).read_text(encoding='utf-8')
+        self.manifest.record(
+            spec_path, template_path,
+            content_hash(spec_content), content_hash(new_content), self.generator
+        )
+
+    def generate_one(
+        self,
+        spec_path: str,
+        template_path: str,
+        rendered: Optional[Tuple[Optional[str], Optional[str]]] = None
+    ) -> Dict:
+        """
+        Generate a single template from spec.
+
+        Args:
+            spec_path: Spec path relative to the repository root
+            template_path: Template path relative to the repository root
+            rendered: (content, error) already generated for the spec, if any
+        """
         result = {
             'spec': spec_path,
             'template': template_path,
@@ -103,23 +303,19 @@ class BatchTemplateGenerator:
 
         try:
             # Parse spec and generate template
-            parser = SpecParser(spec_full)
-            generator = TemplateGenerator(parser)
-            new_content = generator.generate_template()
+            if rendered is None:
+                new_content = render_template(spec_full)
+            else:
+                new_content, error = rendered
+                if error is not None:
+                    raise RuntimeError(error)
 
             # Check if template already exists
             if template_full.exists():
                 old_content = template_full.read_text(encoding='utf-8')
                 if old_content == new_content:
-                    result['success'] = True
-                    result['changed'] = False
-                    result['message'] = "Up-to-date"
-                    if self.verbose:
-                        print(f"✓ {spec_path} → {template_path}")
-                        self.log("Template already up-to-date")
-                    else:
-                        print(f"✓ {spec_path} → {template_path} (up-to-date)")
-                    return result
+                    self._record(spec_path, template_path, new_content)
+                    return self._up_to_date(spec_path, template_path, "Template already up-to-date")
                 else:
                     result['changed'] = True
                     result['message'] = "Updated"
@@ -135,6 +331,7 @@ class BatchTemplateGenerator:
 
                         # Write new template
                         template_full.write_text(new_content, encoding='utf-8')
+                        self._record(spec_path, template_path, new_content)
                         print(f"✓ {spec_path} → {template_path}")
                         self.log(f"Updated (backup: {backup_path.name})")
             else:
@@ -148,6 +345,7 @@ class BatchTemplateGenerator:
                     # Ensure directory exists
                     template_full.parent.mkdir(parents=True, exist_ok=True)
                     template_full.write_text(new_content, encoding='utf-8')
+                    self._record(spec_path, template_path, new_content)
                     print(f"✓ {spec_path} → {template_path}")
                     self.log("Created new template")
 
@@ -184,6 +382,10 @@ class BatchTemplateGenerator:
         """
         Check if all templates are up-to-date with their specs.
 
+        Templates matching the manifest are fresh by hash comparison; only
+        the others are regenerated (in parallel if jobs > 1) and compared.
+        Never writes the manifest.
+
         Returns:
             True if all templates are fresh, False otherwise
         """
@@ -192,10 +394,26 @@ class BatchTemplateGenerator:
         all_fresh = True
         stale_templates = []
 
-        for spec_path, template_path in SPEC_TO_TEMPLATE_MAP.items():
+        pairs = self._select()
+        fresh = {
+            template_path for spec_path, template_path in pairs
+            if self._fresh_in_manifest(spec_path, template_path)
+        }
+        rendered = self._render_many([
+            spec_path for spec_path, template_path in pairs
+            if template_path not in fresh
+            and (self.repo_root / spec_path).exists()
+            and (self.repo_root / template_path).exists()
+        ])
+
+        for spec_path, template_path in pairs:
             spec_full = self.repo_root / spec_path
             template_full = self.repo_root / template_path
 
+            if template_path in fresh:
+                print(f"✓ {template_path} - Fresh")
+                continue
+
             if not spec_full.exists():
                 print(f"✗ {spec_path} - Spec not found")
                 all_fresh = False
@@ -207,24 +425,20 @@ class BatchTemplateGenerator:
                 all_fresh = False
                 continue
 
-            try:
-                # Generate what template should be
-                parser = SpecParser(spec_full)
-                generator = TemplateGenerator(parser)
-                expected_content = generator.generate_template()
-
-                # Compare with actual
-                actual_content = template_full.read_text(encoding='utf-8')
+            expected_content, error = rendered[spec_path]
+            if error is not None:
+                print(f"✗ {template_path} - Error: {error}")
+                all_fresh = False
+                continue
 
-                if actual_content == expected_content:
-                    print(f"✓ {template_path} - Fresh")
-                else:
-                    print(f"✗ {template_path} - Stale (doesn't match spec)")
-                    stale_templates.append(template_path)
-                    all_fresh = False
+            # Compare with actual
+            actual_content = template_full.read_text(encoding='utf-8')
 
-            except Exception as e:
-                print(f"✗ {template_path} - Error: {e}")
+            if actual_content == expected_content:
+                print(f"✓ {template_path} - Fresh")
+            else:
+                print(f"✗ {template_path} - Stale (doesn't match spec)")
+                stale_templates.append(template_path)
                 all_fresh = False
 
         if not all_fresh:
@@ -300,6 +514,17 @@ Examples:
         action='store_true',
         help='Show detailed output'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Regenerate changed templates across N worker processes'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate every template, ignoring the manifest'
+    )
 
     args = parser.parse_args()
 
@@ -310,7 +535,9 @@ Examples:
     generator = BatchTemplateGenerator(
         repo_root=repo_root,
         verbose=args.verbose,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        jobs=args.jobs,
+        force=args.force
     )
 
     if args.check:
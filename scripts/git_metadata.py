@@ -0,0 +1,186 @@
+"""
+Batched git authorship lookups for accountability checks.
+
+Asking git who last changed each of N files with `git log -1 -- <path>`
+forks git N times. GitMetadata answers a whole batch from one
+`git log -z --name-only` stream instead: commits are walked newest first,
+each requested path takes the author of the first commit that lists it, and
+the walk stops as soon as every path has been seen. Answers are cached per
+resolved commit SHA (and diff filter), so asking again against the same
+commit does not run git.
+
+    metadata = get_git_metadata()
+    authors = metadata.last_authors(['01_edges/validation-a.md', '01_edges/validation-b.md'])
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+# Each commit in the log stream starts with this byte, then the SHA and the
+# author name as NUL-terminated fields, then the NUL-terminated file names
+COMMIT_MARKER = '\x01'
+LOG_FORMAT = '--format=%x01%H%x00%an'
+
+
+class GitMetadata:
+    """Authorship of files in one git work tree, cached per commit."""
+
+    def __init__(self, toplevel: Path):
+        self.toplevel = toplevel
+        # (commit SHA, diff filter) -> path relative to toplevel -> author
+        self._authors: Dict[Tuple[str, Optional[str]], Dict[str, str]] = {}
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Return the commit SHA for a revision, or None if it does not exist."""
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--verify', '--quiet', f"{rev}^{{commit}}"],
+                cwd=self.toplevel, capture_output=True, text=True
+            )
+        except OSError:
+            return None
+        return result.stdout.strip() or None
+
+    def _relative(self, path: PathLike) -> Optional[str]:
+        """Path relative to the work tree (POSIX form), or None if outside it."""
+        try:
+            return Path(path).resolve().relative_to(self.toplevel).as_posix()
+        except ValueError:
+            return None
+
+    def last_authors(
+        self,
+        paths: Iterable[PathLike],
+        rev: str = 'HEAD',
+        diff_filter: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Find who last changed each path in the history of a revision.
+
+        Args:
+            paths: File paths, absolute or relative to the current directory
+            rev: Revision whose history is searched
+            diff_filter: Only count commits with these change types
+                (git log --diff-filter, e.g. 'AM' for added or modified)
+
+        Returns:
+            Each path (as given, converted to str) -> author name, or empty
+            string if the path has no matching commit or git fails
+        """
+        paths = [str(path) for path in paths]
+        authors = {path: '' for path in paths}
+        sha = self.resolve(rev)
+        if sha is None:
+            return authors
+
+        relative = {path: self._relative(path) for path in paths}
+        cache = self._authors.setdefault((sha, diff_filter), {})
+        missing = sorted({rel for rel in relative.values() if rel is not None and rel not in cache})
+        if missing:
+            found = self._log(sha, missing, diff_filter)
+            if found is not None:
+                for rel in missing:
+                    cache[rel] = found.get(rel, '')
+
+        for path, rel in relative.items():
+            if rel is not None:
+                authors[path] = cache.get(rel, '')
+        return authors
+
+    def last_author(self, path: PathLike, rev: str = 'HEAD', diff_filter: Optional[str] = None) -> str:
+        """Find who last changed a single path (see last_authors)."""
+        return self.last_authors([path], rev, diff_filter)[str(path)]
+
+    def _log(self, sha: str, paths: List[str], diff_filter: Optional[str]) -> Optional[Dict[str, str]]:
+        """
+        Walk the history of sha once, recording the newest author of each path.
+
+        Pathspecs go through stdin so large batches do not hit command line
+        limits. Returns None if git fails.
+        """
+        command = ['git', '--literal-pathspecs', 'log', '-z', '--name-only', LOG_FORMAT, '--stdin']
+        if diff_filter:
+            command.append(f"--diff-filter={diff_filter}")
+        command.append(sha)
+
+        try:
+            process = subprocess.Popen(
+                command, cwd=self.toplevel,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return None
+
+        pending = set(paths)
+        found: Dict[str, str] = {}
+        author = None
+        expect_author = False
+        buffer = b''
+        try:
+            process.stdin.write(b'--\n' + b''.join(os.fsencode(path) + b'\n' for path in paths))
+            process.stdin.close()
+            while pending:
+                chunk = process.stdout.read1(65536)
+                if not chunk:
+                    break
+                *fields, buffer = (buffer + chunk).split(b'\0')
+                for field in fields:
+                    if expect_author:
+                        author = field.decode('utf-8', errors='replace')
+                        expect_author = False
+                    elif field.startswith(COMMIT_MARKER.encode()):
+                        expect_author = True
+                    elif field:
+                        path = os.fsdecode(field.lstrip(b'\n'))
+                        if path in pending:
+                            pending.discard(path)
+                            found[path] = author
+        finally:
+            stopped_early = process.poll() is None and not pending
+            if stopped_early:
+                process.kill()
+            process.stdout.close()
+            returncode = process.wait()
+
+        if returncode != 0 and not stopped_early:
+            return None
+        return found
+
+
+_metadata: Dict[Path, GitMetadata] = {}
+_toplevels: Dict[str, Optional[Path]] = {}
+
+
+def get_git_metadata(directory: Optional[PathLike] = None) -> Optional[GitMetadata]:
+    """
+    Return the shared GitMetadata for the work tree containing a directory.
+
+    Args:
+        directory: Directory inside the work tree (defaults to the current
+            directory)
+
+    Returns:
+        GitMetadata, or None if the directory is not in a git work tree
+    """
+    key = str(Path(directory or Path.cwd()).resolve())
+    if key not in _toplevels:
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--show-toplevel'],
+                cwd=key, capture_output=True, text=True
+            )
+            toplevel = result.stdout.strip()
+        except OSError:
+            toplevel = ''
+        _toplevels[key] = Path(toplevel).resolve() if toplevel else None
+
+    toplevel = _toplevels[key]
+    if toplevel is None:
+        return None
+    if toplevel not in _metadata:
+        _metadata[toplevel] = GitMetadata(toplevel)
+    return _metadata[toplevel]
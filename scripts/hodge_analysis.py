@@ -18,7 +18,7 @@ import json
 import numpy as np
 import scipy.sparse as sp
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Callable, Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 
 
@@ -55,7 +55,7 @@ class EdgePageRankResults:
     edge_to_index: Dict[str, int]
     index_to_edge: Dict[int, str]
 
-    # PageRank vectors (one per edge)
+    # PageRank vectors (one per edge; views of pagerank_matrix columns)
     pagerank_vectors: Dict[str, np.ndarray]
 
     # Hodge decompositions (one per edge)
@@ -69,6 +69,10 @@ class EdgePageRankResults:
     global_circular_influence: np.ndarray
     global_harmonic_influence: np.ndarray
 
+    # PageRank matrix (n_edges × n_edges); column j is the personalized
+    # PageRank vector of edge j (empty if PageRank was not computed)
+    pagerank_matrix: np.ndarray = None
+
 
 class ChartData:
     """Simple container for chart data loaded from JSON."""
@@ -134,7 +138,8 @@ class HodgeAnalyzer:
     def analyze(
         self,
         beta: float = 0.1,
-        compute_all_pagerank: bool = True
+        compute_all_pagerank: bool = True,
+        batched: bool = True
     ) -> EdgePageRankResults:
         """
         Perform complete Hodge analysis on the chart.
@@ -144,6 +149,9 @@ class HodgeAnalyzer:
                   Related to jumping probability α by β = 2α/(1-α)
             compute_all_pagerank: If True, compute personalized PageRank for all edges
                                  If False, only compute Laplacian and decompositions
+            batched: If True, factorize (βI + L₁) once and solve for all edges
+                     as one block right-hand side. If False, run one iterative
+                     solve per edge.
 
         Returns:
             EdgePageRankResults object
@@ -162,7 +170,8 @@ class HodgeAnalyzer:
                 influences={},
                 global_gradient_influence=np.array([]),
                 global_circular_influence=np.array([]),
-                global_harmonic_influence=np.array([])
+                global_harmonic_influence=np.array([]),
+                pagerank_matrix=np.zeros((0, 0), dtype=np.float64)
             )
 
         # Build boundary operators
@@ -176,39 +185,50 @@ class HodgeAnalyzer:
         pagerank_vectors = {}
         hodge_decompositions = {}
         influences = {}
+        pagerank_matrix = np.zeros((0, 0), dtype=np.float64)
 
         if compute_all_pagerank:
-            for edge_id in self.chart.edge_ids:
-                if edge_id not in edge_to_index:
-                    continue
-
-                edge_idx = edge_to_index[edge_id]
-
-                # Indicator vector for this edge
-                indicator = np.zeros(n_edges, dtype=np.float64)
-                indicator[edge_idx] = 1.0
-
-                # Compute personalized PageRank
-                pr_vector = self._compute_pagerank(L1, indicator, beta)
-                pagerank_vectors[edge_id] = pr_vector
-
-                # Hodge decomposition
-                decomp = self._hodge_decompose(pr_vector, d0, d1)
-                hodge_decompositions[edge_id] = decomp
-
-                # Influence measures
-                influences[edge_id] = self._compute_influence(edge_id, pr_vector)
+            A = self._build_pagerank_system(L1, beta)
 
-        # Compute global influence measures
-        global_gradient = np.zeros(n_edges, dtype=np.float64)
-        global_circular = np.zeros(n_edges, dtype=np.float64)
-        global_harmonic = np.zeros(n_edges, dtype=np.float64)
-
-        if hodge_decompositions:
-            for decomp in hodge_decompositions.values():
-                global_gradient += np.abs(decomp.gradient)
-                global_circular += np.abs(decomp.circular)
-                global_harmonic += np.abs(decomp.harmonic)
+            if batched:
+                pagerank_matrix = self._compute_pagerank_matrix(A)
+                gradient, circular, harmonic = self._hodge_decompose_matrix(pagerank_matrix, d0, d1)
+            else:
+                pagerank_matrix = np.empty((n_edges, n_edges), dtype=np.float64)
+                gradient = np.empty_like(pagerank_matrix)
+                circular = np.empty_like(pagerank_matrix)
+                harmonic = np.empty_like(pagerank_matrix)
+                for edge_idx in range(n_edges):
+                    # Indicator vector for this edge
+                    indicator = np.zeros(n_edges, dtype=np.float64)
+                    indicator[edge_idx] = 1.0
+                    pr_vector = self._compute_pagerank(A, indicator)
+                    decomp = self._hodge_decompose(pr_vector, d0, d1)
+                    pagerank_matrix[:, edge_idx] = pr_vector
+                    gradient[:, edge_idx] = decomp.gradient
+                    circular[:, edge_idx] = decomp.circular
+                    harmonic[:, edge_idx] = decomp.harmonic
+
+            # Per-edge views of the matrix columns
+            for edge_id, edge_idx in edge_to_index.items():
+                pagerank_vectors[edge_id] = pagerank_matrix[:, edge_idx]
+                hodge_decompositions[edge_id] = HodgeDecomposition(
+                    gradient=gradient[:, edge_idx],
+                    circular=circular[:, edge_idx],
+                    harmonic=harmonic[:, edge_idx]
+                )
+
+            # Influence measures
+            influences = self._compute_influences(pagerank_matrix, edge_to_index)
+
+            # Global influence measures: summed magnitude over all edges' PageRank
+            global_gradient = np.abs(gradient).sum(axis=1)
+            global_circular = np.abs(circular).sum(axis=1)
+            global_harmonic = np.abs(harmonic).sum(axis=1)
+        else:
+            global_gradient = np.zeros(n_edges, dtype=np.float64)
+            global_circular = np.zeros(n_edges, dtype=np.float64)
+            global_harmonic = np.zeros(n_edges, dtype=np.float64)
 
         return EdgePageRankResults(
             chart_id=self.chart.id,
@@ -219,12 +239,13 @@ class HodgeAnalyzer:
             influences=influences,
             global_gradient_influence=global_gradient,
             global_circular_influence=global_circular,
-            global_harmonic_influence=global_harmonic
+            global_harmonic_influence=global_harmonic,
+            pagerank_matrix=pagerank_matrix
         )
 
     def _build_edge_index(self) -> Tuple[Dict[str, int], Dict[int, str]]:
-        """Build bidirectional edge indexing."""
-        edge_to_index = {edge_id: idx for idx, edge_id in enumerate(self.chart.edge_ids)}
+        """Build bidirectional edge indexing (duplicate edge IDs share one index)."""
+        edge_to_index = {edge_id: idx for idx, edge_id in enumerate(dict.fromkeys(self.chart.edge_ids))}
         index_to_edge = {idx: edge_id for edge_id, idx in edge_to_index.items()}
         return edge_to_index, index_to_edge
 
@@ -232,63 +253,54 @@ class HodgeAnalyzer:
         """
         Build ∂₁: edges → vertices boundary operator.
 
-        For each edge, marks its source and target vertices.
-        Matrix is (n_vertices × n_edges).
+        For each edge, marks its source (-1) and target (+1) vertices.
+        Matrix is (n_vertices × n_edges), assembled from index arrays.
         """
         # Build vertex index
         vertex_to_index = {v_id: idx for idx, v_id in enumerate(self.chart.vertices)}
         n_vertices = len(vertex_to_index)
         n_edges = len(edge_to_index)
 
-        # Build sparse matrix
-        row_indices = []
-        col_indices = []
-        data = []
-
-        for edge_id, edge_data in self.chart.edges.items():
-            if edge_id not in edge_to_index:
-                continue
-
-            edge_idx = edge_to_index[edge_id]
-            source = edge_data.get('source', '')
-            target = edge_data.get('target', '')
-
-            # Source vertex gets -1
-            if source in vertex_to_index:
-                source_idx = vertex_to_index[source]
-                row_indices.append(source_idx)
-                col_indices.append(edge_idx)
-                data.append(-1.0)
-
-            # Target vertex gets +1
-            if target in vertex_to_index:
-                target_idx = vertex_to_index[target]
-                row_indices.append(target_idx)
-                col_indices.append(edge_idx)
-                data.append(1.0)
-
-        if not data:
-            return sp.csr_matrix((n_vertices, n_edges), dtype=np.float64)
-
-        # Convert to numpy arrays with explicit dtype
-        data = np.array(data, dtype=np.float64)
-        row_indices = np.array(row_indices, dtype=np.int32)
-        col_indices = np.array(col_indices, dtype=np.int32)
-
-        d0 = sp.csr_matrix(
+        edges = [
+            (edge_to_index[edge_id], edge_data)
+            for edge_id, edge_data in self.chart.edges.items()
+            if edge_id in edge_to_index
+        ]
+        n = len(edges)
+
+        # Column (edge) and row (vertex) index arrays; -1 marks unknown vertices
+        cols = np.fromiter((idx for idx, _ in edges), dtype=np.int64, count=n)
+        sources = np.fromiter(
+            (vertex_to_index.get(data.get('source', ''), -1) for _, data in edges),
+            dtype=np.int64, count=n
+        )
+        targets = np.fromiter(
+            (vertex_to_index.get(data.get('target', ''), -1) for _, data in edges),
+            dtype=np.int64, count=n
+        )
+
+        has_source = sources >= 0
+        has_target = targets >= 0
+        row_indices = np.concatenate([sources[has_source], targets[has_target]])
+        col_indices = np.concatenate([cols[has_source], cols[has_target]])
+        # Source vertex gets -1, target vertex gets +1
+        data = np.concatenate([
+            np.full(int(has_source.sum()), -1.0),
+            np.full(int(has_target.sum()), 1.0)
+        ])
+
+        return sp.csr_matrix(
             (data, (row_indices, col_indices)),
             shape=(n_vertices, n_edges),
             dtype=np.float64
         )
 
-        return d0
-
     def _build_d1(self, edge_to_index: Dict[str, int]) -> sp.csr_matrix:
         """
         Build ∂₂: faces → edges boundary operator.
 
         For each face, marks its boundary edges.
-        Matrix is (n_edges × n_faces).
+        Matrix is (n_edges × n_faces), assembled from index arrays.
         """
         n_edges = len(edge_to_index)
         n_faces = len(self.chart.face_ids)
@@ -296,41 +308,31 @@ class HodgeAnalyzer:
         # Build face index
         face_to_index = {f_id: idx for idx, f_id in enumerate(self.chart.face_ids)}
 
-        # Build sparse matrix
-        row_indices = []
-        col_indices = []
-        data = []
-
-        for face_id, boundary_edges in self.chart.faces.items():
-            if face_id not in face_to_index:
-                continue
-
-            face_idx = face_to_index[face_id]
-
-            # Mark each boundary edge
-            for edge_id in boundary_edges:
-                if edge_id in edge_to_index:
-                    edge_idx = edge_to_index[edge_id]
-                    row_indices.append(edge_idx)
-                    col_indices.append(face_idx)
-                    data.append(1.0)
-
-        if not data:
-            return sp.csr_matrix((n_edges, n_faces), dtype=np.float64)
+        faces = [
+            (face_to_index[face_id], boundary_edges)
+            for face_id, boundary_edges in self.chart.faces.items()
+            if face_id in face_to_index
+        ]
+
+        # One column entry per (face, boundary edge) pair; -1 marks unknown edges
+        lengths = np.fromiter((len(edges) for _, edges in faces), dtype=np.int64, count=len(faces))
+        face_indices = np.fromiter((idx for idx, _ in faces), dtype=np.int64, count=len(faces))
+        col_indices = np.repeat(face_indices, lengths)
+        row_indices = np.fromiter(
+            (edge_to_index.get(edge_id, -1) for _, edges in faces for edge_id in edges),
+            dtype=np.int64, count=int(lengths.sum())
+        )
 
-        # Convert to numpy arrays with explicit dtype
-        data = np.array(data, dtype=np.float64)
-        row_indices = np.array(row_indices, dtype=np.int32)
-        col_indices = np.array(col_indices, dtype=np.int32)
+        known = row_indices >= 0
+        row_indices = row_indices[known]
+        col_indices = col_indices[known]
 
-        d1 = sp.csr_matrix(
-            (data, (row_indices, col_indices)),
+        return sp.csr_matrix(
+            (np.ones(len(row_indices), dtype=np.float64), (row_indices, col_indices)),
             shape=(n_edges, n_faces),
             dtype=np.float64
         )
 
-        return d1
-
     def _build_edge_laplacian(
         self,
         d0: sp.csr_matrix,
@@ -344,20 +346,13 @@ class HodgeAnalyzer:
         - D₀ is diagonal with vertex degrees
         - D₁ is diagonal with edge degrees (number of incident faces)
         """
-        n_edges = len(edge_to_index)
-        n_vertices = d0.shape[0]
-
-        # Build D0: diagonal matrix with vertex degrees
-        vertex_degrees = np.zeros(n_vertices, dtype=np.float64)
-        for i in range(n_vertices):
-            vertex_degrees[i] = np.abs(d0[i, :]).sum()
+        # Build D0: diagonal matrix with vertex degrees (row sums of |∂₁|)
+        vertex_degrees = np.asarray(abs(d0).sum(axis=1), dtype=np.float64).ravel()
         vertex_degrees[vertex_degrees == 0] = 1.0  # Avoid division by zero
         D0_inv = sp.diags(1.0 / vertex_degrees, dtype=np.float64)
 
         # Build D1: diagonal matrix with edge degrees (faces per edge)
-        edge_degrees = np.zeros(n_edges, dtype=np.float64)
-        for i in range(n_edges):
-            edge_degrees[i] = np.abs(d1[i, :]).sum()
+        edge_degrees = np.asarray(abs(d1).sum(axis=1), dtype=np.float64).ravel()
         edge_degrees[edge_degrees == 0] = 1.0  # Avoid division by zero
         D1_inv = sp.diags(1.0 / edge_degrees, dtype=np.float64)
 
@@ -373,33 +368,38 @@ class HodgeAnalyzer:
         # Ensure final matrix is float64
         return L1.astype(np.float64).tocsr()
 
+    def _build_pagerank_system(self, L1: sp.csr_matrix, beta: float) -> sp.csc_matrix:
+        """
+        Build the PageRank system matrix A = βI + L₁ once per analysis.
+
+        Args:
+            L1: Edge Laplacian
+            beta: Jumping parameter
+
+        Returns:
+            System matrix in CSC format (as required by splu)
+        """
+        n = L1.shape[0]
+        I = sp.eye(n, format='csc', dtype=np.float64)
+        return (beta * I + L1.astype(np.float64)).tocsc()
+
     def _compute_pagerank(
         self,
-        L1: sp.csr_matrix,
-        indicator: np.ndarray,
-        beta: float
+        A: sp.csc_matrix,
+        indicator: np.ndarray
     ) -> np.ndarray:
         """
         Compute personalized PageRank: PR = (βI + L₁)⁻¹ χ
 
         Args:
-            L1: Edge Laplacian
+            A: System matrix βI + L₁ (see _build_pagerank_system)
             indicator: Indicator vector for edge of interest
-            beta: Jumping parameter
 
         Returns:
             PageRank vector
         """
-        n = L1.shape[0]
-
-        # Ensure everything is float64 and convert to proper format
-        L1 = L1.astype(np.float64).tocsr()
         indicator = np.asarray(indicator, dtype=np.float64).ravel()
 
-        # Build system matrix A = βI + L1
-        I = sp.eye(n, format='csr', dtype=np.float64)
-        A = (beta * I + L1).tocsr()
-
         # Try iterative solver first for larger systems
         try:
             from scipy.sparse.linalg import cg
@@ -416,6 +416,32 @@ class HodgeAnalyzer:
 
         return np.asarray(pr, dtype=np.float64).ravel()
 
+    def _compute_pagerank_matrix(self, A: sp.csc_matrix) -> np.ndarray:
+        """
+        Compute personalized PageRank for every edge at once.
+
+        Factorizes A = βI + L₁ a single time (sparse LU; A is not symmetric
+        because of the D₁⁻¹ weighting) and solves A X = I, so column j of X
+        is the PageRank vector of edge j.
+
+        Args:
+            A: System matrix βI + L₁ (see _build_pagerank_system)
+
+        Returns:
+            Dense PageRank matrix (n_edges × n_edges)
+        """
+        n = A.shape[0]
+        try:
+            from scipy.sparse.linalg import splu
+            lu = splu(A)
+            pagerank = lu.solve(np.eye(n, dtype=np.float64))
+        except Exception as e:
+            if self.verbose:
+                print(f"Warning: Sparse factorization failed ({e}), using dense solver")
+            pagerank = np.linalg.solve(A.toarray(), np.eye(n, dtype=np.float64))
+
+        return np.asarray(pagerank, dtype=np.float64)
+
     def _hodge_decompose(
         self,
         vector: np.ndarray,
@@ -456,6 +482,76 @@ class HodgeAnalyzer:
             harmonic=harmonic
         )
 
+    def _hodge_decompose_matrix(
+        self,
+        vectors: np.ndarray,
+        d0: sp.csr_matrix,
+        d1: sp.csr_matrix
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Hodge-decompose every column of a matrix at once.
+
+        Builds the gradient and circular projectors once per chart (see
+        _build_projector) and applies each to the whole matrix.
+
+        Args:
+            vectors: Edge vectors as columns (n_edges × k)
+            d0: ∂₁ boundary operator (edges → vertices)
+            d1: ∂₂ boundary operator (faces → edges)
+
+        Returns:
+            Tuple of (gradient, circular, harmonic) matrices, same shape as vectors
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+
+        gradient = self._build_projector(d0.T)(vectors)
+        circular = self._build_projector(d1)(vectors)
+        harmonic = vectors - gradient - circular
+
+        return gradient, circular, harmonic
+
+    def _build_projector(
+        self,
+        operator: sp.csr_matrix,
+        regularization: float = 1e-10
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Build a projection onto the image of an operator.
+
+        Factorizes the regularized normal equations (A.T @ A + εI) once, so
+        proj_{im(A)} V = A @ (A.T @ A)⁻¹ @ A.T @ V costs two sparse products
+        and triangular solves for any number of columns of V.
+
+        Args:
+            operator: Operator whose image we project onto
+            regularization: Small value added to diagonal for numerical stability
+
+        Returns:
+            Function mapping a vector or matrix of column vectors to its projection
+        """
+        operator = operator.astype(np.float64).tocsr()
+        n = operator.shape[1]
+
+        if n == 0 or operator.nnz == 0:
+            return lambda V: np.zeros_like(np.asarray(V, dtype=np.float64))
+
+        ATA_reg = (operator.T @ operator + regularization * sp.eye(n, dtype=np.float64)).tocsc()
+
+        try:
+            from scipy.sparse.linalg import splu
+            solve = splu(ATA_reg).solve
+        except Exception as e:
+            if self.verbose:
+                print(f"Warning: Projection factorization failed ({e}), using dense solver")
+            ATA_dense = ATA_reg.toarray()
+            solve = lambda b: np.linalg.lstsq(ATA_dense, b, rcond=None)[0]
+
+        def project(V: np.ndarray) -> np.ndarray:
+            ATV = np.asarray(operator.T @ np.asarray(V, dtype=np.float64))
+            return np.asarray(operator @ solve(ATV), dtype=np.float64)
+
+        return project
+
     def _project_onto_image(
         self,
         vector: np.ndarray,
@@ -515,39 +611,42 @@ class HodgeAnalyzer:
 
         return np.asarray(projection, dtype=np.float64).ravel()
 
-    def _compute_influence(
+    def _compute_influences(
         self,
-        edge_id: str,
-        pagerank_vector: np.ndarray
-    ) -> EdgeInfluence:
+        pagerank_matrix: np.ndarray,
+        edge_to_index: Dict[str, int]
+    ) -> Dict[str, EdgeInfluence]:
         """
-        Compute influence measures for an edge's PageRank vector.
+        Compute influence measures for every edge's PageRank vector.
 
-        Measures:
+        Measures (per column of the PageRank matrix):
         - spread: ||v||₂ / ||v||₁ (how spread out is influence)
         - absolute_influence: ||v||₁ (total magnitude of influence)
         - penetration: ||v||₂ (emphasis on influencing many edges)
         - relative_influence: Σv (signed sum, accounts for excitation/inhibition)
         """
         # L1 norm (absolute influence)
-        l1_norm = np.linalg.norm(pagerank_vector, ord=1)
+        l1_norms = np.abs(pagerank_matrix).sum(axis=0)
 
         # L2 norm (penetration)
-        l2_norm = np.linalg.norm(pagerank_vector, ord=2)
+        l2_norms = np.linalg.norm(pagerank_matrix, ord=2, axis=0)
 
         # Spread
-        spread = l2_norm / l1_norm if l1_norm > 0 else 0.0
+        spread = np.divide(l2_norms, l1_norms, out=np.zeros_like(l1_norms), where=l1_norms > 0)
 
         # Relative influence (signed sum)
-        relative = np.sum(pagerank_vector)
-
-        return EdgeInfluence(
-            edge_id=edge_id,
-            spread=spread,
-            absolute_influence=l1_norm,
-            penetration=l2_norm,
-            relative_influence=relative
-        )
+        relative = pagerank_matrix.sum(axis=0)
+
+        return {
+            edge_id: EdgeInfluence(
+                edge_id=edge_id,
+                spread=spread[idx],
+                absolute_influence=l1_norms[idx],
+                penetration=l2_norms[idx],
+                relative_influence=relative[idx]
+            )
+            for edge_id, idx in edge_to_index.items()
+        }
 
     def get_top_edges_by_measure(
         self,
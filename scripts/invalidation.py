@@ -0,0 +1,414 @@
+"""
+Reverse-dependency index from element files to the verifications that read them.
+
+Every verification is a task on one subject file, with the element IDs
+(and template types) it reads as inputs:
+
+    chart           verify_chart.py              chart, its elements, its faces' edges
+    audit           audit_assurance_chart.py     assurance_audit chart, its vertices and faces
+    accountability  check_accountability.py      signature face, its validation edge and
+                                                 the assurance faces sharing that edge
+    dependencies    verify_dependency_hierarchy  vertex and the vertices it depends on
+    template        verify_template_based.py     element and the template for its type
+
+Given the files changed since a git revision, a task is affected if one of
+its inputs changed, in either the current tree or the tree at the revision
+(so removing a reference invalidates the task that used it). Changes to the
+verifier scripts themselves invalidate every task of their kind.
+
+    python scripts/invalidation.py --changed-since origin/main
+    python scripts/invalidation.py --changed-since HEAD~1 --json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from build_cache import ELEMENT_DIRECTORIES
+from parse_chart import ParseError, extract_frontmatter, list_element_files, read_frontmatter
+
+TASK_KINDS = ['chart', 'audit', 'accountability', 'dependencies', 'template']
+
+# Scripts whose changes invalidate every task of a kind; shared modules
+# (parsing, caching) invalidate all kinds
+SCRIPT_TASKS = {
+    'verify_chart.py': ['chart'],
+    'audit_assurance_chart.py': ['audit'],
+    'generate_assurance_audit_elements.py': ['audit'],
+    'check_accountability.py': ['accountability'],
+    'verify_dependency_hierarchy.py': ['dependencies'],
+    'verify_template_based.py': ['template'],
+    'template_parser.py': ['template'],
+    'parse_chart.py': TASK_KINDS,
+    'element_index.py': TASK_KINDS,
+    'cached_complex.py': TASK_KINDS,
+    'binary_cache.py': TASK_KINDS,
+    'build_cache.py': TASK_KINDS,
+}
+
+
+class InvalidationError(Exception):
+    """Raised when the set of changed files cannot be determined."""
+    pass
+
+
+@dataclass(frozen=True, order=True)
+class Task:
+    """One verification of one subject file."""
+
+    kind: str
+    file: str
+    element_id: Optional[str] = None
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.element_id or self.file}"
+
+
+def template_node(element_type: str) -> str:
+    """Input node standing for the template of an element type."""
+    return f"template/{element_type}"
+
+
+def _references(value: Any) -> List[str]:
+    """Element IDs in a frontmatter field (a string or a list of strings)."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, list):
+        return [str(item) for item in value if isinstance(item, (str, int))]
+    return []
+
+
+def build_task_inputs(files: Dict[str, Optional[Dict[str, Any]]]) -> Dict[Task, Set[str]]:
+    """
+    Derive every verification task and its inputs from element frontmatter.
+
+    Args:
+        files: Element file path (relative to the root) -> frontmatter, or
+            None if the file's frontmatter is malformed
+
+    Returns:
+        Mapping of task to the element IDs and template nodes it reads
+    """
+    by_id = {}
+    for rel_path, frontmatter in files.items():
+        if frontmatter and frontmatter.get('id'):
+            by_id.setdefault(str(frontmatter['id']), frontmatter)
+
+    # Assurance faces by the validation edge they share (see check_accountability)
+    assurance_by_edge: Dict[str, Set[str]] = {}
+    for rel_path, frontmatter in files.items():
+        path = Path(rel_path)
+        if frontmatter and path.parent.name == '02_faces' and path.name.startswith('assurance-'):
+            for edge_id in _references(frontmatter.get('validation_edge')):
+                assurance_by_edge.setdefault(edge_id, set()).add(str(frontmatter.get('id', rel_path)))
+
+    tasks: Dict[Task, Set[str]] = {}
+    for rel_path, frontmatter in files.items():
+        path = Path(rel_path)
+        in_charts = path.parts[0] == 'charts'
+
+        if not isinstance(frontmatter, dict):
+            # Unreadable chart files are still verified (their parse error is reported)
+            if in_charts:
+                tasks[Task('chart', rel_path)] = set()
+            continue
+
+        element_id = str(frontmatter['id']) if frontmatter.get('id') else None
+        element_type = str(frontmatter.get('type', ''))
+        own = {element_id} if element_id else set()
+
+        if element_type:
+            tasks[Task('template', rel_path, element_id)] = own | {template_node(element_type)}
+
+        if in_charts and element_type.startswith('chart/'):
+            elements = frontmatter.get('elements') or {}
+            if not isinstance(elements, dict):
+                elements = {}
+            vertices = _references(elements.get('vertices'))
+            edges = _references(elements.get('edges'))
+            faces = _references(elements.get('faces'))
+
+            inputs = own | set(vertices) | set(edges) | set(faces)
+            for face_id in faces:
+                inputs.update(_references((by_id.get(face_id) or {}).get('edges')))
+            tasks[Task('chart', rel_path, element_id)] = inputs
+
+            if element_type == 'chart/assurance_audit':
+                tasks[Task('audit', rel_path, element_id)] = own | set(vertices) | set(faces)
+
+        elif path.parent.name == '00_vertices':
+            dependencies = _references(frontmatter.get('dependencies'))
+            if dependencies:
+                tasks[Task('dependencies', rel_path, element_id)] = own | set(dependencies)
+
+        elif path.parent.name == '02_faces' and path.name.startswith('signature-'):
+            edges = _references(frontmatter.get('validation_edge'))
+            inputs = own | set(edges)
+            for edge_id in edges:
+                inputs.update(assurance_by_edge.get(edge_id, ()))
+            tasks[Task('accountability', rel_path, element_id)] = inputs
+
+    return tasks
+
+
+def reverse_index(task_inputs: Dict[Task, Set[str]]) -> Dict[str, Set[Task]]:
+    """
+    Invert task inputs into input node -> tasks that read it.
+
+    Args:
+        task_inputs: Mapping from build_task_inputs
+
+    Returns:
+        Mapping of element ID (or template node) to dependent tasks
+    """
+    dependents: Dict[str, Set[Task]] = {}
+    for task, inputs in task_inputs.items():
+        for node in inputs:
+            dependents.setdefault(node, set()).add(task)
+    return dependents
+
+
+def _read_frontmatter_text(content: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Frontmatter of file content, or None if missing or unreadable."""
+    if content is None:
+        return None
+    try:
+        frontmatter, _ = extract_frontmatter(content)
+    except ParseError:
+        return None
+    return frontmatter if isinstance(frontmatter, dict) else None
+
+
+def load_element_frontmatter(root_path: Path) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Read the frontmatter of every element file.
+
+    Args:
+        root_path: Repository root
+
+    Returns:
+        Element file path (relative to root) -> frontmatter, or None if it is
+        malformed; files without frontmatter (README.md etc.) are left out
+    """
+    files = {}
+    for _, dir_name, element_type in ELEMENT_DIRECTORIES:
+        for file_path in list_element_files(root_path / dir_name, element_type):
+            try:
+                frontmatter = read_frontmatter(file_path)
+            except (ParseError, OSError, UnicodeDecodeError):
+                files[str(file_path.relative_to(root_path))] = None
+                continue
+            if isinstance(frontmatter, dict):
+                files[str(file_path.relative_to(root_path))] = frontmatter
+    return files
+
+
+def _git(root_path: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ['git', *args], cwd=root_path, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, 'stderr', '') or ''
+        raise InvalidationError(f"git {' '.join(args)} failed: {stderr.strip() or e}")
+    return result.stdout
+
+
+def changed_files_since(root_path: Path, rev: str) -> List[str]:
+    """
+    List files changed between a revision and the working tree.
+
+    Includes uncommitted and untracked files; renames are reported as a
+    deletion plus an addition.
+
+    Args:
+        root_path: Repository root (or a directory inside the git work tree)
+        rev: Git revision to compare against
+
+    Returns:
+        Sorted file paths relative to root_path
+
+    Raises:
+        InvalidationError: If git fails (e.g. unknown revision)
+    """
+    changed = _git(root_path, 'diff', '--name-only', '--no-renames', '--relative', rev, '--')
+    untracked = _git(root_path, 'ls-files', '--others', '--exclude-standard')
+    return sorted(set(changed.splitlines()) | set(untracked.splitlines()))
+
+
+def read_file_at(root_path: Path, rev: str, rel_path: str) -> Optional[str]:
+    """
+    Read a file as it was at a revision.
+
+    Returns:
+        File content, or None if the file did not exist at the revision
+    """
+    try:
+        return _git(root_path, 'show', f"{rev}:./{rel_path}")
+    except InvalidationError:
+        return None
+
+
+def _is_element_file(rel_path: str) -> bool:
+    parts = Path(rel_path).parts
+    if not rel_path.endswith('.md') or len(parts) < 2:
+        return False
+    if parts[0] == 'charts':
+        return True
+    return len(parts) == 2 and parts[0] in {dir_name for _, dir_name, _ in ELEMENT_DIRECTORIES}
+
+
+def affected_tasks(
+    root_path: Path,
+    changed_files: Iterable[str],
+    rev: Optional[str] = None,
+    files: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+) -> List[Task]:
+    """
+    Compute the minimal set of verification tasks affected by changed files.
+
+    Args:
+        root_path: Repository root
+        changed_files: Changed file paths relative to root_path
+        rev: Revision the files changed since; their content there supplies
+            the old IDs and references (without it only the current tree is used)
+        files: Current element frontmatter (default: read from root_path)
+
+    Returns:
+        Sorted tasks of the current tree that need re-running
+    """
+    root_path = Path(root_path)
+    if files is None:
+        files = load_element_frontmatter(root_path)
+
+    changed_nodes: Set[str] = set()
+    changed_paths: Set[str] = set()
+    whole_kinds: Set[str] = set()
+    old_files = dict(files)
+
+    for rel_path in changed_files:
+        rel_path = Path(rel_path).as_posix()
+        path = Path(rel_path)
+
+        if path.parts[0] == 'scripts' and path.name in SCRIPT_TASKS:
+            whole_kinds.update(SCRIPT_TASKS[path.name])
+            continue
+
+        is_element = _is_element_file(rel_path)
+        is_template = path.parts[0] == 'templates' and path.suffix == '.md'
+        if not is_element and not is_template:
+            continue
+
+        new = files.get(rel_path) if is_element else None
+        if is_template and (root_path / path).exists():
+            new = _read_frontmatter_text((root_path / path).read_text(encoding='utf-8'))
+        old = _read_frontmatter_text(read_file_at(root_path, rev, rel_path)) if rev else None
+
+        for frontmatter in (old, new):
+            if not frontmatter:
+                continue
+            if is_template:
+                template_type = str(frontmatter.get('type', ''))
+                if template_type.startswith('template/'):
+                    template_type = template_type[len('template/'):]
+                if template_type:
+                    changed_nodes.add(template_node(template_type))
+            elif frontmatter.get('id'):
+                changed_nodes.add(str(frontmatter['id']))
+
+        if is_element:
+            changed_paths.add(rel_path)
+            if old is not None:
+                old_files[rel_path] = old
+            else:
+                old_files.pop(rel_path, None)
+
+    current = build_task_inputs(files)
+    affected = {
+        task for task in current
+        if task.kind in whole_kinds or task.file in changed_paths
+    }
+    # Dependents in the current tree, and in the tree at rev (references
+    # that were removed still invalidate the task that held them)
+    graphs = [current, build_task_inputs(old_files)] if rev else [current]
+    for task_inputs in graphs:
+        dependents = reverse_index(task_inputs)
+        for node in changed_nodes:
+            affected.update(task for task in dependents.get(node, ()) if task in current)
+    return sorted(affected)
+
+
+def tasks_changed_since(root_path: Path, rev: str, kind: Optional[str] = None) -> List[Task]:
+    """
+    Tasks affected by changes since a git revision (see affected_tasks).
+
+    Args:
+        root_path: Repository root
+        rev: Git revision
+        kind: Only return tasks of this kind
+
+    Raises:
+        InvalidationError: If git fails
+    """
+    tasks = affected_tasks(root_path, changed_files_since(root_path, rev), rev)
+    return [task for task in tasks if kind is None or task.kind == kind]
+
+
+def main():
+    """Command-line interface for invalidation."""
+    parser = argparse.ArgumentParser(
+        description='List the verification tasks affected by changed files'
+    )
+    parser.add_argument(
+        '--changed-since',
+        required=True,
+        metavar='REV',
+        help='Git revision to compare the working tree against'
+    )
+    parser.add_argument(
+        '--root',
+        type=Path,
+        default=Path.cwd(),
+        help='Repository root (default: current directory)'
+    )
+    parser.add_argument(
+        '--kind',
+        choices=TASK_KINDS,
+        help='Only list tasks of this kind'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print tasks as JSON'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        tasks = tasks_changed_since(args.root, args.changed_since, args.kind)
+    except InvalidationError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps([
+            {'kind': task.kind, 'id': task.element_id, 'file': task.file} for task in tasks
+        ], indent=2))
+        return 0
+
+    print(f"{len(tasks)} task(s) affected since {args.changed_since}")
+    for kind in TASK_KINDS:
+        selected = [task for task in tasks if task.kind == kind]
+        if selected:
+            print(f"\n{kind} ({len(selected)}):")
+            for task in selected:
+                print(f"  {task.element_id or '-'}  {task.file}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
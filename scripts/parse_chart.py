@@ -5,10 +5,22 @@ This module provides core parsing functionality for knowledge complex elements
 (vertices, edges, faces, charts).
 """
 
+import os
+import sys
 import yaml
 import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Iterator, Optional, List
+
+
+try:
+    # libyaml bindings are several times faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 class ParseError(Exception):
@@ -16,6 +28,34 @@ class ParseError(Exception):
     pass
 
 
+# Match YAML frontmatter: --- at start, content, --- end
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+
+# Same delimiters without the body, for matching a prefix of the file. Any
+# prefix that contains the closing delimiter line yields the same group.
+FRONTMATTER_HEAD_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_FRONTMATTER_CHUNK = 4096
+
+
+def load_yaml(text: str) -> Any:
+    """
+    Parse YAML text with the fastest available safe loader.
+
+    Uses libyaml's CSafeLoader when PyYAML was built with it and falls back
+    to the pure-Python SafeLoader otherwise; both build the same objects.
+
+    Args:
+        text: YAML source
+
+    Returns:
+        Parsed YAML value
+
+    Raises:
+        yaml.YAMLError: If the YAML is malformed
+    """
+    return yaml.load(text, Loader=SafeLoader)
+
+
 def extract_frontmatter(content: str) -> tuple[Optional[Dict[str, Any]], str]:
     """
     Extract YAML frontmatter and body from markdown content.
@@ -30,9 +70,7 @@ def extract_frontmatter(content: str) -> tuple[Optional[Dict[str, Any]], str]:
     Raises:
         ParseError: If frontmatter is malformed
     """
-    # Match YAML frontmatter: --- at start, content, --- end
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
+    match = FRONTMATTER_PATTERN.match(content)
 
     if not match:
         return None, content
@@ -40,24 +78,168 @@ def extract_frontmatter(content: str) -> tuple[Optional[Dict[str, Any]], str]:
     frontmatter_str, body = match.groups()
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_str)
+        frontmatter = load_yaml(frontmatter_str)
         return frontmatter, body.strip()
     except yaml.YAMLError as e:
         raise ParseError(f"Invalid YAML frontmatter: {e}")
 
 
-def parse_element(file_path: Path) -> Dict[str, Any]:
+class SourceStore:
+    """
+    Parsed markdown files shared by every reader in one process.
+
+    While a store is active (see use_source_store), read_markdown and
+    read_frontmatter answer from it instead of reading the file, so several
+    checkers run over the same tree parse each file once. Entries are
+    filled on first use or up front with load(). Frontmatter dictionaries
+    are shared between readers and must not be mutated.
+    """
+
+    def __init__(self):
+        # Absolute path -> (frontmatter, body, parse error message)
+        self._entries: Dict[str, tuple] = {}
+
+    def _entry(self, file_path: Path) -> tuple:
+        key = os.path.abspath(file_path)
+        entry = self._entries.get(key)
+        if entry is None:
+            # OSErrors propagate uncached, as for a direct read
+            content = Path(file_path).read_text(encoding='utf-8')
+            try:
+                entry = (*extract_frontmatter(content), None)
+            except ParseError as e:
+                entry = (None, None, str(e))
+            self._entries[key] = entry
+        return entry
+
+    def load(self, files: Iterable[Path]) -> None:
+        """
+        Read and parse files ahead of use.
+
+        Args:
+            files: Markdown files (unreadable files are left to fail on use)
+        """
+        for file_path in files:
+            try:
+                self._entry(file_path)
+            except OSError:
+                continue
+
+    def get(self, file_path: Path) -> tuple[Optional[Dict[str, Any]], str]:
+        """
+        Get a file's frontmatter and body (see extract_frontmatter).
+
+        Raises:
+            ParseError: If frontmatter is malformed
+            OSError: If the file cannot be read
+        """
+        frontmatter, body, error = self._entry(file_path)
+        if error is not None:
+            raise ParseError(error)
+        return frontmatter, body
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_active_store: Optional[SourceStore] = None
+
+
+@contextmanager
+def use_source_store(store: SourceStore) -> Iterator[SourceStore]:
+    """
+    Serve read_markdown and read_frontmatter from a store within the block.
+
+    The store is process-wide, so threads started inside the block share it.
+
+    Args:
+        store: Store to read from
+    """
+    global _active_store
+    previous, _active_store = _active_store, store
+    try:
+        yield store
+    finally:
+        _active_store = previous
+
+
+def read_markdown(file_path: Path) -> tuple[Optional[Dict[str, Any]], str]:
+    """
+    Read a markdown file and split it into frontmatter and body.
+
+    Args:
+        file_path: Path to markdown file
+
+    Returns:
+        Tuple of (frontmatter_dict, body_content) as from extract_frontmatter
+
+    Raises:
+        ParseError: If frontmatter is malformed
+        OSError: If the file cannot be read
+    """
+    if _active_store is not None:
+        return _active_store.get(file_path)
+    return extract_frontmatter(Path(file_path).read_text(encoding='utf-8'))
+
+
+def read_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read only the YAML frontmatter of a markdown file.
+
+    Reads in growing chunks and stops once the closing --- delimiter has
+    been seen, instead of loading the whole document, for callers that
+    don't need the body. Delimiters are matched exactly as in
+    extract_frontmatter. Served from the active SourceStore, if any.
+
+    Args:
+        file_path: Path to markdown file
+
+    Returns:
+        Frontmatter dictionary, or None if no frontmatter found
+
+    Raises:
+        ParseError: If frontmatter is malformed
+        OSError: If the file cannot be read
+    """
+    if _active_store is not None:
+        return _active_store.get(file_path)[0]
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        head = f.read(_FRONTMATTER_CHUNK)
+        if not head.startswith('---'):
+            return None
+
+        chunk_size = _FRONTMATTER_CHUNK
+        while True:
+            match = FRONTMATTER_HEAD_PATTERN.match(head)
+            if match:
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return None
+            head += chunk
+            chunk_size *= 2
+
+    try:
+        return load_yaml(match.group(1))
+    except yaml.YAMLError as e:
+        raise ParseError(f"Invalid YAML frontmatter: {e}")
+
+
+def parse_element(file_path: Path, include_body: bool = True) -> Dict[str, Any]:
     """
     Parse a single element file (vertex, edge, face, or chart).
 
     Args:
         file_path: Path to markdown file
+        include_body: Read and return the markdown body; when False only
+            the frontmatter is read and the 'body' key is omitted
 
     Returns:
         Dictionary containing:
             - file: Relative path from repo root
             - All frontmatter fields
-            - body: Markdown body content
+            - body: Markdown body content (if include_body)
 
     Raises:
         ParseError: If file cannot be parsed or is missing required fields
@@ -66,12 +248,15 @@ def parse_element(file_path: Path) -> Dict[str, Any]:
         raise ParseError(f"File not found: {file_path}")
 
     try:
-        content = file_path.read_text(encoding='utf-8')
+        if include_body:
+            frontmatter, body = read_markdown(file_path)
+        else:
+            frontmatter = read_frontmatter(file_path)
+    except ParseError:
+        raise
     except Exception as e:
         raise ParseError(f"Cannot read file {file_path}: {e}")
 
-    frontmatter, body = extract_frontmatter(content)
-
     if frontmatter is None:
         raise ParseError(f"No YAML frontmatter found in {file_path}")
 
@@ -85,15 +270,16 @@ def parse_element(file_path: Path) -> Dict[str, Any]:
     element = {
         'file': str(file_path),
         **frontmatter,
-        'body': body
     }
+    if include_body:
+        element['body'] = body
 
     return element
 
 
-def parse_vertex(file_path: Path) -> Dict[str, Any]:
+def parse_vertex(file_path: Path, include_body: bool = True) -> Dict[str, Any]:
     """Parse a vertex file with vertex-specific validation."""
-    element = parse_element(file_path)
+    element = parse_element(file_path, include_body)
 
     if not element['type'].startswith('vertex/'):
         raise ParseError(f"Expected vertex type, got {element['type']}")
@@ -105,9 +291,9 @@ def parse_vertex(file_path: Path) -> Dict[str, Any]:
     return element
 
 
-def parse_edge(file_path: Path) -> Dict[str, Any]:
+def parse_edge(file_path: Path, include_body: bool = True) -> Dict[str, Any]:
     """Parse an edge file with edge-specific validation."""
-    element = parse_element(file_path)
+    element = parse_element(file_path, include_body)
 
     if not element['type'].startswith('edge/'):
         raise ParseError(f"Expected edge type, got {element['type']}")
@@ -129,9 +315,9 @@ def parse_edge(file_path: Path) -> Dict[str, Any]:
     return element
 
 
-def parse_face(file_path: Path) -> Dict[str, Any]:
+def parse_face(file_path: Path, include_body: bool = True) -> Dict[str, Any]:
     """Parse a face file with face-specific validation."""
-    element = parse_element(file_path)
+    element = parse_element(file_path, include_body)
 
     if not element['type'].startswith('face/'):
         raise ParseError(f"Expected face type, got {element['type']}")
@@ -160,9 +346,9 @@ def parse_face(file_path: Path) -> Dict[str, Any]:
     return element
 
 
-def parse_chart(file_path: Path) -> Dict[str, Any]:
+def parse_chart(file_path: Path, include_body: bool = True) -> Dict[str, Any]:
     """Parse a chart file with chart-specific validation."""
-    element = parse_element(file_path)
+    element = parse_element(file_path, include_body)
 
     if not element['type'].startswith('chart/'):
         raise ParseError(f"Expected chart type, got {element['type']}")
@@ -189,13 +375,144 @@ def parse_chart(file_path: Path) -> Dict[str, Any]:
     return element
 
 
-def parse_directory(directory: Path, element_type: str) -> List[Dict[str, Any]]:
+ELEMENT_PARSERS = {
+    'vertex': parse_vertex,
+    'edge': parse_edge,
+    'face': parse_face,
+    'chart': parse_chart,
+}
+
+
+def list_element_files(directory: Path, element_type: str) -> List[Path]:
+    """
+    List candidate element files in a directory, in parse order.
+
+    Args:
+        directory: Path to directory containing element files
+        element_type: One of 'vertex', 'edge', 'face', 'chart'
+
+    Returns:
+        Sorted list of markdown file paths (empty if directory doesn't exist)
+    """
+    if not directory.exists():
+        return []
+
+    # For charts, search recursively in subdirectories
+    # For other types, only search direct children
+    if element_type == 'chart':
+        return sorted(directory.glob('**/*.md'))
+    return sorted(directory.glob('*.md'))
+
+
+def _parse_batch(
+    element_type: str,
+    files: List[Path],
+    include_body: bool = True
+) -> List[tuple[Path, Optional[Dict[str, Any]], Optional[str]]]:
+    """Parse a batch of files, capturing ParseErrors instead of raising."""
+    parser = ELEMENT_PARSERS[element_type]
+    results = []
+    for file_path in files:
+        try:
+            results.append((file_path, parser(file_path, include_body), None))
+        except ParseError as e:
+            results.append((file_path, None, str(e)))
+    return results
+
+
+def iter_parse_files(
+    files: List[Path],
+    element_type: str,
+    workers: Optional[int] = None,
+    include_body: bool = True,
+    executor: Optional[Executor] = None
+) -> Iterator[tuple[Path, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Parse element files lazily, optionally fanning them out over a process pool.
+
+    Files are split into contiguous batches (several per worker) so process
+    startup and pickling overhead is amortized; results are yielded in
+    input order as each batch completes.
+
+    Args:
+        files: Element files to parse
+        element_type: One of 'vertex', 'edge', 'face', 'chart'
+        workers: Number of worker processes (None or 1 parses sequentially)
+        include_body: Include each file's markdown body (see parse_element)
+        executor: Process pool of `workers` workers to reuse across calls,
+            so callers parsing several directories start workers once
+            (by default a pool is created for this call)
+
+    Yields:
+        (file_path, element, error) tuples in input order, where exactly one
+        of element and error is None
+    """
+    if element_type not in ELEMENT_PARSERS:
+        raise ValueError(f"Unknown element type: {element_type}")
+
+    if not workers or workers <= 1 or len(files) < 2:
+        parser = ELEMENT_PARSERS[element_type]
+        for file_path in files:
+            try:
+                yield file_path, parser(file_path, include_body), None
+            except ParseError as e:
+                yield file_path, None, str(e)
+        return
+
+    batch_count = min(len(files), workers * 4)
+    batch_size = -(-len(files) // batch_count)
+    batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+
+    if executor is not None:
+        for batch_results in executor.map(
+            _parse_batch, repeat(element_type), batches, repeat(include_body)
+        ):
+            yield from batch_results
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_results in executor.map(
+            _parse_batch, repeat(element_type), batches, repeat(include_body)
+        ):
+            yield from batch_results
+
+
+def parse_files(
+    files: List[Path],
+    element_type: str,
+    workers: Optional[int] = None,
+    include_body: bool = True
+) -> List[tuple[Path, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Parse element files, optionally fanning them out over a process pool.
+
+    Args:
+        files: Element files to parse
+        element_type: One of 'vertex', 'edge', 'face', 'chart'
+        workers: Number of worker processes (None or 1 parses sequentially)
+        include_body: Include each file's markdown body (see parse_element)
+
+    Returns:
+        List of (file_path, element, error) tuples in input order, where
+        exactly one of element and error is None (see iter_parse_files)
+    """
+    return list(iter_parse_files(files, element_type, workers, include_body))
+
+
+def parse_directory(
+    directory: Path,
+    element_type: str,
+    workers: Optional[int] = None,
+    include_body: bool = True
+) -> List[Dict[str, Any]]:
     """
     Parse all markdown files in a directory.
 
     Args:
         directory: Path to directory containing element files
         element_type: One of 'vertex', 'edge', 'face', 'chart'
+        workers: Number of worker processes (None or 1 parses sequentially)
+        include_body: Include each file's markdown body (see parse_element)
 
     Returns:
         List of parsed element dictionaries
@@ -203,48 +520,41 @@ def parse_directory(directory: Path, element_type: str) -> List[Dict[str, Any]]:
     Raises:
         ParseError: If any file fails to parse
     """
-    parsers = {
-        'vertex': parse_vertex,
-        'edge': parse_edge,
-        'face': parse_face,
-        'chart': parse_chart,
-    }
-
-    if element_type not in parsers:
+    if element_type not in ELEMENT_PARSERS:
         raise ValueError(f"Unknown element type: {element_type}")
 
-    parser = parsers[element_type]
-    elements = []
-
-    if not directory.exists():
-        return elements  # Empty list if directory doesn't exist
-
-    # For charts, search recursively in subdirectories
-    # For other types, only search direct children
-    if element_type == 'chart':
-        md_files = sorted(directory.glob('**/*.md'))
-    else:
-        md_files = sorted(directory.glob('*.md'))
+    md_files = list_element_files(directory, element_type)
 
+    elements = []
     parse_errors = []
-    for md_file in md_files:
-        try:
-            element = parser(md_file)
+    for md_file, element, error in parse_files(md_files, element_type, workers, include_body):
+        if error is None:
             elements.append(element)
-        except ParseError as e:
+        else:
             # Skip files without frontmatter or that don't match expected structure
             # This includes README.md, TEACHING-GUIDE.md, and any other documentation files
             # But track errors for debugging
-            parse_errors.append((md_file, str(e)))
-            continue
+            parse_errors.append((md_file, error))
 
     # If we have parse errors, print them as warnings (don't fail the build)
-    if parse_errors:
-        import sys
-        print(f"Warning: {len(parse_errors)} files skipped in {directory}:", file=sys.stderr)
-        for file_path, error in parse_errors[:5]:  # Show first 5 errors
-            print(f"  {file_path.name}: {error}", file=sys.stderr)
-        if len(parse_errors) > 5:
-            print(f"  ... and {len(parse_errors) - 5} more", file=sys.stderr)
+    warn_skipped_files(directory, parse_errors)
 
     return elements
+
+
+def warn_skipped_files(directory: Path, parse_errors: List[tuple[Path, str]]) -> None:
+    """
+    Print a warning summary for files skipped while parsing a directory.
+
+    Args:
+        directory: Directory that was parsed
+        parse_errors: List of (file_path, error_message) tuples
+    """
+    if not parse_errors:
+        return
+
+    print(f"Warning: {len(parse_errors)} files skipped in {directory}:", file=sys.stderr)
+    for file_path, error in parse_errors[:5]:  # Show first 5 errors
+        print(f"  {file_path.name}: {error}", file=sys.stderr)
+    if len(parse_errors) > 5:
+        print(f"  ... and {len(parse_errors) - 5} more", file=sys.stderr)
@@ -4,12 +4,105 @@ Template Parser for Knowledge Complex
 
 Extracts verification requirements from template files.
 Templates become the single source of truth for what fields/sections are required.
+
+Parsed templates are cached in templates/.template-registry.json, keyed by
+each template file's content hash, together with the resolved ``extends``
+chains. Loading the registry only hashes the template files; a template is
+parsed again only when its content changes.
 """
 
+import hashlib
+import json
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from parse_chart import extract_frontmatter
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from parse_chart import read_markdown
+
+REGISTRY_VERSION = '1.2.0'
+REGISTRY_CACHE_NAME = '.template-registry.json'
+
+# Python types used for field_type, by name in the registry cache
+FIELD_TYPES = {'str': str, 'list': list, 'bool': bool, 'int': int, 'float': float}
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+# Conditional requirement syntax (see compile_conditional)
+_OR_PATTERN = re.compile(r'\s+or\s+')
+_AND_PATTERN = re.compile(r'\s+and\s+')
+_COMPARISON_PATTERN = re.compile(r'^(\w+)\s*(==|!=)\s*(.+)$')
+_MEMBERSHIP_PATTERN = re.compile(r'^(\w+)\s+(not\s+in|in)\s+(.+)$')
+_FIELD_PATTERN = re.compile(r'^\w+$')
+# Inline conditions in requirement tables: REQUIRED if `<expression>`
+_EXPRESSION_PATTERN = re.compile(r'(==|!=|\s(?:not\s+)?in\s|\sand\s|\sor\s)')
+# Prose conditions: REQUIRED if `field` is `a`, `b` or `c`
+_PROSE_CONDITION_PATTERN = re.compile(
+    r'REQUIRED (?:if|when) `?([^`]+?)`? (?:is|==) `?([^`\s]+)`?((?:(?:\s*,\s*(?:or\s+)?|\s+or\s+)`[^`]+`)*)'
+)
+
+
+def _unquote(value: str) -> str:
+    return value.strip().strip("'\"")
+
+
+def _compile_term(term: str) -> Predicate:
+    """Compile one comparison, membership test or field-existence check."""
+    match = _COMPARISON_PATTERN.match(term)
+    if match:
+        field, operator, value = match.group(1), match.group(2), _unquote(match.group(3))
+        if operator == '==':
+            return lambda frontmatter: str(frontmatter.get(field, '')) == value
+        return lambda frontmatter: str(frontmatter.get(field, '')) != value
+
+    match = _MEMBERSHIP_PATTERN.match(term)
+    if match:
+        field, operator, values = match.groups()
+        values = values.strip()
+        if values[:1] + values[-1:] in ('[]', '()'):
+            values = values[1:-1]
+        options = frozenset(_unquote(value) for value in values.split(',') if value.strip())
+        if operator == 'in':
+            return lambda frontmatter: str(frontmatter.get(field, '')) in options
+        return lambda frontmatter: str(frontmatter.get(field, '')) not in options
+
+    if _FIELD_PATTERN.match(term):
+        return lambda frontmatter: frontmatter.get(term) is not None
+
+    raise ValueError(f"Cannot parse condition '{term}'")
+
+
+@lru_cache(maxsize=None)
+def compile_conditional(conditional: str) -> Predicate:
+    """
+    Compile a conditional requirement into a predicate over frontmatter.
+
+    Supported forms, combined with ``and`` (binding tighter) and ``or``:
+
+        validation_method==llm-assisted        equality (values compared as strings)
+        validation_method != manual            inequality
+        validation_method in [llm-assisted, automated]
+        validation_method not in [manual]
+        llm_model                              field is present and not null
+
+    Identical conditionals share one compiled predicate.
+
+    Raises:
+        ValueError: If the conditional cannot be parsed
+    """
+    alternatives = []
+    for alternative in _OR_PATTERN.split(conditional.strip()):
+        terms = [_compile_term(term.strip()) for term in _AND_PATTERN.split(alternative)]
+        if len(terms) == 1:
+            alternatives.append(terms[0])
+        else:
+            alternatives.append(lambda frontmatter, terms=terms: all(t(frontmatter) for t in terms))
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return lambda frontmatter: any(a(frontmatter) for a in alternatives)
+
+
+def _never(frontmatter: Dict[str, Any]) -> bool:
+    return False
 
 
 class TemplateRequirement:
@@ -26,8 +119,46 @@ class TemplateRequirement:
         self.field = field
         self.required = required
         self.expected_value = expected_value
-        self.conditional = conditional  # e.g., "validation_method == 'llm-assisted'"
+        self.conditional = conditional  # e.g., "validation_method==llm-assisted"
         self.field_type = field_type
+        # Compiled once here; like evaluate_conditional, a conditional that
+        # cannot be parsed is never met
+        self.condition: Optional[Predicate] = None
+        if conditional:
+            try:
+                self.condition = compile_conditional(conditional)
+            except ValueError:
+                self.condition = _never
+
+    def condition_met(self, frontmatter: Dict[str, Any]) -> bool:
+        """Check whether a conditional requirement applies to a document."""
+        return self.condition is not None and self.condition(frontmatter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the registry cache."""
+        field_types = self.field_type if isinstance(self.field_type, tuple) else (self.field_type,)
+        return {
+            'field': self.field,
+            'required': self.required,
+            'expected_value': self.expected_value,
+            'conditional': self.conditional,
+            'field_type': [t.__name__ for t in field_types if t is not None] or None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TemplateRequirement':
+        """Deserialize from the registry cache."""
+        field_type = None
+        if data['field_type']:
+            types = tuple(FIELD_TYPES[name] for name in data['field_type'])
+            field_type = types[0] if len(types) == 1 else types
+        return cls(
+            field=data['field'],
+            required=data['required'],
+            expected_value=data['expected_value'],
+            conditional=data['conditional'],
+            field_type=field_type
+        )
 
 
 class TemplateSpec:
@@ -37,10 +168,34 @@ class TemplateSpec:
         self.template_path = template_path
         self.type = None
         self.extends = None
+        self.extends_chain: List[str] = []  # Ancestor template types, nearest first
         self.frontmatter_requirements: List[TemplateRequirement] = []
         self.body_requirements: List[str] = []  # Required section headers
         self.tag_requirements: List[str] = []
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the registry cache (without path or extends chain)."""
+        return {
+            'type': self.type,
+            'extends': self.extends,
+            'frontmatter_requirements': [req.to_dict() for req in self.frontmatter_requirements],
+            'body_requirements': self.body_requirements,
+            'tag_requirements': self.tag_requirements,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], template_path: Path) -> 'TemplateSpec':
+        """Deserialize from the registry cache."""
+        spec = cls(template_path)
+        spec.type = data['type']
+        spec.extends = data['extends']
+        spec.frontmatter_requirements = [
+            TemplateRequirement.from_dict(req) for req in data['frontmatter_requirements']
+        ]
+        spec.body_requirements = list(data['body_requirements'])
+        spec.tag_requirements = list(data['tag_requirements'])
+        return spec
+
     def add_frontmatter_requirement(self, req: TemplateRequirement):
         """Add a frontmatter field requirement."""
         self.frontmatter_requirements.append(req)
@@ -57,28 +212,106 @@ class TemplateSpec:
 class TemplateParser:
     """Parses template files to extract verification requirements."""
 
-    def __init__(self, templates_dir: Path):
+    def __init__(self, templates_dir: Path, cache_path: Optional[Path] = None):
         self.templates_dir = Path(templates_dir)
+        self.cache_path = cache_path or self.templates_dir / REGISTRY_CACHE_NAME
         self.templates: Dict[str, TemplateSpec] = {}
 
-    def load_all_templates(self):
-        """Load all templates from the templates directory."""
+    def load_all_templates(self, use_cache: bool = True):
+        """
+        Load all templates from the templates directory.
+
+        Args:
+            use_cache: Reuse parsed templates from the registry cache when
+                their content hash is unchanged, and update the cache
+        """
+        cache = self._read_registry_cache() if use_cache else {}
+        cached_specs = cache.get('specs', {})
+
+        files = []
+        specs = {}
         for template_file in self.templates_dir.rglob("*.md"):
             if template_file.name.startswith('.'):
                 continue
             try:
-                spec = self.parse_template(template_file)
-                if spec.type:
-                    self.templates[spec.type] = spec
+                digest = hashlib.sha256(template_file.read_bytes()).hexdigest()
+                if digest in cached_specs:
+                    spec = TemplateSpec.from_dict(cached_specs[digest], template_file)
+                else:
+                    spec = self.parse_template(template_file)
             except Exception as e:
                 print(f"Warning: Could not parse template {template_file}: {e}")
+                continue
+            files.append([template_file.relative_to(self.templates_dir).as_posix(), digest])
+            specs[digest] = spec
+            if spec.type:
+                self.templates[spec.type] = spec
+
+        if files == cache.get('files'):
+            for type_name, chain in cache['extends_chains'].items():
+                self.templates[type_name].extends_chain = chain
+            return
+
+        for spec in self.templates.values():
+            spec.extends_chain = self._resolve_extends_chain(spec)
+
+        if use_cache:
+            self._write_registry_cache(files, specs)
+
+    def _read_registry_cache(self) -> Dict[str, Any]:
+        """Read the registry cache, or return {} if missing or from another version."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != REGISTRY_VERSION:
+            return {}
+        return data
+
+    def _write_registry_cache(self, files: List[List[str]], specs: Dict[str, TemplateSpec]):
+        """Write the registry cache: file hashes, parsed specs and extends chains."""
+        data = {
+            'version': REGISTRY_VERSION,
+            'files': files,
+            'specs': {digest: spec.to_dict() for digest, spec in specs.items()},
+            'extends_chains': {
+                type_name: spec.extends_chain for type_name, spec in self.templates.items()
+            },
+        }
+        try:
+            self.cache_path.write_text(json.dumps(data, indent=1), encoding='utf-8')
+        except (OSError, TypeError, ValueError):
+            # Read-only checkout or unserializable values: keep templates in memory only
+            pass
+
+    def _resolve_extends_chain(self, spec: TemplateSpec) -> List[str]:
+        """
+        Follow ``extends`` through the loaded templates.
+
+        A short name is looked up as a type, then within the template's own
+        base (``doc`` from ``vertex/spec`` is ``vertex/doc``). The chain
+        stops at the first name without a template, or at a cycle.
+        """
+        chain = []
+        seen = {spec.type}
+        current = spec
+        while current.extends:
+            parent_name = str(current.extends)
+            parent = self.templates.get(parent_name)
+            if parent is None and '/' not in parent_name:
+                parent = self.templates.get(f"{current.type.split('/')[0]}/{parent_name}")
+            if parent is None or parent.type in seen:
+                break
+            chain.append(parent.type)
+            seen.add(parent.type)
+            current = parent
+        return chain
 
     def parse_template(self, template_path: Path) -> TemplateSpec:
         """Parse a single template file."""
         spec = TemplateSpec(template_path)
 
-        content = template_path.read_text(encoding='utf-8')
-        frontmatter, body = extract_frontmatter(content)
+        frontmatter, body = read_markdown(template_path)
 
         if not frontmatter:
             return spec
@@ -218,13 +451,20 @@ class TemplateParser:
 
             # Check if it's a conditional requirement
             conditional = None
-            if 'REQUIRED if' in description or 'REQUIRED when' in description:
+            expression_match = re.search(r'REQUIRED (?:if|when) `([^`]+)`', description)
+            if expression_match and _EXPRESSION_PATTERN.search(expression_match.group(1)):
+                # Whole condition in backticks, e.g. REQUIRED if `review in [peer, external]`
+                conditional = expression_match.group(1).strip()
+            elif 'REQUIRED if' in description or 'REQUIRED when' in description:
                 # Extract the condition
-                cond_match = re.search(r'REQUIRED (?:if|when) `?([^`]+)`? (?:is|==) `?([^`\s]+)`?', description)
+                cond_match = _PROSE_CONDITION_PATTERN.search(description)
                 if cond_match:
                     cond_field = cond_match.group(1)
-                    cond_value = cond_match.group(2)
-                    conditional = f"{cond_field}=={cond_value}"
+                    cond_values = [cond_match.group(2)] + re.findall(r'`([^`]+)`', cond_match.group(3))
+                    if len(cond_values) == 1:
+                        conditional = f"{cond_field}=={cond_values[0]}"
+                    else:
+                        conditional = f"{cond_field} in [{', '.join(cond_values)}]"
 
             # Check if there's an expected value
             expected_value = None
@@ -303,12 +543,21 @@ class TemplateParser:
         """Get the template spec for a given element type."""
         return self.templates.get(element_type)
 
+    def get_extends_chain(self, element_type: str) -> List[str]:
+        """Get the ancestor template types of a type, nearest first."""
+        template = self.templates.get(element_type)
+        return list(template.extends_chain) if template else []
+
     def evaluate_conditional(self, conditional: str, frontmatter: Dict[str, Any]) -> bool:
         """
         Evaluate a conditional requirement.
 
+        Requirements compile their conditionals when templates load (see
+        TemplateRequirement.condition_met); this compiles on first use.
+
         Args:
             conditional: String like "validation_method==llm-assisted"
+                (see compile_conditional)
             frontmatter: The document's frontmatter
 
         Returns:
@@ -317,15 +566,10 @@ class TemplateParser:
         if not conditional:
             return False
 
-        # Parse simple equality conditions
-        match = re.match(r'(\w+)==(.+)', conditional)
-        if match:
-            field = match.group(1)
-            expected = match.group(2).strip("'\"")
-            actual = frontmatter.get(field, '')
-            return str(actual) == expected
-
-        return False
+        try:
+            return compile_conditional(conditional)(frontmatter)
+        except ValueError:
+            return False
 
 
 def main():
@@ -340,6 +584,8 @@ def main():
     for type_name, spec in parser.templates.items():
         print(f"\n{type_name}:")
         print(f"  Extends: {spec.extends}")
+        if spec.extends_chain:
+            print(f"  Extends chain: {' -> '.join(spec.extends_chain)}")
         print(f"  Frontmatter requirements: {len(spec.frontmatter_requirements)}")
         print(f"  Body requirements: {len(spec.body_requirements)}")
         print(f"  Tag requirements: {len(spec.tag_requirements)}")
@@ -9,19 +9,11 @@ import argparse
 import json
 from pathlib import Path
 from typing import Dict, Any, List, Set, Tuple
-from itertools import combinations
 
+from cached_complex import get_complex
 from parse_chart import parse_chart, ParseError
 
 
-def load_cache(root_path: Path) -> Dict[str, Any]:
-    """Load complex.json cache."""
-    cache_path = root_path / 'complex.json'
-    if not cache_path.exists():
-        raise FileNotFoundError(f"Cache not found: {cache_path}")
-    return json.loads(cache_path.read_text(encoding='utf-8'))
-
-
 def get_edge_boundary(edge: Dict[str, Any]) -> Tuple[str, str]:
     """Get the boundary vertices of an edge as a sorted tuple."""
     return tuple(sorted([edge['source'], edge['target']]))
@@ -44,27 +36,43 @@ def find_potential_faces(
     Returns:
         List of potential face tuples (vertex1, vertex2, vertex3)
     """
+    # Index vertices by first position (duplicate IDs are ignored)
+    position = {v: i for i, v in enumerate(dict.fromkeys(vertices))}
+
     # Build adjacency list from edges
-    adjacency: Dict[str, Set[str]] = {v: set() for v in vertices}
+    adjacency: Dict[str, Set[str]] = {v: set() for v in position}
 
     for edge in edges.values():
         v1, v2 = edge['source'], edge['target']
-        if v1 in adjacency and v2 in adjacency:
+        if v1 in adjacency and v2 in adjacency and v1 != v2:
             adjacency[v1].add(v2)
             adjacency[v2].add(v1)
 
-    # Find all triangles
-    potential_faces = []
-
-    for v1, v2, v3 in combinations(vertices, 3):
-        # Check if all three edges exist
-        has_v1_v2 = v2 in adjacency[v1]
-        has_v2_v3 = v3 in adjacency[v2]
-        has_v1_v3 = v3 in adjacency[v1]
+    # Find all triangles (forward algorithm, O(E^1.5)): orient each edge
+    # from lower to higher (degree, position) rank, so every triangle is
+    # found exactly once at its lowest-ranked vertex
+    rank = {
+        v: r for r, v in enumerate(
+            sorted(position, key=lambda v: (len(adjacency[v]), position[v]))
+        )
+    }
+    forward = {
+        v: {u for u in neighbours if rank[u] > rank[v]}
+        for v, neighbours in adjacency.items()
+    }
 
-        if has_v1_v2 and has_v2_v3 and has_v1_v3:
-            # All edges present - this is a potential face
-            potential_faces.append(tuple(sorted([v1, v2, v3])))
+    triangles = []
+    for v1, higher in forward.items():
+        for v2 in higher:
+            for v3 in higher & forward[v2]:
+                triangles.append(tuple(sorted((position[v1], position[v2], position[v3]))))
+
+    # Report in the order combinations(vertices, 3) would visit them
+    ordered = list(position)
+    potential_faces = [
+        tuple(sorted((ordered[i], ordered[j], ordered[k])))
+        for i, j, k in sorted(triangles)
+    ]
 
     return potential_faces
 
@@ -95,8 +103,8 @@ def find_holes(chart_path: Path, root_path: Path = None) -> Dict[str, Any]:
     if root_path is None:
         root_path = chart_path.parent.parent
 
-    # Load cache
-    cache = load_cache(root_path)
+    # Load cache (reused across calls in one process)
+    cache = get_complex(root_path)
 
     # Get chart elements
     chart_vertices = chart['elements']['vertices']
@@ -120,10 +128,10 @@ def find_holes(chart_path: Path, root_path: Path = None) -> Dict[str, Any]:
     potential_faces = find_potential_faces(chart_vertices, chart_edges)
 
     # Find which potential faces actually exist
-    actual_face_vertices = [
+    actual_face_vertices = {
         tuple(sorted(face['vertices']))
         for face in chart_faces.values()
-    ]
+    }
 
     # Holes are potential faces that don't exist
     holes = [
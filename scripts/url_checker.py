@@ -0,0 +1,328 @@
+"""
+Concurrent URL reachability checks for verify_citations.py
+
+Checking a bibliography one URL at a time costs up to a full timeout per
+dead link. UrlChecker checks many URLs from a bounded thread pool:
+
+- each URL is tried with HEAD first, falling back to GET when HEAD fails
+  (many servers reject or mishandle HEAD); redirects are followed
+- requests to one host are limited to a few at a time, spaced by a minimum
+  interval, so a bibliography full of one publisher's links stays polite
+- each worker thread keeps one keep-alive connection per host
+- proxies are taken from the environment (HTTP_PROXY, HTTPS_PROXY,
+  NO_PROXY) as urllib does: http requests are sent to the proxy with an
+  absolute URI, https requests through a CONNECT tunnel
+- reachable URLs are remembered in an on-disk JSON cache for a TTL, so
+  unchanged citations are not re-fetched on every run; failures are always
+  re-checked
+
+    checker = UrlChecker(jobs=8, cache=UrlCache(Path('.citation-url-cache.json')))
+    results = checker.check_many(urls)   # url -> (accessible, error)
+    checker.close()
+"""
+
+import base64
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+USER_AGENT = 'Mozilla/5.0 (citation-verifier)'
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+# GET bodies are read up to this size to keep the connection reusable;
+# longer responses close the connection instead
+MAX_DRAIN_BYTES = 64 * 1024
+DEFAULT_CACHE_TTL = 7 * 24 * 3600
+
+CheckResult = Tuple[bool, str]
+
+
+class UrlCache:
+    """On-disk cache of reachable URLs, each valid for ttl seconds."""
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._checked_at: Dict[str, float] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            self._checked_at = {
+                url: entry['checked_at'] for url, entry in data.get('urls', {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def get(self, url: str) -> Optional[CheckResult]:
+        """Return the cached result for url, or None if missing or expired."""
+        checked_at = self._checked_at.get(url)
+        if checked_at is None or time.time() - checked_at > self.ttl:
+            return None
+        return True, ""
+
+    def put(self, url: str, result: CheckResult):
+        """Record a check result (only reachable URLs are cached)."""
+        if result[0]:
+            self._checked_at[url] = time.time()
+            self._dirty = True
+
+    def save(self):
+        """Write the cache if it changed, dropping expired entries."""
+        if not self._dirty:
+            return
+        now = time.time()
+        urls = {
+            url: {'checked_at': checked_at}
+            for url, checked_at in sorted(self._checked_at.items())
+            if now - checked_at <= self.ttl
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps({'urls': urls}, indent=2) + '\n', encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+class HostLimiter:
+    """Per-host concurrency limit and minimum interval between request starts."""
+
+    def __init__(self, concurrency: int = 2, interval: float = 0.25):
+        self.concurrency = concurrency
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, host: str):
+        """Hold one of the host's request slots, waiting for its turn."""
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.Semaphore(self.concurrency))
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+class UrlChecker:
+    """
+    Checks URL reachability concurrently with per-host limits.
+
+    Args:
+        timeout: Socket timeout per request, in seconds
+        jobs: Number of worker threads for check_many
+        per_host: Maximum concurrent requests to one host
+        host_interval: Minimum seconds between request starts to one host
+        cache: Optional UrlCache of reachable URLs
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        jobs: int = 8,
+        per_host: int = 2,
+        host_interval: float = 0.25,
+        cache: Optional[UrlCache] = None
+    ):
+        self.timeout = timeout
+        self.jobs = jobs
+        self.cache = cache
+        self.limiter = HostLimiter(per_host, host_interval)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._proxies = getproxies()
+        self._proxy_routes: Dict[Tuple[str, str], Optional[SplitResult]] = {}
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[SplitResult]:
+        """Return the proxy URL for requests to host, or None to connect directly."""
+        route = (scheme, host)
+        if route not in self._proxy_routes:
+            proxy = self._proxies.get(scheme)
+            if not proxy or proxy_bypass(host):
+                self._proxy_routes[route] = None
+            else:
+                if '://' not in proxy:
+                    proxy = f"http://{proxy}"
+                self._proxy_routes[route] = urlsplit(proxy)
+        return self._proxy_routes[route]
+
+    @staticmethod
+    def _proxy_headers(proxy: SplitResult) -> Dict[str, str]:
+        """Proxy-Authorization header for credentials in the proxy URL."""
+        if proxy.username is None:
+            return {}
+        credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+        return {'Proxy-Authorization': 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')}
+
+    def _pool(self) -> Dict[Tuple[str, str, Optional[int]], http.client.HTTPConnection]:
+        if not hasattr(self._local, 'pool'):
+            self._local.pool = {}
+        return self._local.pool
+
+    def _connection(self, key: Tuple[str, str, Optional[int]]) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return this thread's connection for (scheme, host, port) and whether it was reused."""
+        pool = self._pool()
+        if key in pool:
+            return pool[key], True
+        scheme, host, port = key
+        proxy = self._proxy_for(scheme, host)
+        if proxy is None:
+            connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            connection = connection_class(host, port, timeout=self.timeout)
+        elif scheme == 'https':
+            connection = http.client.HTTPSConnection(proxy.hostname, proxy.port or 80, timeout=self.timeout)
+            connection.set_tunnel(host, port, headers=self._proxy_headers(proxy))
+        else:
+            connection = http.client.HTTPConnection(proxy.hostname, proxy.port or 80, timeout=self.timeout)
+        pool[key] = connection
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection, False
+
+    def _drop(self, key: Tuple[str, str, Optional[int]]):
+        connection = self._pool().pop(key, None)
+        if connection is not None:
+            connection.close()
+            with self._connections_lock:
+                self._connections.remove(connection)
+
+    def _request(self, method: str, url: str) -> Tuple[int, str, Optional[str]]:
+        """
+        Send one request, reusing this thread's connection to the host.
+
+        Returns:
+            (status, reason, Location header)
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"unsupported URL: {url}")
+        key = (parts.scheme, parts.hostname, parts.port)
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        headers = {'User-Agent': USER_AGENT, 'Accept': '*/*'}
+        proxy = self._proxy_for(parts.scheme, parts.hostname)
+        if proxy is not None and parts.scheme == 'http':
+            # Plain http goes to the proxy with the absolute URI
+            target = f"http://{parts.netloc.rpartition('@')[2]}{target}"
+            headers.update(self._proxy_headers(proxy))
+
+        with self.limiter.slot(parts.hostname):
+            for attempt in range(2):
+                connection, reused = self._connection(key)
+                try:
+                    connection.request(method, target, headers=headers)
+                    response = connection.getresponse()
+                    break
+                except (http.client.HTTPException, ConnectionError):
+                    self._drop(key)
+                    # A kept-alive connection may have been closed by the server
+                    if not reused or attempt:
+                        raise
+                except OSError:
+                    self._drop(key)
+                    raise
+
+            try:
+                if method == 'HEAD':
+                    response.read()
+                else:
+                    response.read(MAX_DRAIN_BYTES)
+            except OSError:
+                self._drop(key)
+                raise
+            if response.will_close or not response.isclosed():
+                self._drop(key)
+            return response.status, response.reason, response.getheader('Location')
+
+    def _fetch(self, method: str, url: str) -> CheckResult:
+        """Request url with method, following redirects."""
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, location = self._request(method, url)
+            if status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            if status == 200:
+                return True, ""
+            return False, f"HTTP {status}: {reason}"
+        return False, "Too many redirects"
+
+    def _check_uncached(self, url: str) -> CheckResult:
+        try:
+            accessible, error = self._fetch('HEAD', url)
+            if accessible:
+                return True, ""
+        except (socket.timeout, TimeoutError) as e:
+            return False, f"URL Error: {e}"
+        except ValueError as e:
+            return False, f"Error: {e}"
+        except (http.client.HTTPException, OSError):
+            pass
+
+        # Fall back to GET: many servers reject or mishandle HEAD
+        try:
+            return self._fetch('GET', url)
+        except (http.client.HTTPException, OSError) as e:
+            return False, f"URL Error: {e}"
+        except Exception as e:
+            return False, f"Error: {e}"
+
+    def check(self, url: str) -> CheckResult:
+        """
+        Check whether one URL is reachable.
+
+        Returns:
+            (is_accessible, error_message)
+        """
+        return self.check_many([url])[url]
+
+    def check_many(self, urls: Iterable[str]) -> Dict[str, CheckResult]:
+        """
+        Check URLs concurrently; cached reachable URLs are not fetched.
+
+        Returns:
+            Each distinct URL -> (is_accessible, error_message)
+        """
+        results = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url) if self.cache else None
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+
+        if pending:
+            # One pool for the checker's lifetime, so worker threads keep
+            # their connections between calls
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(1, self.jobs))
+            for url, result in zip(pending, self._executor.map(self._check_uncached, pending)):
+                results[url] = result
+                if self.cache:
+                    self.cache.put(url, result)
+        if self.cache:
+            self.cache.save()
+        return results
+
+    def close(self):
+        """Stop the worker threads and close every kept-alive connection."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
@@ -0,0 +1,469 @@
+"""
+Run every repository verification in one process over one parse of the tree.
+
+Each element, chart and template file is read and parsed once into a shared
+SourceStore (see parse_chart.py), the complex is assembled in memory from
+it, and each checker runs as a plugin against that shared state:
+
+  - structure: element directories parse (verify_structure.py)
+  - typed: elements against their type requirements (verify_typed.py)
+  - template: elements against their templates (verify_template_based.py)
+  - chart: charts are simplicial complexes (verify_chart.py)
+  - invariants: assured-signed chart counting invariants (verify_chart_invariants.py)
+  - dependencies: dependency hierarchy and cycles (verify_dependency_hierarchy.py)
+  - audit: assurance coverage of chart/assurance_audit charts (audit_assurance_chart.py)
+  - accountability: signature accountability consistency (check_accountability.py)
+
+Checkers are independent and run concurrently on a thread pool; what each
+prints is captured per thread. One combined report with per-checker wall
+times is printed, and optionally written as JSON or JUnit XML:
+
+    python scripts/verify_all.py
+    python scripts/verify_all.py --jobs 4 --json report.json --junit report.xml
+    python scripts/verify_all.py --only chart audit
+
+Unlike the individual tools, no complex.json is needed: the complex is built
+from the working tree.
+"""
+
+import argparse
+import io
+import json
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from build_cache import ELEMENT_DIRECTORIES, cache_entry
+from cached_complex import Complex
+from element_index import get_element_index
+from parse_chart import ELEMENT_PARSERS, ParseError, SourceStore, list_element_files, use_source_store
+
+# Checker outcome: number of subjects checked, subject -> error messages
+CheckOutcome = Tuple[int, Dict[str, List[str]]]
+
+CHECKERS: Dict[str, Callable[['VerificationContext'], CheckOutcome]] = {}
+
+
+def checker(name: str):
+    """Register a checker plugin under a name (see CHECKERS)."""
+    def register(function: Callable[['VerificationContext'], CheckOutcome]):
+        CHECKERS[name] = function
+        return function
+    return register
+
+
+class VerificationContext:
+    """Shared, read-only state handed to every checker."""
+
+    def __init__(self, root_path: Path, templates_dir: Path = None):
+        """
+        Args:
+            root_path: Repository root
+            templates_dir: Templates directory (default: root_path/templates)
+        """
+        self.root_path = Path(root_path).resolve()
+        self.templates_dir = templates_dir or self.root_path / 'templates'
+        self.store = SourceStore()
+        self.complex: Optional[Complex] = None
+        # Relative path -> parse error for files the parser skipped
+        self.skipped: Dict[str, str] = {}
+
+    def load(self) -> int:
+        """
+        Parse every element and template file and assemble the complex.
+
+        Must run with the store active (see use_source_store).
+
+        Returns:
+            Number of files parsed
+        """
+        files = {
+            element_type: list_element_files(self.root_path / dir_name, element_type)
+            for _, dir_name, element_type in ELEMENT_DIRECTORIES
+        }
+        self.store.load(file_path for paths in files.values() for file_path in paths)
+        self.store.load(sorted(self.templates_dir.glob('**/*.md')))
+
+        elements = {section: {} for section, _, _ in ELEMENT_DIRECTORIES}
+        for section, _, element_type in ELEMENT_DIRECTORIES:
+            for file_path in files[element_type]:
+                try:
+                    element = ELEMENT_PARSERS[element_type](file_path, include_body=False)
+                except (ParseError, OSError) as e:
+                    self.skipped[str(file_path.relative_to(self.root_path))] = str(e)
+                    continue
+                entry = cache_entry(element, self.root_path)
+                elements[section][entry['id']] = entry
+        self.complex = Complex({'elements': elements})
+        return len(self.store)
+
+    def element_files(self, *sections: str) -> List[Path]:
+        """Files of the parsed elements in the given sections (default: all)."""
+        return [
+            self.root_path / entry['file']
+            for section in sections or self.complex['elements']
+            for entry in self.complex['elements'][section].values()
+        ]
+
+    def audit_charts(self) -> Dict[str, Dict[str, Any]]:
+        """chart/assurance_audit charts by ID."""
+        return {
+            chart_id: chart for chart_id, chart in self.complex.charts.items()
+            if chart.get('type') == 'chart/assurance_audit'
+        }
+
+
+_thread_output = threading.local()
+
+
+class _ThreadOutput(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr that sends checker threads' writes to their buffers."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = getattr(_thread_output, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(_thread_output, 'buffer', None) is None:
+            self.stream.flush()
+
+
+@contextmanager
+def capture_output(buffer: io.StringIO) -> Iterator[io.StringIO]:
+    """Collect the calling thread's stdout and stderr in buffer (see _ThreadOutput)."""
+    _thread_output.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _thread_output.buffer = None
+
+
+@checker('structure')
+def check_structure(context: VerificationContext) -> CheckOutcome:
+    from verify_structure import verify_directory
+
+    failures = {}
+    for _, dir_name, element_type in ELEMENT_DIRECTORIES:
+        errors = verify_directory(context.root_path / dir_name, element_type)
+        if errors:
+            failures[dir_name] = errors
+    return len(ELEMENT_DIRECTORIES), failures
+
+
+@checker('typed')
+def check_typed(context: VerificationContext) -> CheckOutcome:
+    from verify_typed import TypedVerificationError, TypedVerifier
+
+    files = context.element_files()
+    failures = {}
+    for file_path in files:
+        verifier = TypedVerifier()
+        try:
+            passed = verifier.verify_element(file_path)
+        except (TypedVerificationError, ParseError) as e:
+            verifier.errors.append(str(e))
+            passed = False
+        if not passed:
+            failures[str(file_path.relative_to(context.root_path))] = verifier.errors or ['Verification failed']
+    return len(files), failures
+
+
+@checker('template')
+def check_template(context: VerificationContext) -> CheckOutcome:
+    from verify_template_based import TemplateBasedVerifier
+
+    verifier = TemplateBasedVerifier(context.templates_dir)
+    files = context.element_files()
+    failures = {}
+    for result in verifier.verify_many(files):
+        if not result.passed:
+            failures[str(result.path.relative_to(context.root_path))] = result.errors
+    return len(files), failures
+
+
+@checker('chart')
+def check_chart(context: VerificationContext) -> CheckOutcome:
+    from verify_chart import find_chart_files, verify_chart_file
+
+    chart_files = find_chart_files(context.root_path)
+    failures = {}
+    for chart_path in chart_files:
+        errors = verify_chart_file(chart_path, context.root_path, context.complex)
+        if errors:
+            failures[str(chart_path.relative_to(context.root_path))] = errors
+    return len(chart_files), failures
+
+
+@checker('invariants')
+def check_chart_invariants(context: VerificationContext) -> CheckOutcome:
+    from verify_chart_invariants import analyze_chart, check_invariants
+
+    vertices, faces = context.complex.vertices, context.complex.faces
+    checked, failures = 0, {}
+    for chart_id, chart in context.audit_charts().items():
+        # Same shape as export_chart_direct.py output, which the invariants read
+        exported = {
+            'name': chart.get('name', chart_id),
+            'elements': {
+                'vertices': [vertices.get(v, {'id': v}) for v in chart['elements']['vertices']],
+                'faces': [faces.get(f, {'id': f}) for f in chart['elements']['faces']],
+            },
+        }
+        # Only assured-signed charts carry the counting invariants
+        if not any(face.get('type') == 'face/signature' for face in exported['elements']['faces']):
+            continue
+        checked += 1
+        errors = [
+            issue['message'] for issue in check_invariants(analyze_chart(exported))
+            if issue['status'] == 'FAIL'
+        ]
+        if errors:
+            failures[chart_id] = errors
+    return checked, failures
+
+
+@checker('dependencies')
+def check_dependencies(context: VerificationContext) -> CheckOutcome:
+    from verify_dependency_hierarchy import detect_circular_dependencies, verify_dependency_hierarchy
+
+    failures = {}
+    errors = verify_dependency_hierarchy(context.complex)
+    if errors:
+        failures['hierarchy'] = errors
+    cycles = detect_circular_dependencies(context.complex)
+    if cycles:
+        failures['cycles'] = cycles
+    return len(context.complex.vertices), failures
+
+
+@checker('audit')
+def check_audit(context: VerificationContext) -> CheckOutcome:
+    # Imported lazily: the audit pulls in the element generator
+    from audit_assurance_chart import audit_charts
+
+    charts = context.audit_charts()
+    results = audit_charts([context.root_path / chart['file'] for chart in charts.values()], jobs=1)
+    failures = {}
+    for chart_id, result in zip(charts, results.values()):
+        if result['status'] != 'PASS':
+            failures[chart_id] = result['issues'] or [result.get('summary', result['status'])]
+    return len(charts), failures
+
+
+@checker('accountability')
+def check_signature_accountability(context: VerificationContext) -> CheckOutcome:
+    from check_accountability import (
+        AccountabilityIndex, check_shared_validation_edge_consistency, find_signature_faces
+    )
+
+    signature_faces = find_signature_faces(context.root_path)
+    index = AccountabilityIndex(context.root_path)
+    failures = {}
+    for sig_path in signature_faces:
+        passed, message, _ = check_shared_validation_edge_consistency(sig_path, context.root_path, index)
+        if not passed:
+            failures[str(sig_path.relative_to(context.root_path))] = [message]
+    return len(signature_faces), failures
+
+
+def run_checker(name: str, context: VerificationContext) -> Dict[str, Any]:
+    """
+    Run one checker, capturing what it prints and how long it takes.
+
+    Returns:
+        Result with 'name', 'passed', 'checked', 'failures', 'seconds' and
+        'output'; a checker that raises fails with the exception as its error
+    """
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    with capture_output(buffer):
+        try:
+            checked, failures = CHECKERS[name](context)
+        except Exception as e:
+            checked, failures = 0, {'error': [f"{type(e).__name__}: {e}"]}
+    return {
+        'name': name,
+        'passed': not failures,
+        'checked': checked,
+        'failures': failures,
+        'seconds': round(time.perf_counter() - start, 3),
+        'output': buffer.getvalue(),
+    }
+
+
+def verify_all(
+    root_path: Path,
+    checkers: List[str] = None,
+    jobs: int = None,
+    templates_dir: Path = None
+) -> Dict[str, Any]:
+    """
+    Parse the repository once and run checkers against it.
+
+    Args:
+        root_path: Repository root
+        checkers: Checker names to run, in report order (default: all)
+        jobs: Checker threads (default: one per checker)
+        templates_dir: Templates directory (default: root_path/templates)
+
+    Returns:
+        Report with 'root', 'passed', 'seconds', 'parse' ({'files',
+        'skipped', 'seconds'}) and 'checkers' (see run_checker)
+    """
+    checkers = checkers or list(CHECKERS)
+    unknown = [name for name in checkers if name not in CHECKERS]
+    if unknown:
+        raise ValueError(f"Unknown checker(s): {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    context = VerificationContext(root_path, templates_dir)
+
+    with use_source_store(context.store):
+        files = context.load()
+        parse_seconds = time.perf_counter() - start
+        # Build the element index before the checkers share it
+        get_element_index(context.root_path)
+
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = _ThreadOutput(stdout), _ThreadOutput(stderr)
+        try:
+            with ThreadPoolExecutor(max_workers=jobs or len(checkers)) as executor:
+                results = list(executor.map(lambda name: run_checker(name, context), checkers))
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+
+    return {
+        'root': str(context.root_path),
+        'passed': all(result['passed'] for result in results),
+        'seconds': round(time.perf_counter() - start, 3),
+        'parse': {'files': files, 'skipped': context.skipped, 'seconds': round(parse_seconds, 3)},
+        'checkers': results,
+    }
+
+
+def junit_report(report: Dict[str, Any]) -> str:
+    """
+    Format a report as JUnit XML, one test case per checker.
+
+    Args:
+        report: Report from verify_all
+
+    Returns:
+        XML document text
+    """
+    results = report['checkers']
+    failed = sum(1 for result in results if not result['passed'])
+    suites = ET.Element('testsuites', name='verify_all', tests=str(len(results)),
+                        failures=str(failed), time=str(report['seconds']))
+    suite = ET.SubElement(suites, 'testsuite', name='verify_all', tests=str(len(results)),
+                          failures=str(failed), time=str(report['seconds']))
+    for result in results:
+        case = ET.SubElement(suite, 'testcase', classname='verify_all',
+                             name=result['name'], time=str(result['seconds']))
+        if not result['passed']:
+            failure = ET.SubElement(case, 'failure',
+                                    message=f"{len(result['failures'])} of {result['checked']} failed")
+            failure.text = '\n'.join(
+                f"{subject}: {error}"
+                for subject, errors in result['failures'].items()
+                for error in errors
+            )
+        if result['output']:
+            ET.SubElement(case, 'system-out').text = result['output']
+    return ET.tostring(suites, encoding='unicode')
+
+
+def print_report(report: Dict[str, Any], verbose: bool = False) -> None:
+    """Print per-checker results, failures and wall times."""
+    parse = report['parse']
+    print(f"Parsed {parse['files']} file(s) in {parse['seconds']:.2f}s "
+          f"({len(parse['skipped'])} skipped)")
+    for result in report['checkers']:
+        mark = '✓' if result['passed'] else '✗'
+        print(f"{mark} {result['name']:<15} {result['checked']:>5} checked  "
+              f"{len(result['failures']):>4} failed  {result['seconds']:>7.2f}s")
+        for subject, errors in result['failures'].items():
+            print(f"    ✗ {subject}")
+            for error in errors[:5]:
+                print(f"      - {error}")
+            if len(errors) > 5:
+                print(f"      ... and {len(errors) - 5} more")
+        if verbose and result['output']:
+            print(result['output'])
+    print(f"\n{'✓ All checks passed' if report['passed'] else '✗ Some checks failed'} "
+          f"in {report['seconds']:.2f}s")
+
+
+def main():
+    """Command-line interface for verify_all."""
+    parser = argparse.ArgumentParser(
+        description='Run every verification over one parse of the repository'
+    )
+    parser.add_argument(
+        '--root',
+        type=Path,
+        default=Path.cwd(),
+        help='Repository root (default: current directory)'
+    )
+    parser.add_argument(
+        '--templates',
+        type=Path,
+        help='Templates directory (default: <root>/templates)'
+    )
+    parser.add_argument(
+        '--only',
+        nargs='+',
+        choices=list(CHECKERS),
+        metavar='CHECKER',
+        help=f"Run only these checkers ({', '.join(CHECKERS)})"
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Run N checkers concurrently (default: all at once)'
+    )
+    parser.add_argument(
+        '--json',
+        type=Path,
+        metavar='FILE',
+        help="Write the report as JSON ('-' for stdout)"
+    )
+    parser.add_argument(
+        '--junit',
+        type=Path,
+        metavar='FILE',
+        help='Write the report as JUnit XML'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help="Also print each checker's captured output"
+    )
+
+    args = parser.parse_args()
+
+    report = verify_all(args.root, args.only, args.jobs, args.templates)
+
+    if args.json and str(args.json) == '-':
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.verbose)
+        if args.json:
+            args.json.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    if args.junit:
+        args.junit.write_text(junit_report(report), encoding='utf-8')
+
+    return 0 if report['passed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,14 +6,20 @@ Checks that:
 2. Every edge's boundary vertices are in the chart
 3. Every face's boundary edges are in the chart
 4. Every face's boundary vertices match its edges' endpoints
+
+With --all, every chart under charts/ is verified against a single loaded
+copy of complex.json; with --changed-since REV, only the charts affected by
+changes since a git revision are.
 """
 
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Union
 
-from parse_chart import parse_chart, ParseError
+from cached_complex import Complex, get_complex
+from invalidation import InvalidationError, tasks_changed_since
+from parse_chart import parse_chart, list_element_files, read_frontmatter, ParseError
 
 
 class VerificationError(Exception):
@@ -21,29 +27,26 @@ class VerificationError(Exception):
     pass
 
 
-def load_cache(root_path: Path) -> Dict[str, Any]:
+def load_complex(root_path: Path) -> Complex:
     """
-    Load complex.json cache.
+    Load the indexed complex.json cache, reusing it within a process.
 
     Args:
         root_path: Root directory containing complex.json
 
     Returns:
-        Cache dictionary
+        Complex for the cache
 
     Raises:
         VerificationError: If cache doesn't exist or is invalid
     """
-    cache_path = root_path / 'complex.json'
-
-    if not cache_path.exists():
+    try:
+        return get_complex(root_path)
+    except FileNotFoundError:
         raise VerificationError(
-            f"Cache not found: {cache_path}\n"
+            f"Cache not found: {root_path / 'complex.json'}\n"
             f"Run 'python scripts/build_cache.py --path {root_path}' first"
         )
-
-    try:
-        return json.loads(cache_path.read_text(encoding='utf-8'))
     except json.JSONDecodeError as e:
         raise VerificationError(f"Invalid JSON in cache: {e}")
 
@@ -61,40 +64,40 @@ def get_edge_boundary(edge: Dict[str, Any]) -> Set[str]:
     return {edge['source'], edge['target']}
 
 
-def verify_chart_elements(chart: Dict[str, Any], cache: Dict[str, Any]) -> List[str]:
+def verify_chart_elements(
+    chart: Dict[str, Any],
+    cache: Union[Complex, Dict[str, Any]]
+) -> List[str]:
     """
     Verify that all chart elements exist and form a valid simplicial complex.
 
     Args:
         chart: Parsed chart element
-        cache: complex.json cache
+        cache: Indexed Complex (or raw complex.json dictionary)
 
     Returns:
         List of error messages (empty if valid)
     """
+    if not isinstance(cache, Complex):
+        cache = Complex(cache)
+
     errors = []
     elements = chart['elements']
 
-    # Extract element indices from cache
-    cached_vertices = cache['elements']['vertices']
-    cached_edges = cache['elements']['edges']
-    cached_faces = cache['elements']['faces']
-
     # Verify all vertices exist
     for vertex_id in elements['vertices']:
-        if vertex_id not in cached_vertices:
+        if vertex_id not in cache.vertex_ids:
             errors.append(f"Vertex {vertex_id} not found in cache")
 
     # Verify all edges exist and their boundaries are in the chart
     chart_vertices = set(elements['vertices'])
 
     for edge_id in elements['edges']:
-        if edge_id not in cached_edges:
+        if edge_id not in cache.edge_ids:
             errors.append(f"Edge {edge_id} not found in cache")
             continue
 
-        edge = cached_edges[edge_id]
-        boundary = get_edge_boundary(edge)
+        boundary = set(cache.edge_boundary[edge_id])
 
         # Check if boundary vertices are in chart
         missing = boundary - chart_vertices
@@ -107,14 +110,12 @@ def verify_chart_elements(chart: Dict[str, Any], cache: Dict[str, Any]) -> List[
     chart_edges = set(elements['edges'])
 
     for face_id in elements['faces']:
-        if face_id not in cached_faces:
+        if face_id not in cache.face_ids:
             errors.append(f"Face {face_id} not found in cache")
             continue
 
-        face = cached_faces[face_id]
-
         # Check if boundary edges are in chart
-        face_edges = set(face['edges'])
+        face_edges = set(cache.face_edges[face_id])
         missing_edges = face_edges - chart_edges
         if missing_edges:
             errors.append(
@@ -122,7 +123,7 @@ def verify_chart_elements(chart: Dict[str, Any], cache: Dict[str, Any]) -> List[
             )
 
         # Check if face vertices are in chart
-        face_vertices = set(face['vertices'])
+        face_vertices = set(cache.face_vertices[face_id])
         missing_vertices = face_vertices - chart_vertices
         if missing_vertices:
             errors.append(
@@ -132,9 +133,9 @@ def verify_chart_elements(chart: Dict[str, Any], cache: Dict[str, Any]) -> List[
         # Verify face is a valid 2-simplex:
         # The vertices must be exactly the boundary of the edges
         edge_endpoints = set()
-        for edge_id in face['edges']:
-            if edge_id in cached_edges:
-                edge_endpoints.update(get_edge_boundary(cached_edges[edge_id]))
+        for edge_id in cache.face_edges[face_id]:
+            if edge_id in cache.edge_ids:
+                edge_endpoints.update(cache.edge_boundary[edge_id])
 
         if edge_endpoints != face_vertices:
             errors.append(
@@ -177,13 +178,18 @@ def find_cache_root(start_path: Path) -> Path:
     )
 
 
-def verify_chart_file(chart_path: Path, root_path: Path = None) -> List[str]:
+def verify_chart_file(
+    chart_path: Path,
+    root_path: Path = None,
+    cache: Complex = None
+) -> List[str]:
     """
     Verify a chart file.
 
     Args:
         chart_path: Path to chart markdown file
         root_path: Root directory (defaults to searching upward for complex.json)
+        cache: Already loaded Complex (skips locating and loading the cache)
 
     Returns:
         List of error messages (empty if valid)
@@ -192,29 +198,89 @@ def verify_chart_file(chart_path: Path, root_path: Path = None) -> List[str]:
 
     # Parse chart
     try:
-        chart = parse_chart(chart_path)
+        chart = parse_chart(chart_path, include_body=False)
     except ParseError as e:
         return [f"Parse error: {e}"]
 
-    # Determine root path by searching upward for complex.json
-    if root_path is None:
+    if cache is None:
+        # Determine root path by searching upward for complex.json
+        if root_path is None:
+            try:
+                root_path = find_cache_root(chart_path.parent)
+            except VerificationError as e:
+                return [str(e)]
+
+        # Load cache
         try:
-            root_path = find_cache_root(chart_path.parent)
+            cache = load_complex(root_path)
         except VerificationError as e:
             return [str(e)]
 
-    # Load cache
-    try:
-        cache = load_cache(root_path)
-    except VerificationError as e:
-        return [str(e)]
-
     # Verify chart structure
     errors.extend(verify_chart_elements(chart, cache))
 
     return errors
 
 
+def is_chart_file(md_file: Path) -> bool:
+    """
+    Check whether a markdown file in a chart directory is a chart.
+
+    Files whose type is not chart/* (teaching guides, audit trails) are not;
+    files with unreadable frontmatter are, so their parse errors are reported.
+
+    Args:
+        md_file: Markdown file under charts/
+
+    Returns:
+        True if the file should be verified as a chart
+    """
+    try:
+        frontmatter = read_frontmatter(md_file)
+    except ParseError:
+        return True
+    return isinstance(frontmatter, dict) and str(frontmatter.get('type', '')).startswith('chart/')
+
+
+def find_chart_files(root_path: Path) -> List[Path]:
+    """
+    Find chart files under root_path/charts/ (see is_chart_file).
+
+    Args:
+        root_path: Repository root
+
+    Returns:
+        Sorted list of chart file paths
+    """
+    return [
+        md_file for md_file in list_element_files(root_path / 'charts', 'chart')
+        if is_chart_file(md_file)
+    ]
+
+
+def verify_all_charts(root_path: Path, chart_files: List[Path] = None) -> Dict[Path, List[str]]:
+    """
+    Verify every chart under root_path/charts/ against one loaded cache.
+
+    Args:
+        root_path: Root directory containing complex.json and charts/
+        chart_files: Verify only these charts (default: find_chart_files)
+
+    Returns:
+        Mapping of chart path to error messages (empty if valid)
+
+    Raises:
+        VerificationError: If cache doesn't exist or is invalid
+    """
+    cache = load_complex(root_path)
+    if chart_files is None:
+        chart_files = find_chart_files(root_path)
+    return {
+        chart_path: verify_chart_file(chart_path, root_path, cache)
+        for chart_path in chart_files
+    }
+
+
 def main():
     """Command-line interface for verify_chart."""
     parser = argparse.ArgumentParser(
@@ -223,6 +289,7 @@ def main():
     parser.add_argument(
         'chart',
         type=Path,
+        nargs='?',
         help='Path to chart markdown file'
     )
     parser.add_argument(
@@ -230,9 +297,49 @@ def main():
         type=Path,
         help='Root directory (default: infer from chart path)'
     )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Verify every chart under charts/ in one pass'
+    )
+    parser.add_argument(
+        '--changed-since',
+        metavar='REV',
+        help='Verify only charts affected by changes since a git revision (see invalidation.py)'
+    )
 
     args = parser.parse_args()
 
+    if args.all or args.changed_since:
+        try:
+            root_path = args.root or find_cache_root(Path.cwd())
+            chart_files = None
+            if args.changed_since:
+                chart_files = [
+                    root_path / task.file
+                    for task in tasks_changed_since(root_path, args.changed_since, 'chart')
+                ]
+            results = verify_all_charts(root_path, chart_files)
+        except (VerificationError, InvalidationError) as e:
+            print(f"✗ {e}")
+            return 1
+
+        failed = 0
+        for chart_path, errors in results.items():
+            if errors:
+                failed += 1
+                print(f"✗ {chart_path}:")
+                for error in errors:
+                    print(f"  - {error}")
+            else:
+                print(f"✓ {chart_path}")
+
+        print(f"\n{len(results) - failed}/{len(results)} charts are valid simplicial complexes")
+        return 1 if failed else 0
+
+    if args.chart is None:
+        parser.error('a chart path is required unless --all or --changed-since is given')
+
     errors = verify_chart_file(args.chart, args.root)
 
     if errors:
@@ -13,6 +13,10 @@ Usage:
 
 Options:
     --check-urls    Actually fetch URLs to verify they're accessible (slower)
+    --jobs N        Check up to N URLs concurrently (default: 8)
+    --url-cache     Cache file of reachable URLs (default: .citation-url-cache.json
+                    next to the literature review)
+    --url-cache-ttl Hours a reachable URL is not re-fetched (default: 168, 0 disables)
     --verbose       Print detailed information about each citation
 """
 
@@ -24,6 +28,10 @@ from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
 
+from url_checker import DEFAULT_CACHE_TTL, UrlCache, UrlChecker
+
+URL_CACHE_NAME = '.citation-url-cache.json'
+
 
 @dataclass
 class Citation:
@@ -176,32 +184,29 @@ def check_url_accessible(url: str, timeout: int = 10) -> tuple[bool, str]:
     """
     Actually fetch URL to check if it's accessible.
 
+    Tries HEAD, then GET (see url_checker.py). To check many URLs, use
+    UrlChecker.check_many, which checks them concurrently.
+
     Returns (is_accessible, error_message).
     """
+    checker = UrlChecker(timeout=timeout, jobs=1)
     try:
-        import urllib.request
-        import urllib.error
+        return checker.check(url)
+    finally:
+        checker.close()
 
-        req = urllib.request.Request(
-            url,
-            headers={'User-Agent': 'Mozilla/5.0 (citation-verifier)'}
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            if response.status == 200:
-                return True, ""
-            return False, f"HTTP {response.status}"
-    except urllib.error.HTTPError as e:
-        return False, f"HTTP {e.code}: {e.reason}"
-    except urllib.error.URLError as e:
-        return False, f"URL Error: {e.reason}"
-    except Exception as e:
-        return False, f"Error: {str(e)}"
-
-
-def verify_citation(citation: Citation, check_urls: bool = False) -> VerificationResult:
+
+def verify_citation(
+    citation: Citation,
+    check_urls: bool = False,
+    url_results: Optional[dict] = None
+) -> VerificationResult:
     """
     Verify a single citation.
 
+    url_results maps URLs already checked (e.g. by UrlChecker.check_many)
+    to (is_accessible, error_message); other URLs are fetched here.
+
     Returns VerificationResult with pass/fail and any errors.
     """
     result = VerificationResult(citation_id=citation.id, passed=True)
@@ -267,7 +272,10 @@ def verify_citation(citation: Citation, check_urls: bool = False) -> Verificatio
 
     # Optional: Actually check URL accessibility
     if check_urls and citation.url:
-        accessible, error = check_url_accessible(citation.url)
+        if url_results and citation.url in url_results:
+            accessible, error = url_results[citation.url]
+        else:
+            accessible, error = check_url_accessible(citation.url)
         if not accessible:
             result.warnings.append(f"Primary URL not accessible: {error}")
 
@@ -277,11 +285,15 @@ def verify_citation(citation: Citation, check_urls: bool = False) -> Verificatio
 def verify_all_citations(
     markdown_path: Path,
     check_urls: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    url_checker: Optional[UrlChecker] = None
 ) -> tuple[bool, list[VerificationResult]]:
     """
     Verify all citations in the literature review.
 
+    With check_urls, every primary URL is checked up front by url_checker
+    (a default UrlChecker without a cache if not given), concurrently.
+
     Returns (all_passed, results).
     """
     citations = parse_citations(markdown_path)
@@ -290,11 +302,21 @@ def verify_all_citations(
         print(f"Found {len(citations)} citations")
         print()
 
+    url_results = None
+    if check_urls:
+        urls = [citation.url for citation in citations if citation.url]
+        checker = url_checker or UrlChecker()
+        try:
+            url_results = checker.check_many(urls)
+        finally:
+            if url_checker is None:
+                checker.close()
+
     results = []
     all_passed = True
 
     for citation in citations:
-        result = verify_citation(citation, check_urls)
+        result = verify_citation(citation, check_urls, url_results)
         results.append(result)
 
         if not result.passed:
@@ -323,6 +345,24 @@ def main():
         action='store_true',
         help='Actually fetch URLs to verify accessibility'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=8,
+        help='Number of URLs to check concurrently (default: 8)'
+    )
+    parser.add_argument(
+        '--url-cache',
+        type=Path,
+        default=None,
+        help=f'Cache file of reachable URLs (default: {URL_CACHE_NAME} next to the file)'
+    )
+    parser.add_argument(
+        '--url-cache-ttl',
+        type=float,
+        default=DEFAULT_CACHE_TTL / 3600,
+        help='Hours before a reachable URL is re-fetched (default: 168, 0 disables the cache)'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -351,11 +391,24 @@ def main():
     print(f"Verifying citations in: {file_path}")
     print()
 
-    all_passed, results = verify_all_citations(
-        file_path,
-        check_urls=args.check_urls,
-        verbose=args.verbose
-    )
+    url_checker = None
+    if args.check_urls:
+        cache = None
+        if args.url_cache_ttl > 0:
+            cache_path = args.url_cache or file_path.parent / URL_CACHE_NAME
+            cache = UrlCache(cache_path, ttl=args.url_cache_ttl * 3600)
+        url_checker = UrlChecker(jobs=args.jobs, cache=cache)
+
+    try:
+        all_passed, results = verify_all_citations(
+            file_path,
+            check_urls=args.check_urls,
+            verbose=args.verbose,
+            url_checker=url_checker
+        )
+    finally:
+        if url_checker:
+            url_checker.close()
 
     # Summary
     total = len(results)
@@ -12,18 +12,16 @@ This enforces proper separation between type/template level and instance level.
 """
 
 import sys
-import json
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
 
+from cached_complex import Complex, get_complex
+from invalidation import InvalidationError, tasks_changed_since
 
-def load_cache(cache_path: Path) -> Dict:
-    """Load the complex.json cache."""
-    if not cache_path.exists():
-        raise FileNotFoundError(f"Cache not found: {cache_path}")
 
-    with open(cache_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def load_cache(cache_path: Path) -> Complex:
+    """Load the complex.json cache (reused across calls in one process)."""
+    return get_complex(cache_path.parent, cache_path)
 
 
 def get_vertex_type(vertex_id: str, cache: Dict) -> str:
@@ -54,7 +52,7 @@ def get_vertex_type(vertex_id: str, cache: Dict) -> str:
         return 'other'
 
 
-def verify_dependency_hierarchy(cache: Dict) -> List[str]:
+def verify_dependency_hierarchy(cache: Dict, vertex_ids: Iterable[str] = None) -> List[str]:
     """
     Verify that dependency hierarchies are correct.
 
@@ -64,11 +62,17 @@ def verify_dependency_hierarchy(cache: Dict) -> List[str]:
     - Docs can only depend on docs (not specs or guidances)
     - 'other' types (b0, test) have no restrictions
 
+    Args:
+        cache: Loaded complex
+        vertex_ids: Check only these vertices (default: all)
+
     Returns:
         List of error messages (empty if valid)
     """
     errors = []
     vertices = cache['elements']['vertices']
+    if vertex_ids is not None:
+        vertices = {vid: vertices[vid] for vid in vertex_ids if vid in vertices}
 
     for vertex_id, vertex in vertices.items():
         dependencies = vertex.get('dependencies', [])
@@ -108,10 +112,16 @@ def verify_dependency_hierarchy(cache: Dict) -> List[str]:
     return errors
 
 
-def detect_circular_dependencies(cache: Dict) -> List[str]:
+def detect_circular_dependencies(cache: Dict, start: Iterable[str] = None) -> List[str]:
     """
     Detect circular dependencies using DFS.
 
+    Args:
+        cache: Loaded complex
+        start: Only search from these vertices (default: all). Any new cycle
+            passes through a vertex whose dependencies changed, so starting
+            from the changed vertices finds it.
+
     Returns:
         List of error messages describing cycles (empty if no cycles)
     """
@@ -149,8 +159,8 @@ def detect_circular_dependencies(cache: Dict) -> List[str]:
         return False
 
     # Check each unvisited node
-    for vertex_id in graph:
-        if vertex_id not in visited:
+    for vertex_id in (graph if start is None else start):
+        if vertex_id in graph and vertex_id not in visited:
             has_cycle(vertex_id, [])
 
     return errors
@@ -220,6 +230,11 @@ def main():
         action='store_true',
         help='Print detailed dependency summary'
     )
+    parser.add_argument(
+        '--changed-since',
+        metavar='REV',
+        help='Check only vertices affected by changes since a git revision (see invalidation.py)'
+    )
 
     args = parser.parse_args()
 
@@ -232,11 +247,21 @@ def main():
 
     print(f"Verifying dependency hierarchies from: {args.cache}")
 
+    vertex_ids = None
+    if args.changed_since:
+        try:
+            tasks = tasks_changed_since(args.cache.parent, args.changed_since, 'dependencies')
+        except InvalidationError as e:
+            print(f"Error: {e}")
+            return 1
+        vertex_ids = [task.element_id for task in tasks if task.element_id]
+        print(f"Checking {len(vertex_ids)} affected vertices since {args.changed_since}")
+
     # Check hierarchy rules
-    hierarchy_errors = verify_dependency_hierarchy(cache)
+    hierarchy_errors = verify_dependency_hierarchy(cache, vertex_ids)
 
     # Check for circular dependencies
-    circular_errors = detect_circular_dependencies(cache)
+    circular_errors = detect_circular_dependencies(cache, vertex_ids)
 
     # Combine all errors
     all_errors = hierarchy_errors + circular_errors
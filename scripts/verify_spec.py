@@ -38,6 +38,7 @@ from typing import Any, Dict, List, Optional
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from element_index import get_element_index
 from parse_chart import extract_frontmatter, ParseError
 
 
@@ -108,8 +109,12 @@ class SpecVerifier:
 
         # If it's an ID like v:spec:spec, resolve it
         if spec_ref.startswith('v:spec:'):
+            indexed = get_element_index(self.repo_root).resolve(spec_ref)
+            if indexed is not None and indexed.exists():
+                return indexed
+
             spec_name = spec_ref.split(':')[2]
-            # Try common locations
+            # Fall back to conventional locations outside the element index
             candidates = [
                 self.repo_root / '00_vertices' / f'spec-for-{spec_name}.md',
                 self.repo_root / '00_vertices' / f'{spec_name}.md',
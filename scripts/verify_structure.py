@@ -6,18 +6,19 @@ Checks that all markdown files have valid YAML frontmatter and required fields.
 
 import argparse
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from parse_chart import parse_directory, ParseError
 
 
-def verify_directory(directory: Path, element_type: str) -> List[str]:
+def verify_directory(directory: Path, element_type: str, workers: Optional[int] = None) -> List[str]:
     """
     Verify all files in a directory.
 
     Args:
         directory: Path to directory
         element_type: Type of elements expected ('vertex', 'edge', 'face', 'chart')
+        workers: Number of parser processes (None parses sequentially)
 
     Returns:
         List of error messages (empty if no errors)
@@ -33,7 +34,7 @@ def verify_directory(directory: Path, element_type: str) -> List[str]:
         return errors
 
     try:
-        elements = parse_directory(directory, element_type)
+        elements = parse_directory(directory, element_type, workers=workers, include_body=False)
         print(f"✓ {directory}: {len(elements)} {element_type}(s) verified")
     except ParseError as e:
         errors.append(f"{directory}: {e}")
@@ -41,12 +42,13 @@ def verify_directory(directory: Path, element_type: str) -> List[str]:
     return errors
 
 
-def verify_all(root_path: Path) -> List[str]:
+def verify_all(root_path: Path, workers: Optional[int] = None) -> List[str]:
     """
     Verify all element directories in a repository.
 
     Args:
         root_path: Root directory containing element directories
+        workers: Number of parser processes (None parses sequentially)
 
     Returns:
         List of all error messages (empty if no errors)
@@ -62,7 +64,7 @@ def verify_all(root_path: Path) -> List[str]:
     ]
 
     for directory, element_type in directories:
-        errors = verify_directory(directory, element_type)
+        errors = verify_directory(directory, element_type, workers=workers)
         all_errors.extend(errors)
 
     return all_errors
@@ -85,6 +87,12 @@ def main():
         choices=['vertex', 'edge', 'face', 'chart'],
         help='Element type (required if path is a directory of elements)'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Parse files with N worker processes (default: sequential)'
+    )
 
     args = parser.parse_args()
 
@@ -126,10 +134,10 @@ def main():
         # Directory verification
         if args.type:
             # Single directory with known type
-            errors = verify_directory(path, args.type)
+            errors = verify_directory(path, args.type, workers=args.jobs)
         else:
             # Root directory - verify all subdirectories
-            errors = verify_all(path)
+            errors = verify_all(path, workers=args.jobs)
 
         if errors:
             print(f"\n✗ Verification failed with {len(errors)} error(s):")
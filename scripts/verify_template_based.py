@@ -4,24 +4,65 @@ Template-Based Verification for Knowledge Complex
 
 Uses templates as the single source of truth for verification requirements.
 Replaces hardcoded type-specific verification logic with template-driven checks.
+
+Each verification returns an ElementResult, so one verifier can check many
+files, from several threads or (with verify_many) several worker processes
+that each load the template registry once.
+
+    python scripts/verify_template_based.py 01_edges/validation-spec-spec.md
+    python scripts/verify_template_based.py 00_vertices/ --jobs 8
 """
 
+import datetime
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any, Optional
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from parse_chart import extract_frontmatter, ParseError
+from invalidation import InvalidationError, tasks_changed_since
+from parse_chart import read_markdown, ParseError
 from template_parser import TemplateParser, TemplateSpec, TemplateRequirement
 
 
+@dataclass
+class ElementResult:
+    """Outcome of verifying one element against its template."""
+    path: Path
+    passed: bool = False
+    errors: List[str] = field(default_factory=list)
+    checks_passed: int = 0
+    checks_total: int = 0
+    template_path: Optional[Path] = None
+    # Every check and error in order, kept only for verbose reports
+    log: Optional[List[str]] = None
+
+    def check(self, description: str, value: Any = None):
+        """Record a successful check."""
+        self.checks_passed += 1
+        self.checks_total += 1
+        if self.log is not None:
+            value_str = f": {value}" if value is not None else ""
+            self.log.append(f"  ✓ {description}{value_str}")
+
+    def add_error(self, message: str):
+        """Record an error."""
+        self.checks_total += 1
+        self.errors.append(message)
+        if self.log is not None:
+            self.log.append(f"  ✗ {message}")
+
+
 class TemplateBasedVerifier:
     """Verifies knowledge complex elements against their templates."""
 
     def __init__(self, templates_dir: Path, verbose: bool = False):
+        self.templates_dir = Path(templates_dir)
         self.verbose = verbose
+        # Result of the last verify_element call
         self.errors: List[str] = []
         self.checks_passed = 0
         self.checks_total = 0
@@ -33,75 +74,129 @@ class TemplateBasedVerifier:
         if self.verbose:
             print(f"Loaded {len(self.parser.templates)} templates")
 
-    def verify_element(self, element_path: Path) -> bool:
+    def verify(self, element_path: Path) -> ElementResult:
         """
         Verify an element against its template.
 
+        Does not modify the verifier, so it is safe to call from several
+        threads at once.
+
         Returns:
-            True if all checks pass, False otherwise
+            ElementResult with the errors and check counts
         """
-        self.errors = []
-        self.checks_passed = 0
-        self.checks_total = 0
+        result = ElementResult(Path(element_path), log=[] if self.verbose else None)
 
         try:
-            content = element_path.read_text(encoding='utf-8')
-            frontmatter, body = extract_frontmatter(content)
+            frontmatter, body = read_markdown(element_path)
 
             if not frontmatter:
-                self.add_error("No frontmatter found")
-                return False
+                result.add_error("No frontmatter found")
+                return result
 
             # Get element type
             element_type = frontmatter.get('type', '')
             if not element_type:
-                self.add_error("No 'type' field in frontmatter")
-                return False
+                result.add_error("No 'type' field in frontmatter")
+                return result
 
             # Get template for this type
             template = self.parser.get_template(element_type)
             if not template:
-                self.add_error(f"No template found for type '{element_type}'")
-                return False
+                result.add_error(f"No template found for type '{element_type}'")
+                return result
 
-            if self.verbose:
-                print(f"Using template: {template.template_path.name}")
+            result.template_path = template.template_path
 
             # Verify frontmatter fields
-            passed = self.verify_frontmatter(frontmatter, template)
+            passed = self.verify_frontmatter(frontmatter, template, result)
 
             # Verify body sections
-            passed &= self.verify_body(body, template)
+            passed &= self.verify_body(body, template, result)
 
             # Verify tags
-            passed &= self.verify_tags(frontmatter, template)
+            passed &= self.verify_tags(frontmatter, template, result)
 
-            return passed
+            result.passed = passed
 
         except Exception as e:
-            self.add_error(f"Verification error: {e}")
-            return False
+            result.add_error(f"Verification error: {e}")
+
+        return result
+
+    def verify_element(self, element_path: Path) -> bool:
+        """
+        Verify an element against its template.
+
+        Keeps the result in errors, checks_passed and checks_total (see
+        verify for a thread-safe variant returning the result).
+
+        Returns:
+            True if all checks pass, False otherwise
+        """
+        result = self.verify(element_path)
+        self.errors = result.errors
+        self.checks_passed = result.checks_passed
+        self.checks_total = result.checks_total
+        if self.verbose:
+            if result.template_path:
+                print(f"Using template: {result.template_path.name}")
+            for line in result.log:
+                print(line)
+        return result.passed
+
+    def verify_many(self, element_paths: Iterable[Path], jobs: Optional[int] = None) -> List[ElementResult]:
+        """
+        Verify many elements, optionally fanning them out over a process pool.
 
-    def verify_frontmatter(self, frontmatter: Dict[str, Any], template: TemplateSpec) -> bool:
+        Each worker process loads the template registry once and verifies
+        contiguous batches of files (several per worker).
+
+        Args:
+            element_paths: Element files to verify
+            jobs: Number of worker processes (None or 1 verifies in this process)
+
+        Returns:
+            ElementResult per file, in input order
+        """
+        element_paths = [Path(path) for path in element_paths]
+        if not jobs or jobs <= 1 or len(element_paths) < 2:
+            return [self.verify(path) for path in element_paths]
+
+        batch_count = min(len(element_paths), jobs * 4)
+        batch_size = -(-len(element_paths) // batch_count)
+        batches = [element_paths[i:i + batch_size] for i in range(0, len(element_paths), batch_size)]
+
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(self.templates_dir, self.verbose)
+        ) as executor:
+            for batch_results in executor.map(_verify_batch, batches):
+                results.extend(batch_results)
+        return results
+
+    def verify_frontmatter(
+        self,
+        frontmatter: Dict[str, Any],
+        template: TemplateSpec,
+        result: ElementResult
+    ) -> bool:
         """Verify frontmatter fields against template requirements."""
         passed = True
 
         for req in template.frontmatter_requirements:
             # Check if field is conditionally required
-            if req.conditional:
-                condition_met = self.parser.evaluate_conditional(req.conditional, frontmatter)
-                if not condition_met:
-                    # Condition not met, field not required
-                    continue
+            if req.conditional and not req.condition_met(frontmatter):
+                # Condition not met, field not required
+                continue
 
             # Check if field exists
             if req.field not in frontmatter:
                 if req.required:
-                    self.add_error(f"Missing required field '{req.field}'")
+                    result.add_error(f"Missing required field '{req.field}'")
                     passed = False
                 continue
 
-            self.check(f"Field '{req.field}'", frontmatter[req.field])
+            result.check(f"Field '{req.field}'", frontmatter[req.field])
 
             # Check expected value if specified
             if req.expected_value:
@@ -114,18 +209,17 @@ class TemplateBasedVerifier:
                     # For "vertex/doc", allow "vertex/spec" (extends doc)
                     # This is simplified - full type checking would need inheritance chain
                     if actual_parts[0] != expected_parts[0]:
-                        self.add_error(f"Field '{req.field}': expected base '{expected_parts[0]}', got '{actual_parts[0]}'")
+                        result.add_error(f"Field '{req.field}': expected base '{expected_parts[0]}', got '{actual_parts[0]}'")
                         passed = False
                 elif str(actual) != str(req.expected_value):
-                    self.add_error(f"Field '{req.field}': expected '{req.expected_value}', got '{actual}'")
+                    result.add_error(f"Field '{req.field}': expected '{req.expected_value}', got '{actual}'")
                     passed = False
                 else:
-                    self.check(f"Field '{req.field}' value", req.expected_value)
+                    result.check(f"Field '{req.field}' value", req.expected_value)
 
             # Check field type if specified
             if req.field_type:
                 # Skip type check for datetime fields - YAML parser converts them
-                import datetime
                 if isinstance(frontmatter[req.field], (datetime.datetime, datetime.date)):
                     # Datetime fields are fine - YAML parser handles them
                     continue
@@ -134,78 +228,96 @@ class TemplateBasedVerifier:
                     # Handle tuples of types (for union types)
                     if isinstance(req.field_type, tuple):
                         if not isinstance(frontmatter[req.field], req.field_type):
-                            self.add_error(f"Field '{req.field}': expected {req.field_type}, got {type(frontmatter[req.field])}")
+                            result.add_error(f"Field '{req.field}': expected {req.field_type}, got {type(frontmatter[req.field])}")
                             passed = False
                     else:
-                        self.add_error(f"Field '{req.field}': expected {req.field_type}, got {type(frontmatter[req.field])}")
+                        result.add_error(f"Field '{req.field}': expected {req.field_type}, got {type(frontmatter[req.field])}")
                         passed = False
 
         return passed
 
-    def verify_body(self, body: str, template: TemplateSpec) -> bool:
+    def verify_body(self, body: str, template: TemplateSpec, result: ElementResult) -> bool:
         """Verify required body sections are present."""
         passed = True
 
         for required_section in template.body_requirements:
             if required_section in body:
-                self.check(f"Body section '{required_section}'")
+                result.check(f"Body section '{required_section}'")
             else:
-                self.add_error(f"Missing required body section '{required_section}'")
+                result.add_error(f"Missing required body section '{required_section}'")
                 passed = False
 
         return passed
 
-    def verify_tags(self, frontmatter: Dict[str, Any], template: TemplateSpec) -> bool:
+    def verify_tags(self, frontmatter: Dict[str, Any], template: TemplateSpec, result: ElementResult) -> bool:
         """Verify required tags are present."""
         passed = True
 
         tags = frontmatter.get('tags', [])
         if not isinstance(tags, list):
-            self.add_error("'tags' field must be an array")
+            result.add_error("'tags' field must be an array")
             return False
 
         for required_tag in template.tag_requirements:
             if required_tag in tags:
-                self.check(f"Tag '{required_tag}'")
+                result.check(f"Tag '{required_tag}'")
             else:
-                self.add_error(f"Missing required tag '{required_tag}'")
+                result.add_error(f"Missing required tag '{required_tag}'")
                 passed = False
 
         return passed
 
-    def check(self, description: str, value: Any = None):
-        """Record a successful check."""
-        self.checks_passed += 1
-        self.checks_total += 1
-        if self.verbose:
-            value_str = f": {value}" if value is not None else ""
-            print(f"  ✓ {description}{value_str}")
-
-    def add_error(self, message: str):
-        """Record an error."""
-        self.checks_total += 1
-        self.errors.append(message)
-        if self.verbose:
-            print(f"  ✗ {message}")
-
-    def print_report(self, element_path: Path, passed: bool):
+    def print_report(self, result: ElementResult):
         """Print verification report."""
-        print(f"Verifying: {element_path}")
+        print(f"Verifying: {result.path}")
         print("=" * 70)
 
-        if not self.verbose:
+        if result.log is not None:
+            if result.template_path:
+                print(f"Using template: {result.template_path.name}")
+            for line in result.log:
+                print(line)
+        else:
             # Print errors
-            for error in self.errors:
+            for error in result.errors:
                 print(f"  ✗ {error}")
 
         print("=" * 70)
-        if passed:
+        if result.passed:
             print(f"Result: ✓ PASS")
-            print(f"Checks: {self.checks_passed}/{self.checks_total} passed")
+            print(f"Checks: {result.checks_passed}/{result.checks_total} passed")
         else:
             print(f"Result: ✗ FAIL")
-            print(f"Checks: {self.checks_passed}/{self.checks_total} passed")
-            print(f"Errors: {len(self.errors)}")
+            print(f"Checks: {result.checks_passed}/{result.checks_total} passed")
+            print(f"Errors: {len(result.errors)}")
+
+
+# Verifier of each verify_many worker process (see _init_worker)
+_worker_verifier: Optional[TemplateBasedVerifier] = None
+
+
+def _init_worker(templates_dir: Path, verbose: bool):
+    """Load the template registry once per worker process."""
+    global _worker_verifier
+    _worker_verifier = TemplateBasedVerifier(templates_dir)
+    _worker_verifier.verbose = verbose
+
+
+def _verify_batch(element_paths: List[Path]) -> List[ElementResult]:
+    """Verify a batch of files in a worker process."""
+    return [_worker_verifier.verify(path) for path in element_paths]
+
+
+def find_element_files(directory: Path) -> List[Path]:
+    """
+    Find the element files in a directory (recursively, for charts/).
+
+    README.md and hidden files are skipped.
+    """
+    return sorted(
+        path for path in directory.rglob('*.md')
+        if path.name != 'README.md' and not path.name.startswith('.')
+    )
 
 
 def main():
@@ -213,16 +325,38 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='Verify knowledge complex elements against templates')
-    parser.add_argument('element', help='Path to element file to verify')
+    parser.add_argument('element', nargs='?',
+                        help='Path to element file to verify, or a directory of element files')
     parser.add_argument('--verbose', action='store_true', help='Show all checks, not just errors')
     parser.add_argument('--templates', default=None, help='Path to templates directory')
+    parser.add_argument('--changed-since', metavar='REV',
+                        help='Verify every element affected by changes since a git revision '
+                             '(see invalidation.py)')
+    parser.add_argument('--root', type=Path, default=Path.cwd(),
+                        help='Repository root for --changed-since (default: current directory)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Verify files with N worker processes (default: sequential)')
 
     args = parser.parse_args()
 
-    element_path = Path(args.element)
-    if not element_path.exists():
-        print(f"Error: File not found: {element_path}")
-        return 1
+    if args.changed_since:
+        try:
+            tasks = tasks_changed_since(args.root, args.changed_since, 'template')
+        except InvalidationError as e:
+            print(f"Error: {e}")
+            return 1
+        element_paths = [args.root / task.file for task in tasks]
+        print(f"{len(element_paths)} element(s) affected since {args.changed_since}")
+    elif args.element and Path(args.element).is_dir():
+        element_paths = find_element_files(Path(args.element))
+        print(f"{len(element_paths)} element(s) in {args.element}")
+    elif args.element:
+        element_paths = [Path(args.element)]
+        if not element_paths[0].exists():
+            print(f"Error: File not found: {element_paths[0]}")
+            return 1
+    else:
+        parser.error('an element path is required unless --changed-since is given')
 
     # Default templates directory
     if args.templates:
@@ -234,16 +368,22 @@ def main():
         print(f"Error: Templates directory not found: {templates_dir}")
         return 1
 
-    # Create verifier
+    # Create verifier (templates are loaded once for every element)
     verifier = TemplateBasedVerifier(templates_dir, verbose=args.verbose)
 
-    # Verify element
-    passed = verifier.verify_element(element_path)
+    # Verify elements
+    results = verifier.verify_many(element_paths, jobs=args.jobs)
+
+    # Several files: report failures only, unless verbose
+    for result in results:
+        if len(results) == 1 or args.verbose or not result.passed:
+            verifier.print_report(result)
 
-    # Print report
-    verifier.print_report(element_path, passed)
+    passed = sum(1 for result in results if result.passed)
+    if len(results) > 1:
+        print(f"{passed}/{len(results)} element(s) passed")
 
-    return 0 if passed else 1
+    return 0 if passed == len(results) else 1
 
 
 if __name__ == '__main__':
@@ -25,7 +25,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
-from parse_chart import extract_frontmatter, ParseError
+from parse_chart import read_markdown, ParseError
 
 
 class TypedVerificationError(Exception):
@@ -65,8 +65,7 @@ class TypedVerifier:
         if not file_path.exists():
             raise TypedVerificationError(f"File not found: {file_path}")
 
-        content = file_path.read_text(encoding='utf-8')
-        frontmatter, body = extract_frontmatter(content)
+        frontmatter, body = read_markdown(file_path)
 
         if frontmatter is None:
             raise TypedVerificationError(f"No YAML frontmatter in {file_path}")
@@ -0,0 +1,477 @@
+"""
+Watch the element directories and keep the complex hot in memory.
+
+A long-running process that parses 00_vertices/, 01_edges/, 02_faces/ and
+charts/ once, then polls them for changes. Only added or modified files
+are re-parsed, and only the checks whose inputs changed are re-run:
+
+  - structure: files the parser skips (as verify_structure.py reports)
+  - charts: every chart is verified as a simplicial complex (as
+    verify_chart.py does) when the chart or an element it references changes
+  - audits: chart/assurance_audit charts are audited for assurance coverage
+    (as audit_assurance_chart.py does) under the same rule
+
+Results are served over a local Unix socket as one JSON request/response
+per line, so editors and scripts can ask for them without starting Python
+and reparsing the repository:
+
+    python scripts/watch.py                      # watch the current directory
+    python scripts/watch.py --query status
+    python scripts/watch.py --query failures
+    python scripts/watch.py --query chart c:my-chart
+    python scripts/watch.py --once               # scan, verify and exit
+
+Changes are detected by polling file mtimes and sizes (a few hundred stat
+calls per interval), which works on every platform without extra
+dependencies.
+"""
+
+import argparse
+import json
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from build_cache import ELEMENT_DIRECTORIES, build_cache, cache_entry
+from cached_complex import Complex
+from parse_chart import ELEMENT_PARSERS, ParseError, list_element_files
+from verify_chart import is_chart_file, verify_chart_elements
+
+DEFAULT_SOCKET = '.kc-watch.sock'
+DEFAULT_INTERVAL = 1.0
+
+
+def chart_inputs(chart: Dict[str, Any], cache: Complex) -> Set[str]:
+    """
+    Collect the element IDs a chart's verification depends on.
+
+    Args:
+        chart: Chart cache entry
+        cache: Complex the chart is verified against
+
+    Returns:
+        Chart ID, referenced element IDs and the boundary edges of its faces
+    """
+    elements = chart['elements']
+    inputs = {chart['id'], *elements['vertices'], *elements['edges'], *elements['faces']}
+    for face_id in elements['faces']:
+        inputs.update(cache.face_edges.get(face_id, []))
+    return inputs
+
+
+class ComplexWatcher:
+    """Parsed elements and check results for one repository, kept up to date."""
+
+    def __init__(self, root_path: Path, audit: bool = True):
+        """
+        Args:
+            root_path: Repository root
+            audit: Also audit chart/assurance_audit charts
+        """
+        self.root_path = Path(root_path).resolve()
+        self.audit = audit
+        self.lock = threading.RLock()
+
+        # Relative path -> {'section', 'path', 'signature', 'entry', 'error'}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.complex = Complex({'elements': {section: {} for section, _, _ in ELEMENT_DIRECTORIES}})
+        # Chart ID -> {'file', 'errors', 'inputs'} / audit summary
+        self.chart_results: Dict[str, Dict[str, Any]] = {}
+        self.audit_results: Dict[str, Dict[str, Any]] = {}
+        self.generation = 0
+        self.refreshed: Optional[str] = None
+
+    def scan(self) -> Dict[str, tuple]:
+        """
+        Stat every element file.
+
+        Returns:
+            Mapping of relative path to (section, element type, path,
+            (mtime_ns, size)) in complex.json order
+        """
+        current = {}
+        for section, dir_name, element_type in ELEMENT_DIRECTORIES:
+            for file_path in list_element_files(self.root_path / dir_name, element_type):
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:
+                    continue
+                rel_path = str(file_path.relative_to(self.root_path))
+                current[rel_path] = (section, element_type, file_path, (stat.st_mtime_ns, stat.st_size))
+        return current
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Re-parse changed files and re-run the checks that depend on them.
+
+        Returns:
+            Summary with 'changed' and 'removed' file lists and the 'rerun'
+            check keys (empty if nothing changed)
+        """
+        with self.lock:
+            current = self.scan()
+            changed = [
+                rel_path for rel_path, (_, _, _, signature) in current.items()
+                if self.files.get(rel_path, {}).get('signature') != signature
+            ]
+            removed = [rel_path for rel_path in self.files if rel_path not in current]
+            if not changed and not removed:
+                return {'changed': [], 'removed': [], 'rerun': []}
+
+            # IDs whose entries appeared, disappeared or changed
+            changed_ids = set()
+            for rel_path in removed + changed:
+                previous = self.files.get(rel_path)
+                if previous is not None and previous['entry'] is not None:
+                    changed_ids.add(previous['entry']['id'])
+
+            for rel_path in changed:
+                section, element_type, file_path, signature = current[rel_path]
+                entry, error = None, None
+                try:
+                    element = ELEMENT_PARSERS[element_type](file_path, include_body=False)
+                    entry = cache_entry(element, self.root_path)
+                    changed_ids.add(entry['id'])
+                except (ParseError, OSError) as e:
+                    error = str(e)
+                self.files[rel_path] = {
+                    'section': section,
+                    'path': file_path,
+                    'signature': signature,
+                    'entry': entry,
+                    'error': error,
+                }
+
+            # Rebuild the element sections in file order, as complex.json does
+            self.files = {rel_path: self.files[rel_path] for rel_path in current}
+            elements = {section: {} for section, _, _ in ELEMENT_DIRECTORIES}
+            for state in self.files.values():
+                if state['entry'] is not None:
+                    elements[state['section']][state['entry']['id']] = state['entry']
+            self.complex = Complex({'elements': elements})
+
+            rerun = self._run_checks(changed_ids)
+            self.generation += 1
+            self.refreshed = datetime.now(timezone.utc).isoformat()
+            return {'changed': changed, 'removed': removed, 'rerun': rerun}
+
+    def _run_checks(self, changed_ids: Set[str]) -> List[str]:
+        """Re-run chart verifications and audits whose inputs changed."""
+        charts = self.complex.charts
+        for stale in [chart_id for chart_id in self.chart_results if chart_id not in charts]:
+            del self.chart_results[stale]
+            self.audit_results.pop(stale, None)
+
+        rerun = []
+        for chart_id, chart in charts.items():
+            previous = self.chart_results.get(chart_id)
+            if (previous is not None and previous['file'] == chart['file']
+                    and not previous['inputs'] & changed_ids):
+                continue
+
+            self.chart_results[chart_id] = {
+                'file': chart['file'],
+                'errors': verify_chart_elements(chart, self.complex),
+                'inputs': chart_inputs(chart, self.complex),
+            }
+            rerun.append(f"chart:{chart_id}")
+
+            if self.audit and chart.get('type') == 'chart/assurance_audit':
+                self.audit_results[chart_id] = self._audit(self.root_path / chart['file'])
+                rerun.append(f"audit:{chart_id}")
+            else:
+                self.audit_results.pop(chart_id, None)
+
+        return rerun
+
+    @staticmethod
+    def _audit(chart_path: Path) -> Dict[str, Any]:
+        """Audit an assurance chart, keeping only the reported summary."""
+        # Imported lazily: the audit pulls in the element generator
+        from audit_assurance_chart import audit_assurance_chart
+        try:
+            result = audit_assurance_chart(chart_path)
+        except Exception as e:
+            # Keep the watcher alive; the failure is reported like any other
+            return {'status': 'ERROR', 'summary': f"Audit failed: {e}", 'issues': [str(e)]}
+        return {
+            'status': result['status'],
+            'summary': result.get('summary', result['status']),
+            'issues': result['issues'],
+        }
+
+    def skipped_files(self) -> Dict[str, str]:
+        """Files the parser skipped, with the reason (README.md etc.)."""
+        return {
+            rel_path: state['error']
+            for rel_path, state in self.files.items()
+            if state['error'] is not None
+        }
+
+    def failures(self) -> Dict[str, List[str]]:
+        """
+        Collect failing checks.
+
+        Returns:
+            Mapping of check key ('chart:<id>', 'audit:<id>', 'parse:<file>')
+            to error messages
+        """
+        failures = {}
+        for rel_path, error in self.skipped_files().items():
+            state = self.files[rel_path]
+            # Unparseable charts fail, as in verify_chart.py --all
+            if state['section'] == 'charts' and is_chart_file(state['path']):
+                failures[f"parse:{rel_path}"] = [error]
+        for chart_id, result in self.chart_results.items():
+            if result['errors']:
+                failures[f"chart:{chart_id}"] = result['errors']
+        for chart_id, result in self.audit_results.items():
+            if result['status'] != 'PASS':
+                failures[f"audit:{chart_id}"] = result['issues'] or [result['summary']]
+        return failures
+
+    def status(self) -> Dict[str, Any]:
+        """Summary of the watched complex."""
+        statistics = {
+            section: len(getattr(self.complex, section))
+            for section in ('vertices', 'edges', 'faces', 'charts')
+        }
+        return {
+            'root_path': str(self.root_path),
+            'generation': self.generation,
+            'refreshed': self.refreshed,
+            'files': len(self.files),
+            'elements': statistics,
+            'skipped': len(self.skipped_files()),
+            'charts_verified': len(self.chart_results),
+            'charts_audited': len(self.audit_results),
+            'failures': len(self.failures()),
+        }
+
+    def query(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a query API request.
+
+        Commands: status, failures, results, skipped, refresh,
+        element <id>, chart <id>.
+
+        Args:
+            request: {'command': str, 'id': str (element and chart only)}
+
+        Returns:
+            JSON-safe response ({'error': message} for bad requests)
+        """
+        command = request.get('command')
+        with self.lock:
+            if command == 'status':
+                return self.status()
+            if command == 'failures':
+                return {'failures': self.failures()}
+            if command == 'results':
+                return {
+                    'charts': {
+                        chart_id: result['errors'] for chart_id, result in self.chart_results.items()
+                    },
+                    'audits': self.audit_results,
+                }
+            if command == 'skipped':
+                return {'skipped': self.skipped_files()}
+            if command == 'refresh':
+                return self.refresh()
+            if command in ('element', 'chart'):
+                element_id = request.get('id')
+                if command == 'chart':
+                    if element_id not in self.chart_results:
+                        return {'error': f"Unknown chart: {element_id}"}
+                    return {
+                        'id': element_id,
+                        'errors': self.chart_results[element_id]['errors'],
+                        'audit': self.audit_results.get(element_id),
+                    }
+                for section in ('vertices', 'edges', 'faces', 'charts'):
+                    entry = getattr(self.complex, section).get(element_id)
+                    if entry is not None:
+                        return {'section': section, 'entry': entry}
+                return {'error': f"Unknown element: {element_id}"}
+        return {'error': f"Unknown command: {command}"}
+
+
+class QueryHandler(socketserver.StreamRequestHandler):
+    """Answer one JSON request per line with one JSON response per line."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+                response = self.server.watcher.query(request)
+            except ValueError as e:
+                response = {'error': f"Bad request: {e}"}
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+class QueryServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server for a ComplexWatcher."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, watcher: ComplexWatcher):
+        """
+        Args:
+            socket_path: Path of the Unix socket to listen on
+            watcher: Watcher whose results are served
+        """
+        self.watcher = watcher
+        # A socket left behind by a watcher that did not shut down cleanly
+        socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), QueryHandler)
+
+
+def send_query(socket_path: Path, command: str, element_id: str = None, timeout: float = 30.0) -> Dict[str, Any]:
+    """
+    Send one request to a running watcher.
+
+    Args:
+        socket_path: Watcher socket
+        command: Query command (see ComplexWatcher.query)
+        element_id: Element or chart ID for 'element' and 'chart'
+        timeout: Seconds to wait for the response
+
+    Returns:
+        Response dictionary
+
+    Raises:
+        OSError: If no watcher is listening on the socket
+    """
+    request = {'command': command}
+    if element_id is not None:
+        request['id'] = element_id
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with client.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+def print_report(watcher: ComplexWatcher, summary: Dict[str, Any]) -> None:
+    """Print what changed, what was re-checked and what is failing."""
+    changed = len(summary['changed']) + len(summary['removed'])
+    status = watcher.status()
+    elements = status['elements']
+    print(f"[{time.strftime('%H:%M:%S')}] {changed} file(s) changed, "
+          f"{len(summary['rerun'])} check(s) re-run "
+          f"({elements['vertices']} vertices, {elements['edges']} edges, "
+          f"{elements['faces']} faces, {elements['charts']} charts)")
+    failures = watcher.failures()
+    for key, errors in failures.items():
+        print(f"  ✗ {key}")
+        for error in errors[:5]:
+            print(f"    - {error}")
+        if len(errors) > 5:
+            print(f"    ... and {len(errors) - 5} more")
+    if not failures:
+        print("  ✓ All checks pass")
+
+
+def main():
+    """Command-line interface for watch."""
+    parser = argparse.ArgumentParser(
+        description='Keep the complex in memory and re-verify on file changes'
+    )
+    parser.add_argument(
+        '--path',
+        type=Path,
+        default=Path.cwd(),
+        help='Repository root (default: current directory)'
+    )
+    parser.add_argument(
+        '--socket',
+        type=Path,
+        help=f'Query socket (default: <path>/{DEFAULT_SOCKET})'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f'Seconds between scans (default: {DEFAULT_INTERVAL})'
+    )
+    parser.add_argument(
+        '--no-audit',
+        action='store_true',
+        help='Do not audit chart/assurance_audit charts'
+    )
+    parser.add_argument(
+        '--write-cache',
+        action='store_true',
+        help='Rebuild complex.json incrementally after each change'
+    )
+    parser.add_argument(
+        '--once',
+        action='store_true',
+        help='Scan and verify once, then exit (status 1 on failures)'
+    )
+    parser.add_argument(
+        '--query',
+        nargs='+',
+        metavar=('COMMAND', 'ID'),
+        help='Query a running watcher: status, failures, results, skipped, '
+             'refresh, element ID or chart ID'
+    )
+
+    args = parser.parse_args()
+    socket_path = args.socket or args.path / DEFAULT_SOCKET
+
+    if args.query:
+        try:
+            response = send_query(socket_path, *args.query[:2])
+        except OSError as e:
+            print(f"Error: no watcher listening on {socket_path} ({e})", file=sys.stderr)
+            return 1
+        print(json.dumps(response, indent=2))
+        return 1 if 'error' in response else 0
+
+    watcher = ComplexWatcher(args.path, audit=not args.no_audit)
+
+    def refresh():
+        summary = watcher.refresh()
+        if summary['changed'] or summary['removed']:
+            if args.write_cache:
+                with redirect_stdout(StringIO()):
+                    build_cache(watcher.root_path, incremental=True)
+            print_report(watcher, summary)
+
+    refresh()
+    if args.once:
+        return 1 if watcher.failures() else 0
+
+    # Shut down cleanly (removing the socket) when stopped by a service manager
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    server = QueryServer(socket_path, watcher)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Watching {watcher.root_path} (queries on {socket_path}, Ctrl-C to stop)")
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            refresh()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -23,7 +23,9 @@ from check_accountability import (
     normalize_username,
     check_shared_validation_edge_consistency,
     check_all_signature_accountability,
+    AccountabilityIndex,
 )
+import check_accountability
 
 
 def test_manual_validation_accountability():
@@ -250,6 +252,55 @@ class TestSharedValidationEdgeConsistency:
 
         assert all_passed, "All signature faces should pass accountability consistency"
 
+    def _write_signed_set(self, root: Path, name: str, signer: str, approver: str):
+        """Write a validation edge, assurance face and signature face sharing one edge."""
+        edges_dir = root / '01_edges'
+        faces_dir = root / '02_faces'
+        edges_dir.mkdir(exist_ok=True)
+        faces_dir.mkdir(exist_ok=True)
+        edge_id = f"e:validation:{name}"
+        (edges_dir / f"validation-{name}.md").write_text(
+            f"---\ntype: edge/validation\nid: {edge_id}\n"
+            f"validation_method: manual\nvalidator: {signer}\n---\n", encoding='utf-8')
+        (faces_dir / f"assurance-{name}.md").write_text(
+            f"---\ntype: face/assurance\nid: f:assurance:{name}\n"
+            f"validation_edge: {edge_id}\nhuman_approver: {approver}\n---\n", encoding='utf-8')
+        sig_path = faces_dir / f"signature-{name}.md"
+        sig_path.write_text(
+            f"---\ntype: face/signature\nid: f:signature:{name}\n"
+            f"signer: v:signer:{signer}\nvalidation_edge: {edge_id}\n---\n", encoding='utf-8')
+        return sig_path
+
+    def test_index_reads_each_face_once(self, tmp_path, monkeypatch):
+        """Test checking many signatures reads every file once, not once per signature."""
+        for i in range(5):
+            self._write_signed_set(tmp_path, f"doc-{i}", 'alice', 'alice')
+        reads = []
+        read_frontmatter = check_accountability.read_frontmatter
+
+        def counting_read(path):
+            reads.append(Path(path).name)
+            return read_frontmatter(path)
+
+        monkeypatch.setattr(check_accountability, 'read_frontmatter', counting_read)
+        all_passed, messages = check_all_signature_accountability(tmp_path)
+
+        assert all_passed, messages
+        assert len(reads) == 15
+        assert len(set(reads)) == 15
+
+    def test_index_detects_mismatch(self, tmp_path):
+        """Test the indexed join still reports a mismatched assurance approver."""
+        sig_path = self._write_signed_set(tmp_path, 'doc', 'alice', 'bob')
+        index = AccountabilityIndex(tmp_path)
+
+        assert index.assurance_face('e:validation:doc')[0].name == 'assurance-doc.md'
+        assert index.assurance_face('e:validation:other') is None
+        passed, message, details = check_shared_validation_edge_consistency(sig_path, tmp_path, index)
+        assert not passed
+        assert details['assurance_face'] == 'f:assurance:doc'
+        assert 'assurance approver (bob)' in message
+
 
 class TestPerFileAuthorTracking:
     """
@@ -0,0 +1,103 @@
+"""
+Tests for batch auditing in audit_assurance_chart.py
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from audit_assurance_chart import (
+    audit_assurance_chart,
+    audit_charts,
+    find_audit_charts,
+    format_coverage_report,
+    report_batch,
+)
+
+
+def write_chart(root: Path, name: str, faces: list, chart_type: str = 'chart/assurance_audit') -> Path:
+    """Write a chart auditing two documents, assured by the given faces (inferred targets)."""
+    path = root / 'charts' / name / f"{name}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    face_lines = ''.join(f"    - {face}\n" for face in faces) or "    []\n"
+    path.write_text(
+        f"---\ntype: {chart_type}\nid: c:{name}\n"
+        f"assurance_requirements:\n  requires_boundary_anchoring: false\n"
+        f"  audit_targets:\n    - v:spec:a\n    - v:guidance:a\n"
+        f"elements:\n  vertices:\n    - v:spec:a\n    - v:guidance:a\n  edges: []\n"
+        f"  faces:\n{face_lines}---\n",
+        encoding='utf-8'
+    )
+    return path
+
+
+def write_repo(root: Path) -> list:
+    """One passing and one failing audit chart, plus a chart of another type."""
+    for directory in ['00_vertices', '01_edges', '02_faces']:
+        (root / directory).mkdir(parents=True)
+    write_chart(root, 'other', [], chart_type='chart/chart')
+    return [
+        write_chart(root, 'complete', ['f:assurance:a-spec', 'f:assurance:a-guidance']),
+        write_chart(root, 'partial', ['f:assurance:a-spec']),
+    ]
+
+
+class TestBatchAudit:
+    """Test auditing every assurance_audit chart in one run."""
+
+    def test_find_audit_charts(self, tmp_path):
+        """Test only chart/assurance_audit charts are found."""
+        charts = write_repo(tmp_path)
+        assert find_audit_charts(tmp_path) == charts
+
+    def test_results_match_single_audits(self, tmp_path):
+        """Test batch results are exactly the per-chart audit_assurance_chart results."""
+        charts = write_repo(tmp_path)
+
+        results = audit_charts(charts, jobs=2)
+
+        assert list(results) == charts
+        for chart_path in charts:
+            assert results[chart_path] == audit_assurance_chart(chart_path)
+        assert [result['status'] for result in results.values()] == ['PASS', 'FAIL']
+
+    def test_failing_audit_reported(self, tmp_path):
+        """Test a chart whose audit raises is reported as an error, not raised."""
+        charts = write_repo(tmp_path)
+        charts[1].write_text("---\ntype: chart/assurance_audit\nid: [unclosed\n---\n", encoding='utf-8')
+
+        for jobs in (None, 2):
+            results = audit_charts(charts, jobs=jobs)
+
+            assert results[charts[0]]['status'] == 'PASS'
+            assert results[charts[1]]['status'] == 'ERROR'
+            assert results[charts[1]]['issues']
+
+    def test_report_batch(self, tmp_path):
+        """Test audit trails, the coverage report and JSON results are written."""
+        charts = write_repo(tmp_path)
+        report_path, json_path = tmp_path / 'coverage.md', tmp_path / 'coverage.json'
+
+        with redirect_stdout(StringIO()):
+            passed = report_batch(charts, report_path=report_path, json_path=json_path, root_path=tmp_path)
+
+        assert not passed
+        assert all(chart.with_name(f"{chart.stem}-audit-trail.md").exists() for chart in charts)
+        report = report_path.read_text(encoding='utf-8')
+        assert '**Charts:** 2 audited, 1 passed, 1 failed' in report
+        assert '**Coverage:** 75.0% (3/4 audit targets)' in report
+        assert '| `c:partial` | charts/partial/partial.md | ❌ FAIL | 50.0% | 1/2 | 3 |' in report
+        data = json.loads(json_path.read_text(encoding='utf-8'))
+        assert data['summary']['failed'] == 1
+        assert data['charts'][str(charts[0])]['vertices_assured'] == 2
+
+    def test_format_coverage_report_issues(self, tmp_path):
+        """Test issues are listed per failing chart."""
+        charts = write_repo(tmp_path)
+        report = format_coverage_report(audit_charts(charts))
+        assert '### c:partial' in report
+        assert '- ❌ v:guidance:a: Not assured' in report
@@ -0,0 +1,169 @@
+"""
+Tests for betti.py
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from betti import betti_numbers, build_complex, orient_face, reduce_gf2, rank_mod_p
+
+
+def make_cache(triangles, extra_edges=()):
+    """Build a complex.json-style cache from vertex triples (plus bare edges)."""
+    vertices, edges, faces = {}, {}, {}
+
+    def edge(a, b):
+        a, b = sorted((a, b))
+        edge_id = f"e:{a}:{b}"
+        edges.setdefault(edge_id, {'id': edge_id, 'source': f"v:{a}", 'target': f"v:{b}"})
+        return edge_id
+
+    for a, b, c in triangles:
+        for v in (a, b, c):
+            vertices[f"v:{v}"] = {'id': f"v:{v}"}
+        face_id = f"f:{a}:{b}:{c}"
+        faces[face_id] = {'id': face_id, 'edges': [edge(a, b), edge(b, c), edge(a, c)]}
+
+    for a, b in extra_edges:
+        for v in (a, b):
+            vertices[f"v:{v}"] = {'id': f"v:{v}"}
+        edge(a, b)
+
+    return {'elements': {'vertices': vertices, 'edges': edges, 'faces': faces, 'charts': {}}}
+
+
+def torus(n, m):
+    """Triangulated n × m torus."""
+    def idx(i, j):
+        return (i % n) * m + (j % m)
+    triangles = []
+    for i in range(n):
+        for j in range(m):
+            triangles.append((idx(i, j), idx(i + 1, j), idx(i + 1, j + 1)))
+            triangles.append((idx(i, j), idx(i, j + 1), idx(i + 1, j + 1)))
+    return triangles
+
+
+# Minimal 6-vertex triangulation of the real projective plane
+PROJECTIVE_PLANE = [
+    (0, 1, 2), (0, 2, 3), (0, 3, 4), (0, 4, 5), (0, 5, 1),
+    (1, 2, 4), (2, 3, 5), (3, 4, 1), (4, 5, 2), (5, 1, 3),
+]
+
+# Boundary of a tetrahedron
+SPHERE = [(0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3)]
+
+
+class TestBettiNumbers:
+    """Test Betti numbers of known surfaces."""
+
+    def test_sphere(self):
+        """Test the hollow tetrahedron encloses one void."""
+        results = betti_numbers(make_cache(SPHERE))
+        assert results['real']['betti'] == [1, 0, 1]
+        assert results['gf2']['betti'] == [1, 0, 1]
+        assert sorted(results['generators']['2'][0]) == sorted(make_cache(SPHERE)['elements']['faces'])
+
+    def test_torus(self):
+        """Test the torus has two independent loops and one void."""
+        results = betti_numbers(make_cache(torus(4, 5)))
+        assert results['real']['betti'] == [1, 2, 1]
+        assert results['gf2']['betti'] == [1, 2, 1]
+        assert len(results['generators']['1']) == 2
+        assert results['invalid_faces'] == []
+
+    def test_projective_plane_torsion(self):
+        """Test GF(2) and real Betti numbers differ on a non-orientable surface."""
+        results = betti_numbers(make_cache(PROJECTIVE_PLANE))
+        assert results['real']['betti'] == [1, 0, 0]
+        assert results['gf2']['betti'] == [1, 1, 1]
+
+    def test_unfilled_square(self):
+        """Test a 4-cycle with no faces is one hole (not a missing triangle)."""
+        cache = make_cache([], extra_edges=[(0, 1), (1, 2), (2, 3), (0, 3), (5, 6)])
+        results = betti_numbers(cache)
+
+        assert results['real']['betti'] == [2, 1, 0]
+        assert sorted(results['generators']['1'][0]) == ['e:0:1', 'e:0:3', 'e:1:2', 'e:2:3']
+        assert results['generators']['0'] == [['v:0'], ['v:5']]
+
+    def test_euler_characteristic(self):
+        """Test χ equals the alternating sum of Betti numbers."""
+        results = betti_numbers(make_cache(torus(3, 4)))
+        b0, b1, b2 = results['real']['betti']
+        assert results['statistics']['euler_characteristic'] == b0 - b1 + b2
+
+
+class TestChartClosure:
+    """Test computing homology of a chart subcomplex."""
+
+    def test_chart_pulls_in_boundary(self):
+        """Test a chart listing only faces is closed under boundaries."""
+        cache = make_cache(SPHERE)
+        chart = {'id': 'c:faces-only', 'elements': {
+            'vertices': [], 'edges': [], 'faces': list(cache['elements']['faces'])
+        }}
+
+        results = betti_numbers(cache, chart)
+
+        assert results['scope'] == 'c:faces-only'
+        assert results['real']['betti'] == [1, 0, 1]
+        assert len(results['added']) == 4 + 6
+
+    def test_missing_and_invalid(self):
+        """Test unknown references and open face boundaries are reported."""
+        cache = make_cache([(0, 1, 2)], extra_edges=[(2, 3)])
+        cache['elements']['faces']['f:open'] = {'edges': ['e:0:1', 'e:2:3']}
+        chart = {'elements': {
+            'vertices': ['v:0', 'v:missing'],
+            'edges': ['e:0:1', 'e:unknown'],
+            'faces': ['f:open'],
+        }}
+
+        results = betti_numbers(cache, chart)
+
+        assert 'v:missing' in results['missing']
+        assert 'e:unknown' in results['missing']
+        assert results['invalid_faces'] == ['f:open']
+
+
+class TestReduction:
+    """Test the column reduction primitives."""
+
+    def test_orient_face(self):
+        """Test boundary edges are signed to form a closed walk."""
+        edges = {'a': ('v:0', 'v:1'), 'b': ('v:0', 'v:2'), 'c': ('v:1', 'v:2')}
+        assert orient_face(['a', 'b', 'c'], edges) == [('a', 1), ('c', 1), ('b', -1)]
+        assert orient_face(['a', 'b'], edges) is None
+
+    def test_boundary_of_boundary(self):
+        """Test oriented faces have zero boundary (∂₁∂₂ = 0)."""
+        cache = make_cache(torus(3, 3))
+        elements = cache['elements']
+        complex_data = build_complex(
+            elements, list(elements['vertices']), list(elements['edges']), list(elements['faces'])
+        )
+        for oriented in complex_data['face_boundary'].values():
+            total = {}
+            for edge_id, sign in oriented:
+                source, target = complex_data['edge_boundary'][edge_id]
+                total[source] = total.get(source, 0) - sign
+                total[target] = total.get(target, 0) + sign
+            assert all(value == 0 for value in total.values())
+
+    def test_reduce_gf2_tracks_cycles(self):
+        """Test zero columns record the columns that sum to them."""
+        # Columns 0, 1, 2 form a triangle's boundary; column 3 repeats column 0
+        columns = [[0, 1], [1, 2], [0, 2], [0, 1]]
+        pivots, cycles = reduce_gf2(columns, track=True)
+
+        assert len(pivots) == 2
+        assert cycles == {2: [0, 1, 2], 3: [0, 3]}
+
+    def test_rank_mod_p_matches_gf2_when_torsion_free(self):
+        """Test ranks agree across fields on an orientable surface."""
+        columns = [[(0, -1), (1, 1)], [(1, -1), (2, 1)], [(0, -1), (2, 1)]]
+        assert len(rank_mod_p(columns)) == 2
+        assert len(reduce_gf2([[row for row, _ in c] for c in columns])[0]) == 2
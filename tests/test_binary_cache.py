@@ -0,0 +1,159 @@
+"""
+Tests for binary_cache.py
+"""
+
+import json
+import os
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from binary_cache import ElementTable, binary_path_for, open_binary_cache, write_binary_cache
+from cached_complex import get_complex
+
+CACHE = {
+    'version': '1.0.0',
+    'generated': '2026-01-01T00:00:00+00:00',
+    'root_path': '.',
+    'elements': {
+        'vertices': {
+            'v:a': {'id': 'v:a', 'type': 'vertex/doc', 'tags': ['vertex'], 'name': 'Ä'},
+            'v:b': {'id': 'v:b', 'type': 'vertex/doc', 'dependencies': ['v:a']},
+        },
+        'edges': {
+            'e:a:b': {'id': 'e:a:b', 'type': 'edge/dependency', 'source': 'v:a', 'target': 'v:b'},
+            'e:a:x': {'id': 'e:a:x', 'type': 'edge/dependency', 'source': 'v:a', 'target': 'v:x'},
+        },
+        'faces': {
+            'f:abc': {'id': 'f:abc', 'type': 'face/assurance',
+                      'vertices': ['v:a', 'v:b', 'v:c'], 'edges': ['e:a:b', 'e:b:c', 'e:a:c']},
+        },
+        'charts': {
+            'c:test': {'id': 'c:test', 'type': 'chart/test',
+                       'elements': {'vertices': ['v:a', 'v:b'], 'edges': ['e:a:b'], 'faces': []}},
+        },
+    },
+    'statistics': {'vertex_count': 2, 'edge_count': 2, 'face_count': 1, 'chart_count': 1},
+}
+
+
+def as_dict(value):
+    """Recursively convert mappings to plain dictionaries."""
+    if hasattr(value, 'items'):
+        return {key: as_dict(item) for key, item in value.items()}
+    return value
+
+
+class TestBinaryCache:
+    """Test writing and reading the binary layout."""
+
+    def test_round_trip(self, tmp_path):
+        """Test the binary cache reads back as the original dictionary."""
+        path = tmp_path / 'complex.bin'
+        write_binary_cache(CACHE, path)
+
+        cache = open_binary_cache(path)
+        assert as_dict(cache) == CACHE
+        assert list(cache['elements']['edges']) == ['e:a:b', 'e:a:x']
+        cache.close()
+
+    def test_columns(self, tmp_path):
+        """Test columns decode without touching element records."""
+        path = tmp_path / 'complex.bin'
+        write_binary_cache(CACHE, path)
+        elements = open_binary_cache(path)['elements']
+
+        assert isinstance(elements['edges'], ElementTable)
+        assert elements['edges'].strings('target') == ['v:b', 'v:x']
+        assert elements['vertices'].strings('type') == ['vertex/doc', 'vertex/doc']
+        assert elements['faces'].lists('vertices') == [['v:a', 'v:b', 'v:c']]
+        assert elements['charts'].lists('edges') == [['e:a:b']]
+        # IDs and references share one interned string table
+        assert elements['edges'].column('source')[0] == elements['vertices'].column('id')[0]
+
+    def test_missing_element(self, tmp_path):
+        """Test unknown IDs behave like dictionary misses."""
+        path = tmp_path / 'complex.bin'
+        write_binary_cache(CACHE, path)
+        vertices = open_binary_cache(path)['elements']['vertices']
+
+        assert 'v:missing' not in vertices
+        assert vertices.get('v:missing') is None
+        assert vertices['v:b']['dependencies'] == ['v:a']
+
+    def test_empty_cache(self, tmp_path):
+        """Test a cache with no elements."""
+        path = tmp_path / 'complex.bin'
+        write_binary_cache({'version': '1.0.0', 'elements': {}}, path)
+
+        cache = open_binary_cache(path)
+        assert len(cache['elements']['faces']) == 0
+        assert cache['version'] == '1.0.0'
+
+
+class TestBinaryLoading:
+    """Test get_complex picks the binary cache only when it is fresh."""
+
+    def test_prefers_fresh_binary(self, tmp_path):
+        """Test a binary cache at least as new as complex.json is used."""
+        json_path = tmp_path / 'complex.json'
+        json_path.write_text(json.dumps(CACHE), encoding='utf-8')
+        write_binary_cache(CACHE, binary_path_for(json_path))
+
+        complex_ = get_complex(tmp_path)
+        assert complex_.cache_path.suffix == '.bin'
+        assert complex_.edge_boundary['e:a:x'] == ('v:a', 'v:x')
+        assert complex_.face_edges['f:abc'] == ['e:a:b', 'e:b:c', 'e:a:c']
+
+    def test_ignores_stale_binary(self, tmp_path):
+        """Test complex.json is used when it is newer than complex.bin."""
+        json_path = tmp_path / 'complex.json'
+        binary_path = binary_path_for(json_path)
+        write_binary_cache(CACHE, binary_path)
+        json_path.write_text(json.dumps({'elements': {}}), encoding='utf-8')
+        stat = binary_path.stat()
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        complex_ = get_complex(tmp_path)
+        assert complex_.cache_path.suffix == '.json'
+        assert complex_.vertex_ids == frozenset()
+
+    def test_replaced_binary_closed(self, tmp_path):
+        """Test reloading a rewritten cache releases the previous memory map."""
+        json_path = tmp_path / 'complex.json'
+        binary_path = binary_path_for(json_path)
+        json_path.write_text(json.dumps(CACHE), encoding='utf-8')
+        write_binary_cache(CACHE, binary_path)
+        first = get_complex(tmp_path)
+
+        write_binary_cache({**CACHE, 'elements': {**CACHE['elements'], 'charts': {}}}, binary_path)
+        stat = binary_path.stat()
+        os.utime(binary_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = get_complex(tmp_path)
+
+        assert second is not first
+        assert second.chart_ids == frozenset()
+        assert first.cache._mmap.closed
+        assert not second.cache._mmap.closed
+
+    def test_unusable_previous_build_closed(self, tmp_path, monkeypatch):
+        """Test load_previous_build closes a binary cache it rejects."""
+        import build_cache
+
+        json_path = tmp_path / 'complex.json'
+        json_path.write_text(json.dumps(CACHE), encoding='utf-8')
+        write_binary_cache({**CACHE, 'version': '0.0.0'}, binary_path_for(json_path))
+        build_cache.manifest_path_for(json_path).write_text(
+            json.dumps({'version': build_cache.CACHE_VERSION, 'files': {}}), encoding='utf-8'
+        )
+        opened = []
+
+        def recording_open(path):
+            opened.append(open_binary_cache(path))
+            return opened[-1]
+
+        monkeypatch.setattr(build_cache, 'open_binary_cache', recording_open)
+
+        assert build_cache.load_previous_build(json_path) is None
+        assert len(opened) == 1 and opened[0]._mmap.closed
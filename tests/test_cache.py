@@ -4,13 +4,15 @@ Tests for build_cache.py
 """
 
 import json
+import os
 from pathlib import Path
 import sys
 import tempfile
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
-from build_cache import build_cache, calculate_euler_characteristic
+from binary_cache import binary_path_for, open_binary_cache
+from build_cache import build_cache, calculate_euler_characteristic, manifest_path_for
 
 
 class TestEulerCharacteristic:
@@ -81,6 +83,157 @@ version: 1.0.0
         loaded = json.loads(cache_file.read_text())
         assert loaded['statistics']['vertex_count'] == 1
 
+    def test_build_cache_writes_binary(self, tmp_path):
+        """Test the binary cache mirrors complex.json."""
+        vertices_dir = tmp_path / "00_vertices"
+        vertices_dir.mkdir()
+        write_vertex(vertices_dir, 'a')
+        write_vertex(vertices_dir, 'b')
+
+        build_cache(tmp_path, tmp_path / "complex.json")
+
+        binary = open_binary_cache(binary_path_for(tmp_path / "complex.json"))
+        loaded = json.loads((tmp_path / "complex.json").read_text())
+        assert list(binary['elements']['vertices']) == ['v:a', 'v:b']
+        assert binary['elements']['vertices']['v:a'] == loaded['elements']['vertices']['v:a']
+        assert binary['statistics'] == loaded['statistics']
+        binary.close()
+
+    def test_build_cache_without_binary(self, tmp_path):
+        """Test the binary cache can be skipped."""
+        build_cache(tmp_path, tmp_path / "complex.json", binary=False)
+        assert not binary_path_for(tmp_path / "complex.json").exists()
+
+    def test_streamed_output_matches_json_dumps(self, tmp_path):
+        """Test the streamed file is exactly json.dumps of the cache, duplicates included."""
+        vertices_dir = tmp_path / "00_vertices"
+        vertices_dir.mkdir()
+        write_vertex(vertices_dir, 'a', title='Ä first')
+        write_vertex(vertices_dir, 'b')
+        # Same ID as a.md: keeps a's position with this entry, as a dict would
+        (vertices_dir / "z.md").write_text((vertices_dir / "a.md").read_text().replace(
+            'Ä first', 'Second'), encoding='utf-8')
+
+        cache = build_cache(tmp_path, tmp_path / "complex.json")
+
+        text = (tmp_path / "complex.json").read_text(encoding='utf-8')
+        assert text == json.dumps(json.loads(text), indent=2)
+        assert list(cache['elements']['vertices']) == ['v:a', 'v:b']
+        assert cache['elements']['vertices']['v:a']['name'] == 'Second'
+        assert cache['elements']['edges'] == {}
+        # Counts are per parsed file, as before
+        assert cache['statistics']['vertex_count'] == 3
+
+
+
+def write_vertex(directory: Path, name: str, title: str = None):
+    """Write a minimal vertex file."""
+    (directory / f"{name}.md").write_text(f"""---
+type: vertex/vertex
+extends: null
+id: v:{name}
+name: {title or name.title()}
+tags:
+  - vertex
+version: 1.0.0
+---
+""")
+
+
+def strip_generated(text: str) -> str:
+    """Drop the 'generated' timestamp line so builds can be compared."""
+    return '\n'.join(line for line in text.splitlines() if '"generated"' not in line)
+
+
+class TestIncrementalBuild:
+    """Test incremental cache rebuilds."""
+
+    def _setup(self, tmp_path):
+        vertices_dir = tmp_path / "00_vertices"
+        vertices_dir.mkdir()
+        for name in ['alpha', 'beta', 'gamma']:
+            write_vertex(vertices_dir, name)
+        (vertices_dir / "README.md").write_text("# Not an element\n")
+        return vertices_dir
+
+    def test_manifest_written(self, tmp_path):
+        """Test a build writes a manifest covering every scanned file."""
+        self._setup(tmp_path)
+        build_cache(tmp_path, tmp_path / "complex.json")
+
+        manifest = json.loads(manifest_path_for(tmp_path / "complex.json").read_text())
+        files = manifest['files']
+        assert files['00_vertices/alpha.md']['id'] == 'v:alpha'
+        assert files['00_vertices/README.md']['id'] is None
+        assert len(files['00_vertices/alpha.md']['sha256']) == 64
+
+    def test_incremental_matches_full_build(self, tmp_path):
+        """Test changed, added and deleted files produce a full-build result."""
+        vertices_dir = self._setup(tmp_path)
+        build_cache(tmp_path, tmp_path / "complex.json")
+
+        write_vertex(vertices_dir, 'beta', title='Beta Renamed')
+        write_vertex(vertices_dir, 'delta')
+        (vertices_dir / "gamma.md").unlink()
+
+        incremental = build_cache(tmp_path, tmp_path / "complex.json", incremental=True)
+        build_cache(tmp_path, tmp_path / "full.json")
+
+        assert incremental['elements']['vertices']['v:beta']['name'] == 'Beta Renamed'
+        assert 'v:gamma' not in incremental['elements']['vertices']
+        assert incremental['statistics']['vertex_count'] == 3
+        assert strip_generated((tmp_path / "complex.json").read_text()) == \
+            strip_generated((tmp_path / "full.json").read_text())
+
+    def test_incremental_reparses_only_changed(self, tmp_path, capsys):
+        """Test unchanged files are reused, including touched-but-identical ones."""
+        vertices_dir = self._setup(tmp_path)
+        build_cache(tmp_path, tmp_path / "complex.json")
+
+        # New mtime, same content: resolved by hash without re-parsing
+        alpha = vertices_dir / "alpha.md"
+        stat = alpha.stat()
+        os.utime(alpha, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        write_vertex(vertices_dir, 'beta', title='Beta Renamed')
+        capsys.readouterr()
+
+        build_cache(tmp_path, tmp_path / "complex.json", incremental=True)
+        out = capsys.readouterr().out
+        assert "3 unchanged, 1 re-parsed, 0 removed" in out
+
+    def test_parallel_build_starts_workers_once(self, tmp_path, monkeypatch):
+        """Test a --jobs build shares one process pool across element directories."""
+        import build_cache as build_cache_module
+        import parse_chart
+
+        self._setup(tmp_path)
+        edges_dir = tmp_path / "01_edges"
+        edges_dir.mkdir()
+        (edges_dir / "README.md").write_text("# Not an element\n")
+        pools = []
+        pool_class = build_cache_module.ProcessPoolExecutor
+
+        def counting_pool(*args, **kwargs):
+            pools.append(kwargs)
+            return pool_class(*args, **kwargs)
+
+        monkeypatch.setattr(build_cache_module, 'ProcessPoolExecutor', counting_pool)
+        monkeypatch.setattr(parse_chart, 'ProcessPoolExecutor', counting_pool)
+        parallel = build_cache(tmp_path, tmp_path / "complex.json", workers=2)
+        build_cache(tmp_path, tmp_path / "sequential.json")
+
+        assert pools == [{'max_workers': 2}]
+        assert parallel['statistics']['vertex_count'] == 3
+        assert strip_generated((tmp_path / "complex.json").read_text()) == \
+            strip_generated((tmp_path / "sequential.json").read_text())
+
+    def test_incremental_without_previous_build(self, tmp_path):
+        """Test incremental mode falls back to a full build."""
+        self._setup(tmp_path)
+        cache = build_cache(tmp_path, tmp_path / "complex.json", incremental=True)
+        assert cache['statistics']['vertex_count'] == 3
+        assert manifest_path_for(tmp_path / "complex.json").exists()
+
 
 def run_tests():
     """Run all cache tests."""
@@ -141,6 +294,33 @@ def run_tests():
             print(f"✗ test_build_cache_simple: {e}")
             return False
 
+    for test_name in ['test_build_cache_writes_binary', 'test_build_cache_without_binary',
+                      'test_streamed_output_matches_json_dumps']:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                getattr(build_tests, test_name)(Path(tmp))
+                print(f"✓ {test_name}")
+            except AssertionError as e:
+                print(f"✗ {test_name}: {e}")
+                return False
+
+    # TestIncrementalBuild
+    print("\n--- Incremental Build Tests ---")
+    incremental_tests = TestIncrementalBuild()
+
+    for test_name in [
+        'test_manifest_written',
+        'test_incremental_matches_full_build',
+        'test_incremental_without_previous_build',
+    ]:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                getattr(incremental_tests, test_name)(Path(tmp))
+                print(f"✓ {test_name}")
+            except AssertionError as e:
+                print(f"✗ {test_name}: {e}")
+                return False
+
     print("\n" + "=" * 70)
     print("All cache tests passed!")
     print("=" * 70)
@@ -0,0 +1,78 @@
+"""
+Tests for cached_complex.py
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from cached_complex import Complex, get_complex
+
+CACHE = {
+    'elements': {
+        'vertices': {'v:a': {'id': 'v:a'}, 'v:b': {'id': 'v:b'}, 'v:c': {'id': 'v:c'}},
+        'edges': {
+            'e:a:b': {'id': 'e:a:b', 'source': 'v:a', 'target': 'v:b'},
+            'e:b:c': {'id': 'e:b:c', 'source': 'v:b', 'target': 'v:c'},
+            'e:a:c': {'id': 'e:a:c', 'source': 'v:a', 'target': 'v:c'},
+        },
+        'faces': {'f:abc': {'id': 'f:abc', 'edges': ['e:a:b', 'e:b:c', 'e:a:c']}},
+        'charts': {},
+    }
+}
+
+
+class TestComplex:
+    """Test the indexed cache view."""
+
+    def test_id_sets(self):
+        """Test typed ID sets mirror the cache."""
+        complex_ = Complex(CACHE)
+        assert complex_.vertex_ids == {'v:a', 'v:b', 'v:c'}
+        assert complex_.face_ids == {'f:abc'}
+        assert complex_.chart_ids == frozenset()
+
+    def test_adjacency(self):
+        """Test boundary and coboundary maps."""
+        complex_ = Complex(CACHE)
+        assert complex_.edge_boundary['e:a:b'] == ('v:a', 'v:b')
+        assert complex_.vertex_edges['v:a'] == {'e:a:b', 'e:a:c'}
+        assert complex_.edge_faces['e:b:c'] == {'f:abc'}
+        assert complex_.neighbours['v:b'] == {'v:a', 'v:c'}
+
+    def test_mapping_interface(self):
+        """Test dict-style access to the raw cache still works."""
+        complex_ = Complex(CACHE)
+        assert complex_['elements']['edges'] is CACHE['elements']['edges']
+        assert 'elements' in complex_
+
+    def test_get_complex_reuses_until_changed(self):
+        """Test the cache is loaded once and reloaded when the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            cache_path = root / 'complex.json'
+            cache_path.write_text(json.dumps(CACHE), encoding='utf-8')
+
+            first = get_complex(root)
+            assert get_complex(root) is first
+
+            cache_path.write_text(json.dumps({'elements': {}}), encoding='utf-8')
+            stat = cache_path.stat()
+            os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            second = get_complex(root)
+            assert second is not first
+            assert second.vertex_ids == frozenset()
+
+    def test_get_complex_missing(self):
+        """Test a missing cache raises FileNotFoundError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            try:
+                get_complex(Path(tmpdir))
+                assert False, "Should have raised FileNotFoundError"
+            except FileNotFoundError as e:
+                assert 'Cache not found' in str(e)
@@ -8,6 +8,7 @@ Tests document compilation with Obsidian embed expansion:
 - Expand simple embeds
 - Expand nested embeds
 - Handle missing embeds gracefully
+- Read each embedded file once and stop at embed cycles
 """
 
 import sys
@@ -17,6 +18,7 @@ import tempfile
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
+import compile_document as compile_module
 from compile_document import (
     extract_content_without_frontmatter,
     resolve_embed_path,
@@ -322,6 +324,77 @@ Just normal content.
         assert compiled == source_file.read_text()
 
 
+class TestEmbedExpander:
+    """Test single-pass expansion."""
+
+    def test_repeated_embed_read_once(self, tmp_path, monkeypatch):
+        """Test a file embedded many times (directly and nested) is read once."""
+        base_dir = tmp_path / "00_vertices"
+        base_dir.mkdir()
+        (base_dir / "shared.md").write_text("---\ntype: vertex/doc\n---\n\nShared.\n")
+        (base_dir / "section.md").write_text("Section ![[shared]]\n")
+        source_file = base_dir / "paper.md"
+        source_file.write_text("# Paper\n" + "![[shared]]\n![[section]]\n" * 50)
+
+        reads = []
+        extract = compile_module.extract_content_without_frontmatter
+
+        def counting_extract(file_path):
+            reads.append(file_path.name)
+            return extract(file_path)
+
+        monkeypatch.setattr(compile_module, 'extract_content_without_frontmatter', counting_extract)
+        output_file = tmp_path / "compiled.md"
+        compile_document(source_file, output_file, base_dir)
+
+        assert sorted(reads) == ["section.md", "shared.md"]
+        assert output_file.read_text() == "# Paper\n" + "Shared.\nSection Shared.\n" * 50
+
+    def test_embed_cycle(self, tmp_path, capsys):
+        """Test an embed cycle is left unexpanded with a warning naming it."""
+        base_dir = tmp_path / "00_vertices"
+        base_dir.mkdir()
+        (base_dir / "a.md").write_text("A start\n![[b]]\nA end\n")
+        (base_dir / "b.md").write_text("B start\n![[a]]\n![[b]]\nB end\n")
+
+        output_file = tmp_path / "compiled.md"
+        compile_document(base_dir / "a.md", output_file, base_dir)
+
+        assert output_file.read_text() == "A start\nB start\n![[a]]\n![[b]]\nB end\nA end\n"
+        warnings = capsys.readouterr().err
+        assert "Circular embed: a.md → b.md → a.md" in warnings
+        assert "Circular embed: a.md → b.md → b.md" in warnings
+
+    def test_deep_nesting(self, tmp_path):
+        """Test chains deeper than the old 100-pass cap expand fully."""
+        base_dir = tmp_path / "00_vertices"
+        base_dir.mkdir()
+        depth = 300
+        for level in range(depth):
+            (base_dir / f"level-{level}.md").write_text(f"{level} ![[level-{level + 1}]]\n")
+        (base_dir / f"level-{depth}.md").write_text("bottom\n")
+
+        output_file = tmp_path / "compiled.md"
+        compile_document(base_dir / "level-0.md", output_file, base_dir)
+
+        compiled = output_file.read_text()
+        assert "![[" not in compiled
+        assert compiled.endswith("299 bottom\n")
+
+    def test_missing_embed_warns_once(self, tmp_path, capsys):
+        """Test a missing embed used several times warns once."""
+        base_dir = tmp_path / "00_vertices"
+        base_dir.mkdir()
+        source_file = base_dir / "test.md"
+        source_file.write_text("![[gone]] ![[gone]] ![[gone]]\n")
+
+        output_file = tmp_path / "compiled.md"
+        compile_document(source_file, output_file, base_dir)
+
+        assert output_file.read_text() == source_file.read_text()
+        assert capsys.readouterr().err.count("gone") == 1
+
+
 class TestWithRealDocuments:
     """Test with actual repository documents."""
 
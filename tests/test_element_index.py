@@ -0,0 +1,88 @@
+"""
+Tests for element_index.py
+"""
+
+import json
+import os
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from element_index import ElementIndex, get_element_index, index_path_for
+
+
+def write_element(path: Path, element_id: str, element_type: str = 'vertex/vertex'):
+    """Write a minimal element file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"""---
+type: {element_type}
+id: {element_id}
+name: {element_id}
+tags:
+  - vertex
+version: 1.0.0
+---
+""")
+
+
+def make_repo(root: Path):
+    """Create a small repository with one element of each kind."""
+    write_element(root / '00_vertices' / 'alpha.md', 'v:alpha')
+    write_element(root / '01_edges' / 'edge-with-odd-name.md', 'e:validation:alpha:beta')
+    write_element(root / '02_faces' / 'assurance-alpha.md', 'f:assurance:alpha')
+    write_element(root / 'charts' / 'demo' / 'demo.md', 'c:demo')
+    (root / '00_vertices' / 'README.md').write_text("# Not an element\n")
+
+
+class TestElementIndex:
+    """Test building, persisting and invalidating the index."""
+
+    def test_resolve_by_id(self, tmp_path):
+        """Test IDs resolve regardless of filename conventions."""
+        make_repo(tmp_path)
+        index = ElementIndex.build(tmp_path)
+
+        assert index.resolve('e:validation:alpha:beta') == tmp_path / '01_edges' / 'edge-with-odd-name.md'
+        assert index.resolve('c:demo') == tmp_path / 'charts' / 'demo' / 'demo.md'
+        assert index.resolve('v:missing') is None
+        assert len(index) == 4
+
+    def test_load_persists_and_reuses(self, tmp_path):
+        """Test load writes the index and reuses it while directories are unchanged."""
+        make_repo(tmp_path)
+        ElementIndex.load(tmp_path)
+        index_path = index_path_for(tmp_path / 'complex.json')
+        assert index_path.exists()
+
+        # Tamper with the stored mapping: a fresh index is trusted as-is
+        data = json.loads(index_path.read_text())
+        data['elements']['v:alpha'] = '00_vertices/renamed.md'
+        index_path.write_text(json.dumps(data))
+        assert ElementIndex.load(tmp_path).resolve('v:alpha') == tmp_path / '00_vertices' / 'renamed.md'
+
+    def test_directory_change_invalidates(self, tmp_path):
+        """Test adding a file (new directory mtime) triggers a rescan."""
+        make_repo(tmp_path)
+        index = get_element_index(tmp_path)
+        assert 'v:beta' not in index
+
+        vertices_dir = tmp_path / '00_vertices'
+        write_element(vertices_dir / 'beta.md', 'v:beta')
+        stat = vertices_dir.stat()
+        os.utime(vertices_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert get_element_index(tmp_path).resolve('v:beta') == (vertices_dir / 'beta.md').resolve()
+
+    def test_search_dirs_do_not_override(self, tmp_path):
+        """Test search directories add elements without shadowing the repository."""
+        make_repo(tmp_path)
+        extra = tmp_path / 'extra'
+        write_element(extra / 'alpha-copy.md', 'v:alpha')
+        write_element(extra / 'gamma.md', 'v:gamma')
+
+        index = ElementIndex.build(tmp_path)
+        index.add_search_dirs([extra])
+
+        assert index.resolve('v:alpha') == tmp_path / '00_vertices' / 'alpha.md'
+        assert index.resolve('v:gamma') == extra / 'gamma.md'
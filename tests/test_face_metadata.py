@@ -0,0 +1,99 @@
+"""
+Tests for face metadata lookups in audit_assurance_chart.py
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import audit_assurance_chart
+from audit_assurance_chart import FaceMetadata, get_face_metadata, get_face_target
+from build_cache import build_cache
+
+
+def write_face(root: Path, name: str, target: str):
+    """Write an assurance face with an explicit target."""
+    path = root / '02_faces' / f"assurance-{name}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\ntype: face/assurance\nextends: face\nid: f:assurance:{name}\nname: Face\n"
+        f"target: {target}\nvalidation_edge: e:validation:{name}\n"
+        f"vertices: [v:a, v:b, v:c]\nedges: [e:1, e:2, e:3]\norientation: oriented\n"
+        f"tags: [face]\nversion: 1.0.0\n---\n",
+        encoding='utf-8'
+    )
+    return path
+
+
+def build(root: Path):
+    with redirect_stdout(StringIO()):
+        build_cache(root)
+
+
+class CountingReads:
+    """Stand-in for read_frontmatter that counts file reads."""
+
+    def __init__(self):
+        self.paths = []
+        self.read_frontmatter = audit_assurance_chart.read_frontmatter
+
+    def __call__(self, path):
+        self.paths.append(Path(path).name)
+        return self.read_frontmatter(path)
+
+
+class TestFaceMetadata:
+    """Test the face metadata table used by the audit."""
+
+    def test_reads_face_file_once(self, tmp_path, monkeypatch):
+        """Test faces without a build cache are read once, then served from the table."""
+        write_face(tmp_path, 'x', 'v:doc:x')
+        reads = CountingReads()
+        monkeypatch.setattr(audit_assurance_chart, 'read_frontmatter', reads)
+
+        faces = FaceMetadata(tmp_path)
+        for _ in range(3):
+            assert faces.get('f:assurance:x') == {
+                'type': 'face/assurance', 'target': 'v:doc:x', 'validation_edge': 'e:validation:x'
+            }
+        assert faces.get('f:assurance:missing') is None
+        assert reads.paths == ['assurance-x.md']
+
+    def test_uses_fresh_build_cache(self, tmp_path, monkeypatch):
+        """Test unchanged faces come from complex.json without reading the file."""
+        write_face(tmp_path, 'x', 'v:doc:x')
+        build(tmp_path)
+        reads = CountingReads()
+        monkeypatch.setattr(audit_assurance_chart, 'read_frontmatter', reads)
+
+        assert FaceMetadata(tmp_path).get('f:assurance:x')['target'] == 'v:doc:x'
+        assert reads.paths == []
+
+    def test_changed_face_is_reread(self, tmp_path):
+        """Test edits after the build, or after a lookup, are picked up."""
+        path = write_face(tmp_path, 'x', 'v:doc:x')
+        build(tmp_path)
+        faces = FaceMetadata(tmp_path)
+        assert faces.get('f:assurance:x')['target'] == 'v:doc:x'
+
+        write_face(tmp_path, 'x', 'v:doc:changed-target')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert faces.get('f:assurance:x')['target'] == 'v:doc:changed-target'
+
+    def test_shared_table(self, tmp_path):
+        """Test one table is reused per repository and sees new face files."""
+        write_face(tmp_path, 'x', 'v:doc:x')
+        faces = get_face_metadata(tmp_path)
+        assert get_face_metadata(tmp_path) is faces
+
+        write_face(tmp_path, 'y', 'v:doc:y')
+        os.utime(tmp_path / '02_faces', ns=(0, 10**18))
+        assert get_face_target('f:assurance:y', tmp_path) == 'v:doc:y'
+        # Unknown faces fall back to the naming convention
+        assert get_face_target('f:assurance:chart-spec', tmp_path) == 'v:spec:chart'
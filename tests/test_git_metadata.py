@@ -0,0 +1,148 @@
+"""
+Tests for git_metadata.py
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import git_metadata
+from check_accountability import get_file_author_in_commit, get_modified_validation_edges
+from git_metadata import GitMetadata, get_git_metadata
+
+
+def git(root: Path, *args: str, author: str = 'Alice'):
+    subprocess.run(
+        ['git', '-c', f"user.name={author}", '-c', 'user.email=test@example.com', *args],
+        cwd=root, check=True, capture_output=True
+    )
+
+
+def commit(root: Path, files: dict, author: str, message: str = 'change'):
+    """Write files and commit them as author."""
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    git(root, 'add', '.')
+    git(root, 'commit', '-q', '-m', message, author=author)
+
+
+def edge(name: str, validator: str) -> str:
+    return (f"---\ntype: edge/validation\nid: e:validation:{name}\n"
+            f"validation_method: manual\nvalidator: {validator}\n---\n")
+
+
+def fixture_repo(root: Path):
+    """
+    History (oldest first):
+      Alice adds a, b and notes.txt
+      Bob modifies b
+      Carol adds c and modifies notes.txt
+    """
+    git(root, 'init', '-q')
+    commit(root, {'01_edges/validation-a.md': edge('a', 'alice'),
+                  '01_edges/validation-b.md': edge('b', 'alice'),
+                  'notes.txt': 'one\n'}, 'Alice')
+    commit(root, {'01_edges/validation-b.md': edge('b', 'bob')}, 'Bob')
+    commit(root, {'01_edges/validation-c.md': edge('c', 'carol'),
+                  'notes.txt': 'two\n'}, 'Carol')
+
+
+class CountingPopen:
+    """Stand-in for subprocess.Popen that counts git log runs."""
+
+    def __init__(self):
+        self.calls = 0
+        self.popen = subprocess.Popen
+
+    def __call__(self, command, *args, **kwargs):
+        if 'log' in command:
+            self.calls += 1
+        return self.popen(command, *args, **kwargs)
+
+
+class TestGitMetadata:
+    """Test batched authorship lookups against a fixture repository."""
+
+    def test_last_authors(self, tmp_path):
+        """Test each path gets the author of the newest commit touching it."""
+        fixture_repo(tmp_path)
+        metadata = GitMetadata(tmp_path.resolve())
+
+        authors = metadata.last_authors([
+            tmp_path / '01_edges' / 'validation-a.md',
+            tmp_path / '01_edges' / 'validation-b.md',
+            tmp_path / '01_edges' / 'validation-c.md',
+            tmp_path / 'untracked.md',
+            '/outside/the/repository.md',
+        ])
+
+        assert list(authors.values()) == ['Alice', 'Bob', 'Carol', '', '']
+
+    def test_one_log_per_batch_cached_per_commit(self, tmp_path, monkeypatch):
+        """Test a batch runs git log once and repeated lookups at a commit run it not at all."""
+        fixture_repo(tmp_path)
+        popen = CountingPopen()
+        monkeypatch.setattr(git_metadata.subprocess, 'Popen', popen)
+        metadata = GitMetadata(tmp_path.resolve())
+        paths = [tmp_path / '01_edges' / f"validation-{name}.md" for name in 'abc']
+
+        metadata.last_authors(paths)
+        assert popen.calls == 1
+        assert metadata.last_author(paths[1]) == 'Bob'
+        assert popen.calls == 1
+
+        # A new commit moves HEAD, so authors are looked up again
+        commit(tmp_path, {'01_edges/validation-b.md': edge('b', 'dana')}, 'Dana')
+        assert metadata.last_author(paths[1]) == 'Dana'
+        assert popen.calls == 2
+
+    def test_revision_and_diff_filter(self, tmp_path):
+        """Test lookups respect the revision and only count matching change types."""
+        fixture_repo(tmp_path)
+        git(tmp_path, 'rm', '-q', 'notes.txt')
+        git(tmp_path, 'commit', '-q', '-m', 'remove notes', author='Erin')
+        metadata = GitMetadata(tmp_path.resolve())
+        notes = tmp_path / 'notes.txt'
+
+        assert metadata.last_author(tmp_path / '01_edges' / 'validation-b.md', 'HEAD~3') == 'Alice'
+        assert metadata.last_author(notes) == 'Erin'
+        assert metadata.last_author(notes, diff_filter='AM') == 'Carol'
+        assert metadata.last_author(notes, 'no-such-revision') == ''
+
+    def test_not_a_repository(self, tmp_path):
+        """Test directories outside a work tree have no metadata."""
+        assert get_git_metadata(tmp_path) is None
+
+
+class TestAccountabilityGitBackend:
+    """Test the accountability checks use the batched backend."""
+
+    def test_modified_validation_edges(self, tmp_path, monkeypatch):
+        """Test every changed edge is attributed to its own author with one git log."""
+        fixture_repo(tmp_path)
+        commit(tmp_path, {'01_edges/validation-a.md': edge('a', 'frank'),
+                          '01_edges/validation-d.md': edge('d', 'frank'),
+                          'notes.txt': 'three\n'}, 'Frank')
+        monkeypatch.chdir(tmp_path)
+        popen = CountingPopen()
+        monkeypatch.setattr(git_metadata.subprocess, 'Popen', popen)
+
+        edges = get_modified_validation_edges()
+
+        assert sorted((str(path), author) for path, author in edges) == [
+            ('01_edges/validation-a.md', 'Frank'),
+            ('01_edges/validation-d.md', 'Frank'),
+        ]
+        assert popen.calls == 1
+
+    def test_file_author_in_commit(self, tmp_path):
+        """Test the commit argument selects whose change is reported."""
+        fixture_repo(tmp_path)
+        edge_path = str(tmp_path / '01_edges' / 'validation-b.md')
+
+        assert get_file_author_in_commit(edge_path) == 'Bob'
+        assert get_file_author_in_commit(edge_path, 'HEAD~2') == 'Alice'
@@ -0,0 +1,171 @@
+"""
+Tests for hodge_analysis.py
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('scipy')
+
+from hodge_analysis import ChartData, HodgeAnalyzer
+
+
+def make_chart(n_vertices: int = 6) -> ChartData:
+    """Build a triangulated strip: vertex i joins i+1 and i+2, faces (i, i+1, i+2)."""
+    vertices = [f"v:{i}" for i in range(n_vertices)]
+    edges = []
+    for i in range(n_vertices):
+        for j in (i + 1, i + 2):
+            if j < n_vertices:
+                edges.append({'id': f"e:{i}:{j}", 'source': f"v:{i}", 'target': f"v:{j}"})
+    # Leave the last triangle unfilled so the strip has a harmonic cycle
+    faces = [
+        {'id': f"f:{i}", 'edges': [f"e:{i}:{i + 1}", f"e:{i + 1}:{i + 2}", f"e:{i}:{i + 2}"]}
+        for i in range(n_vertices - 3)
+    ]
+    return ChartData({
+        'chart_id': 'c:strip',
+        'elements': {'vertices': vertices, 'edges': edges, 'faces': faces},
+    })
+
+
+class TestBoundaryOperators:
+    """Test boundary operator and edge Laplacian assembly."""
+
+    def _reference(self, chart, edge_to_index):
+        """Dense operators built entry by entry."""
+        vertex_to_index = {v: i for i, v in enumerate(chart.vertices)}
+        d0 = np.zeros((len(chart.vertices), len(edge_to_index)))
+        for edge_id, data in chart.edges.items():
+            if data['source'] in vertex_to_index:
+                d0[vertex_to_index[data['source']], edge_to_index[edge_id]] -= 1
+            if data['target'] in vertex_to_index:
+                d0[vertex_to_index[data['target']], edge_to_index[edge_id]] += 1
+        d1 = np.zeros((len(edge_to_index), len(chart.face_ids)))
+        for face_idx, face_id in enumerate(chart.face_ids):
+            for edge_id in chart.faces[face_id]:
+                if edge_id in edge_to_index:
+                    d1[edge_to_index[edge_id], face_idx] += 1
+        return d0, d1
+
+    def test_operators_match_reference(self):
+        """Test d0 and d1 match an entry-by-entry construction."""
+        chart = make_chart(8)
+        chart.edges['e:0:1']['source'] = 'v:missing'
+        chart.faces['f:0'].append('e:missing')
+        analyzer = HodgeAnalyzer(chart, verbose=False)
+        edge_to_index, _ = analyzer._build_edge_index()
+
+        ref_d0, ref_d1 = self._reference(chart, edge_to_index)
+        assert np.array_equal(analyzer._build_d0(edge_to_index).toarray(), ref_d0)
+        assert np.array_equal(analyzer._build_d1(edge_to_index).toarray(), ref_d1)
+
+    def test_laplacian_matches_reference(self):
+        """Test L1 matches the dense formula with row-sum degrees."""
+        chart = make_chart(8)
+        analyzer = HodgeAnalyzer(chart, verbose=False)
+        edge_to_index, _ = analyzer._build_edge_index()
+        d0 = analyzer._build_d0(edge_to_index)
+        d1 = analyzer._build_d1(edge_to_index)
+
+        ref_d0, ref_d1 = self._reference(chart, edge_to_index)
+        vertex_degrees = np.abs(ref_d0).sum(axis=1)
+        edge_degrees = np.abs(ref_d1).sum(axis=1)
+        edge_degrees[edge_degrees == 0] = 1.0
+        expected = ref_d0.T @ np.diag(1 / vertex_degrees) @ ref_d0 + \
+            np.diag(1 / edge_degrees) @ ref_d1 @ ref_d1.T
+
+        L1 = analyzer._build_edge_laplacian(d0, d1, edge_to_index)
+        assert np.allclose(L1.toarray(), expected)
+
+
+class TestPageRank:
+    """Test batched and per-edge PageRank."""
+
+    def test_batched_matches_per_edge(self):
+        """Test one factorization gives the same vectors as per-edge solves."""
+        analyzer = HodgeAnalyzer(make_chart(), verbose=False)
+        batched = analyzer.analyze(batched=True)
+        iterative = analyzer.analyze(batched=False)
+
+        assert np.allclose(batched.pagerank_matrix, iterative.pagerank_matrix, atol=1e-6)
+        assert np.allclose(
+            batched.global_gradient_influence, iterative.global_gradient_influence, atol=1e-6
+        )
+
+    def test_pagerank_matrix_layout(self):
+        """Test column j of the matrix is the PageRank vector of edge j."""
+        analyzer = HodgeAnalyzer(make_chart(), verbose=False)
+        results = analyzer.analyze()
+        n_edges = len(results.edge_to_index)
+
+        assert results.pagerank_matrix.shape == (n_edges, n_edges)
+        for edge_id, idx in results.edge_to_index.items():
+            assert np.array_equal(results.pagerank_vectors[edge_id], results.pagerank_matrix[:, idx])
+
+    def test_pagerank_solves_system(self):
+        """Test (βI + L₁) PR = I holds for the batched solution."""
+        analyzer = HodgeAnalyzer(make_chart(), verbose=False)
+        edge_to_index, _ = analyzer._build_edge_index()
+        d0 = analyzer._build_d0(edge_to_index)
+        d1 = analyzer._build_d1(edge_to_index)
+        L1 = analyzer._build_edge_laplacian(d0, d1, edge_to_index)
+        A = analyzer._build_pagerank_system(L1, 0.1)
+
+        pagerank = analyzer._compute_pagerank_matrix(A)
+        assert np.allclose(A @ pagerank, np.eye(A.shape[0]), atol=1e-10)
+
+    def test_empty_chart(self):
+        """Test a chart without edges yields empty results."""
+        results = HodgeAnalyzer(ChartData({'elements': {}}), verbose=False).analyze()
+        assert results.pagerank_matrix.shape == (0, 0)
+        assert results.pagerank_vectors == {}
+
+
+class TestHodgeDecomposition:
+    """Test batched Hodge projections."""
+
+    def _operators(self, analyzer):
+        edge_to_index, _ = analyzer._build_edge_index()
+        return analyzer._build_d0(edge_to_index), analyzer._build_d1(edge_to_index)
+
+    def test_matrix_matches_per_vector(self):
+        """Test projecting all columns at once matches per-vector projection."""
+        analyzer = HodgeAnalyzer(make_chart(), verbose=False)
+        d0, d1 = self._operators(analyzer)
+        vectors = np.random.default_rng(0).standard_normal((d0.shape[1], 5))
+
+        gradient, circular, harmonic = analyzer._hodge_decompose_matrix(vectors, d0, d1)
+
+        for j in range(vectors.shape[1]):
+            decomp = analyzer._hodge_decompose(vectors[:, j], d0, d1)
+            assert np.allclose(gradient[:, j], decomp.gradient, atol=1e-6)
+            assert np.allclose(circular[:, j], decomp.circular, atol=1e-6)
+            assert np.allclose(harmonic[:, j], decomp.harmonic, atol=1e-6)
+
+    def test_projector_is_idempotent(self):
+        """Test projecting a projection leaves it unchanged."""
+        analyzer = HodgeAnalyzer(make_chart(), verbose=False)
+        d0, _ = self._operators(analyzer)
+        project = analyzer._build_projector(d0.T)
+        vectors = np.random.default_rng(1).standard_normal((d0.shape[1], 3))
+
+        once = project(vectors)
+        assert np.allclose(project(once), once, atol=1e-8)
+
+    def test_global_influence_sums_components(self):
+        """Test global measures sum component magnitudes over all edges."""
+        results = HodgeAnalyzer(make_chart(), verbose=False).analyze()
+        expected = sum(np.abs(d.gradient) for d in results.hodge_decompositions.values())
+        assert np.allclose(results.global_gradient_influence, expected)
+
+    def test_duplicate_edge_ids(self):
+        """Test duplicate edge IDs share one index."""
+        chart = make_chart()
+        chart.edge_ids.append(chart.edge_ids[0])
+        results = HodgeAnalyzer(chart, verbose=False).analyze()
+        assert results.pagerank_matrix.shape == (len(chart.edges), len(chart.edges))
@@ -0,0 +1,140 @@
+"""
+Tests for invalidation.py
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from invalidation import Task, affected_tasks, build_task_inputs, changed_files_since, reverse_index
+
+FILES = {
+    '00_vertices/spec-a.md': {'id': 'v:spec:a', 'type': 'vertex/spec', 'dependencies': ['v:spec:b']},
+    '00_vertices/spec-b.md': {'id': 'v:spec:b', 'type': 'vertex/spec', 'dependencies': []},
+    '00_vertices/other.md': {'id': 'v:other', 'type': 'vertex/doc'},
+    '01_edges/a-b.md': {'id': 'e:a:b', 'type': 'edge/dependency', 'source': 'v:spec:a', 'target': 'v:spec:b'},
+    '01_edges/b-c.md': {'id': 'e:b:c', 'type': 'edge/dependency'},
+    '01_edges/validation-x.md': {'id': 'e:validation:x', 'type': 'edge/validation'},
+    '02_faces/f-abc.md': {'id': 'f:abc', 'type': 'face/assurance', 'edges': ['e:a:b', 'e:b:c']},
+    '02_faces/assurance-x.md': {'id': 'f:assurance:x', 'type': 'face/assurance',
+                                'validation_edge': 'e:validation:x'},
+    '02_faces/signature-x.md': {'id': 'f:signature:x', 'type': 'face/signature',
+                                'validation_edge': 'e:validation:x'},
+    'charts/c/c.md': {'id': 'c:c', 'type': 'chart/assurance_audit',
+                      'elements': {'vertices': ['v:spec:a'], 'edges': ['e:a:b'], 'faces': ['f:abc']}},
+    'charts/bad/bad.md': None,
+}
+
+
+def keys(tasks):
+    return sorted(str(task) for task in tasks)
+
+
+class TestTaskInputs:
+    """Test deriving tasks and their inputs from frontmatter."""
+
+    def test_chart_inputs(self):
+        """Test charts read their elements and the boundary edges of their faces."""
+        tasks = build_task_inputs(FILES)
+        chart = tasks[Task('chart', 'charts/c/c.md', 'c:c')]
+        assert chart == {'c:c', 'v:spec:a', 'e:a:b', 'f:abc', 'e:b:c'}
+        assert tasks[Task('audit', 'charts/c/c.md', 'c:c')] == {'c:c', 'v:spec:a', 'f:abc'}
+
+    def test_unreadable_chart_is_verified(self):
+        """Test a chart with malformed frontmatter still gets a chart task."""
+        assert Task('chart', 'charts/bad/bad.md') in build_task_inputs(FILES)
+
+    def test_accountability_inputs(self):
+        """Test signature faces read their validation edge and the assurance faces sharing it."""
+        tasks = build_task_inputs(FILES)
+        signature = tasks[Task('accountability', '02_faces/signature-x.md', 'f:signature:x')]
+        assert signature == {'f:signature:x', 'e:validation:x', 'f:assurance:x'}
+
+    def test_reverse_index(self):
+        """Test inputs map back to every task that reads them."""
+        dependents = reverse_index(build_task_inputs(FILES))
+        assert keys(dependents['v:spec:b']) == ['dependencies:v:spec:a', 'template:v:spec:b']
+        assert keys(dependents['template/vertex/doc']) == ['template:v:other']
+
+
+class TestAffectedTasks:
+    """Test selecting the tasks affected by changed files."""
+
+    def test_vertex_change(self, tmp_path):
+        """Test a vertex change reaches charts, dependents and its own template check."""
+        tasks = affected_tasks(tmp_path, ['00_vertices/spec-b.md'], files=FILES)
+        assert keys(tasks) == ['dependencies:v:spec:a', 'template:v:spec:b']
+
+        tasks = affected_tasks(tmp_path, ['00_vertices/spec-a.md'], files=FILES)
+        assert keys(tasks) == ['audit:c:c', 'chart:c:c', 'dependencies:v:spec:a', 'template:v:spec:a']
+
+    def test_face_boundary_edge_change(self, tmp_path):
+        """Test an edge reached only through a face's boundary invalidates the chart."""
+        tasks = affected_tasks(tmp_path, ['01_edges/b-c.md'], files=FILES)
+        assert keys(tasks) == ['chart:c:c', 'template:e:b:c']
+
+    def test_unrelated_files_ignored(self, tmp_path):
+        """Test files outside element and template directories affect nothing."""
+        assert affected_tasks(tmp_path, ['README.md', 'docs/guide.md'], files=FILES) == []
+
+    def test_script_change_invalidates_kind(self, tmp_path):
+        """Test changing a verifier re-runs every task of its kind."""
+        tasks = affected_tasks(tmp_path, ['scripts/check_accountability.py'], files=FILES)
+        assert keys(tasks) == ['accountability:f:signature:x']
+
+    def test_template_change(self, tmp_path):
+        """Test changing a template re-verifies the elements of its type."""
+        template = tmp_path / 'templates' / '00_vertices' / 'doc.md'
+        template.parent.mkdir(parents=True)
+        template.write_text('---\ntype: template/vertex/doc\n---\n', encoding='utf-8')
+
+        tasks = affected_tasks(tmp_path, ['templates/00_vertices/doc.md'], files=FILES)
+        assert keys(tasks) == ['template:v:other']
+
+
+def git(root: Path, *args: str):
+    subprocess.run(['git', *args], cwd=root, check=True, capture_output=True)
+
+
+def write(root: Path, rel_path: str, frontmatter: str):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{frontmatter}---\n", encoding='utf-8')
+
+
+class TestChangedSince:
+    """Test git-based change detection."""
+
+    def _repo(self, root: Path):
+        git(root, 'init', '-q')
+        git(root, 'config', 'user.email', 'test@example.com')
+        git(root, 'config', 'user.name', 'Test')
+        write(root, '01_edges/validation-x.md', 'id: e:validation:x\ntype: edge/validation\n')
+        write(root, '02_faces/assurance-x.md',
+              'id: f:assurance:x\ntype: face/assurance\nvalidation_edge: e:validation:x\n')
+        write(root, '02_faces/signature-x.md',
+              'id: f:signature:x\ntype: face/signature\nvalidation_edge: e:validation:x\n')
+        git(root, 'add', '.')
+        git(root, 'commit', '-q', '-m', 'initial')
+
+    def test_changed_and_untracked_files(self, tmp_path):
+        """Test uncommitted edits and new files are both reported."""
+        self._repo(tmp_path)
+        write(tmp_path, '01_edges/validation-x.md', 'id: e:validation:x\ntype: edge/validation\nx: 1\n')
+        write(tmp_path, '00_vertices/new.md', 'id: v:new\ntype: vertex/doc\n')
+
+        assert changed_files_since(tmp_path, 'HEAD') == ['00_vertices/new.md', '01_edges/validation-x.md']
+
+    def test_removed_reference_uses_old_tree(self, tmp_path):
+        """Test an assurance face leaving a shared edge still invalidates the signature."""
+        self._repo(tmp_path)
+        write(tmp_path, '02_faces/assurance-x.md',
+              'id: f:assurance:x\ntype: face/assurance\nvalidation_edge: e:validation:y\n')
+
+        tasks = affected_tasks(tmp_path, changed_files_since(tmp_path, 'HEAD'), 'HEAD')
+        assert keys(tasks) == ['accountability:f:signature:x', 'template:f:assurance:x']
+
+        # Without the old tree the signature no longer reads the assurance face
+        assert keys(affected_tasks(tmp_path, ['02_faces/assurance-x.md'])) == ['template:f:assurance:x']
@@ -12,12 +12,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
 from parse_chart import (
     extract_frontmatter,
+    read_frontmatter,
     parse_element,
     parse_vertex,
     parse_edge,
     parse_face,
     parse_chart,
-    ParseError
+    parse_directory,
+    parse_files,
+    read_markdown,
+    use_source_store,
+    ParseError,
+    SourceStore
 )
 
 
@@ -60,6 +66,60 @@ Body
             assert "Invalid YAML frontmatter" in str(e)
 
 
+
+class TestReadFrontmatter:
+    """Test the frontmatter-only fast path."""
+
+    CASES = [
+        "---\ntype: vertex/vertex\nid: v:test\n---\nBody\n",
+        "---  \ntype: vertex/vertex\n---\n\n---\nSecond rule in body\n",
+        "---\nid: v:test\n---",
+        "---\nid: v:test\n",
+        "Plain markdown\n---\nid: v:test\n---\n",
+        "---\n\n---\nEmpty frontmatter\n",
+        # Frontmatter spanning several read chunks
+        "---\ndescription: " + "x" * 10000 + "\n---\nBody\n",
+        "---\ndescription: " + "x" * 10000 + "\n",
+    ]
+
+    def test_matches_extract_frontmatter(self, tmp_path):
+        """Test read_frontmatter agrees with extract_frontmatter on delimiters."""
+        for i, content in enumerate(self.CASES):
+            md_file = tmp_path / f"case-{i}.md"
+            md_file.write_text(content)
+            expected, _ = extract_frontmatter(content)
+            assert read_frontmatter(md_file) == expected, repr(content)
+
+    def test_invalid_yaml(self, tmp_path):
+        """Test malformed YAML raises ParseError."""
+        md_file = tmp_path / "bad.md"
+        md_file.write_text("---\ntype: vertex\n  invalid: yaml: structure\n---\nBody\n")
+        try:
+            read_frontmatter(md_file)
+            assert False, "Should have raised ParseError"
+        except ParseError as e:
+            assert "Invalid YAML frontmatter" in str(e)
+
+    def test_parse_element_without_body(self, tmp_path):
+        """Test parse_element(include_body=False) omits the body."""
+        md_file = tmp_path / "vertex.md"
+        md_file.write_text("""---
+type: vertex/vertex
+extends: null
+id: v:test
+name: Test Vertex
+tags:
+  - vertex
+version: 1.0.0
+---
+Body content here
+""")
+        element = parse_vertex(md_file, include_body=False)
+        assert element['id'] == 'v:test'
+        assert 'body' not in element
+        assert parse_vertex(md_file)['body'] == 'Body content here'
+
+
 class TestParsing:
     """Test parsing different element types."""
 
@@ -197,6 +257,88 @@ Chart content
         assert isinstance(chart['elements']['vertices'], list)
 
 
+
+class TestParseDirectory:
+    """Test directory parsing, sequential and with a worker pool."""
+
+    def _write_vertices(self, directory, count):
+        for i in range(count):
+            (directory / f"v-{i:02d}.md").write_text(f"""---
+type: vertex/vertex
+extends: null
+id: v:test:{i:02d}
+name: Vertex {i}
+tags:
+  - vertex
+version: 1.0.0
+---
+""")
+        (directory / "README.md").write_text("# Not an element\n")
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Test a worker pool returns the same elements in sorted-file order."""
+        self._write_vertices(tmp_path, 12)
+
+        sequential = parse_directory(tmp_path, 'vertex')
+        parallel = parse_directory(tmp_path, 'vertex', workers=2)
+
+        assert [v['id'] for v in sequential] == [f"v:test:{i:02d}" for i in range(12)]
+        assert parallel == sequential
+
+    def test_parallel_collects_parse_errors(self, tmp_path):
+        """Test parse errors are reported per file in input order."""
+        self._write_vertices(tmp_path, 3)
+        files = sorted(tmp_path.glob('*.md'))
+
+        results = parse_files(files, 'vertex', workers=2)
+
+        assert [r[0] for r in results] == files
+        errors = [(f.name, error) for f, element, error in results if error]
+        assert len(errors) == 1
+        assert errors[0][0] == 'README.md'
+        assert "No YAML frontmatter" in errors[0][1]
+
+
+class TestSourceStore:
+    """Test serving reads from a shared SourceStore."""
+
+    VERTEX = "---\ntype: vertex/vertex\nid: v:test\nname: Test\ntags: [vertex]\nversion: 1.0.0\n---\nBody\n"
+
+    def test_reads_served_from_store(self, tmp_path):
+        """Test reads inside the block come from the store, not the file."""
+        md_file = tmp_path / "vertex.md"
+        md_file.write_text(self.VERTEX)
+        store = SourceStore()
+        store.load([md_file])
+
+        md_file.write_text(self.VERTEX.replace('v:test', 'v:changed'))
+        with use_source_store(store):
+            assert read_frontmatter(md_file)['id'] == 'v:test'
+            assert read_markdown(md_file) == extract_frontmatter(self.VERTEX)
+            assert parse_vertex(md_file)['body'] == 'Body'
+        assert read_frontmatter(md_file)['id'] == 'v:changed'
+        assert len(store) == 1
+
+    def test_errors(self, tmp_path):
+        """Test parse errors are cached and missing files still raise OSError."""
+        md_file = tmp_path / "bad.md"
+        md_file.write_text("---\ntype: vertex\n  invalid: yaml: structure\n---\n")
+        store = SourceStore()
+        with use_source_store(store):
+            for _ in range(2):
+                try:
+                    read_frontmatter(md_file)
+                    assert False, "Should have raised ParseError"
+                except ParseError as e:
+                    assert "Invalid YAML frontmatter" in str(e)
+            try:
+                read_markdown(tmp_path / "missing.md")
+                assert False, "Should have raised OSError"
+            except OSError:
+                pass
+        assert len(store) == 1
+
+
 def run_tests():
     """Run all parse tests."""
     print("=" * 70)
@@ -228,6 +370,19 @@ def run_tests():
         print(f"✗ test_extract_frontmatter_invalid_yaml: {e}")
         return False
 
+    # TestReadFrontmatter
+    print("\n--- Frontmatter Fast Path Tests ---")
+    read_tests = TestReadFrontmatter()
+
+    for test_name in ['test_matches_extract_frontmatter', 'test_invalid_yaml', 'test_parse_element_without_body']:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                getattr(read_tests, test_name)(Path(tmp))
+                print(f"✓ {test_name}")
+            except AssertionError as e:
+                print(f"✗ {test_name}: {e}")
+                return False
+
     # TestParsing
     print("\n--- Element Parsing Tests ---")
     parsing_tests = TestParsing()
@@ -270,6 +425,32 @@ def run_tests():
             print(f"✗ test_parse_chart: {e}")
             return False
 
+    # TestParseDirectory
+    print("\n--- Directory Parsing Tests ---")
+    directory_tests = TestParseDirectory()
+
+    for test_name in ['test_parallel_matches_sequential', 'test_parallel_collects_parse_errors']:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                getattr(directory_tests, test_name)(Path(tmp))
+                print(f"✓ {test_name}")
+            except AssertionError as e:
+                print(f"✗ {test_name}: {e}")
+                return False
+
+    # TestSourceStore
+    print("\n--- Source Store Tests ---")
+    store_tests = TestSourceStore()
+
+    for test_name in ['test_reads_served_from_store', 'test_errors']:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                getattr(store_tests, test_name)(Path(tmp))
+                print(f"✓ {test_name}")
+            except AssertionError as e:
+                print(f"✗ {test_name}: {e}")
+                return False
+
     print("\n" + "=" * 70)
     print("All element parsing tests passed!")
     print("=" * 70)
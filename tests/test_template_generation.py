@@ -15,7 +15,8 @@ import shutil
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
 from generate_template_from_spec import SpecParser, TemplateGenerator
-from generate_all_templates import BatchTemplateGenerator, SPEC_TO_TEMPLATE_MAP
+import generate_all_templates
+from generate_all_templates import BatchTemplateGenerator, SPEC_TO_TEMPLATE_MAP, MANIFEST_PATH
 
 
 class TestSpecParser:
@@ -450,6 +451,136 @@ id: v:spec:test
         print("✓ Template is stale (doesn't match spec)")
 
 
+TEST_SPEC = """---
+type: vertex/spec
+id: v:spec:{name}
+---
+
+# Spec for {name}
+
+## Frontmatter Requirements
+
+| Field | Type | Requirement | Description |
+|-------|------|-------------|-------------|
+| `type` | string | REQUIRED | Must be `vertex/{name}` |
+"""
+
+
+class CountingRender:
+    """Stand-in for render_template that counts generator runs."""
+
+    def __init__(self):
+        self.specs = []
+        self.render = generate_all_templates.render_template
+
+    def __call__(self, spec_full):
+        self.specs.append(spec_full.name)
+        return self.render(spec_full)
+
+
+class TestTemplateManifest:
+    """Test manifest-based skipping and parallel regeneration."""
+
+    def make_repo(self, repo_root, monkeypatch, names=('alpha', 'beta', 'gamma')):
+        """Write one spec per name and point the batch map at them."""
+        (repo_root / "00_vertices").mkdir()
+        spec_map = {}
+        for name in names:
+            (repo_root / "00_vertices" / f"spec-for-{name}.md").write_text(TEST_SPEC.format(name=name))
+            spec_map[f"00_vertices/spec-for-{name}.md"] = f"templates/00_vertices/{name}.md"
+        monkeypatch.setattr(generate_all_templates, 'SPEC_TO_TEMPLATE_MAP', spec_map)
+        render = CountingRender()
+        monkeypatch.setattr(generate_all_templates, 'render_template', render)
+        return render
+
+    def test_unchanged_specs_skipped(self, tmp_path, monkeypatch):
+        """Test only specs changed since the last run are regenerated."""
+        render = self.make_repo(tmp_path, monkeypatch)
+
+        assert BatchTemplateGenerator(tmp_path).generate_all()
+        assert len(render.specs) == 3
+        assert (tmp_path / MANIFEST_PATH).exists()
+
+        spec = tmp_path / "00_vertices" / "spec-for-beta.md"
+        spec.write_text(spec.read_text() + "| `name` | string | REQUIRED | Display name |\n")
+        render.specs.clear()
+
+        generator = BatchTemplateGenerator(tmp_path)
+        assert generator.generate_all()
+        assert render.specs == ["spec-for-beta.md"]
+        assert [r['changed'] for r in generator.results] == [False, True, False]
+
+        render.specs.clear()
+        assert BatchTemplateGenerator(tmp_path).check_freshness()
+        assert render.specs == []
+
+    def test_edited_template_not_trusted(self, tmp_path, monkeypatch):
+        """Test a template edited after generation is regenerated and compared."""
+        render = self.make_repo(tmp_path, monkeypatch)
+        BatchTemplateGenerator(tmp_path).generate_all()
+        (tmp_path / "templates" / "00_vertices" / "gamma.md").write_text("---\ntype: vertex/edited\n---\n")
+        render.specs.clear()
+
+        assert not BatchTemplateGenerator(tmp_path).check_freshness()
+        assert render.specs == ["spec-for-gamma.md"]
+
+    def test_generator_change_invalidates(self, tmp_path, monkeypatch):
+        """Test a new generator version regenerates every template."""
+        render = self.make_repo(tmp_path, monkeypatch)
+        BatchTemplateGenerator(tmp_path).generate_all()
+        monkeypatch.setattr(generate_all_templates, 'generator_version', lambda: 'new-version')
+        render.specs.clear()
+
+        assert BatchTemplateGenerator(tmp_path).check_freshness()
+        assert len(render.specs) == 3
+
+    def test_force_ignores_manifest(self, tmp_path, monkeypatch):
+        """Test force regenerates templates the manifest shows as fresh."""
+        render = self.make_repo(tmp_path, monkeypatch)
+        BatchTemplateGenerator(tmp_path).generate_all()
+        render.specs.clear()
+
+        assert BatchTemplateGenerator(tmp_path, force=True).generate_all()
+        assert len(render.specs) == 3
+
+    def test_dry_run_leaves_manifest(self, tmp_path, monkeypatch):
+        """Test dry-run mode writes neither templates nor the manifest."""
+        self.make_repo(tmp_path, monkeypatch)
+        generator = BatchTemplateGenerator(tmp_path, dry_run=True)
+
+        assert generator.generate_all()
+        assert not (tmp_path / "templates").exists()
+
+    def test_committed_manifest_current(self, monkeypatch):
+        """Test the committed manifest matches the generator, so CI checks are hash comparisons."""
+        repo_root = Path(__file__).parent.parent
+        render = CountingRender()
+        monkeypatch.setattr(generate_all_templates, 'render_template', render)
+        generator = BatchTemplateGenerator(repo_root)
+
+        entries = generator.manifest.entries
+        assert sorted(entries) == sorted(SPEC_TO_TEMPLATE_MAP.values())
+        assert {entry['generator'] for entry in entries.values()} == {generate_all_templates.generator_version()}, \
+            "Run: python scripts/generate_all_templates.py"
+        assert generator.check_freshness()
+        assert render.specs == []
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test templates generated in worker processes match serial generation."""
+        spec_map = {}
+        (tmp_path / "00_vertices").mkdir()
+        for name in ('alpha', 'beta', 'gamma', 'delta'):
+            (tmp_path / "00_vertices" / f"spec-for-{name}.md").write_text(TEST_SPEC.format(name=name))
+            spec_map[f"00_vertices/spec-for-{name}.md"] = f"templates/00_vertices/{name}.md"
+
+        generator = BatchTemplateGenerator(tmp_path, jobs=2)
+        rendered = generator._render_many(list(spec_map))
+        serial = BatchTemplateGenerator(tmp_path)._render_many(list(spec_map))
+
+        assert rendered == serial
+        assert all(error is None for _, error in rendered.values())
+
+
 class TestRealSpecs:
     """Test generation from actual spec files in repository."""
 
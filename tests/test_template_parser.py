@@ -3,13 +3,16 @@
 Tests for template parser functionality.
 """
 
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
-from template_parser import TemplateParser, TemplateSpec
+from template_parser import TemplateParser, TemplateSpec, compile_conditional
+from verify_template_based import TemplateBasedVerifier
 
 
 def test_load_all_templates():
@@ -101,6 +104,150 @@ def test_conditional_evaluation():
     print("✓ Conditional evaluation works correctly")
 
 
+def test_compiled_conditionals():
+    """Test the conditional vocabulary: ==, !=, in, and/or and field existence."""
+    llm = {'validation_method': 'llm-assisted', 'llm_model': 'model-x'}
+    manual = {'validation_method': 'manual', 'llm_model': None}
+
+    cases = {
+        "validation_method=='llm-assisted'": (True, False),
+        'validation_method != manual': (True, False),
+        'validation_method in [llm-assisted, automated]': (True, False),
+        'validation_method not in (llm-assisted)': (False, True),
+        'llm_model': (True, False),
+        'llm_model and validation_method==manual': (False, False),
+        'validation_method==manual or llm_model': (True, True),
+        'human_approver or validation_method==automated and llm_model': (False, False),
+    }
+    for conditional, expected in cases.items():
+        predicate = compile_conditional(conditional)
+        assert (predicate(llm), predicate(manual)) == expected, conditional
+
+    # Identical conditionals share one predicate; malformed ones are rejected
+    assert compile_conditional('llm_model') is compile_conditional('llm_model')
+    try:
+        compile_conditional('validation_method ~ manual')
+        assert False, "Malformed conditional should not compile"
+    except ValueError:
+        pass
+
+    print("✓ Compiled conditionals evaluate correctly")
+
+
+def test_table_expression_conditional():
+    """Test a whole expression in backticks becomes a compiled requirement condition."""
+    with tempfile.TemporaryDirectory() as tmp:
+        templates_dir = Path(tmp)
+        (templates_dir / 'review.md').write_text(
+            "---\ntype: template/vertex/review\n---\n\n"
+            "| Field | Type | Description |\n|-------|------|-------------|\n"
+            "| `type` | string | Must be `vertex/review` |\n"
+            "| `reviewer` | string | REQUIRED if `review in [peer, external] and not_waived` |\n"
+            "| `waiver` | string | REQUIRED if `review` is `waived` |\n\n## Body\n",
+            encoding='utf-8'
+        )
+        verifier = TemplateBasedVerifier(templates_dir)
+        requirements = {req.field: req for req in verifier.parser.get_template('vertex/review').frontmatter_requirements}
+        assert requirements['reviewer'].conditional == 'review in [peer, external] and not_waived'
+        assert requirements['waiver'].conditional == 'review==waived'
+
+        document = Path(tmp) / 'doc.md'
+        for frontmatter, missing in [
+            ("review: peer\nnot_waived: true\n", ["reviewer"]),
+            ("review: internal\nnot_waived: true\n", []),
+            ("review: waived\n", ["waiver"]),
+        ]:
+            document.write_text(f"---\ntype: vertex/review\n{frontmatter}---\n", encoding='utf-8')
+            result = verifier.verify(document)
+            assert result.errors == [f"Missing required field '{field}'" for field in missing], frontmatter
+
+    print("✓ Table expressions compile into requirement conditions")
+
+
+def test_prose_alternatives_conditional():
+    """Test 'is `a` or `b`' conditions require the field for every listed value."""
+    templates_dir = Path(__file__).parent.parent / 'templates'
+    parser = TemplateParser(templates_dir)
+    parser.load_all_templates(use_cache=False)
+    requirements = {req.field: req for req in parser.get_template('edge/validation').frontmatter_requirements}
+
+    human_approver = requirements['human_approver']
+    assert human_approver.conditional == 'validation_method in [llm-assisted, automated]'
+    assert human_approver.condition_met({'validation_method': 'automated'})
+    assert human_approver.condition_met({'validation_method': 'llm-assisted'})
+    assert not human_approver.condition_met({'validation_method': 'manual'})
+    # A single value (followed by prose) still compiles to equality
+    assert requirements['llm_model'].conditional == 'validation_method==llm-assisted'
+
+    print("✓ Prose alternatives compile into membership conditions")
+
+
+def test_extends_chain():
+    """Test extends chains are resolved through short and full type names."""
+    templates_dir = Path(__file__).parent.parent / 'templates'
+    parser = TemplateParser(templates_dir)
+    parser.load_all_templates()
+
+    assert parser.get_extends_chain('vertex/staff') == ['vertex/individual', 'vertex/actor', 'vertex']
+    assert parser.get_extends_chain('vertex/skill') == ['vertex/property', 'vertex']
+    # No template for the base 'edge' type
+    assert parser.get_extends_chain('edge/validation') == []
+
+    print("✓ Extends chains resolved")
+
+
+def _counting_parser(templates_dir: Path) -> TemplateParser:
+    """TemplateParser that records which templates it parses."""
+    parser = TemplateParser(templates_dir)
+    parser.parsed = []
+    parse_template = parser.parse_template
+
+    def counting_parse(template_path):
+        parser.parsed.append(template_path.name)
+        return parse_template(template_path)
+
+    parser.parse_template = counting_parse
+    return parser
+
+
+def test_registry_cache():
+    """Test cached templates match a fresh parse and only edited templates are reparsed."""
+    source_dir = Path(__file__).parent.parent / 'templates'
+    with tempfile.TemporaryDirectory() as tmp:
+        templates_dir = Path(tmp)
+        for name in ['00_vertices/vertex.md', '00_vertices/doc.md', '00_vertices/spec.md',
+                     '01_edges/validation.md']:
+            (templates_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(source_dir / name, templates_dir / name)
+
+        first = _counting_parser(templates_dir)
+        first.load_all_templates()
+        assert len(first.parsed) == 4
+
+        cached = _counting_parser(templates_dir)
+        cached.load_all_templates()
+        assert cached.parsed == []
+        assert cached.templates.keys() == first.templates.keys()
+        for type_name, spec in first.templates.items():
+            loaded = cached.templates[type_name]
+            assert loaded.to_dict() == spec.to_dict()
+            assert loaded.extends_chain == spec.extends_chain
+            assert loaded.template_path == spec.template_path
+            assert [r.field_type for r in loaded.frontmatter_requirements] == \
+                [r.field_type for r in spec.frontmatter_requirements]
+        assert cached.get_extends_chain('vertex/spec') == ['vertex/doc', 'vertex']
+
+        edited = templates_dir / '00_vertices' / 'doc.md'
+        edited.write_text(edited.read_text(encoding='utf-8').replace('extends: vertex', 'extends: null'),
+                          encoding='utf-8')
+        reloaded = _counting_parser(templates_dir)
+        reloaded.load_all_templates()
+        assert reloaded.parsed == ['doc.md']
+        assert reloaded.get_extends_chain('vertex/spec') == ['vertex/doc']
+
+    print("✓ Template registry cache reused")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
@@ -108,6 +255,11 @@ def run_all_tests():
         test_validation_edge_template,
         test_assurance_face_template,
         test_conditional_evaluation,
+        test_compiled_conditionals,
+        test_table_expression_conditional,
+        test_prose_alternatives_conditional,
+        test_extends_chain,
+        test_registry_cache,
     ]
 
     print("=" * 70)
@@ -80,6 +80,36 @@ class TestTopology:
         # Should find no potential faces (triangle incomplete)
         assert len(potential) == 0
 
+    def test_find_potential_faces_order(self):
+        """Test faces are reported in vertex-list order, each triple sorted."""
+        vertices = ['v:d', 'v:c', 'v:b', 'v:a']
+        edges = {
+            f"e:{i}:{j}": {'source': vertices[i], 'target': vertices[j]}
+            for i in range(4) for j in range(i + 1, 4)
+        }
+
+        potential = find_potential_faces(vertices, edges)
+
+        assert potential == [
+            ('v:b', 'v:c', 'v:d'),
+            ('v:a', 'v:c', 'v:d'),
+            ('v:a', 'v:b', 'v:d'),
+            ('v:a', 'v:b', 'v:c'),
+        ]
+
+    def test_find_potential_faces_sparse(self):
+        """Test a long triangulated strip (vertex i joined to i+1 and i+2)."""
+        vertices = [f"v:{i}" for i in range(5000)]
+        edges = {
+            f"e:{i}:{j}": {'source': vertices[i], 'target': vertices[j]}
+            for i in range(5000) for j in (i + 1, i + 2) if j < 5000
+        }
+
+        potential = find_potential_faces(vertices, edges)
+
+        assert len(potential) == 4998
+        assert potential[0] == ('v:0', 'v:1', 'v:2')
+
 
 def run_tests():
     """Run all topology tests."""
@@ -117,6 +147,14 @@ def run_tests():
         print(f"✗ test_find_potential_faces_incomplete: {e}")
         return False
 
+    for test_name in ['test_find_potential_faces_order', 'test_find_potential_faces_sparse']:
+        try:
+            getattr(topology_tests, test_name)()
+            print(f"✓ {test_name}")
+        except AssertionError as e:
+            print(f"✗ {test_name}: {e}")
+            return False
+
     print("\n" + "=" * 70)
     print("All topology tests passed!")
     print("=" * 70)
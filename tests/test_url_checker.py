@@ -0,0 +1,279 @@
+"""
+Tests for url_checker.py, against a local HTTP server
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from url_checker import UrlCache, UrlChecker
+from verify_citations import verify_all_citations
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Paths:
+      /ok          200
+      /no-head     405 to HEAD, 200 to GET
+      /missing     404
+      /redirect    301 to /ok
+      /slow        200 after a short delay
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path))
+            server.clients.add(self.client_address)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            path = self.path.split('?')[0]
+            if path == '/slow':
+                time.sleep(0.2)
+            if path == '/redirect':
+                status, headers = 301, {'Location': '/ok'}
+            elif path == '/missing':
+                status, headers = 404, {}
+            elif path == '/no-head' and self.command == 'HEAD':
+                status, headers = 405, {}
+            else:
+                status, headers = 200, {}
+            body = b'stand-in body\n'
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if self.command == 'GET':
+                self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+
+class ProxyStandInHandler(BaseHTTPRequestHandler):
+    """
+    Answers every proxied request itself: 200 to absolute-URI HEAD/GET,
+    403 to CONNECT (so https tunnels are attempted but never opened).
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self):
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+        status = 403 if self.command == 'CONNECT' else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_HEAD = _respond
+    do_GET = _respond
+    do_CONNECT = _respond
+
+
+def serve(handler):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.clients = set()
+    httpd.active = 0
+    httpd.max_active = 0
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    return httpd
+
+
+@pytest.fixture
+def server():
+    httpd = serve(StandInHandler)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def proxy(monkeypatch):
+    """A proxy stand-in set as the environment's http and https proxy."""
+    httpd = serve(ProxyStandInHandler)
+    for name in ('http_proxy', 'https_proxy', 'no_proxy', 'all_proxy'):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+    monkeypatch.setenv('http_proxy', httpd.url)
+    monkeypatch.setenv('https_proxy', httpd.url)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_checker(**kwargs) -> UrlChecker:
+    kwargs.setdefault('host_interval', 0)
+    return UrlChecker(timeout=5, **kwargs)
+
+
+class TestUrlChecker:
+    """Test concurrent reachability checks."""
+
+    def test_statuses(self, server):
+        """Test HEAD-then-GET fallback, redirects and failures."""
+        checker = make_checker()
+        try:
+            results = checker.check_many([
+                f"{server.url}/ok", f"{server.url}/no-head", f"{server.url}/redirect",
+                f"{server.url}/missing", 'ftp://example.com/file',
+            ])
+        finally:
+            checker.close()
+
+        assert list(results.values()) == [
+            (True, ""), (True, ""), (True, ""),
+            (False, "HTTP 404: Not Found"), (False, "Error: unsupported URL: ftp://example.com/file"),
+        ]
+        requests = server.requests
+        assert ('GET', '/no-head') in requests
+        assert ('GET', '/ok') not in requests
+        assert requests.count(('HEAD', '/ok')) == 2
+
+    def test_connection_reuse(self, server):
+        """Test one worker sends every request over one kept-alive connection."""
+        checker = make_checker(jobs=1)
+        try:
+            for i in range(5):
+                assert checker.check(f"{server.url}/ok?i={i}") == (True, "")
+        finally:
+            checker.close()
+
+        assert len(server.requests) == 5
+        assert len(server.clients) == 1
+
+    def test_concurrent_with_per_host_limit(self, server):
+        """Test URLs are checked in parallel, but never above the per-host limit."""
+        urls = [f"{server.url}/slow?i={i}" for i in range(8)]
+
+        checker = make_checker(jobs=8, per_host=8)
+        start = time.perf_counter()
+        try:
+            assert all(accessible for accessible, _ in checker.check_many(urls).values())
+        finally:
+            checker.close()
+        assert time.perf_counter() - start < 8 * 0.2
+        assert server.max_active > 1
+
+        server.max_active = 0
+        checker = make_checker(jobs=8, per_host=1)
+        try:
+            checker.check_many(urls[:3])
+        finally:
+            checker.close()
+        assert server.max_active == 1
+
+    def test_environment_proxy(self, proxy, server, monkeypatch):
+        """Test requests go through the environment's proxy unless NO_PROXY exempts the host."""
+        monkeypatch.setenv('no_proxy', '127.0.0.1')
+        checker = make_checker()
+        try:
+            results = checker.check_many([
+                'http://citations.example/paper?id=1',
+                'https://secure.example/paper',
+                f"{server.url}/ok",
+            ])
+        finally:
+            checker.close()
+
+        assert results['http://citations.example/paper?id=1'] == (True, "")
+        assert results['https://secure.example/paper'][0] is False
+        assert results[f"{server.url}/ok"] == (True, "")
+        assert ('HEAD', 'http://citations.example/paper?id=1') in proxy.requests
+        assert ('CONNECT', 'secure.example:443') in proxy.requests
+        assert server.requests == [('HEAD', '/ok')]
+
+    def test_host_interval(self, server):
+        """Test request starts to one host are spaced by the interval."""
+        checker = UrlChecker(timeout=5, jobs=4, per_host=4, host_interval=0.1)
+        start = time.perf_counter()
+        try:
+            checker.check_many([f"{server.url}/ok?i={i}" for i in range(4)])
+        finally:
+            checker.close()
+        assert time.perf_counter() - start >= 0.3
+
+
+class TestUrlCache:
+    """Test the on-disk cache of reachable URLs."""
+
+    def test_cached_urls_not_refetched(self, server, tmp_path):
+        """Test reachable URLs are served from the cache and failures are re-checked."""
+        cache_path = tmp_path / 'urls.json'
+        urls = [f"{server.url}/ok", f"{server.url}/missing"]
+
+        for _ in range(2):
+            checker = make_checker(cache=UrlCache(cache_path))
+            try:
+                results = checker.check_many(urls)
+            finally:
+                checker.close()
+            assert results[urls[0]] == (True, "")
+            assert results[urls[1]][0] is False
+
+        assert server.requests.count(('HEAD', '/ok')) == 1
+        assert server.requests.count(('HEAD', '/missing')) == 2
+        assert list(json.loads(cache_path.read_text())['urls']) == [urls[0]]
+
+    def test_expired_entries(self, tmp_path):
+        """Test entries older than the TTL are ignored."""
+        cache_path = tmp_path / 'urls.json'
+        cache_path.write_text(json.dumps({'urls': {
+            'http://old.example/': {'checked_at': time.time() - 7200},
+            'http://new.example/': {'checked_at': time.time()},
+        }}))
+
+        cache = UrlCache(cache_path, ttl=3600)
+        assert cache.get('http://old.example/') is None
+        assert cache.get('http://new.example/') == (True, "")
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        """Test an unreadable cache file starts an empty cache."""
+        cache_path = tmp_path / 'urls.json'
+        cache_path.write_text('not json')
+        assert UrlCache(cache_path).get('http://example.com/') is None
+
+
+def test_verify_all_citations_checks_urls(server, tmp_path):
+    """Test unreachable primary URLs become warnings, checked in one batch."""
+    review = tmp_path / 'review.md'
+    review.write_text(
+        "```yaml\nid: good\ntype: web\ntitle: Good\nyear: 2020\nverified: true\n"
+        f"url: {server.url}/ok\n```\n\n"
+        "```yaml\nid: gone\ntype: web\ntitle: Gone\nyear: 2020\nverified: true\n"
+        f"url: {server.url}/missing\n```\n",
+        encoding='utf-8'
+    )
+
+    checker = make_checker()
+    try:
+        all_passed, results = verify_all_citations(review, check_urls=True, url_checker=checker)
+    finally:
+        checker.close()
+
+    assert all_passed
+    assert results[0].warnings == []
+    assert results[1].warnings == ["Primary URL not accessible: HTTP 404: Not Found"]
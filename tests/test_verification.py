@@ -3,7 +3,10 @@
 Tests for template-based verification functionality.
 """
 
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add scripts to path
@@ -128,6 +131,46 @@ def test_conditional_requirements():
         print("✓ Automated validation edge conditional requirements work")
 
 
+def test_verify_many():
+    """Test batch verification returns per-file results, in and out of process."""
+    repo_root = Path(__file__).parent.parent
+    verifier = TemplateBasedVerifier(repo_root / 'templates', verbose=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        good = Path(tmp) / 'validation.md'
+        shutil.copy(repo_root / '01_edges' / 'validation-spec-spec.md', good)
+        bad = Path(tmp) / 'untyped.md'
+        bad.write_text("---\nid: v:untyped\n---\n", encoding='utf-8')
+        paths = [good, bad, good]
+
+        for jobs in [None, 2]:
+            results = verifier.verify_many(paths, jobs=jobs)
+            assert [result.path for result in results] == paths
+            assert [result.passed for result in results] == [True, False, True]
+            assert results[0].template_path.name == 'validation.md'
+            assert results[0].checks_passed == results[0].checks_total > 0
+            assert results[1].errors == ["No 'type' field in frontmatter"]
+
+        # verify does not touch the verifier's own state
+        assert verifier.errors == [] and verifier.checks_total == 0
+
+    print("✓ verify_many returns per-file results")
+
+
+def test_verify_threads():
+    """Test one verifier can be shared by several threads."""
+    repo_root = Path(__file__).parent.parent
+    verifier = TemplateBasedVerifier(repo_root / 'templates', verbose=False)
+    edges = sorted((repo_root / '01_edges').glob('*.md'))
+
+    expected = [(result.passed, result.errors) for result in verifier.verify_many(edges)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        shared = [(result.passed, result.errors) for result in executor.map(verifier.verify, edges)]
+
+    assert shared == expected
+    print(f"✓ {len(edges)} edges verified from 4 threads")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
@@ -137,6 +180,8 @@ def run_all_tests():
         test_assurance_faces,
         test_foundational_vertices,
         test_conditional_requirements,
+        test_verify_many,
+        test_verify_threads,
     ]
 
     print("=" * 70)
@@ -0,0 +1,104 @@
+"""
+Tests for verify_all.py
+"""
+
+from pathlib import Path
+import json
+import sys
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import parse_chart
+from verify_all import CHECKERS, checker, junit_report, verify_all
+
+
+def write_element(path: Path, frontmatter: str):
+    """Write an element file with the given frontmatter lines."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{frontmatter}version: 1.0.0\n---\n\n# Body\n", encoding='utf-8')
+
+
+def write_repo(root: Path, chart_vertices: str = 'v:a, v:b'):
+    """Two vertices joined by an edge and a chart over them."""
+    for name in ['a', 'b']:
+        write_element(root / '00_vertices' / f"{name}.md",
+                      f"type: vertex/doc\nextends: doc\nid: v:{name}\nname: Vertex\ntags: [vertex]\n")
+    write_element(root / '01_edges' / 'a-b.md',
+                  "type: edge/dependency\nextends: edge\nid: e:a:b\nname: Edge\n"
+                  "source: v:a\ntarget: v:b\nsource_type: vertex/doc\ntarget_type: vertex/doc\n"
+                  "orientation: directed\ntags: [edge]\n")
+    write_element(root / 'charts' / 'test' / 'test.md',
+                  "type: chart/test\nextends: chart\nid: c:test\nname: Test\ntags: [chart]\n"
+                  f"elements:\n  vertices: [{chart_vertices}]\n  edges: [e:a:b]\n  faces: []\n")
+    (root / 'templates').mkdir()
+
+
+class TestVerifyAll:
+    """Test the single-parse verification runner."""
+
+    def test_each_file_parsed_once(self, tmp_path, monkeypatch):
+        """Test every checker reads files from the shared store."""
+        write_repo(tmp_path)
+        parsed = []
+        extract = parse_chart.extract_frontmatter
+
+        def counting_extract(content):
+            parsed.append(content)
+            return extract(content)
+
+        monkeypatch.setattr(parse_chart, 'extract_frontmatter', counting_extract)
+        report = verify_all(tmp_path)
+
+        assert report['parse']['files'] == 4
+        assert len(parsed) == 4
+        assert [result['name'] for result in report['checkers']] == list(CHECKERS)
+
+    def test_report(self, tmp_path):
+        """Test failures are reported per checker and subject, with timings."""
+        write_repo(tmp_path, chart_vertices='v:a, v:b, v:missing')
+
+        report = verify_all(tmp_path, ['structure', 'chart', 'dependencies'], jobs=2)
+
+        results = {result['name']: result for result in report['checkers']}
+        assert not report['passed']
+        assert results['structure']['passed']
+        assert results['chart']['failures'] == {
+            'charts/test/test.md': ['Vertex v:missing not found in cache']
+        }
+        assert results['dependencies']['checked'] == 2
+        assert all(result['seconds'] >= 0 for result in report['checkers'])
+        json.dumps(report)
+
+    def test_output_captured(self, tmp_path, capsys):
+        """Test what checkers print goes to their results, and a crash fails only that checker."""
+        write_repo(tmp_path)
+
+        @checker('noisy')
+        def check_noisy(context):
+            print('to stdout')
+            print('to stderr', file=sys.stderr)
+            raise RuntimeError('boom')
+
+        try:
+            report = verify_all(tmp_path, ['noisy', 'chart'])
+        finally:
+            del CHECKERS['noisy']
+
+        noisy, chart = report['checkers']
+        assert noisy['output'] == 'to stdout\nto stderr\n'
+        assert noisy['failures'] == {'error': ['RuntimeError: boom']}
+        assert chart['passed']
+        captured = capsys.readouterr()
+        assert 'to stdout' not in captured.out and 'to stderr' not in captured.err
+
+    def test_junit_report(self, tmp_path):
+        """Test the JUnit report has one test case per checker."""
+        write_repo(tmp_path, chart_vertices='v:a, v:b, v:missing')
+
+        suites = ET.fromstring(junit_report(verify_all(tmp_path, ['structure', 'chart'])))
+
+        cases = suites.findall('testsuite/testcase')
+        assert [case.get('name') for case in cases] == ['structure', 'chart']
+        assert suites.get('failures') == '1'
+        assert 'v:missing' in cases[1].find('failure').text
@@ -7,10 +7,14 @@ from pathlib import Path
 import sys
 import tempfile
 import os
+import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
-from verify_chart import get_edge_boundary, verify_chart_elements, find_cache_root, VerificationError
+from verify_chart import (
+    get_edge_boundary, verify_chart_elements, find_cache_root, VerificationError,
+    find_chart_files, verify_all_charts
+)
 
 
 class TestVerifyChart:
@@ -158,6 +162,63 @@ class TestFindCacheRoot:
             assert result == nested
 
 
+def write_chart(path: Path, chart_id: str, vertices, edges=(), chart_type='chart/test'):
+    """Write a minimal chart markdown file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\ntype: {chart_type}\nextends: chart\nid: {chart_id}\nname: Test\n"
+        f"tags: [chart]\nversion: 1.0.0\n"
+        f"elements:\n  vertices: {list(vertices)}\n  edges: {list(edges)}\n  faces: []\n"
+        f"---\n\n# Test\n",
+        encoding='utf-8'
+    )
+
+
+class TestVerifyAllCharts:
+    """Test verifying every chart against one loaded cache."""
+
+    def _write_repo(self, root: Path):
+        cache = {
+            'elements': {
+                'vertices': {'v:a': {'id': 'v:a'}, 'v:b': {'id': 'v:b'}},
+                'edges': {'e:a:b': {'id': 'e:a:b', 'source': 'v:a', 'target': 'v:b'}},
+                'faces': {},
+            }
+        }
+        (root / 'complex.json').write_text(json.dumps(cache), encoding='utf-8')
+        write_chart(root / 'charts' / 'good' / 'good.md', 'c:good', ['v:a', 'v:b'], ['e:a:b'])
+        write_chart(root / 'charts' / 'bad' / 'bad.md', 'c:bad', ['v:a'], ['e:a:b'])
+        (root / 'charts' / 'good' / 'TEACHING-GUIDE.md').write_text('# Guide\n', encoding='utf-8')
+
+    def test_find_chart_files_skips_non_charts(self):
+        """Test only chart/* documents are selected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._write_repo(root)
+            names = [p.name for p in find_chart_files(root)]
+            assert names == ['bad.md', 'good.md']
+
+    def test_verify_all_charts(self):
+        """Test each chart gets its own error list."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            self._write_repo(root)
+            results = verify_all_charts(root)
+
+            by_name = {path.name: errors for path, errors in results.items()}
+            assert by_name['good.md'] == []
+            assert any('boundary vertices not in chart' in err for err in by_name['bad.md'])
+
+    def test_verify_all_charts_missing_cache(self):
+        """Test a missing cache raises VerificationError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            try:
+                verify_all_charts(Path(tmpdir))
+                assert False, "Should have raised VerificationError"
+            except VerificationError as e:
+                assert 'Cache not found' in str(e)
+
+
 def run_tests():
     """Run all verify_chart tests."""
     print("=" * 70)
@@ -194,6 +255,19 @@ def run_tests():
         print(f"✗ test_verify_chart_edge_boundary_missing: {e}")
         return False
 
+    all_charts_tests = TestVerifyAllCharts()
+    for test_name in [
+        'test_find_chart_files_skips_non_charts',
+        'test_verify_all_charts',
+        'test_verify_all_charts_missing_cache',
+    ]:
+        try:
+            getattr(all_charts_tests, test_name)()
+            print(f"✓ {test_name}")
+        except AssertionError as e:
+            print(f"✗ {test_name}: {e}")
+            return False
+
     print("\n" + "=" * 70)
     print("All chart verification tests passed!")
     print("=" * 70)
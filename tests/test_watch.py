@@ -0,0 +1,143 @@
+"""
+Tests for watch.py
+"""
+
+import os
+from pathlib import Path
+import sys
+import threading
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from watch import ComplexWatcher, QueryServer, send_query
+
+
+def write_element(path: Path, frontmatter: str):
+    """Write an element file with the given frontmatter lines."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{frontmatter}version: 1.0.0\n---\n\n# Body\n", encoding='utf-8')
+
+
+def write_vertex(root: Path, name: str, title: str = 'Vertex'):
+    """Write a minimal vertex file."""
+    write_element(root / '00_vertices' / f"{name}.md",
+                  f"type: vertex/doc\nextends: doc\nid: v:{name}\nname: {title}\ntags: [vertex]\n")
+
+
+def write_repo(root: Path):
+    """Two vertices joined by an edge, a chart over them, and an unrelated vertex."""
+    for name in ['a', 'b', 'other']:
+        write_vertex(root, name)
+    write_element(root / '01_edges' / 'a-b.md',
+                  "type: edge/dependency\nextends: edge\nid: e:a:b\nname: Edge\n"
+                  "source: v:a\ntarget: v:b\nsource_type: vertex/doc\ntarget_type: vertex/doc\n"
+                  "orientation: directed\ntags: [edge]\n")
+    write_element(root / 'charts' / 'test' / 'test.md',
+                  "type: chart/test\nextends: chart\nid: c:test\nname: Test\ntags: [chart]\n"
+                  "elements:\n  vertices: [v:a, v:b]\n  edges: [e:a:b]\n  faces: []\n")
+    (root / '00_vertices' / 'README.md').write_text('# Not an element\n', encoding='utf-8')
+
+
+def touch(path: Path):
+    """Bump a file's mtime so the change is seen even within one tick."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestComplexWatcher:
+    """Test incremental re-parsing and re-verification."""
+
+    def test_initial_scan(self, tmp_path):
+        """Test the first refresh parses everything and verifies every chart."""
+        write_repo(tmp_path)
+        watcher = ComplexWatcher(tmp_path, audit=False)
+
+        summary = watcher.refresh()
+
+        assert len(summary['changed']) == 6
+        assert summary['rerun'] == ['chart:c:test']
+        assert watcher.chart_results['c:test']['errors'] == []
+        assert list(watcher.skipped_files()) == ['00_vertices/README.md']
+        assert watcher.failures() == {}
+
+    def test_no_changes(self, tmp_path):
+        """Test a refresh without changes does no work."""
+        write_repo(tmp_path)
+        watcher = ComplexWatcher(tmp_path, audit=False)
+        watcher.refresh()
+
+        assert watcher.refresh() == {'changed': [], 'removed': [], 'rerun': []}
+        assert watcher.generation == 1
+
+    def test_unrelated_change_skips_chart(self, tmp_path):
+        """Test editing an element no chart references re-runs nothing."""
+        write_repo(tmp_path)
+        watcher = ComplexWatcher(tmp_path, audit=False)
+        watcher.refresh()
+
+        write_vertex(tmp_path, 'other', title='Renamed')
+        touch(tmp_path / '00_vertices' / 'other.md')
+        summary = watcher.refresh()
+
+        assert summary['changed'] == ['00_vertices/other.md']
+        assert summary['rerun'] == []
+        assert watcher.complex.vertices['v:other']['name'] == 'Renamed'
+
+    def test_removed_input_reverifies_chart(self, tmp_path):
+        """Test deleting a referenced element re-runs and fails the chart."""
+        write_repo(tmp_path)
+        watcher = ComplexWatcher(tmp_path, audit=False)
+        watcher.refresh()
+
+        (tmp_path / '00_vertices' / 'b.md').unlink()
+        summary = watcher.refresh()
+
+        assert summary['removed'] == ['00_vertices/b.md']
+        assert summary['rerun'] == ['chart:c:test']
+        assert watcher.failures() == {'chart:c:test': ['Vertex v:b not found in cache']}
+
+        # Restoring it fixes the chart again
+        write_vertex(tmp_path, 'b')
+        assert watcher.refresh()['rerun'] == ['chart:c:test']
+        assert watcher.failures() == {}
+
+    def test_unparseable_chart_fails(self, tmp_path):
+        """Test a chart file that no longer parses is reported as a failure."""
+        write_repo(tmp_path)
+        watcher = ComplexWatcher(tmp_path, audit=False)
+        watcher.refresh()
+
+        chart_path = tmp_path / 'charts' / 'test' / 'test.md'
+        chart_path.write_text("---\ntype: chart/test\nid: [unclosed\n---\n", encoding='utf-8')
+        touch(chart_path)
+        watcher.refresh()
+
+        assert 'c:test' not in watcher.chart_results
+        assert list(watcher.failures()) == ['parse:charts/test/test.md']
+
+
+class TestQueryServer:
+    """Test the Unix-socket query API."""
+
+    def test_queries(self, tmp_path):
+        """Test status, chart, element and unknown requests over the socket."""
+        write_repo(tmp_path)
+        watcher = ComplexWatcher(tmp_path, audit=False)
+        watcher.refresh()
+
+        socket_path = tmp_path / 'watch.sock'
+        server = QueryServer(socket_path, watcher)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            status = send_query(socket_path, 'status')
+            assert status['elements'] == {'vertices': 3, 'edges': 1, 'faces': 0, 'charts': 1}
+            assert status['failures'] == 0
+
+            assert send_query(socket_path, 'chart', 'c:test')['errors'] == []
+            assert send_query(socket_path, 'element', 'e:a:b')['entry']['source'] == 'v:a'
+            assert 'error' in send_query(socket_path, 'element', 'v:missing')
+            assert 'error' in send_query(socket_path, 'unknown')
+        finally:
+            server.shutdown()
+            server.server_close()